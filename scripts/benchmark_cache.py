@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Benchmark the cache hit path with and without the in-memory L1 tier."""
+
+import tempfile
+import time
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from navam_invest.cache import CacheManager
+
+ITERATIONS = 5000
+QUOTE = "**AAPL - Apple Inc.**\n\n**Price:** $227.52\n" * 4
+
+
+def bench_hits(cache: CacheManager, iterations: int) -> float:
+    """Return average microseconds per cache hit."""
+    args = ("AAPL",)
+    cache.set("yahoo_finance", "get_quote", args, {}, QUOTE)
+    assert cache.get("yahoo_finance", "get_quote", args, {}) == QUOTE
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        cache.get("yahoo_finance", "get_quote", args, {})
+    elapsed = time.perf_counter() - start
+
+    return elapsed / iterations * 1e6
+
+
+def main() -> None:
+    """Compare DuckDB-only hits with L1 memory-tier hits."""
+    console = Console()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        duckdb_only = CacheManager(
+            Path(tmp) / "l2_only.duckdb",
+            memory_max_entries=0,
+            stats_flush_threshold=1,
+        )
+        l2_us = bench_hits(duckdb_only, ITERATIONS // 10)
+        duckdb_only.close()
+
+        tiered = CacheManager(Path(tmp) / "tiered.duckdb")
+        l1_us = bench_hits(tiered, ITERATIONS)
+        tiered.close()
+
+    table = Table(title="Cache Hit Latency", show_header=True, header_style="bold magenta")
+    table.add_column("Configuration", style="cyan")
+    table.add_column("µs / hit", justify="right")
+    table.add_row("DuckDB only (per-hit statistics)", f"{l2_us:,.1f}")
+    table.add_row("L1 memory tier + batched statistics", f"{l1_us:,.1f}")
+    console.print(table)
+    console.print(f"[bold green]Speedup: {l2_us / l1_us:,.0f}x[/bold green]")
+
+
+if __name__ == "__main__":
+    main()
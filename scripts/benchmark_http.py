@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark per-call httpx clients against the shared pooled client.
+
+Runs 50 back-to-back SEC/FRED-shaped requests against a local stub server.
+The stub delays every new connection by ``HANDSHAKE_MS`` to stand in for the
+TCP + TLS round trips a real API host costs on connect.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+import httpx
+from rich.console import Console
+from rich.table import Table
+
+from navam_invest.net import aclose_http_clients, get_http_client
+
+CALLS = 50
+HANDSHAKE_MS = 30
+PATHS = (
+    "/submissions/CIK0000320193.json",
+    "/fred/series/observations?series_id=GDP",
+)
+PAYLOAD = json.dumps({"filings": {"recent": {"form": ["10-K"] * 50}}}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON endpoint with simulated connection setup cost."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        time.sleep(HANDSHAKE_MS / 1000)
+        super().setup()
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def start_stub() -> Tuple[ThreadingHTTPServer, str]:
+    """Start the stub server on a free port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+async def fetch_per_call(url: str) -> dict:
+    """Previous helper pattern: a new client for every request."""
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url, timeout=30.0)
+        response.raise_for_status()
+        return response.json()
+
+
+async def fetch_pooled(url: str) -> dict:
+    """Current helper pattern: the shared keep-alive client."""
+    client = get_http_client(url)
+    response = await client.get(url)
+    response.raise_for_status()
+    return response.json()
+
+
+async def bench(fetch, base_url: str) -> float:  # type: ignore[no-untyped-def]
+    """Return total milliseconds for CALLS sequential requests."""
+    start = time.perf_counter()
+    for i in range(CALLS):
+        await fetch(base_url + PATHS[i % len(PATHS)])
+    return (time.perf_counter() - start) * 1000
+
+
+async def run() -> Tuple[float, float]:
+    """Run both variants against one stub server."""
+    server, base_url = start_stub()
+    try:
+        per_call_ms = await bench(fetch_per_call, base_url)
+        pooled_ms = await bench(fetch_pooled, base_url)
+        await aclose_http_clients()
+    finally:
+        server.shutdown()
+    return per_call_ms, pooled_ms
+
+
+def main() -> None:
+    """Compare request latency of both client strategies."""
+    console = Console()
+    per_call_ms, pooled_ms = asyncio.run(run())
+
+    table = Table(
+        title=f"{CALLS} Sequential SEC/FRED Requests ({HANDSHAKE_MS} ms simulated handshake)",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Client", style="cyan")
+    table.add_column("Total ms", justify="right")
+    table.add_column("ms / call", justify="right")
+    table.add_row("New AsyncClient per call", f"{per_call_ms:,.1f}", f"{per_call_ms / CALLS:,.2f}")
+    table.add_row("Shared pooled client", f"{pooled_ms:,.1f}", f"{pooled_ms / CALLS:,.2f}")
+    console.print(table)
+    console.print(f"[bold green]Latency cut: {1 - pooled_ms / per_call_ms:.0%}[/bold green]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Measure TUI time-to-interactive of the working tree against a baseline tree.
+
+Each run starts a fresh interpreter with one tree's ``src`` first on the path,
+mounts ``ChatUI`` headlessly and records, from interpreter start:
+
+- Welcome shown: the chat log has painted its welcome text and the input
+  takes queries (the time-to-interactive)
+- Router ready: the router agent is built, so a query is answered right away
+- All agents ready: every agent and workflow is built (the lazy tree warms
+  them up in the background; an eager tree builds them before Ready)
+
+The baseline defaults to the repository's root commit, the startup before
+lazy construction; pass ``--baseline REV`` to compare another revision. Its
+``src`` is exported with ``git archive``, so the working tree is untouched.
+Baseline and current runs alternate so that machine noise affects both, and
+the median with the min-max range is shown.
+
+No model or data API is called: constructing the graphs does not touch the
+network, so a placeholder API key is enough.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+REPO = Path(__file__).resolve().parent.parent
+METRICS = (
+    ("shown", "Welcome shown"),
+    ("ready", "Router ready"),
+    ("warmed", "All agents ready"),
+)
+
+
+async def measure(start: float) -> Dict[str, float]:
+    """Mount the TUI once and time it (runs inside the child process)."""
+    from navam_invest.tui import app as tui
+
+    app = tui.ChatUI()
+    shown = None
+    async with app.run_test() as pilot:
+        chat_log = app.query_one("#chat-log")
+        while not app.agents_initialized:
+            if shown is None and chat_log.lines:
+                shown = time.perf_counter() - start
+            await pilot.pause(0.01)
+        ready = time.perf_counter() - start
+        if shown is None:
+            shown = ready
+
+        # Trees with lazy construction warm up the rest after the router
+        if hasattr(app, "warmup_task"):
+            while app.warmup_task is None:
+                await pilot.pause(0.01)
+            await app.warmup_task
+        warmed = time.perf_counter() - start
+
+    return {"shown": shown, "ready": ready, "warmed": warmed}
+
+
+def export_tree(rev: str, dest: Path) -> Path:
+    """Write the ``src`` directory of ``rev`` into ``dest``."""
+    archive = subprocess.run(
+        ["git", "-C", str(REPO), "archive", rev, "src"],
+        check=True,
+        capture_output=True,
+    ).stdout
+    subprocess.run(["tar", "-x", "-C", str(dest)], input=archive, check=True)
+    return dest / "src"
+
+
+def run_child(src: Path, cwd: Path) -> Dict[str, float]:
+    """Run one measurement in a fresh interpreter so imports are cold."""
+    path = [str(src), os.environ.get("PYTHONPATH", "")]
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(p for p in path if p),
+        "ANTHROPIC_API_KEY": os.environ.get("ANTHROPIC_API_KEY", "benchmark"),
+    }
+    output = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--child"],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=cwd,  # No .env from the repository
+        env=env,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(values: List[float]) -> str:
+    """Median with the min-max range."""
+    return f"{statistics.median(values):.2f}s ({min(values):.2f}-{max(values):.2f})"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--runs", type=int, default=10, help="Runs per tree (default: 10)"
+    )
+    parser.add_argument(
+        "--baseline", help="Git revision to compare against (default: root commit)"
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        import asyncio
+
+        start = time.perf_counter()
+        print(json.dumps(asyncio.run(measure(start))))
+        return
+
+    baseline: Optional[str] = args.baseline
+    if baseline is None:
+        baseline = subprocess.run(
+            ["git", "-C", str(REPO), "rev-list", "--max-parents=0", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()[0]
+
+    console = Console()
+    results: Dict[str, List[Dict[str, float]]] = {"baseline": [], "current": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        trees = {
+            "baseline": export_tree(baseline, Path(tmp)),
+            "current": REPO / "src",
+        }
+        for i in range(args.runs):
+            console.print(f"[dim]Run {i + 1}/{args.runs}[/dim]")
+            for name, src in trees.items():
+                results[name].append(run_child(src, Path(tmp)))
+
+    table = Table(title=f"TUI startup, median (min-max) of {args.runs} runs")
+    table.add_column("Tree")
+    for _, label in METRICS:
+        table.add_column(label, justify="right")
+    for name, runs in results.items():
+        label = f"baseline ({baseline[:10]})" if name == "baseline" else "current"
+        table.add_row(label, *(summarize([r[key] for r in runs]) for key, _ in METRICS))
+    console.print(table)
+
+    for key, label in METRICS:
+        before = statistics.median(r[key] for r in results["baseline"])
+        after = statistics.median(r[key] for r in results["current"])
+        console.print(f"{label}: {before:.2f}s -> {after:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
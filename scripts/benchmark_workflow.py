@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Compare /analyze latency in sequential and parallel workflow modes.
+
+By default every agent is simulated with a fixed latency standing in for its
+model/tool loop, so the run is free and deterministic. ``--live SYMBOL`` runs
+the real agents against the configured model and data APIs instead.
+
+For each mode the harness records when every agent started and finished and
+reports the wall-clock time next to the critical path implied by the graph.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from rich.console import Console
+from rich.table import Table
+
+AGENTS = (
+    "quill",
+    "news_sentry",
+    "macro_lens",
+    "risk_shield",
+    "tax_scout",
+    "synthesize",
+)
+
+# Seconds per agent tool loop, roughly proportional to observed live runs
+SIMULATED_LATENCY = {
+    "quill": 1.2,
+    "news_sentry": 0.6,
+    "macro_lens": 0.8,
+    "risk_shield": 0.6,
+    "tax_scout": 0.4,
+    "synthesize": 0.3,
+}
+
+# How each agent introduces itself in its system prompt
+PROMPT_NAMES = {
+    "You are Quill": "quill",
+    "You are News Sentry": "news_sentry",
+    "You are Macro Lens": "macro_lens",
+    "You are Risk Shield": "risk_shield",
+    "You are Tax Scout": "tax_scout",
+}
+
+
+class SimulatedChatModel(BaseChatModel):
+    """Chat model that answers after a per-agent delay without calling tools."""
+
+    latencies: Dict[str, float]
+
+    @property
+    def _llm_type(self) -> str:
+        return "simulated"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "SimulatedChatModel":
+        return self
+
+    def _generate(self, messages: List[BaseMessage], **kwargs: Any) -> ChatResult:
+        raise NotImplementedError("SimulatedChatModel is async only")
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Any = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        system = kwargs.get("system", "")
+        agent = next(
+            (name for prefix, name in PROMPT_NAMES.items() if system.startswith(prefix)),
+            "synthesize",
+        )
+        await asyncio.sleep(self.latencies[agent])
+        message = AIMessage(content=f"{agent} analysis")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class AgentSpans(AsyncCallbackHandler):
+    """Record the first start and last end of every agent's nodes."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.spans: Dict[str, List[float]] = {}
+        self._runs: Dict[Any, str] = {}
+
+    def _agent(self, name: Optional[str]) -> Optional[str]:
+        if not name:
+            return None
+        agent = name[: -len("_tools")] if name.endswith("_tools") else name
+        return agent if agent in AGENTS else None
+
+    async def on_chain_start(
+        self, serialized: Any, inputs: Any, *, run_id: Any, **kwargs: Any
+    ) -> None:
+        agent = self._agent(kwargs.get("name"))
+        if agent:
+            self._runs[run_id] = agent
+            now = time.perf_counter() - self.origin
+            self.spans.setdefault(agent, [now, now])
+
+    async def on_chain_end(self, outputs: Any, *, run_id: Any, **kwargs: Any) -> None:
+        agent = self._runs.pop(run_id, None)
+        if agent:
+            self.spans[agent][1] = time.perf_counter() - self.origin
+
+    def duration(self, agent: str) -> float:
+        start, end = self.spans.get(agent, (0.0, 0.0))
+        return end - start
+
+
+def critical_path(spans: AgentSpans, parallel: bool) -> float:
+    """Latency implied by the graph given each agent's own duration."""
+    d = spans.duration
+    if parallel:
+        branches = (
+            d("quill") + d("risk_shield"),
+            d("news_sentry"),
+            d("macro_lens"),
+            d("tax_scout"),
+        )
+        return max(branches) + d("synthesize")
+    return sum(d(agent) for agent in AGENTS)
+
+
+async def run_mode(
+    parallel: bool, symbol: str, llm: Optional[BaseChatModel]
+) -> Tuple[float, AgentSpans]:
+    """Run one /analyze in the given mode and time it."""
+    from navam_invest.workflows import create_investment_analysis_workflow
+
+    workflow = await create_investment_analysis_workflow(parallel=parallel, llm=llm)
+    spans = AgentSpans()
+    start = time.perf_counter()
+    await workflow.ainvoke(
+        {"messages": [HumanMessage(content=f"Analyze {symbol}")], "symbol": symbol},
+        config={"callbacks": [spans]},
+    )
+    return time.perf_counter() - start, spans
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--live", metavar="SYMBOL", help="Run the real agents for SYMBOL")
+    args = parser.parse_args()
+
+    if args.live:
+        symbol, llm = args.live.upper(), None
+    else:
+        # Settings require a key even though the simulated model never uses it
+        os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark")
+        symbol, llm = "AAPL", SimulatedChatModel(latencies=SIMULATED_LATENCY)
+
+    results = {}
+    for parallel in (False, True):
+        results[parallel] = await run_mode(parallel, symbol, llm)
+
+    console = Console()
+    agents = Table(title=f"/analyze {symbol} - agent durations (s)")
+    agents.add_column("Agent")
+    agents.add_column("Sequential", justify="right")
+    agents.add_column("Parallel", justify="right")
+    for agent in AGENTS:
+        agents.add_row(
+            agent,
+            f"{results[False][1].duration(agent):.2f}",
+            f"{results[True][1].duration(agent):.2f}",
+        )
+    console.print(agents)
+
+    summary = Table(title="Latency (s)")
+    summary.add_column("Mode")
+    summary.add_column("Critical path", justify="right")
+    summary.add_column("Wall clock", justify="right")
+    for parallel, label in ((False, "sequential"), (True, "parallel")):
+        wall, spans = results[parallel]
+        summary.add_row(label, f"{critical_path(spans, parallel):.2f}", f"{wall:.2f}")
+    console.print(summary)
+    console.print(f"Speedup: {results[False][0] / results[True][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
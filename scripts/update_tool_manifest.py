@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Regenerate src/navam_invest/tools/manifest.json from the tool implementations.
+
+Run after adding a tool to ``TOOL_MODULES`` or changing a tool's signature or
+docstring. ``--check`` exits non-zero instead of writing when the manifest is
+out of date.
+"""
+
+import argparse
+import json
+import sys
+
+from navam_invest.tools.registry import MANIFEST_PATH, build_manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="Only verify the manifest")
+    args = parser.parse_args()
+
+    content = json.dumps(build_manifest(), indent=2, ensure_ascii=False) + "\n"
+    current = MANIFEST_PATH.read_text(encoding="utf-8") if MANIFEST_PATH.exists() else ""
+
+    if args.check:
+        if content != current:
+            print(f"{MANIFEST_PATH} is out of date; run {sys.argv[0]}")
+            return 1
+        print(f"{MANIFEST_PATH} is up to date")
+        return 0
+
+    MANIFEST_PATH.write_text(content, encoding="utf-8")
+    print(f"Wrote {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""Rule-based intent pre-classifier for the router.
+
+Many router queries name their specialist outright ("What's AAPL's stock
+price?", "Any wash-sale issues if I sell TSLA?"). Classifying those locally
+with keyword rules and ticker detection lets the router call the specialist
+directly and skip both supervisor LLM calls (choosing the tool and writing the
+final answer). Queries that match several specialists, ask for a buy/sell
+decision, or match nothing strongly are left to the LLM supervisor.
+"""
+
+import logging
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (pattern, weight) rules per specialist. Weights are combined per agent as
+# independent evidence: score = 1 - prod(1 - weight).
+_RULES: Dict[str, List[Tuple[str, float]]] = {
+    "portfolio": [
+        (r"\b(stock|share) price\b|\bprice of\b|\bquote\b", 0.7),
+        (r"\btrading at\b|\bhow much is\b|\bcurrent(ly)? price\b", 0.7),
+        (r"\bwhat('s| is) [$a-z]{1,6}('s)? (stock |share )?price\b", 0.5),
+    ],
+    "research": [
+        (
+            r"\b(gdp|cpi|pce|inflation rate|unemployment( rate)?|jobless claims|"
+            r"payrolls|fed(eral)? funds( rate)?|debt[- ]to[- ]gdp|10[- ]year yield|"
+            r"treasury (yield|rate)s?|yield spread)\b",
+            0.6,
+        ),
+        (
+            r"\b(what('s| is)|show( me)?|current|latest)\b.*\b(rate|level|reading|data)\b",
+            0.3,
+        ),
+        (r"\bfred\b|\beconomic indicators?\b", 0.5),
+    ],
+    "macro_lens": [
+        (r"\brecession\b|\b(economic|market|business) (cycle|regime)\b", 0.7),
+        (r"\bsector (allocation|rotation)\b|\bmarket timing\b|\bmacro outlook\b", 0.8),
+        (r"\byield curve\b.*\b(invert|signal|mean|imply)|\b(invert|inversion)\b", 0.6),
+        (
+            r"\b(top[- ]down|macro) (view|analysis|strategy)\b|\brisk[- ]on\b|\brisk[- ]off\b",
+            0.7,
+        ),
+    ],
+    "screen_forge": [
+        (
+            r"\b(find|screen|scan|search for|identify|list|show me)\b.*\b(stocks|companies|names|ideas|candidates)\b",
+            0.8,
+        ),
+        (r"\bscreen(er|ing)?\b|\bstocks with\b|\bshortlist\b|\bwatchlist ideas\b", 0.6),
+        (
+            r"\b(undervalued|cheap|high[- ]dividend|small[- ]cap|growth|value|momentum) stocks\b",
+            0.6,
+        ),
+    ],
+    "earnings_whisperer": [
+        (r"\bearnings\b", 0.7),
+        (r"\b(eps|guidance|beat|miss(ed)?|surprise)\b|\bpost[- ]earnings\b", 0.5),
+        (
+            r"\b(quarterly|q[1-4]) (results|report)\b|\bearnings (call|calendar|date)\b",
+            0.6,
+        ),
+    ],
+    "news_sentry": [
+        (r"\bnews\b|\bheadlines?\b|\bwhat happened\b|\bbreaking\b", 0.7),
+        (r"\b8-k\b|\bmaterial events?\b|\bform 4\b", 0.8),
+        (r"\binsider (trading|buying|selling|transactions|activity)\b", 0.7),
+        (r"\b(upgrade|downgrade)d?\b|\brating changes?\b", 0.5),
+    ],
+    "risk_shield": [
+        (r"\bportfolio risk\b|\brisk (assessment|analysis|exposure|profile)\b", 0.8),
+        (r"\bvar\b|\bvalue at risk\b|\bdrawdowns?\b|\bstress[- ]test", 0.8),
+        (
+            r"\bconcentration\b|\bposition siz(e|ing)\b|\bover[- ]?exposed\b|\bdiversif",
+            0.6,
+        ),
+    ],
+    "tax_scout": [
+        (r"\btax[- ]loss\b|\bharvest(ing)?\b|\bwash[- ]sale\b", 0.9),
+        (r"\bcapital gains?\b|\bcapital loss(es)?\b|\btax(es|able)?\b", 0.6),
+    ],
+    "hedge_smith": [
+        (r"\b(covered calls?|protective puts?|collars?|cash[- ]secured puts?)\b", 0.9),
+        (
+            r"\boptions?( chain| strateg(y|ies)| trade)?\b|\bgreeks\b|\bimplied volatility\b",
+            0.6,
+        ),
+        (r"\bhedg(e|es|ing)\b|\bprotect my\b|\bdownside protection\b", 0.7),
+    ],
+    "quill": [
+        (r"\bvaluation\b|\bfair value\b|\bdcf\b|\bintrinsic value\b", 0.8),
+        (r"\b(investment )?thesis\b|\bdeep[- ]dive\b|\bmoat\b", 0.8),
+        (
+            r"\bfundamentals?\b|\bfundamental analysis\b|\b10-[kq]\b|\bbusiness (model|quality)\b",
+            0.6,
+        ),
+    ],
+}
+
+# Queries asking for a decision get several specialists' views
+_DECISION = re.compile(
+    r"\bshould i (buy|sell|invest|hold|add|trim)\b|\bis [$a-z]{1,6} a (buy|sell)\b|"
+    r"\bbuy or sell\b|\bgood investment\b"
+)
+
+# Upper-case words that look like tickers but are not
+_NOT_TICKERS = {
+    "A",
+    "I",
+    "AI",
+    "ALL",
+    "AM",
+    "AN",
+    "AND",
+    "ARE",
+    "AT",
+    "BE",
+    "BUY",
+    "CEO",
+    "CFO",
+    "CPI",
+    "DCF",
+    "EPS",
+    "ETF",
+    "ETFS",
+    "EV",
+    "FOR",
+    "GDP",
+    "HOLD",
+    "IN",
+    "IPO",
+    "IRA",
+    "IS",
+    "IT",
+    "ME",
+    "MY",
+    "OF",
+    "ON",
+    "OR",
+    "PCE",
+    "PE",
+    "Q1",
+    "Q2",
+    "Q3",
+    "Q4",
+    "SEC",
+    "SELL",
+    "THE",
+    "TO",
+    "US",
+    "USA",
+    "USD",
+    "VAR",
+    "WHAT",
+    "YTD",
+}
+_TICKER = re.compile(r"\$([A-Za-z]{1,5})\b|\b([A-Z]{1,5})\b")
+
+
+class IntentMatch(NamedTuple):
+    """Result of classifying one query."""
+
+    agent: Optional[str]  # Agent pool name, or None when the LLM should decide
+    confidence: float  # 0-1 confidence that ``agent`` alone can answer
+    tickers: Tuple[str, ...]
+    reason: str
+
+
+def detect_tickers(query: str) -> Tuple[str, ...]:
+    """Find ticker symbols in a query ($AAPL, or bare upper-case AAPL).
+
+    Args:
+        query: User query
+
+    Returns:
+        Unique tickers in order of appearance
+    """
+    found: List[str] = []
+    for cashtag, bare in _TICKER.findall(query):
+        symbol = (cashtag or bare).upper()
+        if (cashtag or symbol not in _NOT_TICKERS) and symbol not in found:
+            found.append(symbol)
+    return tuple(found)
+
+
+def _scores(text: str) -> Dict[str, Tuple[float, List[str]]]:
+    scores = {}
+    for agent, rules in _RULES.items():
+        miss = 1.0
+        matched = []
+        for pattern, weight in rules:
+            match = re.search(pattern, text)
+            if match:
+                miss *= 1 - weight
+                matched.append(match.group(0))
+        if matched:
+            scores[agent] = (1 - miss, matched)
+    return scores
+
+
+def classify_intent(query: str) -> IntentMatch:
+    """Classify a query to a single specialist when the rules are confident.
+
+    Confidence is the top agent's score discounted by the runner-up's, so a
+    query that also matches another specialist strongly falls back to the
+    LLM supervisor, which can coordinate several agents.
+
+    Args:
+        query: User query
+
+    Returns:
+        IntentMatch with the chosen agent (or None) and its confidence
+    """
+    text = query.lower()
+    tickers = detect_tickers(query)
+
+    if _DECISION.search(text):
+        match = IntentMatch(
+            None, 0.0, tickers, "decision question needs several specialists"
+        )
+    else:
+        scores = _scores(text)
+        if not scores:
+            match = IntentMatch(None, 0.0, tickers, "no rule matched")
+        else:
+            ranked = sorted(scores.items(), key=lambda item: item[1][0], reverse=True)
+            agent, (top, matched) = ranked[0]
+            runner_up = ranked[1][1][0] if len(ranked) > 1 else 0.0
+            confidence = round(top * (1 - runner_up), 3)
+            reason = f"matched {', '.join(repr(m) for m in matched)}"
+            if len(ranked) > 1:
+                reason += f"; runner-up {ranked[1][0]} ({runner_up:.2f})"
+            match = IntentMatch(agent, confidence, tickers, reason)
+
+    logger.info(
+        "Intent %s (confidence %.2f, tickers %s): %s",
+        match.agent or "llm",
+        match.confidence,
+        ",".join(match.tickers) or "-",
+        match.reason,
+    )
+    return match
+
+
+def fast_path_agent(query: str, threshold: float) -> Tuple[Optional[str], IntentMatch]:
+    """Return the agent to call directly, or None to use the LLM supervisor.
+
+    Args:
+        query: User query
+        threshold: Minimum confidence for the fast path
+
+    Returns:
+        Tuple of (agent or None, the underlying IntentMatch)
+    """
+    match = classify_intent(query)
+    agent = match.agent if match.agent and match.confidence >= threshold else None
+    return agent, match
+
+
+def evaluate_intents(
+    labeled: Iterable[Tuple[str, Optional[str]]], threshold: float
+) -> Dict[str, float]:
+    """Measure the fast path against labeled queries.
+
+    Args:
+        labeled: (query, expected agent) pairs; None marks queries that need
+            the LLM supervisor (multi-agent, decisions, ambiguous)
+        threshold: Fast-path confidence threshold
+
+    Returns:
+        Dictionary with the query count, how many took the fast path, how many
+        of those were routed correctly (precision), the share of queries
+        answered without the supervisor (coverage) and the supervisor LLM
+        calls saved (two per fast-path query: routing and final answer)
+    """
+    pairs: Sequence[Tuple[str, Optional[str]]] = list(labeled)
+    fast = correct = 0
+    for query, expected in pairs:
+        agent, _ = fast_path_agent(query, threshold)
+        if agent is not None:
+            fast += 1
+            correct += agent == expected
+    total = len(pairs)
+    return {
+        "queries": total,
+        "fast_path": fast,
+        "correct": correct,
+        "precision": correct / fast if fast else 1.0,
+        "coverage": fast / total if total else 0.0,
+        "llm_calls_saved": 2 * fast,
+    }
@@ -80,6 +80,9 @@ Your role is to:
 - Yield Spreads: `get_treasury_yield_spread` - Key spreads (10Y-2Y, 10Y-3M)
 - Debt/GDP: `get_debt_to_gdp` - Fiscal health metric
 
+**Available Market Data**:
+- Indices: `get_market_indices` - S&P 500, Dow, Nasdaq, Russell 2000, VIX; pass `include_sectors=true` for the sector ETFs (XLK, XLF, XLE, ...) to check sector leadership
+
 **Available News Tools**:
 - Market News: `search_market_news` - Search by topic (inflation, Fed policy, recession)
 - Top Headlines: `get_top_financial_headlines` - Latest market-moving news
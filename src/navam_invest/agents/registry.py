@@ -0,0 +1,186 @@
+"""Shared pool of specialist agent instances.
+
+The router's ``route_to_*`` tools and the TUI's manual agent commands both draw
+from one pool, so every specialist graph (and its LLM client) exists at most
+once per process. Agents are built on first use; agent modules are imported
+only when their agent is built.
+"""
+
+import asyncio
+import importlib
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+# Pool name -> (module, factory) of every specialist agent
+AGENT_FACTORIES: Dict[str, Tuple[str, str]] = {
+    "portfolio": ("navam_invest.agents.portfolio", "create_portfolio_agent"),
+    "research": ("navam_invest.agents.research", "create_research_agent"),
+    "quill": ("navam_invest.agents.quill", "create_quill_agent"),
+    "screen_forge": ("navam_invest.agents.screen_forge", "create_screen_forge_agent"),
+    "macro_lens": ("navam_invest.agents.macro_lens", "create_macro_lens_agent"),
+    "earnings_whisperer": (
+        "navam_invest.agents.earnings_whisperer",
+        "create_earnings_whisperer_agent",
+    ),
+    "news_sentry": ("navam_invest.agents.news_sentry", "create_news_sentry_agent"),
+    "risk_shield": ("navam_invest.agents.risk_shield", "create_risk_shield_agent"),
+    "tax_scout": ("navam_invest.agents.tax_scout", "create_tax_scout_agent"),
+    "hedge_smith": ("navam_invest.agents.hedge_smith", "create_hedge_smith_agent"),
+}
+
+
+def _import_factory(name: str) -> Callable[[], Awaitable[Any]]:
+    module, factory = AGENT_FACTORIES[name]
+    return cast(
+        Callable[[], Awaitable[Any]], getattr(importlib.import_module(module), factory)
+    )
+
+
+class AgentPool:
+    """Build-once cache of compiled specialist agents.
+
+    Concurrent requests for an agent that is still being built wait for the
+    same build instead of starting another one.
+    """
+
+    def __init__(
+        self,
+        factories: Optional[Dict[str, Callable[[], Awaitable[Any]]]] = None,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            factories: Optional overrides of the agent factories by pool name;
+                agents without an override use ``AGENT_FACTORIES``
+        """
+        self._factories = dict(factories or {})
+        self._agents: Dict[str, Any] = {}
+        self._builds = 0
+        # Build locks per (event loop, agent name)
+        self._locks: weakref.WeakKeyDictionary[Any, Dict[str, asyncio.Lock]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def names(self) -> List[str]:
+        """Names of all agents the pool can build."""
+        return list(AGENT_FACTORIES)
+
+    @property
+    def instance_count(self) -> int:
+        """Number of agent instances currently held by the pool."""
+        return len(self._agents)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._agents
+
+    def _factory(self, name: str) -> Callable[[], Awaitable[Any]]:
+        if name not in AGENT_FACTORIES:
+            raise KeyError(
+                f"Unknown agent '{name}'. Choose from: {', '.join(AGENT_FACTORIES)}"
+            )
+        return self._factories.get(name) or _import_factory(name)
+
+    async def get(self, name: str) -> Any:
+        """Return the agent, building it on first use.
+
+        Args:
+            name: Pool name of the agent (e.g. "quill", "macro_lens")
+
+        Returns:
+            Compiled agent graph
+
+        Raises:
+            KeyError: If ``name`` is not a known agent
+        """
+        agent = self._agents.get(name)
+        if agent is not None:
+            return agent
+
+        factory = self._factory(name)
+        loop = asyncio.get_running_loop()
+        lock = self._locks.setdefault(loop, {}).setdefault(name, asyncio.Lock())
+        async with lock:
+            agent = self._agents.get(name)
+            if agent is None:
+                agent = await factory()
+                self._agents[name] = agent
+                self._builds += 1
+        return agent
+
+    async def warm_up(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """Build agents ahead of use, one at a time.
+
+        Failures are skipped; the same error is raised again when the agent
+        is requested through ``get``.
+
+        Args:
+            names: Agents to build (default: all)
+
+        Returns:
+            Names of the agents that failed to build
+        """
+        failed = []
+        for name in names or self.names:
+            try:
+                await self.get(name)
+            except Exception:
+                failed.append(name)
+            # Yield between builds so other tasks keep running
+            await asyncio.sleep(0)
+        return failed
+
+    def release(self, name: str) -> bool:
+        """Drop an agent from the pool; it is rebuilt on next use.
+
+        Args:
+            name: Pool name of the agent
+
+        Returns:
+            True if an instance was released
+        """
+        return self._agents.pop(name, None) is not None
+
+    def clear(self) -> None:
+        """Release every agent instance."""
+        self._agents.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Report pool contents.
+
+        Returns:
+            Dictionary with the live instance count, the built agent names,
+            the agents not built yet and the total number of builds
+        """
+        return {
+            "instances": self.instance_count,
+            "built": [name for name in self.names if name in self._agents],
+            "pending": [name for name in self.names if name not in self._agents],
+            "builds": self._builds,
+        }
+
+
+# Global pool instance
+_agent_pool: Optional[AgentPool] = None
+
+
+def get_agent_pool() -> AgentPool:
+    """Get or create the global agent pool.
+
+    Returns:
+        Shared AgentPool instance
+    """
+    global _agent_pool
+    if _agent_pool is None:
+        _agent_pool = AgentPool()
+    return _agent_pool
@@ -97,7 +97,7 @@ async def create_risk_shield_agent() -> StateGraph:
             "- **CRITICAL (9-10)**: Extreme concentration, excessive volatility, severe drawdown risk\n\n"
             "**Tools Available:**\n"
             "- **Portfolio Data**: Current holdings, positions, weights, cost basis\n"
-            "- **Market Data**: Real-time quotes, historical prices, volatility indices (VIX)\n"
+            "- **Market Data**: Real-time quotes (get_quotes prices all holdings in one call), historical prices, volatility indices (VIX)\n"
             "- **Fundamentals**: Financial statements, ratios, beta, correlation data\n"
             "- **Macro Indicators**: Interest rates, yield curves, economic indicators (FRED)\n"
             "- **Historical Returns**: Multi-year return history for risk calculations\n\n"
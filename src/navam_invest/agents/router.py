@@ -5,145 +5,89 @@ Coordinates multi-agent responses for complex queries.
 """
 
 import asyncio
-from typing import Annotated, TypedDict, Optional
+import contextvars
+import operator
+from typing import Annotated, Any, Dict, List, Optional, TypedDict
 
 from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
-from langgraph.prebuilt import create_react_agent
+from langgraph.graph import END, START, StateGraph, add_messages
 
+from navam_invest.agents.intent import fast_path_agent
+from navam_invest.agents.registry import get_agent_pool
 from navam_invest.config.settings import get_settings
-from navam_invest.agents.portfolio import create_portfolio_agent
-from navam_invest.agents.research import create_research_agent
-from navam_invest.agents.quill import create_quill_agent
-from navam_invest.agents.screen_forge import create_screen_forge_agent
-from navam_invest.agents.macro_lens import create_macro_lens_agent
-from navam_invest.agents.earnings_whisperer import create_earnings_whisperer_agent
-from navam_invest.agents.news_sentry import create_news_sentry_agent
-from navam_invest.agents.risk_shield import create_risk_shield_agent
-from navam_invest.agents.tax_scout import create_tax_scout_agent
-from navam_invest.agents.hedge_smith import create_hedge_smith_agent
-
-
-# Global agent instances (initialized once)
-_portfolio_agent = None
-_research_agent = None
-_quill_agent = None
-_screen_forge_agent = None
-_macro_lens_agent = None
-_earnings_whisperer_agent = None
-_news_sentry_agent = None
-_risk_shield_agent = None
-_tax_scout_agent = None
-_hedge_smith_agent = None
-
-# Global streaming event queue for progressive disclosure
-# Format: {"type": "tool_call"|"tool_complete"|"error", "agent": str, "tool_name": str, "args": dict, ...}
-_streaming_queue: Optional[asyncio.Queue] = None
-
-
-def set_streaming_queue(queue: asyncio.Queue) -> None:
-    """Set the global streaming queue for progressive disclosure.
-
-    Args:
-        queue: AsyncIO queue for streaming sub-agent tool call events
-    """
-    global _streaming_queue
-    _streaming_queue = queue
-
-
-def get_streaming_queue() -> Optional[asyncio.Queue]:
-    """Get the global streaming queue.
-
-    Returns:
-        The streaming queue if set, None otherwise
-    """
-    return _streaming_queue
+from navam_invest.utils.event_bus import (
+    AGENT_END,
+    AGENT_START,
+    ERROR,
+    TOOL_END,
+    TOOL_START,
+    get_event_bus,
+)
+
+# Set by _dispatch_call: specialists that already published their own ERROR
+# event, so the dispatch does not report the same failure twice
+_reported_errors: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "navam_reported_errors", default=None
+)
 
 
 async def _get_portfolio_agent():
-    """Get or create Portfolio agent instance."""
-    global _portfolio_agent
-    if _portfolio_agent is None:
-        _portfolio_agent = await create_portfolio_agent()
-    return _portfolio_agent
+    """Get or create the shared Portfolio agent instance."""
+    return await get_agent_pool().get("portfolio")
 
 
 async def _get_research_agent():
-    """Get or create Research agent instance."""
-    global _research_agent
-    if _research_agent is None:
-        _research_agent = await create_research_agent()
-    return _research_agent
+    """Get or create the shared Research agent instance."""
+    return await get_agent_pool().get("research")
 
 
 async def _get_quill_agent():
-    """Get or create Quill agent instance."""
-    global _quill_agent
-    if _quill_agent is None:
-        _quill_agent = await create_quill_agent()
-    return _quill_agent
+    """Get or create the shared Quill agent instance."""
+    return await get_agent_pool().get("quill")
 
 
 async def _get_screen_forge_agent():
-    """Get or create Screen Forge agent instance."""
-    global _screen_forge_agent
-    if _screen_forge_agent is None:
-        _screen_forge_agent = await create_screen_forge_agent()
-    return _screen_forge_agent
+    """Get or create the shared Screen Forge agent instance."""
+    return await get_agent_pool().get("screen_forge")
 
 
 async def _get_macro_lens_agent():
-    """Get or create Macro Lens agent instance."""
-    global _macro_lens_agent
-    if _macro_lens_agent is None:
-        _macro_lens_agent = await create_macro_lens_agent()
-    return _macro_lens_agent
+    """Get or create the shared Macro Lens agent instance."""
+    return await get_agent_pool().get("macro_lens")
 
 
 async def _get_earnings_whisperer_agent():
-    """Get or create Earnings Whisperer agent instance."""
-    global _earnings_whisperer_agent
-    if _earnings_whisperer_agent is None:
-        _earnings_whisperer_agent = await create_earnings_whisperer_agent()
-    return _earnings_whisperer_agent
+    """Get or create the shared Earnings Whisperer agent instance."""
+    return await get_agent_pool().get("earnings_whisperer")
 
 
 async def _get_news_sentry_agent():
-    """Get or create News Sentry agent instance."""
-    global _news_sentry_agent
-    if _news_sentry_agent is None:
-        _news_sentry_agent = await create_news_sentry_agent()
-    return _news_sentry_agent
+    """Get or create the shared News Sentry agent instance."""
+    return await get_agent_pool().get("news_sentry")
 
 
 async def _get_risk_shield_agent():
-    """Get or create Risk Shield agent instance."""
-    global _risk_shield_agent
-    if _risk_shield_agent is None:
-        _risk_shield_agent = await create_risk_shield_agent()
-    return _risk_shield_agent
+    """Get or create the shared Risk Shield agent instance."""
+    return await get_agent_pool().get("risk_shield")
 
 
 async def _get_tax_scout_agent():
-    """Get or create Tax Scout agent instance."""
-    global _tax_scout_agent
-    if _tax_scout_agent is None:
-        _tax_scout_agent = await create_tax_scout_agent()
-    return _tax_scout_agent
+    """Get or create the shared Tax Scout agent instance."""
+    return await get_agent_pool().get("tax_scout")
 
 
 async def _get_hedge_smith_agent():
-    """Get or create Hedge Smith agent instance."""
-    global _hedge_smith_agent
-    if _hedge_smith_agent is None:
-        _hedge_smith_agent = await create_hedge_smith_agent()
-    return _hedge_smith_agent
+    """Get or create the shared Hedge Smith agent instance."""
+    return await get_agent_pool().get("hedge_smith")
 
 
-# Helper function to stream agent execution and push events to queue
+# Helper function to stream agent execution and publish progress events
 async def _stream_agent_with_tool_log(agent, query: str, agent_name: str = "Unknown") -> str:
-    """Stream agent execution and push tool call events to global queue for progressive disclosure.
+    """Stream agent execution and publish tool start/finish events for progressive disclosure.
 
     Args:
         agent: The LangGraph agent to stream
@@ -155,45 +99,64 @@ async def _stream_agent_with_tool_log(agent, query: str, agent_name: str = "Unkn
     """
     tool_calls_log = []
     final_response = ""
-    queue = get_streaming_queue()
-
-    async for event in agent.astream(
-        {"messages": [HumanMessage(content=query)]},
-        stream_mode=["values", "updates"]
-    ):
-        if isinstance(event, tuple) and len(event) == 2:
-            event_type, event_data = event
-
-            # Collect tool call information and push to queue immediately
-            if event_type == "updates":
-                for node_name, node_output in event_data.items():
-                    if node_name == "agent" and "messages" in node_output:
-                        for msg in node_output["messages"]:
-                            if hasattr(msg, "tool_calls") and msg.tool_calls:
-                                for tool_call in msg.tool_calls:
-                                    tool_name = tool_call.get("name", "unknown")
-                                    tool_args = tool_call.get("args", {})
-                                    tool_call_str = f"→ {tool_name}({tool_args})"
-                                    tool_calls_log.append(tool_call_str)
-
-                                    # Push event to queue for immediate TUI display
-                                    if queue:
-                                        try:
-                                            await queue.put({
-                                                "type": "tool_call",
-                                                "agent": agent_name,
-                                                "tool_name": tool_name,
-                                                "args": tool_args,
-                                            })
-                                        except Exception:
-                                            pass  # Don't break execution if queue fails
-
-            # Capture final response
-            elif event_type == "values":
-                if "messages" in event_data and event_data["messages"]:
-                    last_msg = event_data["messages"][-1]
-                    if hasattr(last_msg, "content") and last_msg.content:
-                        final_response = last_msg.content
+    bus = get_event_bus()
+    loop = asyncio.get_running_loop()
+    tool_starts: Dict[str, float] = {}  # tool_call_id -> start time
+
+    try:
+        async for event in agent.astream(
+            {"messages": [HumanMessage(content=query)]},
+            stream_mode=["values", "updates"]
+        ):
+            if isinstance(event, tuple) and len(event) == 2:
+                event_type, event_data = event
+
+                # Collect tool call information and publish it immediately
+                if event_type == "updates":
+                    for node_name, node_output in event_data.items():
+                        if node_name == "agent" and "messages" in node_output:
+                            for msg in node_output["messages"]:
+                                if hasattr(msg, "tool_calls") and msg.tool_calls:
+                                    for tool_call in msg.tool_calls:
+                                        tool_name = tool_call.get("name", "unknown")
+                                        tool_args = tool_call.get("args", {})
+                                        tool_call_str = f"→ {tool_name}({tool_args})"
+                                        tool_calls_log.append(tool_call_str)
+                                        tool_starts[tool_call.get("id", "")] = loop.time()
+
+                                        await bus.publish(
+                                            TOOL_START,
+                                            agent=agent_name,
+                                            tool=tool_name,
+                                            data={"args": tool_args},
+                                        )
+
+                        elif node_name == "tools" and "messages" in node_output:
+                            for msg in node_output["messages"]:
+                                if not isinstance(msg, ToolMessage):
+                                    continue
+                                start = tool_starts.pop(msg.tool_call_id, None)
+                                failed = msg.status == "error" or str(msg.content).startswith("Error")
+                                await bus.publish(
+                                    TOOL_END,
+                                    agent=agent_name,
+                                    tool=msg.name,
+                                    seconds=None if start is None else loop.time() - start,
+                                    status="error" if failed else "ok",
+                                )
+
+                # Capture final response
+                elif event_type == "values":
+                    if "messages" in event_data and event_data["messages"]:
+                        last_msg = event_data["messages"][-1]
+                        if hasattr(last_msg, "content") and last_msg.content:
+                            final_response = last_msg.content
+    except Exception as e:
+        await bus.publish(ERROR, agent=agent_name, data={"message": str(e)})
+        reported = _reported_errors.get()
+        if reported is not None:
+            reported.append(agent_name)
+        raise
 
     # Return response with tool call log prefix (for fallback/debugging)
     if tool_calls_log:
@@ -451,7 +414,92 @@ async def route_to_research(query: str) -> str:
         return f"Error: Research agent failed - {str(e)}"
 
 
-async def create_router_agent():
+ROUTE_TOOLS = [
+    route_to_quill,
+    route_to_screen_forge,
+    route_to_macro_lens,
+    route_to_earnings_whisperer,
+    route_to_news_sentry,
+    route_to_risk_shield,
+    route_to_tax_scout,
+    route_to_hedge_smith,
+    route_to_portfolio,  # Fallback
+    route_to_research,  # Fallback
+]
+
+
+class RouterState(TypedDict):
+    """State for the router supervisor."""
+
+    messages: Annotated[list, add_messages]
+    # One record per dispatch turn: {"wall_clock": seconds, "agents": [...]}
+    dispatches: Annotated[list, operator.add]
+    # Pre-classifier result: {"agent", "confidence", "reason", "fast_path"}
+    intent: Dict[str, Any]
+
+
+def summarize_dispatches(dispatches: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine per-turn dispatch records into response metadata.
+
+    Args:
+        dispatches: Records written by the router's dispatch node
+
+    Returns:
+        Dictionary with the number of dispatch turns, the wall-clock time spent
+        running specialists, the summed per-agent time (what a sequential run
+        would have taken) and every agent's own latency
+    """
+    agents = [agent for turn in dispatches for agent in turn["agents"]]
+    return {
+        "turns": len(dispatches),
+        "wall_clock_seconds": round(sum(turn["wall_clock"] for turn in dispatches), 3),
+        "agent_seconds": round(sum(agent["seconds"] for agent in agents), 3),
+        "agents": agents,
+    }
+
+
+async def _dispatch_call(call: Dict[str, Any], config: RunnableConfig) -> tuple:
+    """Run one route_to_* call and time it.
+
+    Returns:
+        Tuple of (ToolMessage, latency record)
+    """
+    name = call["name"]
+    agent = name[len("route_to_"):] if name.startswith("route_to_") else name
+    bus = get_event_bus()
+    query = call["args"].get("query", "")
+    await bus.publish(AGENT_START, agent=agent, data={"query": query})
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    route_tool = next((t for t in ROUTE_TOOLS if t.name == name), None)
+    reported: List[str] = []
+    token = _reported_errors.set(reported)
+    try:
+        if route_tool is None:
+            content = f"Error: unknown agent tool '{name}'"
+        else:
+            try:
+                content = await route_tool.ainvoke(call["args"], config)
+            except Exception as e:  # e.g. malformed arguments from the model
+                content = f"Error: {name} failed - {str(e)}"
+    finally:
+        _reported_errors.reset(token)
+
+    seconds = loop.time() - start
+    status = "error" if str(content).startswith("Error:") else "ok"
+
+    if status == "error" and not reported:
+        error = str(content)[len("Error:") :].strip()
+        await bus.publish(ERROR, agent=agent, data={"message": error})
+    await bus.publish(AGENT_END, agent=agent, seconds=seconds, status=status)
+
+    message = ToolMessage(content=content, name=name, tool_call_id=call["id"])
+    record = {"agent": agent, "seconds": round(seconds, 3), "status": status}
+    return message, record
+
+
+async def create_router_agent(llm: Optional[BaseChatModel] = None):
     """Create router supervisor agent for intent-based routing.
 
     The router analyzes user queries and automatically routes to appropriate
@@ -461,13 +509,27 @@ async def create_router_agent():
     - Fallback handling for ambiguous queries
     - Transparent routing (explains which agents are used)
 
+    All specialist calls the supervisor issues in one turn run concurrently,
+    at most ``router_max_parallel_agents`` at a time. The final message's
+    ``response_metadata["agent_dispatch"]`` reports wall-clock and per-agent
+    latency.
+
+    With ``router_fast_path`` enabled, a rule-based pre-classifier runs first;
+    queries it assigns to one specialist with at least
+    ``router_fast_path_threshold`` confidence go straight to that specialist
+    without any supervisor LLM call. ``response_metadata["intent"]`` on the
+    final message records the classification.
+
+    Args:
+        llm: Chat model for the supervisor (default: Anthropic model from settings)
+
     Returns:
         Compiled router agent with all specialist agent tools
     """
     settings = get_settings()
 
     # Use a powerful model for routing decisions with low temperature for consistency
-    supervisor_llm = ChatAnthropic(
+    supervisor_llm = llm or ChatAnthropic(
         model=settings.anthropic_model,
         api_key=settings.anthropic_api_key,
         temperature=0.1,  # Low temperature for consistent intent classification
@@ -511,7 +573,7 @@ Intent Classification Examples:
 
 Coordination Strategies:
 - **Single-agent queries**: Route directly to the most appropriate specialist
-- **Multi-faceted queries**: You can call 2-3 relevant agents and synthesize their responses
+- **Multi-faceted queries**: You can call 2-3 relevant agents and synthesize their responses. Issue all independent agent calls in the same turn - they run in parallel
 - **Ambiguous queries**: Route to Portfolio (general) or ask clarifying questions
 - **Complex workflows**: Sequence agents if needed (e.g., Screen Forge results → Quill analysis)
 
@@ -525,31 +587,137 @@ Important Guidelines:
 
 Remember: Your goal is to provide the best possible investment advice by intelligently coordinating specialist agents."""
 
-    # Create supervisor with all agent tools and system prompt
-    from langchain_core.prompts import ChatPromptTemplate
-
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", system_prompt),
-            ("placeholder", "{messages}"),
-        ]
-    )
-
-    router = create_react_agent(
-        model=supervisor_llm,
-        tools=[
-            route_to_quill,
-            route_to_screen_forge,
-            route_to_macro_lens,
-            route_to_earnings_whisperer,
-            route_to_news_sentry,
-            route_to_risk_shield,
-            route_to_tax_scout,
-            route_to_hedge_smith,
-            route_to_portfolio,  # Fallback
-            route_to_research,  # Fallback
-        ],
-        prompt=prompt,
+    llm_with_tools = supervisor_llm.bind_tools(ROUTE_TOOLS)
+    max_parallel = max(1, settings.router_max_parallel_agents)
+
+    def classify(state: RouterState) -> dict:
+        """Pre-classify the latest user query with local rules."""
+        query = next(
+            (m.content for m in reversed(state["messages"]) if isinstance(m, HumanMessage)),
+            "",
+        )
+        agent, match = fast_path_agent(str(query), settings.router_fast_path_threshold)
+        return {
+            "intent": {
+                "agent": match.agent,
+                "confidence": match.confidence,
+                "tickers": list(match.tickers),
+                "reason": match.reason,
+                "fast_path": agent is not None,
+            }
+        }
+
+    def route_intent(state: RouterState) -> str:
+        return "fast_path" if state["intent"]["fast_path"] else "agent"
+
+    async def fast_path(state: RouterState, config: RunnableConfig) -> dict:
+        """Answer with the pre-classified specialist, skipping the supervisor.
+
+        If the specialist fails, the supervisor takes over as usual.
+        """
+        intent = state["intent"]
+        query = next(
+            m.content for m in reversed(state["messages"]) if isinstance(m, HumanMessage)
+        )
+        call = {
+            "name": f"route_to_{intent['agent']}",
+            "args": {"query": query},
+            "id": "fast_path",
+        }
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tool_message, record = await _dispatch_call(call, config)
+        turn = {"wall_clock": round(loop.time() - start, 3), "agents": [record]}
+
+        if record["status"] != "ok":
+            return {"dispatches": [turn], "intent": {**intent, "fast_path": False}}
+
+        # Drop the [TOOL CALLS] log the specialist wrapper prepends
+        content = str(tool_message.content)
+        if content.startswith("[TOOL CALLS]") and "[ANALYSIS]\n" in content:
+            content = content.split("[ANALYSIS]\n", 1)[1]
+        response = AIMessage(
+            content=content,
+            response_metadata={
+                "intent": intent,
+                "agent_dispatch": summarize_dispatches([turn]),
+            },
+        )
+        return {"messages": [response], "dispatches": [turn]}
+
+    def after_fast_path(state: RouterState) -> str:
+        return END if state["intent"]["fast_path"] else "agent"
+
+    async def call_model(state: RouterState, config: RunnableConfig) -> dict:
+        """Ask the supervisor which specialists to call, or for the final answer."""
+        messages = [SystemMessage(content=system_prompt)] + state["messages"]
+        response = await llm_with_tools.ainvoke(messages, config)
+
+        dispatches = state.get("dispatches") or []
+        if dispatches and not getattr(response, "tool_calls", None):
+            response.response_metadata["agent_dispatch"] = summarize_dispatches(
+                dispatches
+            )
+            if state.get("intent"):
+                response.response_metadata["intent"] = state["intent"]
+        return {"messages": [response]}
+
+    async def dispatch_agents(state: RouterState, config: RunnableConfig) -> dict:
+        """Run every specialist requested in the last turn concurrently.
+
+        Calls beyond the concurrency cap wait for a free slot. If the run is
+        cancelled, all in-flight specialist calls are cancelled with it.
+        """
+        calls = state["messages"][-1].tool_calls
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def run(call: Dict[str, Any]) -> tuple:
+            async with semaphore:
+                return await _dispatch_call(call, config)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tasks = [asyncio.ensure_future(run(call)) for call in calls]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        messages = [message for message, _ in results]
+        turn = {
+            "wall_clock": round(loop.time() - start, 3),
+            "agents": [record for _, record in results],
+        }
+        return {"messages": messages, "dispatches": [turn]}
+
+    def should_continue(state: RouterState) -> str:
+        last_message = state["messages"][-1]
+        if hasattr(last_message, "tool_calls") and last_message.tool_calls:
+            return "tools"
+        return END
+
+    # Build graph (node names match the prebuilt ReAct agent used previously)
+    workflow = StateGraph(RouterState)
+    workflow.add_node("agent", call_model)
+    workflow.add_node("tools", dispatch_agents)
+    if settings.router_fast_path:
+        workflow.add_node("classify", classify)
+        workflow.add_node("fast_path", fast_path)
+        workflow.add_edge(START, "classify")
+        workflow.add_conditional_edges(
+            "classify", route_intent, {"fast_path": "fast_path", "agent": "agent"}
+        )
+        workflow.add_conditional_edges(
+            "fast_path", after_fast_path, {"agent": "agent", END: END}
+        )
+    else:
+        workflow.add_edge(START, "agent")
+    workflow.add_conditional_edges(
+        "agent", should_continue, {"tools": "tools", END: END}
     )
+    workflow.add_edge("tools", "agent")
 
-    return router
+    return workflow.compile()
@@ -105,7 +105,7 @@ Your expertise includes:
 
 **Data Requirements**:
 - Portfolio holdings with cost basis, purchase dates, and lot information
-- Current market prices for unrealized gain/loss calculations
+- Current market prices for unrealized gain/loss calculations (get_quotes prices every holding in one call)
 - Transaction history for wash-sale monitoring
 - User's tax bracket and filing status for personalized recommendations
 
@@ -5,13 +5,31 @@ Provides intelligent caching to reduce API calls and improve performance.
 """
 
 from navam_invest.cache.manager import (
+    CachedFunction,
+    CacheLookup,
     CacheManager,
     cached,
     get_cache_manager,
 )
+from navam_invest.cache.price_store import PriceStore, get_price_store
+from navam_invest.cache.ticker_index import (
+    CompanyEntry,
+    TickerIndex,
+    get_ticker_index,
+)
+from navam_invest.cache.xbrl_store import XbrlFactStore, get_xbrl_store
 
 __all__ = [
+    "CachedFunction",
+    "CacheLookup",
     "CacheManager",
+    "CompanyEntry",
+    "PriceStore",
+    "TickerIndex",
+    "XbrlFactStore",
     "cached",
     "get_cache_manager",
+    "get_price_store",
+    "get_ticker_index",
+    "get_xbrl_store",
 ]
@@ -6,14 +6,6 @@ improving initial user experience by reducing API calls.
 
 from typing import Any
 
-# Import all cached tool functions
-from navam_invest.tools.yahoo_finance import (
-    _get_quote_cached,
-    _get_market_indices_cached,
-    _get_company_info_cached,
-)
-from navam_invest.tools.treasury import _get_treasury_yield_curve_cached
-from navam_invest.tools.fred import _get_economic_indicator_cached
 from navam_invest.config.settings import get_settings
 
 
@@ -24,6 +16,15 @@ def get_common_queries() -> list[dict[str, Any]]:
     Returns:
         List of query dictionaries for cache warming
     """
+    # Imported here so that importing this module does not load yfinance
+    from navam_invest.tools.fred import _get_economic_indicator_cached
+    from navam_invest.tools.treasury import _get_treasury_yield_curve_cached
+    from navam_invest.tools.yahoo_finance import (
+        _get_info_cached,
+        _market_index_lists,
+        fetch_quotes,
+    )
+
     queries = []
 
     # Get settings for API keys
@@ -34,38 +35,31 @@ def get_common_queries() -> list[dict[str, Any]]:
         # If settings fail, skip FRED queries
         fred_api_key = None
 
-    # 1. Major Market Indices - Most frequently accessed
+    # 1. Major Market Indices - Most frequently accessed. One bulk request
+    # fetches the indices not cached yet and caches each one separately.
+    indices, _ = _market_index_lists()
     queries.append(
         {
             "source": "yahoo_finance",
-            "tool_name": "get_market_indices",
-            "args": (),
+            "tool_name": "fetch_quotes",
+            "args": (list(indices.values()),),
             "kwargs": {},
-            "func": _get_market_indices_cached,
+            "func": fetch_quotes,
+            "store": False,
         }
     )
 
     # 2. Popular Large-Cap Tech Stocks
     popular_stocks = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA"]
     for symbol in popular_stocks:
-        # Quote data
-        queries.append(
-            {
-                "source": "yahoo_finance",
-                "tool_name": "get_quote",
-                "args": (symbol,),
-                "kwargs": {},
-                "func": _get_quote_cached,
-            }
-        )
-        # Company info
+        # Info snapshot (serves quotes, company info and analyst targets)
         queries.append(
             {
-                "source": "yahoo_finance",
-                "tool_name": "get_company_info",
+                "source": "yahoo_info",
+                "tool_name": "_get_info_cached",
                 "args": (symbol,),
                 "kwargs": {},
-                "func": _get_company_info_cached,
+                "func": _get_info_cached,
             }
         )
 
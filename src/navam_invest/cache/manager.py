@@ -5,12 +5,27 @@ Provides intelligent caching with configurable TTL, cache invalidation,
 and statistics tracking to reduce API calls and improve performance.
 """
 
+import atexit
+import concurrent.futures
 import hashlib
 import json
 import logging
-from datetime import datetime, timedelta
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Optional, TypeVar, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 try:
     import duckdb
@@ -19,20 +34,116 @@ except ImportError:
 
 from functools import wraps
 
+from navam_invest.utils.tracing import CACHE, PROVIDER, span
+
 logger = logging.getLogger(__name__)
 
 # Type variable for generic function return types
 T = TypeVar("T")
 
+# Maximum rows per bulk statement when flushing statistics
+_FLUSH_CHUNK_SIZE = 500
+
+
+class WriteBehindQueue:
+    """
+    Coalesces cache statistics deltas in memory until they are flushed.
+
+    Hit/miss/coalesced deltas are keyed by (source, tool_name, date) and hit counter
+    deltas by cache_key, so a burst of lookups on the same keys produces one
+    row per key regardless of how many events were recorded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self.stats: Dict[Tuple[str, str, date], list] = {}
+        self.hits: Dict[str, int] = {}
+        self.events = 0
+
+    def record(
+        self, source: str, tool_name: str, hit: bool, cache_key: Optional[str] = None
+    ) -> None:
+        """
+        Add one hit or miss event.
+
+        Args:
+            source: Data source name
+            tool_name: Tool function name
+            hit: True for cache hit, False for cache miss
+            cache_key: Cache key of the entry that was hit (hits only)
+        """
+        counters = self._counters(source, tool_name)
+        if hit:
+            counters[0] += 1
+            if cache_key is not None:
+                self.hits[cache_key] = self.hits.get(cache_key, 0) + 1
+        else:
+            counters[1] += 1
+        self.events += 1
+
+    def record_coalesced(self, source: str, tool_name: str) -> None:
+        """
+        Add one call that was served by another caller's in-flight fetch.
+
+        Args:
+            source: Data source name
+            tool_name: Tool function name
+        """
+        self._counters(source, tool_name)[2] += 1
+        self.events += 1
+
+    def _counters(self, source: str, tool_name: str) -> list:
+        """Get the [hits, misses, coalesced] counters for today."""
+        return self.stats.setdefault(
+            (source, tool_name, datetime.now().date()), [0, 0, 0]
+        )
+
+    def drain(self) -> "WriteBehindQueue":
+        """Return the pending deltas and reset this queue."""
+        drained = WriteBehindQueue()
+        drained.stats, self.stats = self.stats, {}
+        drained.hits, self.hits = self.hits, {}
+        drained.events, self.events = self.events, 0
+        return drained
+
+    def merge(self, other: "WriteBehindQueue") -> None:
+        """Put deltas back, e.g. after a failed flush."""
+        for stat_key, deltas in other.stats.items():
+            counters = self.stats.setdefault(stat_key, [0, 0, 0])
+            for i, delta in enumerate(deltas):
+                counters[i] += delta
+        for cache_key, hits in other.hits.items():
+            self.hits[cache_key] = self.hits.get(cache_key, 0) + hits
+        self.events += other.events
+
+
+class CacheLookup(NamedTuple):
+    """Result of a cache lookup that may be served stale."""
+
+    value: Any
+    stale: bool
+
+
+class CachedFunction(Protocol[T]):
+    """A function decorated with ``cached``, including its cache helpers."""
+
+    def __call__(self, *args: Any, **kwargs: Any) -> T: ...
+
+    def peek(self, *args: Any, **kwargs: Any) -> Optional[T]: ...
+
+    def prime(self, response: T, *args: Any, **kwargs: Any) -> None: ...
+
 
 class CacheManager:
     """
     Manages API response caching with DuckDB backend.
 
     Features:
+    - Two-tier storage: bounded in-process LRU (L1) in front of DuckDB (L2)
     - Per-source TTL configuration
+    - Per-source stale-while-revalidate grace windows
     - Automatic cache invalidation
-    - Hit/miss statistics tracking
+    - Hit/miss statistics tracking, aggregated in memory and flushed in batches
     - Thread-safe operations
     """
 
@@ -40,6 +151,9 @@ class CacheManager:
         self,
         db_path: Optional[Path] = None,
         default_ttl_seconds: int = 3600,
+        memory_max_entries: int = 1024,
+        stats_flush_threshold: int = 100,
+        stats_flush_interval_seconds: float = 5.0,
     ):
         """
         Initialize cache manager.
@@ -47,6 +161,12 @@ class CacheManager:
         Args:
             db_path: Path to DuckDB database file. If None, uses in-memory DB.
             default_ttl_seconds: Default cache TTL in seconds (1 hour default).
+            memory_max_entries: Maximum entries held in the in-process L1 tier.
+                Set to 0 to disable the memory tier and always read DuckDB.
+            stats_flush_threshold: Number of pending hit/miss events that
+                triggers a batched write of statistics to DuckDB.
+            stats_flush_interval_seconds: Interval of the background timer
+                that flushes pending statistics. Set to 0 to disable the timer.
         """
         if duckdb is None:
             raise ImportError(
@@ -56,11 +176,28 @@ class CacheManager:
         self.db_path = db_path or ":memory:"
         self.default_ttl_seconds = default_ttl_seconds
         self.conn = duckdb.connect(str(self.db_path))
+        self.memory_max_entries = memory_max_entries
+        self.stats_flush_threshold = stats_flush_threshold
+
+        # L1 tier: cache_key -> (response, expires_at), kept in LRU order
+        self._memory: OrderedDict[str, Tuple[Any, datetime]] = OrderedDict()
+
+        # Statistics aggregated in memory until the next flush
+        self._write_behind = WriteBehindQueue()
+
+        # Guards the L1 tier, pending statistics and the DuckDB connection
+        self._lock = threading.RLock()
+
+        # Background timer that flushes statistics periodically
+        self.stats_flush_interval_seconds = stats_flush_interval_seconds
+        self._stop_flusher = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
 
         # Source-specific TTL configuration (in seconds)
         self.source_ttls = {
             # Real-time data - short TTL
             "yahoo_finance": 60,  # 1 minute
+            "yahoo_info": 60,  # 1 minute; per-symbol Ticker.info snapshots
             "finnhub": 60,  # 1 minute
             "alpha_vantage": 300,  # 5 minutes
             "tiingo": 300,  # 5 minutes
@@ -76,7 +213,25 @@ class CacheManager:
             "file_reader": 0,  # Never cache
         }
 
+        # Stale-while-revalidate grace windows (in seconds past expiry).
+        # Entries inside the window are served immediately, tagged as stale,
+        # while the cached decorator refreshes them in the background.
+        self.source_stale_grace = {
+            "yahoo_finance": 300,  # 5 minutes
+            "yahoo_info": 300,  # 5 minutes
+            "finnhub": 300,  # 5 minutes
+        }
+
         self._initialize_schema()
+
+        if stats_flush_interval_seconds > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                name="navam-cache-flusher",
+                daemon=True,
+            )
+            self._flusher.start()
+
         logger.info(
             f"CacheManager initialized with db_path={self.db_path}, "
             f"default_ttl={default_ttl_seconds}s"
@@ -107,11 +262,20 @@ class CacheManager:
                 date DATE NOT NULL,
                 hits INTEGER DEFAULT 0,
                 misses INTEGER DEFAULT 0,
+                coalesced INTEGER DEFAULT 0,
                 PRIMARY KEY (source, tool_name, date)
             )
         """
         )
 
+        # Databases created before request coalescing lack this column
+        self.conn.execute(
+            """
+            ALTER TABLE cache_statistics
+            ADD COLUMN IF NOT EXISTS coalesced INTEGER DEFAULT 0
+        """
+        )
+
         # Create indices for faster lookups
         self.conn.execute(
             """
@@ -174,47 +338,123 @@ class CacheManager:
         Returns:
             Cached response if available, None if cache miss or expired
         """
-        cache_key = self._generate_cache_key(source, tool_name, args, kwargs)
+        result = self.lookup(source, tool_name, args, kwargs, allow_stale=False)
+        return result.value if result is not None else None
 
-        try:
-            result = self.conn.execute(
-                """
-                SELECT response, expires_at
-                FROM cache_entries
-                WHERE cache_key = ? AND expires_at > CURRENT_TIMESTAMP
-            """,
-                [cache_key],
-            ).fetchone()
+    def lookup(
+        self,
+        source: str,
+        tool_name: str,
+        args: tuple,
+        kwargs: dict,
+        allow_stale: bool = True,
+    ) -> Optional[CacheLookup]:
+        """
+        Retrieve cached response, serving expired entries inside the grace window.
 
-            if result:
-                response_json, expires_at = result
+        Args:
+            source: Data source name
+            tool_name: Tool function name
+            args: Positional arguments
+            kwargs: Keyword arguments
+            allow_stale: Whether to return entries that expired less than
+                ``source_stale_grace[source]`` seconds ago
 
-                # Update hit count
-                self.conn.execute(
+        Returns:
+            CacheLookup with the response and whether it is stale, or None on
+            a cache miss
+        """
+        with span(f"cache.get {source}.{tool_name}", CACHE) as traced:
+            result = self._lookup(source, tool_name, args, kwargs, allow_stale)
+            traced.set(hit=result is not None, stale=bool(result and result.stale))
+            return result
+
+    def _lookup(
+        self,
+        source: str,
+        tool_name: str,
+        args: tuple,
+        kwargs: dict,
+        allow_stale: bool,
+        record: bool = True,
+    ) -> Optional[CacheLookup]:
+        """Untraced body of ``lookup``; ``record=False`` skips hit/miss stats."""
+        cache_key = self._generate_cache_key(source, tool_name, args, kwargs)
+        now = datetime.now()
+        grace_cutoff = now - timedelta(seconds=self.source_stale_grace.get(source, 0))
+        threshold = grace_cutoff if allow_stale else now
+
+        with self._lock:
+            # L1: serve hot keys straight from memory
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                response, expires_at = entry
+                if expires_at > threshold:
+                    self._memory.move_to_end(cache_key)
+                    if record:
+                        self._record_statistics(
+                            source, tool_name, hit=True, cache_key=cache_key
+                        )
+                    return CacheLookup(response, expires_at <= now)
+                if expires_at <= grace_cutoff:
+                    del self._memory[cache_key]
+
+            # L2: fall back to DuckDB
+            try:
+                result = self.conn.execute(
                     """
-                    UPDATE cache_entries
-                    SET hits = hits + 1
-                    WHERE cache_key = ?
+                    SELECT response, expires_at
+                    FROM cache_entries
+                    WHERE cache_key = ? AND expires_at > ?
                 """,
-                    [cache_key],
-                )
+                    [cache_key, threshold],
+                ).fetchone()
 
-                # Record cache hit
-                self._record_statistics(source, tool_name, hit=True)
+                if result:
+                    response_json, expires_at = result
+                    response = json.loads(response_json)
 
-                logger.debug(
-                    f"Cache HIT: {source}.{tool_name} (expires: {expires_at})"
-                )
-                return json.loads(response_json)
+                    # Promote to L1 so subsequent hits skip DuckDB
+                    self._remember(cache_key, response, expires_at)
+                    if record:
+                        self._record_statistics(
+                            source, tool_name, hit=True, cache_key=cache_key
+                        )
 
-            # Record cache miss
-            self._record_statistics(source, tool_name, hit=False)
-            logger.debug(f"Cache MISS: {source}.{tool_name}")
-            return None
+                    stale = expires_at <= now
+                    logger.debug(
+                        f"Cache {'STALE ' if stale else ''}HIT: {source}.{tool_name} "
+                        f"(expires: {expires_at})"
+                    )
+                    return CacheLookup(response, stale)
 
-        except Exception as e:
-            logger.error(f"Cache retrieval error: {e}", exc_info=True)
-            return None
+                # Record cache miss
+                if record:
+                    self._record_statistics(source, tool_name, hit=False)
+                logger.debug(f"Cache MISS: {source}.{tool_name}")
+                return None
+
+            except Exception as e:
+                logger.error(f"Cache retrieval error: {e}", exc_info=True)
+                return None
+
+    def _remember(self, cache_key: str, response: Any, expires_at: datetime) -> None:
+        """
+        Store an entry in the L1 memory tier, evicting least recently used keys.
+
+        Args:
+            cache_key: Cache key
+            response: Decoded response
+            expires_at: Expiration timestamp of the entry
+        """
+        if self.memory_max_entries <= 0:
+            return
+
+        self._memory[cache_key] = (response, expires_at)
+        self._memory.move_to_end(cache_key)
+
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
 
     def set(
         self,
@@ -234,6 +474,18 @@ class CacheManager:
             kwargs: Keyword arguments
             response: Response to cache
         """
+        with span(f"cache.set {source}.{tool_name}", CACHE):
+            self._store(source, tool_name, args, kwargs, response)
+
+    def _store(
+        self,
+        source: str,
+        tool_name: str,
+        args: tuple,
+        kwargs: dict,
+        response: Any,
+    ) -> None:
+        """Untraced body of ``set``."""
         # Check if this source should be cached
         ttl_seconds = self.source_ttls.get(source, self.default_ttl_seconds)
 
@@ -256,74 +508,152 @@ class CacheManager:
         try:
             # Serialize response
             response_json = json.dumps(response, default=str)
+        except Exception as e:
+            logger.error(f"Cache storage error: {e}", exc_info=True)
+            return
 
-            # Upsert cache entry
-            self.conn.execute(
-                """
-                INSERT INTO cache_entries (
-                    cache_key, source, tool_name, args_hash,
-                    response, created_at, expires_at, hits
+        with self._lock:
+            # Keep L1 consistent with what L2 would return
+            self._remember(cache_key, json.loads(response_json), expires_at)
+
+            try:
+                # Upsert cache entry
+                self.conn.execute(
+                    """
+                    INSERT INTO cache_entries (
+                        cache_key, source, tool_name, args_hash,
+                        response, created_at, expires_at, hits
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+                    ON CONFLICT (cache_key)
+                    DO UPDATE SET
+                        response = excluded.response,
+                        created_at = excluded.created_at,
+                        expires_at = excluded.expires_at
+                """,
+                    [
+                        cache_key,
+                        source,
+                        tool_name,
+                        args_hash,
+                        response_json,
+                        now,
+                        expires_at,
+                    ],
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, 0)
-                ON CONFLICT (cache_key)
-                DO UPDATE SET
-                    response = excluded.response,
-                    created_at = excluded.created_at,
-                    expires_at = excluded.expires_at
-            """,
-                [
-                    cache_key,
-                    source,
-                    tool_name,
-                    args_hash,
-                    response_json,
-                    now,
-                    expires_at,
-                ],
-            )
 
-            logger.debug(
-                f"Cache SET: {source}.{tool_name} (TTL: {ttl_seconds}s, expires: {expires_at})"
-            )
+                logger.debug(
+                    f"Cache SET: {source}.{tool_name} (TTL: {ttl_seconds}s, expires: {expires_at})"
+                )
 
-        except Exception as e:
-            logger.error(f"Cache storage error: {e}", exc_info=True)
+            except Exception as e:
+                logger.error(f"Cache storage error: {e}", exc_info=True)
 
-    def _record_statistics(self, source: str, tool_name: str, hit: bool) -> None:
+    def _record_statistics(
+        self,
+        source: str,
+        tool_name: str,
+        hit: bool,
+        cache_key: Optional[str] = None,
+    ) -> None:
         """
-        Record cache hit/miss statistics.
+        Queue a cache hit/miss for the write-behind flush.
 
         Args:
             source: Data source name
             tool_name: Tool function name
             hit: True for cache hit, False for cache miss
+            cache_key: Cache key of the entry that was hit (hits only)
         """
-        try:
-            today = datetime.now().date()
+        with self._lock:
+            self._write_behind.record(source, tool_name, hit, cache_key)
+            if self._write_behind.events >= self.stats_flush_threshold:
+                self.flush()
 
-            if hit:
-                self.conn.execute(
-                    """
-                    INSERT INTO cache_statistics (source, tool_name, date, hits, misses)
-                    VALUES (?, ?, ?, 1, 0)
-                    ON CONFLICT (source, tool_name, date)
-                    DO UPDATE SET hits = cache_statistics.hits + 1
-                """,
-                    [source, tool_name, today],
-                )
-            else:
-                self.conn.execute(
-                    """
-                    INSERT INTO cache_statistics (source, tool_name, date, misses, hits)
-                    VALUES (?, ?, ?, 1, 0)
-                    ON CONFLICT (source, tool_name, date)
-                    DO UPDATE SET misses = cache_statistics.misses + 1
-                """,
-                    [source, tool_name, today],
+    def record_coalesced(self, source: str, tool_name: str) -> None:
+        """
+        Count a call that awaited an identical in-flight upstream request.
+
+        Args:
+            source: Data source name
+            tool_name: Tool function name
+        """
+        with self._lock:
+            self._write_behind.record_coalesced(source, tool_name)
+            if self._write_behind.events >= self.stats_flush_threshold:
+                self.flush()
+
+    def _flush_periodically(self) -> None:
+        """Flush pending statistics on a timer until the manager is closed."""
+        while not self._stop_flusher.wait(self.stats_flush_interval_seconds):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write queued statistics and hit counters to DuckDB.
+
+        Each table is updated with a single bulk statement per chunk of
+        coalesced rows, inside one transaction.
+        """
+        with self._lock:
+            if not self._write_behind.events:
+                return
+
+            pending = self._write_behind.drain()
+            stats_rows = [
+                [source, tool_name, day, *counters]
+                for (source, tool_name, day), counters in pending.stats.items()
+            ]
+            hit_rows = [[key, delta] for key, delta in pending.hits.items()]
+
+            try:
+                self.conn.execute("BEGIN TRANSACTION")
+
+                for start in range(0, len(stats_rows), _FLUSH_CHUNK_SIZE):
+                    chunk = stats_rows[start : start + _FLUSH_CHUNK_SIZE]
+                    values = ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(chunk))
+                    self.conn.execute(
+                        f"""
+                        INSERT INTO cache_statistics (
+                            source, tool_name, date, hits, misses, coalesced
+                        )
+                        VALUES {values}
+                        ON CONFLICT (source, tool_name, date)
+                        DO UPDATE SET
+                            hits = cache_statistics.hits + excluded.hits,
+                            misses = cache_statistics.misses + excluded.misses,
+                            coalesced = cache_statistics.coalesced + excluded.coalesced
+                    """,
+                        [param for row in chunk for param in row],
+                    )
+
+                for start in range(0, len(hit_rows), _FLUSH_CHUNK_SIZE):
+                    chunk = hit_rows[start : start + _FLUSH_CHUNK_SIZE]
+                    values = ", ".join(["(?, ?)"] * len(chunk))
+                    self.conn.execute(
+                        f"""
+                        UPDATE cache_entries
+                        SET hits = cache_entries.hits + deltas.delta
+                        FROM (VALUES {values}) AS deltas(cache_key, delta)
+                        WHERE cache_entries.cache_key = deltas.cache_key
+                    """,
+                        [param for row in chunk for param in row],
+                    )
+
+                self.conn.execute("COMMIT")
+                logger.debug(
+                    f"Flushed {pending.events} cache events "
+                    f"({len(stats_rows)} statistics rows, {len(hit_rows)} entries)"
                 )
 
-        except Exception as e:
-            logger.error(f"Statistics recording error: {e}", exc_info=True)
+            except Exception as e:
+                logger.error(f"Statistics recording error: {e}", exc_info=True)
+                try:
+                    self.conn.execute("ROLLBACK")
+                except Exception:
+                    pass
+                # Keep the deltas so the next flush can retry
+                self._write_behind.merge(pending)
 
     def invalidate(
         self, source: Optional[str] = None, tool_name: Optional[str] = None
@@ -338,6 +668,20 @@ class CacheManager:
         Returns:
             Number of entries invalidated
         """
+        with self._lock:
+            for key in list(self._memory):
+                key_source, key_tool, _ = key.split(":", 2)
+                if (source is None or key_source == source) and (
+                    tool_name is None or key_tool == tool_name
+                ):
+                    del self._memory[key]
+
+            return self._invalidate_persistent(source, tool_name)
+
+    def _invalidate_persistent(
+        self, source: Optional[str], tool_name: Optional[str]
+    ) -> int:
+        """Delete matching entries from the DuckDB tier."""
         try:
             if source and tool_name:
                 result = self.conn.execute(
@@ -369,14 +713,47 @@ class CacheManager:
         """
         Remove expired cache entries.
 
+        Entries still inside their source's stale grace window are kept so
+        they can be served while a refresh is in flight.
+
         Returns:
             Number of entries removed
         """
+        with self._lock:
+            now = datetime.now()
+            for key, (_, expires_at) in list(self._memory.items()):
+                source = key.split(":", 1)[0]
+                grace = self.source_stale_grace.get(source, 0)
+                if expires_at <= now - timedelta(seconds=grace):
+                    del self._memory[key]
+
+            return self._cleanup_persistent(now)
+
+    def _cleanup_persistent(self, now: datetime) -> int:
+        """Delete entries past expiry and stale grace from the DuckDB tier."""
         try:
+            grace_sources = [
+                source for source, grace in self.source_stale_grace.items() if grace > 0
+            ]
+            count = 0
+
+            for source in grace_sources:
+                cutoff = now - timedelta(seconds=self.source_stale_grace[source])
+                result = self.conn.execute(
+                    "DELETE FROM cache_entries WHERE source = ? AND expires_at <= ?",
+                    [source, cutoff],
+                )
+                row = result.fetchone()
+                count += row[0] if row else 0
+
+            placeholders = ", ".join(["?"] * len(grace_sources))
             result = self.conn.execute(
-                "DELETE FROM cache_entries WHERE expires_at <= CURRENT_TIMESTAMP"
+                "DELETE FROM cache_entries WHERE expires_at <= ?"
+                + (f" AND source NOT IN ({placeholders})" if grace_sources else ""),
+                [now, *grace_sources],
             )
-            count = result.fetchone()[0] if result else 0
+            row = result.fetchone()
+            count += row[0] if row else 0
 
             if count > 0:
                 logger.info(f"Cleaned up {count} expired cache entries")
@@ -400,6 +777,13 @@ class CacheManager:
         Returns:
             Dictionary with cache statistics
         """
+        with self._lock:
+            # Include statistics still aggregated in memory
+            self.flush()
+            return self._query_statistics(source, days)
+
+    def _query_statistics(self, source: Optional[str], days: int) -> dict[str, Any]:
+        """Read aggregated statistics from DuckDB."""
         try:
             cutoff_date = datetime.now().date() - timedelta(days=days)
 
@@ -410,7 +794,8 @@ class CacheManager:
                         tool_name,
                         SUM(hits) as total_hits,
                         SUM(misses) as total_misses,
-                        ROUND(SUM(hits) * 100.0 / (SUM(hits) + SUM(misses)), 2) as hit_rate
+                        ROUND(SUM(hits) * 100.0 / NULLIF(SUM(hits) + SUM(misses), 0), 2) as hit_rate,
+                        SUM(coalesced) as total_coalesced
                     FROM cache_statistics
                     WHERE source = ? AND date >= ?
                     GROUP BY source, tool_name
@@ -424,7 +809,8 @@ class CacheManager:
                         tool_name,
                         SUM(hits) as total_hits,
                         SUM(misses) as total_misses,
-                        ROUND(SUM(hits) * 100.0 / (SUM(hits) + SUM(misses)), 2) as hit_rate
+                        ROUND(SUM(hits) * 100.0 / NULLIF(SUM(hits) + SUM(misses), 0), 2) as hit_rate,
+                        SUM(coalesced) as total_coalesced
                     FROM cache_statistics
                     WHERE date >= ?
                     GROUP BY source, tool_name
@@ -447,7 +833,8 @@ class CacheManager:
                         "tool_name": row[1],
                         "hits": row[2],
                         "misses": row[3],
-                        "hit_rate": row[4],
+                        "hit_rate": row[4] or 0.0,
+                        "coalesced": row[5],
                     }
                     for row in results
                 ],
@@ -467,6 +854,9 @@ class CacheManager:
 
             stats["total_hits"] = total_hits
             stats["total_misses"] = total_misses
+            stats["total_coalesced"] = sum(
+                tool["coalesced"] for tool in stats["by_tool"]
+            )
 
             return stats
 
@@ -479,6 +869,7 @@ class CacheManager:
                 "overall_hit_rate": 0.0,
                 "total_hits": 0,
                 "total_misses": 0,
+                "total_coalesced": 0,
             }
 
     async def warm_cache(self, queries: list[dict[str, Any]]) -> dict[str, Any]:
@@ -496,6 +887,9 @@ class CacheManager:
                 - args: Tuple of positional arguments
                 - kwargs: Dict of keyword arguments
                 - func: Async function to call for cache miss
+                - store: Optional; False when ``func`` caches its own results
+                  (e.g. a batch fetch priming per-symbol entries), so the
+                  query is always run and its return value is not stored
 
         Returns:
             Dictionary with warming statistics:
@@ -538,10 +932,13 @@ class CacheManager:
             args = query.get("args", ())
             kwargs = query.get("kwargs", {})
             func = query["func"]
+            store = query.get("store", True)
 
             try:
                 # Check if already cached
-                cached_response = self.get(source, tool_name, args, kwargs)
+                cached_response = (
+                    self.get(source, tool_name, args, kwargs) if store else None
+                )
 
                 if cached_response is not None:
                     stats["cached"] += 1
@@ -557,7 +954,8 @@ class CacheManager:
                     response = func(*args, **kwargs)
 
                 # Store in cache
-                self.set(source, tool_name, args, kwargs, response)
+                if store:
+                    self.set(source, tool_name, args, kwargs, response)
                 stats["warmed"] += 1
                 logger.info(f"Cache warm: {source}.{tool_name} populated")
 
@@ -576,10 +974,17 @@ class CacheManager:
         return stats
 
     def close(self) -> None:
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
-            logger.info("Cache manager connection closed")
+        """Flush pending statistics and close database connection."""
+        self._stop_flusher.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=self.stats_flush_interval_seconds + 1)
+
+        with self._lock:
+            if self.conn:
+                self.flush()
+                self._memory.clear()
+                self.conn.close()
+                logger.info("Cache manager connection closed")
 
 
 # Global cache manager instance
@@ -610,14 +1015,45 @@ def get_cache_manager(
 
         _cache_manager = CacheManager(db_path, default_ttl_seconds)
 
+        # Don't lose statistics still aggregated in memory at interpreter exit
+        atexit.register(_cache_manager.flush)
+
     return _cache_manager
 
 
-def cached(source: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+_refresh_executor: Optional["concurrent.futures.ThreadPoolExecutor"] = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> "concurrent.futures.ThreadPoolExecutor":
+    """Get the shared worker pool used to refresh stale entries of sync tools."""
+    global _refresh_executor
+
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="navam-cache-refresh"
+            )
+        return _refresh_executor
+
+
+def cached(source: str) -> Callable[[Callable[..., T]], CachedFunction[T]]:
     """
     Decorator to cache function results with DuckDB backend.
 
-    Supports both synchronous and asynchronous functions.
+    Supports both synchronous and asynchronous functions. Concurrent calls
+    with the same cache key are coalesced (single-flight): the first caller
+    performs the upstream fetch and the others wait for its result instead
+    of issuing duplicate requests.
+
+    For sources with a stale grace window, expired entries inside the window
+    are returned immediately and refreshed in the background (an asyncio task
+    for coroutines, a small worker pool for sync functions).
+
+    The decorated function also gets ``peek(*args, **kwargs)``, returning the
+    fresh cached value for those arguments without fetching (or None), and
+    ``prime(response, *args, **kwargs)``, storing a value fetched elsewhere
+    (e.g. by a bulk request) under the key a call with those arguments uses.
 
     Usage:
         @cached(source="yahoo_finance")
@@ -638,52 +1074,178 @@ def cached(source: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     import asyncio
     import inspect
+    import weakref
 
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+    def decorator(func: Callable[..., T]) -> CachedFunction[T]:
         # Check if function is async
         is_async = inspect.iscoroutinefunction(func)
+        tool_name = func.__name__
+
+        def attach_cache_helpers(wrapper: Any) -> None:
+            def peek(*args: Any, **kwargs: Any) -> Optional[T]:
+                return cast(
+                    Optional[T], get_cache_manager().get(source, tool_name, args, kwargs)
+                )
+
+            def prime(response: T, *args: Any, **kwargs: Any) -> None:
+                get_cache_manager().set(source, tool_name, args, kwargs, response)
+
+            wrapper.peek = peek
+            wrapper.prime = prime
 
         if is_async:
+            # In-flight fetches per event loop: cache_key -> future
+            inflight_by_loop: weakref.WeakKeyDictionary[Any, Dict[str, Any]] = (
+                weakref.WeakKeyDictionary()
+            )
+            # Strong references to background refresh tasks
+            refresh_tasks: set = set()
+
+            async def load(
+                cache: CacheManager, args: tuple, kwargs: dict, background: bool = False
+            ) -> Optional[T]:
+                loop = asyncio.get_running_loop()
+                inflight = inflight_by_loop.setdefault(loop, {})
+                cache_key = cache._generate_cache_key(source, tool_name, args, kwargs)
+
+                # Another caller is already fetching this key - wait for it
+                pending = inflight.get(cache_key)
+                if pending is not None:
+                    if background:
+                        return None
+                    cache.record_coalesced(source, tool_name)
+                    try:
+                        return cast(T, await asyncio.shield(pending))
+                    except asyncio.CancelledError:
+                        if not pending.cancelled():
+                            raise
+                        # The leading caller was cancelled - fetch ourselves
+                        return await load(cache, args, kwargs)
+
+                future: asyncio.Future = loop.create_future()
+                # Avoid "exception was never retrieved" when nobody waits
+                future.add_done_callback(
+                    lambda f: f.cancelled() or f.exception()
+                )
+                inflight[cache_key] = future
+
+                try:
+                    # Cache miss - call original async function
+                    with span(f"{source}.{tool_name}", PROVIDER):
+                        response = await cast(Awaitable[T], func(*args, **kwargs))
+
+                    # Store in cache
+                    cache.set(source, tool_name, args, kwargs, response)
+                    future.set_result(response)
+                    return response
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except BaseException as e:
+                    future.set_exception(e)
+                    raise
+                finally:
+                    inflight.pop(cache_key, None)
+
+            async def refresh(cache: CacheManager, args: tuple, kwargs: dict) -> None:
+                try:
+                    await load(cache, args, kwargs, background=True)
+                except Exception as e:
+                    logger.warning(f"Background refresh failed: {source}.{tool_name}: {e}")
+
             @wraps(func)
             async def async_wrapper(*args: Any, **kwargs: Any) -> T:
                 cache = get_cache_manager()
-                tool_name = func.__name__
 
                 # Try to get from cache
-                cached_response = cache.get(source, tool_name, args, kwargs)
-
-                if cached_response is not None:
-                    return cast(T, cached_response)
-
-                # Cache miss - call original async function
-                response = await func(*args, **kwargs)
+                result = cache.lookup(source, tool_name, args, kwargs)
 
-                # Store in cache
-                cache.set(source, tool_name, args, kwargs, response)
+                if result is not None:
+                    if result.stale:
+                        task = asyncio.ensure_future(refresh(cache, args, kwargs))
+                        refresh_tasks.add(task)
+                        task.add_done_callback(refresh_tasks.discard)
+                    return cast(T, result.value)
 
-                return response
+                return cast(T, await load(cache, args, kwargs))
 
-            return cast(Callable[..., T], async_wrapper)
+            attach_cache_helpers(async_wrapper)
+            return cast(CachedFunction[T], async_wrapper)
         else:
+            # In-flight fetches across threads: cache_key -> future
+            inflight_sync: Dict[str, concurrent.futures.Future] = {}
+            inflight_lock = threading.Lock()
+
+            def load_sync(
+                cache: CacheManager, args: tuple, kwargs: dict, background: bool = False
+            ) -> Optional[T]:
+                cache_key = cache._generate_cache_key(source, tool_name, args, kwargs)
+
+                fresh: Optional[CacheLookup] = None
+                with inflight_lock:
+                    pending = inflight_sync.get(cache_key)
+                    if pending is None:
+                        # A fetch that finished after our cache miss has
+                        # stored its response before leaving inflight_sync
+                        fresh = cache._lookup(
+                            source, tool_name, args, kwargs, False, record=False
+                        )
+                        if fresh is None:
+                            future: concurrent.futures.Future = (
+                                concurrent.futures.Future()
+                            )
+                            inflight_sync[cache_key] = future
+
+                if pending is None and fresh is not None:
+                    if background:
+                        return None
+                    cache.record_coalesced(source, tool_name)
+                    return cast(T, fresh.value)
+
+                # Another thread is already fetching this key - wait for it
+                if pending is not None:
+                    if background:
+                        return None
+                    cache.record_coalesced(source, tool_name)
+                    return cast(T, pending.result())
+
+                try:
+                    # Cache miss - call original function
+                    with span(f"{source}.{tool_name}", PROVIDER):
+                        response = func(*args, **kwargs)
+
+                    # Store in cache
+                    cache.set(source, tool_name, args, kwargs, response)
+                    future.set_result(response)
+                    return response
+                except BaseException as e:
+                    future.set_exception(e)
+                    raise
+                finally:
+                    with inflight_lock:
+                        inflight_sync.pop(cache_key, None)
+
+            def refresh_sync(cache: CacheManager, args: tuple, kwargs: dict) -> None:
+                try:
+                    load_sync(cache, args, kwargs, background=True)
+                except Exception as e:
+                    logger.warning(f"Background refresh failed: {source}.{tool_name}: {e}")
+
             @wraps(func)
             def sync_wrapper(*args: Any, **kwargs: Any) -> T:
                 cache = get_cache_manager()
-                tool_name = func.__name__
 
                 # Try to get from cache
-                cached_response = cache.get(source, tool_name, args, kwargs)
-
-                if cached_response is not None:
-                    return cast(T, cached_response)
-
-                # Cache miss - call original function
-                response = func(*args, **kwargs)
+                result = cache.lookup(source, tool_name, args, kwargs)
 
-                # Store in cache
-                cache.set(source, tool_name, args, kwargs, response)
+                if result is not None:
+                    if result.stale:
+                        _get_refresh_executor().submit(refresh_sync, cache, args, kwargs)
+                    return cast(T, result.value)
 
-                return response
+                return cast(T, load_sync(cache, args, kwargs))
 
-            return cast(Callable[..., T], sync_wrapper)
+            attach_cache_helpers(sync_wrapper)
+            return cast(CachedFunction[T], sync_wrapper)
 
     return decorator
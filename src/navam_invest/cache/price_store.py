@@ -0,0 +1,485 @@
+"""
+Incremental OHLCV price store backed by DuckDB.
+
+Bars are kept per (symbol, interval) series. A request only downloads what
+the store is missing: the bars after the last stored one, plus any older
+range the series does not cover yet. Any period can then be answered
+locally. Weekly, monthly and quarterly bars are resampled from the daily
+series instead of being downloaded separately.
+
+Bars are dividend- and split-adjusted, so an action in newly fetched bars
+changes the whole adjusted history; the series is then downloaded again.
+"""
+
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None  # type: ignore
+
+from navam_invest.utils.tracing import PROVIDER, span
+
+if TYPE_CHECKING:
+    # pandas is imported on first use so that importing the cache stays light
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Interval -> pandas resample rule; these are derived from the daily series
+RESAMPLED_INTERVALS: Dict[str, str] = {"1wk": "W-MON", "1mo": "MS", "3mo": "QS"}
+
+# Interval -> days of history Yahoo serves for it; intraday requests that
+# start earlier come back empty, so their start is clamped to this window
+INTRADAY_LOOKBACK_DAYS: Dict[str, int] = {
+    "1m": 7,
+    "2m": 59,
+    "5m": 59,
+    "15m": 59,
+    "30m": 59,
+    "90m": 59,
+    "60m": 729,
+    "1h": 729,
+}
+
+# Stored column -> yfinance column, in table order
+_BAR_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("open", "Open"),
+    ("high", "High"),
+    ("low", "Low"),
+    ("close", "Close"),
+    ("volume", "Volume"),
+    ("dividends", "Dividends"),
+    ("splits", "Stock Splits"),
+)
+
+# How resampled bars aggregate each column
+_RESAMPLE_AGG = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Volume": "sum",
+    "Dividends": "sum",
+    "Stock Splits": "max",
+}
+
+# Fetches bars as a yfinance-style frame: (symbol, interval, start, end);
+# start None means the full history, end None means up to now
+Fetcher = Callable[[str, str, Optional[date], Optional[date]], "pd.DataFrame"]
+
+
+def fetch_yahoo_bars(
+    symbol: str, interval: str, start: Optional[date], end: Optional[date]
+) -> "pd.DataFrame":
+    """Download adjusted bars with dividends and splits from Yahoo Finance."""
+    import yfinance as yf
+
+    ticker = yf.Ticker(symbol)
+    with span(f"yahoo_finance.history {symbol} {interval}", PROVIDER):
+        if start is None:
+            return ticker.history(period="max", interval=interval, actions=True)
+        return ticker.history(start=start, end=end, interval=interval, actions=True)
+
+
+class SeriesInfo(NamedTuple):
+    """Coverage of one stored (symbol, interval) series."""
+
+    covered_from: Optional[date]  # None once the full history is stored
+    last_bar: Optional[datetime]
+    updated_at: datetime
+
+
+def period_start(period: str, today: Optional[date] = None) -> Optional[date]:
+    """First date a yfinance period string covers.
+
+    Periods in days ("1d", "5d") count trading days, so the returned date
+    leaves room for weekends and holidays; ``PriceStore.history`` trims the
+    result to the last N trading days.
+
+    Args:
+        period: One of 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max
+        today: Reference date (default: today)
+
+    Returns:
+        Start date, or None for "max"
+
+    Raises:
+        ValueError: If the period is not recognized
+    """
+    import pandas as pd
+
+    today = today or date.today()
+    if period == "max":
+        return None
+    if period == "ytd":
+        return date(today.year, 1, 1)
+    try:
+        count = int(period[:-2] if period.endswith("mo") else period[:-1])
+    except ValueError:
+        raise ValueError(f"Unknown period '{period}'") from None
+    start: date
+    if period.endswith("mo"):
+        start = (pd.Timestamp(today) - pd.DateOffset(months=count)).date()
+        return start
+    if period.endswith("y"):
+        start = (pd.Timestamp(today) - pd.DateOffset(years=count)).date()
+        return start
+    if period.endswith("d"):
+        return today - timedelta(days=2 * count + 7)
+    raise ValueError(f"Unknown period '{period}'")
+
+
+def clamp_start(
+    interval: str, start: Optional[date], today: Optional[date] = None
+) -> Optional[date]:
+    """Move a start date into the range Yahoo serves for an interval.
+
+    Args:
+        interval: yfinance interval
+        start: Requested start date, or None for the full history
+        today: Reference date (default: today)
+
+    Returns:
+        ``start``, or the earliest date Yahoo serves for intraday intervals
+    """
+    lookback = INTRADAY_LOOKBACK_DAYS.get(interval)
+    if lookback is None:
+        return start
+    earliest = (today or date.today()) - timedelta(days=lookback)
+    return earliest if start is None or start < earliest else start
+
+
+class PriceStore:
+    """
+    OHLCV bar store with incremental updates.
+
+    Features:
+    - One row per bar, keyed by (symbol, interval, ts)
+    - Tail updates download only the bars since the last stored one
+    - Head gaps download only the range before the covered start
+    - Weekly/monthly/quarterly bars resampled from the daily series
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        refresh_interval_minutes: float = 5.0,
+        fetcher: Optional[Fetcher] = None,
+    ):
+        """
+        Initialize price store.
+
+        Args:
+            db_path: Path to DuckDB database file. If None, uses in-memory DB.
+            refresh_interval_minutes: Age after which the latest bars of a
+                series are downloaded again
+            fetcher: Bar download function (default: Yahoo Finance)
+        """
+        if duckdb is None:
+            raise ImportError(
+                "duckdb is required for the price store. "
+                "Install with: pip install duckdb"
+            )
+
+        self.db_path = db_path or ":memory:"
+        self.refresh_interval = timedelta(minutes=refresh_interval_minutes)
+        self.fetcher = fetcher or fetch_yahoo_bars
+        self.conn = duckdb.connect(str(self.db_path))
+        self._lock = threading.RLock()
+        # One lock per series so concurrent requests for it download once
+        self._series_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._initialize_schema()
+
+    def _initialize_schema(self) -> None:
+        """Create store tables if they don't exist."""
+        columns = ",\n                ".join(
+            f"{name} DOUBLE" for name, _ in _BAR_COLUMNS
+        )
+        self.conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS price_bars (
+                symbol VARCHAR NOT NULL,
+                interval VARCHAR NOT NULL,
+                ts TIMESTAMP NOT NULL,
+                {columns},
+                PRIMARY KEY (symbol, interval, ts)
+            )
+        """
+        )
+
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS price_series (
+                symbol VARCHAR NOT NULL,
+                interval VARCHAR NOT NULL,
+                covered_from DATE,
+                updated_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (symbol, interval)
+            )
+        """
+        )
+
+    def _series_lock(self, symbol: str, interval: str) -> threading.Lock:
+        with self._lock:
+            return self._series_locks.setdefault((symbol, interval), threading.Lock())
+
+    def series_info(self, symbol: str, interval: str = "1d") -> Optional[SeriesInfo]:
+        """Coverage of a stored series, or None if nothing is stored."""
+        with self._lock:
+            row = self.conn.execute(
+                """
+                SELECT s.covered_from, max(b.ts), s.updated_at
+                FROM price_series s
+                LEFT JOIN price_bars b
+                  ON b.symbol = s.symbol AND b.interval = s.interval
+                WHERE s.symbol = ? AND s.interval = ?
+                GROUP BY s.covered_from, s.updated_at
+            """,
+                [symbol, interval],
+            ).fetchone()
+        return SeriesInfo(*row) if row else None
+
+    def _store(
+        self,
+        symbol: str,
+        interval: str,
+        frame: "pd.DataFrame",
+        start: Optional[datetime],
+        end: Optional[datetime],
+        covered_from: Optional[date],
+    ) -> None:
+        """Replace the bars in [start, end) with those of ``frame`` in that range.
+
+        Also records the series' coverage and update time.
+        """
+        import pandas as pd
+
+        bars = pd.DataFrame(
+            {
+                name: frame[source] if source in frame else 0.0
+                for name, source in _BAR_COLUMNS
+            }
+        )
+        index = pd.DatetimeIndex(frame.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        bars.insert(0, "ts", index)
+        bars.insert(0, "interval", interval)
+        bars.insert(0, "symbol", symbol)
+        bars = bars.reset_index(drop=True)
+
+        conditions = ["symbol = ?", "interval = ?"]
+        params: List[Any] = [symbol, interval]
+        if start is not None:
+            conditions.append("ts >= ?")
+            params.append(start)
+            bars = bars[bars["ts"] >= start]
+        if end is not None:
+            conditions.append("ts < ?")
+            params.append(end)
+            bars = bars[bars["ts"] < end]
+
+        with self._lock:
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                # An empty download keeps the stored bars
+                if not bars.empty:
+                    self.conn.execute(
+                        f"DELETE FROM price_bars WHERE {' AND '.join(conditions)}",
+                        params,
+                    )
+                    self.conn.register("navam_new_bars", bars)
+                    try:
+                        self.conn.execute(
+                            "INSERT INTO price_bars SELECT * FROM navam_new_bars"
+                        )
+                    finally:
+                        self.conn.unregister("navam_new_bars")
+                self.conn.execute(
+                    """
+                    INSERT INTO price_series VALUES (?, ?, ?, ?)
+                    ON CONFLICT (symbol, interval) DO UPDATE SET
+                        covered_from = excluded.covered_from,
+                        updated_at = excluded.updated_at
+                """,
+                    [symbol, interval, covered_from, datetime.now()],
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def _download(
+        self, symbol: str, interval: str, start: Optional[date], end: Optional[date]
+    ) -> "pd.DataFrame":
+        import pandas as pd
+
+        frame = self.fetcher(symbol, interval, start, end)
+        return frame if frame is not None else pd.DataFrame()
+
+    def update(self, symbol: str, interval: str, start: Optional[date]) -> None:
+        """Make a stored series cover ``start`` onward and be up to date.
+
+        Args:
+            symbol: Ticker symbol
+            interval: Stored interval (e.g. "1d", "1h")
+            start: First date needed, or None for the full history
+        """
+        import pandas as pd
+
+        info = self.series_info(symbol, interval)
+
+        if info is None or info.last_bar is None:
+            frame = self._download(symbol, interval, start, None)
+            self._store(symbol, interval, frame, None, None, start)
+            return
+
+        covered_from = info.covered_from
+        if covered_from is not None and (start is None or start < covered_from):
+            # Head gap: only the range before the covered start
+            head = self._download(symbol, interval, start, covered_from)
+            end = datetime.combine(covered_from, datetime.min.time())
+            self._store(symbol, interval, head, None, end, start)
+            covered_from = start
+
+        if datetime.now() - info.updated_at < self.refresh_interval:
+            return
+
+        # Tail: refetch the last stored bar (it may have been partial) onward
+        tail_start = clamp_start(interval, info.last_bar.date())
+        tail = self._download(symbol, interval, tail_start, None)
+        if not tail.empty:
+            new_index = pd.DatetimeIndex(tail.index)
+            if new_index.tz is not None:
+                new_index = new_index.tz_localize(None)
+            new_bars = tail[new_index > info.last_bar]
+            actions = [c for c in ("Dividends", "Stock Splits") if c in tail]
+            if actions and (new_bars[actions].fillna(0) != 0).any().any():
+                # Adjusted history changed; download the covered range again
+                logger.info(f"Corporate action for {symbol}; reloading {interval} bars")
+                covered_from = clamp_start(interval, covered_from)
+                frame = self._download(symbol, interval, covered_from, None)
+                self._store(symbol, interval, frame, None, None, covered_from)
+                return
+        first_refetched = datetime.combine(info.last_bar.date(), datetime.min.time())
+        self._store(symbol, interval, tail, first_refetched, None, covered_from)
+
+    def bars(
+        self, symbol: str, interval: str = "1d", start: Optional[date] = None
+    ) -> "pd.DataFrame":
+        """Read stored bars without downloading.
+
+        Args:
+            symbol: Ticker symbol
+            interval: Stored interval
+            start: First date to return (default: all stored bars)
+
+        Returns:
+            yfinance-style frame (Open, High, Low, Close, Volume, Dividends,
+            Stock Splits) indexed by bar timestamp
+        """
+        columns = ", ".join(f'{name} AS "{source}"' for name, source in _BAR_COLUMNS)
+        params: list = [symbol, interval]
+        start_filter = ""
+        if start is not None:
+            start_filter = "AND ts >= ?"
+            params.append(datetime.combine(start, datetime.min.time()))
+        with self._lock:
+            frame = self.conn.execute(
+                f"""
+                SELECT ts, {columns}
+                FROM price_bars
+                WHERE symbol = ? AND interval = ? {start_filter}
+                ORDER BY ts
+            """,
+                params,
+            ).df()
+        return frame.set_index("ts").rename_axis("Date")
+
+    def history(
+        self, symbol: str, period: str = "1y", interval: str = "1d"
+    ) -> "pd.DataFrame":
+        """Get bars for a period, downloading only what the store is missing.
+
+        Args:
+            symbol: Ticker symbol
+            period: yfinance period (1d, 5d, 1mo, ..., 10y, ytd, max)
+            interval: yfinance interval; 1wk, 1mo and 3mo are resampled from
+                daily bars, intraday intervals only reach back as far as
+                Yahoo serves them (7 days for 1m, 60 days below 1h)
+
+        Returns:
+            yfinance-style frame indexed by bar timestamp (empty if Yahoo has
+            no data)
+        """
+        symbol = symbol.strip().upper()
+        base = "1d" if interval in RESAMPLED_INTERVALS else interval
+        start = clamp_start(base, period_start(period))
+
+        with self._series_lock(symbol, base):
+            self.update(symbol, base, start)
+        frame = self.bars(symbol, base, start)
+
+        if period.endswith("d") and period != "ytd" and not frame.empty:
+            # Trading-day periods: keep the bars of the last N trading days
+            dates = frame.index.normalize()
+            frame = frame[dates >= dates.unique()[-int(period[:-1]) :].min()]
+
+        if interval in RESAMPLED_INTERVALS and not frame.empty:
+            frame = (
+                frame.resample(
+                    RESAMPLED_INTERVALS[interval], label="left", closed="left"
+                )
+                .agg(_RESAMPLE_AGG)
+                .dropna(subset=["Close"])
+            )
+        return frame
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+# Global price store instance
+_price_store: Optional[PriceStore] = None
+_price_store_lock = threading.Lock()
+
+
+def get_price_store(db_path: Optional[Path] = None) -> PriceStore:
+    """
+    Get or create global price store instance.
+
+    Args:
+        db_path: Path to DuckDB database file
+
+    Returns:
+        PriceStore instance
+    """
+    global _price_store
+
+    with _price_store_lock:
+        if _price_store is None:
+            # Persist next to the API cache in the user's home directory
+            if db_path is None:
+                cache_dir = Path.home() / ".navam-invest" / "cache"
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                db_path = cache_dir / "prices.duckdb"
+
+            _price_store = PriceStore(db_path)
+
+    return _price_store
@@ -0,0 +1,349 @@
+"""
+Persistent ticker/CIK/name index for SEC lookups.
+
+The SEC publishes one ~10k-row ticker map. It is stored in DuckDB, refreshed
+on a schedule, and loaded into in-memory structures that answer exact
+(O(1)), prefix (O(log n)) and name-token lookups without network access.
+"""
+
+import bisect
+import difflib
+import logging
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_INSERT_CHUNK_SIZE = 1000
+
+
+class CompanyEntry(NamedTuple):
+    """One row of the SEC ticker map."""
+
+    ticker: str
+    cik: int
+    name: str
+
+
+def normalize_ticker(ticker: str) -> str:
+    """Normalize a ticker to SEC form (upper case, class shares with '-').
+
+    Args:
+        ticker: Ticker as typed by a user (e.g., 'brk.b')
+
+    Returns:
+        Normalized ticker (e.g., 'BRK-B')
+    """
+    return ticker.strip().upper().replace(".", "-").replace("/", "-")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split a company name into lower-case word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class TickerIndex:
+    """
+    Ticker/CIK/name index backed by DuckDB.
+
+    Features:
+    - Exact ticker and CIK lookups via dictionaries
+    - Ticker prefix lookups via bisect over sorted tickers
+    - Name search via an inverted token index with typo-tolerant tokens
+    - Scheduled refresh tracking (refreshed_at persisted with the data)
+    """
+
+    def __init__(
+        self, db_path: Optional[Path] = None, refresh_interval_hours: float = 24.0
+    ):
+        """
+        Initialize ticker index.
+
+        Args:
+            db_path: Path to DuckDB database file. If None, uses in-memory DB.
+            refresh_interval_hours: Age after which needs_refresh() is True
+        """
+        if duckdb is None:
+            raise ImportError(
+                "duckdb is required for the ticker index. Install with: pip install duckdb"
+            )
+
+        self.db_path = db_path or ":memory:"
+        self.refresh_interval = timedelta(hours=refresh_interval_hours)
+        self.conn = duckdb.connect(str(self.db_path))
+        self.refreshed_at: Optional[datetime] = None
+        self._lock = threading.RLock()
+
+        self._by_ticker: Dict[str, CompanyEntry] = {}
+        self._by_cik: Dict[int, CompanyEntry] = {}
+        self._sorted_tickers: List[str] = []
+        self._token_postings: Dict[str, Set[str]] = {}
+        self._sorted_tokens: List[str] = []
+
+        self._initialize_schema()
+        self._load()
+
+    def _initialize_schema(self) -> None:
+        """Create index tables if they don't exist."""
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS company_tickers (
+                ticker VARCHAR PRIMARY KEY,
+                cik BIGINT NOT NULL,
+                name VARCHAR NOT NULL,
+                position INTEGER NOT NULL
+            )
+        """
+        )
+
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ticker_index_meta (
+                key VARCHAR PRIMARY KEY,
+                refreshed_at TIMESTAMP NOT NULL
+            )
+        """
+        )
+
+    def _load(self) -> None:
+        """Load persisted rows into the in-memory lookup structures."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT ticker, cik, name FROM company_tickers ORDER BY position"
+            ).fetchall()
+            meta = self.conn.execute(
+                "SELECT refreshed_at FROM ticker_index_meta WHERE key = 'company_tickers'"
+            ).fetchone()
+
+            self._build([CompanyEntry(*row) for row in rows])
+            self.refreshed_at = meta[0] if meta else None
+
+    def _build(self, entries: List[CompanyEntry]) -> None:
+        """Rebuild in-memory structures from entries."""
+        by_ticker: Dict[str, CompanyEntry] = {}
+        by_cik: Dict[int, CompanyEntry] = {}
+        postings: Dict[str, Set[str]] = {}
+
+        for entry in entries:
+            by_ticker[entry.ticker] = entry
+            # The SEC map lists the primary ticker first for each CIK
+            by_cik.setdefault(entry.cik, entry)
+            for token in _tokenize(entry.name):
+                postings.setdefault(token, set()).add(entry.ticker)
+
+        self._by_ticker = by_ticker
+        self._by_cik = by_cik
+        self._sorted_tickers = sorted(by_ticker)
+        self._token_postings = postings
+        self._sorted_tokens = sorted(postings)
+
+    def __len__(self) -> int:
+        return len(self._by_ticker)
+
+    def needs_refresh(self) -> bool:
+        """Check whether the index is empty or older than the refresh interval."""
+        return (
+            not self._by_ticker
+            or self.refreshed_at is None
+            or datetime.now() - self.refreshed_at > self.refresh_interval
+        )
+
+    def replace(self, entries: Iterable[CompanyEntry]) -> int:
+        """
+        Replace the index contents and persist them.
+
+        Args:
+            entries: Complete set of ticker map rows
+
+        Returns:
+            Number of rows stored
+        """
+        unique: Dict[str, CompanyEntry] = {}
+        for entry in entries:
+            ticker = normalize_ticker(entry.ticker)
+            if ticker and ticker not in unique:
+                unique[ticker] = CompanyEntry(ticker, int(entry.cik), entry.name)
+
+        rows = list(unique.values())
+        now = datetime.now()
+
+        with self._lock:
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                self.conn.execute("DELETE FROM company_tickers")
+                # Multi-row inserts; executemany is row-at-a-time in DuckDB
+                for start in range(0, len(rows), _INSERT_CHUNK_SIZE):
+                    chunk = rows[start : start + _INSERT_CHUNK_SIZE]
+                    values = ", ".join(["(?, ?, ?, ?)"] * len(chunk))
+                    self.conn.execute(
+                        f"INSERT INTO company_tickers VALUES {values}",
+                        [
+                            param
+                            for position, row in enumerate(chunk, start)
+                            for param in (*row, position)
+                        ],
+                    )
+                self.conn.execute(
+                    """
+                    INSERT INTO ticker_index_meta VALUES ('company_tickers', ?)
+                    ON CONFLICT (key) DO UPDATE SET refreshed_at = excluded.refreshed_at
+                """,
+                    [now],
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+            self._build(rows)
+            self.refreshed_at = now
+
+        logger.info(f"Ticker index refreshed with {len(rows)} entries")
+        return len(rows)
+
+    def lookup(self, ticker: str) -> Optional[CompanyEntry]:
+        """
+        Exact ticker lookup.
+
+        Args:
+            ticker: Stock ticker symbol (case-insensitive, '.' or '-' for classes)
+
+        Returns:
+            Matching entry or None
+        """
+        return self._by_ticker.get(normalize_ticker(ticker))
+
+    def by_cik(self, cik: int) -> Optional[CompanyEntry]:
+        """
+        Look up the primary ticker for a CIK.
+
+        Args:
+            cik: Central Index Key
+
+        Returns:
+            Matching entry or None
+        """
+        return self._by_cik.get(int(cik))
+
+    def prefix(self, prefix: str, limit: int = 10) -> List[CompanyEntry]:
+        """
+        Tickers starting with a prefix, in alphabetical order.
+
+        Args:
+            prefix: Ticker prefix
+            limit: Maximum number of entries
+
+        Returns:
+            Matching entries
+        """
+        prefix = normalize_ticker(prefix)
+        if not prefix:
+            return []
+
+        tickers = self._sorted_tickers
+        start = bisect.bisect_left(tickers, prefix)
+        end = bisect.bisect_left(tickers, prefix + "\uffff", lo=start)
+        return [self._by_ticker[t] for t in tickers[start : min(end, start + limit)]]
+
+    def _expand_token(self, token: str) -> Set[str]:
+        """Tickers for a query token: exact, then prefix, then close spellings."""
+        postings = self._token_postings.get(token)
+        if postings is not None:
+            return postings
+
+        tokens = self._sorted_tokens
+        start = bisect.bisect_left(tokens, token)
+        matched: Set[str] = set()
+        for candidate in tokens[start:]:
+            if not candidate.startswith(token):
+                break
+            matched |= self._token_postings[candidate]
+        if matched:
+            return matched
+
+        for candidate in difflib.get_close_matches(token, tokens, n=3, cutoff=0.8):
+            matched |= self._token_postings[candidate]
+        return matched
+
+    def search_name(self, query: str, limit: int = 10) -> List[CompanyEntry]:
+        """
+        Fuzzy company name search.
+
+        Every query word must match a name word exactly, as a prefix, or as a
+        close spelling. Results are ranked by overall name similarity.
+
+        Args:
+            query: Company name or part of it (e.g., 'micro soft', 'nvidia')
+            limit: Maximum number of entries
+
+        Returns:
+            Matching entries, best first
+        """
+        tokens = _tokenize(query)
+        if not tokens:
+            return []
+
+        with self._lock:
+            candidates: Optional[Set[str]] = None
+            for token in tokens:
+                matched = self._expand_token(token)
+                candidates = matched if candidates is None else candidates & matched
+                if not candidates:
+                    return []
+
+            entries = [self._by_ticker[t] for t in candidates or ()]
+
+        query_lower = query.lower()
+        entries.sort(
+            key=lambda e: (
+                -difflib.SequenceMatcher(None, query_lower, e.name.lower()).ratio(),
+                # Prefer the primary listing of a company
+                self._by_cik.get(e.cik) is not e,
+                e.ticker,
+            )
+        )
+        return entries[:limit]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+# Global ticker index instance
+_ticker_index: Optional[TickerIndex] = None
+_ticker_index_lock = threading.Lock()
+
+
+def get_ticker_index(db_path: Optional[Path] = None) -> TickerIndex:
+    """
+    Get or create global ticker index instance.
+
+    Args:
+        db_path: Path to DuckDB database file
+
+    Returns:
+        TickerIndex instance
+    """
+    global _ticker_index
+
+    with _ticker_index_lock:
+        if _ticker_index is None:
+            # Persist next to the API cache in the user's home directory
+            if db_path is None:
+                cache_dir = Path.home() / ".navam-invest" / "cache"
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                db_path = cache_dir / "ticker_index.duckdb"
+
+            _ticker_index = TickerIndex(db_path)
+
+    return _ticker_index
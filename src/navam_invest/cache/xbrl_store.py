@@ -0,0 +1,468 @@
+"""
+Columnar XBRL company-facts store backed by DuckDB.
+
+SEC ``companyfacts`` documents are flattened into one row per reported value
+(cik, taxonomy, concept, unit, period, filed, form, val) and bulk-loaded, so
+any concept, period range or peer set can be queried with SQL instead of
+re-downloading and re-sorting the JSON.
+"""
+
+import csv
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Column layout shared by the table, the CSV staging file and read_csv()
+_FACT_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("cik", "BIGINT"),
+    ("taxonomy", "VARCHAR"),
+    ("concept", "VARCHAR"),
+    ("unit", "VARCHAR"),
+    ("period_start", "DATE"),
+    ("period_end", "DATE"),
+    ("val", "DOUBLE"),
+    ("fy", "INTEGER"),
+    ("fp", "VARCHAR"),
+    ("form", "VARCHAR"),
+    ("filed", "DATE"),
+    ("accn", "VARCHAR"),
+    ("frame", "VARCHAR"),
+)
+
+# Duration windows (in days) that identify annual and quarterly values
+_PERIOD_DAYS = {"annual": (350, 380), "quarterly": (80, 100)}
+
+
+def iter_fact_rows(cik: int, document: Dict[str, Any]) -> Iterator[Tuple[Any, ...]]:
+    """Flatten a companyfacts document into fact rows.
+
+    Args:
+        cik: Central Index Key
+        document: Parsed ``companyfacts/CIK##########.json`` document
+
+    Yields:
+        Tuples in _FACT_COLUMNS order
+    """
+    for taxonomy, concepts in (document.get("facts") or {}).items():
+        for concept, concept_data in concepts.items():
+            for unit, values in (concept_data.get("units") or {}).items():
+                for value in values:
+                    yield (
+                        cik,
+                        taxonomy,
+                        concept,
+                        unit,
+                        value.get("start"),
+                        value.get("end"),
+                        value.get("val"),
+                        value.get("fy"),
+                        value.get("fp"),
+                        value.get("form"),
+                        value.get("filed"),
+                        value.get("accn"),
+                        value.get("frame"),
+                    )
+
+
+class XbrlFactStore:
+    """
+    XBRL facts store with time-series and peer queries.
+
+    Features:
+    - One columnar row per reported value, bulk-loaded per company
+    - Time series for any concept with annual/quarterly period filtering
+    - Latest values for a set of concepts and peer comparisons across CIKs
+    - Ingestion timestamps for scheduled refreshes
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, refresh_interval_hours: float = 24.0):
+        """
+        Initialize fact store.
+
+        Args:
+            db_path: Path to DuckDB database file. If None, uses in-memory DB.
+            refresh_interval_hours: Age after which a company is re-ingested
+        """
+        if duckdb is None:
+            raise ImportError(
+                "duckdb is required for the XBRL store. Install with: pip install duckdb"
+            )
+
+        self.db_path = db_path or ":memory:"
+        self.refresh_interval = timedelta(hours=refresh_interval_hours)
+        self.conn = duckdb.connect(str(self.db_path))
+        self._lock = threading.RLock()
+        self._initialize_schema()
+
+    def _initialize_schema(self) -> None:
+        """Create store tables if they don't exist."""
+        columns = ",\n                ".join(f"{name} {kind}" for name, kind in _FACT_COLUMNS)
+        self.conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS xbrl_facts (
+                {columns}
+            )
+        """
+        )
+
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS xbrl_companies (
+                cik BIGINT PRIMARY KEY,
+                entity_name VARCHAR,
+                facts INTEGER NOT NULL,
+                ingested_at TIMESTAMP NOT NULL
+            )
+        """
+        )
+
+        self.conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_xbrl_facts_concept
+            ON xbrl_facts(cik, concept)
+        """
+        )
+
+    def needs_refresh(self, cik: int) -> bool:
+        """Check whether a company is missing or older than the refresh interval."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT ingested_at FROM xbrl_companies WHERE cik = ?", [cik]
+            ).fetchone()
+        return row is None or datetime.now() - row[0] > self.refresh_interval
+
+    def entity_name(self, cik: int) -> Optional[str]:
+        """Get the entity name recorded for a company."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT entity_name FROM xbrl_companies WHERE cik = ?", [cik]
+            ).fetchone()
+        return row[0] if row else None
+
+    def ingest_file(self, cik: int, path: Path) -> int:
+        """
+        Ingest a companyfacts document saved on disk.
+
+        Args:
+            cik: Central Index Key
+            path: Path to the downloaded JSON document
+
+        Returns:
+            Number of fact rows stored
+        """
+        with open(path, "rb") as f:
+            document = json.load(f)
+        return self.ingest(cik, document)
+
+    def ingest(self, cik: int, document: Dict[str, Any]) -> int:
+        """
+        Replace a company's facts with those in a companyfacts document.
+
+        Rows are staged to a CSV file and bulk-loaded with read_csv, which is
+        far faster than parameterized inserts for hundreds of thousands of rows.
+
+        Args:
+            cik: Central Index Key
+            document: Parsed companyfacts document
+
+        Returns:
+            Number of fact rows stored
+        """
+        fd, staging = tempfile.mkstemp(prefix="navam-xbrl-", suffix=".csv")
+        try:
+            count = 0
+            with os.fdopen(fd, "w", newline="") as f:
+                writer = csv.writer(f)
+                for row in iter_fact_rows(cik, document):
+                    writer.writerow(row)
+                    count += 1
+
+            csv_columns = ", ".join(f"'{name}': '{kind}'" for name, kind in _FACT_COLUMNS)
+            with self._lock:
+                self.conn.execute("BEGIN TRANSACTION")
+                try:
+                    self.conn.execute("DELETE FROM xbrl_facts WHERE cik = ?", [cik])
+                    if count:
+                        self.conn.execute(
+                            f"""
+                            INSERT INTO xbrl_facts
+                            SELECT * FROM read_csv(?, header = false, columns = {{{csv_columns}}})
+                        """,
+                            [staging],
+                        )
+                    self.conn.execute(
+                        """
+                        INSERT INTO xbrl_companies VALUES (?, ?, ?, ?)
+                        ON CONFLICT (cik) DO UPDATE SET
+                            entity_name = excluded.entity_name,
+                            facts = excluded.facts,
+                            ingested_at = excluded.ingested_at
+                    """,
+                        [cik, document.get("entityName"), count, datetime.now()],
+                    )
+                    self.conn.execute("COMMIT")
+                except Exception:
+                    self.conn.execute("ROLLBACK")
+                    raise
+        finally:
+            os.unlink(staging)
+
+        logger.info(f"Ingested {count} XBRL facts for CIK {cik}")
+        return count
+
+    def _default_unit(self, cik: int, taxonomy: str, concept: str) -> Optional[str]:
+        """Most frequently reported unit for a concept."""
+        row = self.conn.execute(
+            """
+            SELECT unit FROM xbrl_facts
+            WHERE cik = ? AND taxonomy = ? AND concept = ?
+            GROUP BY unit ORDER BY COUNT(*) DESC, unit LIMIT 1
+        """,
+            [cik, taxonomy, concept],
+        ).fetchone()
+        return row[0] if row else None
+
+    def series(
+        self,
+        cik: int,
+        concept: str,
+        taxonomy: str = "us-gaap",
+        unit: Optional[str] = None,
+        period: str = "annual",
+        since: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Time series of one concept, one value per period (latest filing wins).
+
+        Args:
+            cik: Central Index Key
+            concept: XBRL concept (e.g., 'Revenues', 'NetIncomeLoss')
+            taxonomy: XBRL taxonomy (e.g., 'us-gaap', 'dei')
+            unit: Unit of measure; defaults to the most common one reported
+            period: 'annual', 'quarterly' or 'all'. Instant values (balance
+                sheet items) are always included.
+            since: Only periods ending on or after this date
+
+        Returns:
+            Rows with period_start, period_end, val, unit, fy, fp, form, filed,
+            oldest period first
+        """
+        with self._lock:
+            unit = unit or self._default_unit(cik, taxonomy, concept)
+            if unit is None:
+                return []
+
+            conditions = ["cik = ?", "taxonomy = ?", "concept = ?", "unit = ?"]
+            params: List[Any] = [cik, taxonomy, concept, unit]
+
+            if period in _PERIOD_DAYS:
+                low, high = _PERIOD_DAYS[period]
+                conditions.append(
+                    "(period_start IS NULL OR "
+                    "date_diff('day', period_start, period_end) BETWEEN ? AND ?)"
+                )
+                params.extend([low, high])
+            if since is not None:
+                conditions.append("period_end >= ?")
+                params.append(since)
+
+            rows = self.conn.execute(
+                f"""
+                SELECT period_start, period_end, val, unit, fy, fp, form, filed
+                FROM (
+                    SELECT *, row_number() OVER (
+                        PARTITION BY period_start, period_end
+                        ORDER BY filed DESC
+                    ) AS rn
+                    FROM xbrl_facts
+                    WHERE {" AND ".join(conditions)}
+                )
+                WHERE rn = 1
+                ORDER BY period_end, period_start
+            """,
+                params,
+            ).fetchall()
+
+        keys = ("period_start", "period_end", "val", "unit", "fy", "fp", "form", "filed")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def latest_values(
+        self,
+        cik: int,
+        concepts: Sequence[str],
+        taxonomy: str = "us-gaap",
+        units: Sequence[str] = ("USD", "USD/shares"),
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Most recently filed value of each concept.
+
+        Args:
+            cik: Central Index Key
+            concepts: XBRL concepts to look up
+            taxonomy: XBRL taxonomy
+            units: Acceptable units of measure
+
+        Returns:
+            Mapping of concept to a row with val, unit, period_end, form, filed
+        """
+        if not concepts:
+            return {}
+
+        concept_marks = ", ".join(["?"] * len(concepts))
+        unit_marks = ", ".join(["?"] * len(units))
+        with self._lock:
+            rows = self.conn.execute(
+                f"""
+                SELECT concept, val, unit, period_end, form, filed
+                FROM (
+                    SELECT *, row_number() OVER (
+                        PARTITION BY concept
+                        ORDER BY filed DESC, period_end DESC
+                    ) AS rn
+                    FROM xbrl_facts
+                    WHERE cik = ? AND taxonomy = ?
+                      AND concept IN ({concept_marks}) AND unit IN ({unit_marks})
+                )
+                WHERE rn = 1
+            """,
+                [cik, taxonomy, *concepts, *units],
+            ).fetchall()
+
+        keys = ("val", "unit", "period_end", "form", "filed")
+        return {row[0]: dict(zip(keys, row[1:])) for row in rows}
+
+    def peer_values(
+        self,
+        ciks: Iterable[int],
+        concept: str,
+        taxonomy: str = "us-gaap",
+        unit: Optional[str] = None,
+        fiscal_year: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Latest annual value of one concept for each company in a peer set.
+
+        Args:
+            ciks: Central Index Keys of the peer set
+            concept: XBRL concept
+            taxonomy: XBRL taxonomy
+            unit: Unit of measure; defaults to the most common one across peers
+            fiscal_year: Restrict to the annual period that filings tagged
+                with this fiscal year (``fy``) report as current; later
+                restatements of that period still win
+
+        Returns:
+            Rows with cik, entity_name, val, unit, period_end, form, filed,
+            largest value first
+        """
+        cik_list = list(ciks)
+        if not cik_list:
+            return []
+
+        cik_marks = ", ".join(["?"] * len(cik_list))
+        low, high = _PERIOD_DAYS["annual"]
+
+        with self._lock:
+            if unit is None:
+                row = self.conn.execute(
+                    f"""
+                    SELECT unit FROM xbrl_facts
+                    WHERE cik IN ({cik_marks}) AND taxonomy = ? AND concept = ?
+                    GROUP BY unit ORDER BY COUNT(*) DESC, unit LIMIT 1
+                """,
+                    [*cik_list, taxonomy, concept],
+                ).fetchone()
+                if row is None:
+                    return []
+                unit = row[0]
+
+            # A filing also repeats prior years as comparatives, so the fiscal
+            # year's own period is the latest one its filings report
+            year_filter = (
+                """
+                      AND period_end = (
+                          SELECT max(g.period_end) FROM xbrl_facts g
+                          WHERE g.cik = xbrl_facts.cik AND g.taxonomy = ?
+                            AND g.concept = ? AND g.unit = ? AND g.fy = ?
+                            AND (g.period_start IS NULL OR
+                                 date_diff('day', g.period_start, g.period_end)
+                                 BETWEEN ? AND ?)
+                      )"""
+                if fiscal_year is not None
+                else ""
+            )
+            params: List[Any] = [*cik_list, taxonomy, concept, unit, low, high]
+            if fiscal_year is not None:
+                params += [taxonomy, concept, unit, fiscal_year, low, high]
+
+            rows = self.conn.execute(
+                f"""
+                SELECT f.cik, c.entity_name, f.val, f.unit, f.period_end, f.form, f.filed
+                FROM (
+                    SELECT *, row_number() OVER (
+                        PARTITION BY cik
+                        ORDER BY period_end DESC, filed DESC
+                    ) AS rn
+                    FROM xbrl_facts
+                    WHERE cik IN ({cik_marks}) AND taxonomy = ? AND concept = ?
+                      AND unit = ?
+                      AND (period_start IS NULL OR
+                           date_diff('day', period_start, period_end) BETWEEN ? AND ?)
+                      {year_filter}
+                ) f
+                LEFT JOIN xbrl_companies c ON c.cik = f.cik
+                WHERE f.rn = 1
+                ORDER BY f.val DESC
+            """,
+                params,
+            ).fetchall()
+
+        keys = ("cik", "entity_name", "val", "unit", "period_end", "form", "filed")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+
+
+# Global fact store instance
+_xbrl_store: Optional[XbrlFactStore] = None
+_xbrl_store_lock = threading.Lock()
+
+
+def get_xbrl_store(db_path: Optional[Path] = None) -> XbrlFactStore:
+    """
+    Get or create global XBRL fact store instance.
+
+    Args:
+        db_path: Path to DuckDB database file
+
+    Returns:
+        XbrlFactStore instance
+    """
+    global _xbrl_store
+
+    with _xbrl_store_lock:
+        if _xbrl_store is None:
+            # Persist next to the API cache in the user's home directory
+            if db_path is None:
+                cache_dir = Path.home() / ".navam-invest" / "cache"
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                db_path = cache_dir / "xbrl_facts.duckdb"
+
+            _xbrl_store = XbrlFactStore(db_path)
+
+    return _xbrl_store
@@ -1,11 +1,35 @@
-"""Typer CLI entry point for Navam Invest."""
+"""Typer CLI entry point for Navam Invest.
+
+Besides the interactive TUI (``navam invest``), every workflow and agent can
+run headless for scripts and cron jobs. Headless commands stream progress as
+text or JSON lines, save the same reports as the TUI, accept a file of
+queries that are run concurrently, and exit with one of the EXIT_* codes.
+"""
 
 import asyncio
+import importlib
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import typer
 from rich.console import Console
+from rich.markdown import Markdown
+from rich.markup import escape
 
-from navam_invest.tui.app import run_tui
+from navam_invest.agents.registry import AGENT_FACTORIES, get_agent_pool
 
 app = typer.Typer(
     name="navam",
@@ -13,15 +37,513 @@ app = typer.Typer(
     add_completion=False,
 )
 console = Console()
+err_console = Console(stderr=True)
+
+# Exit codes for headless commands
+EXIT_OK = 0
+EXIT_FAILED = 1  # At least one query failed
+EXIT_USAGE = 2  # Bad arguments or no queries to run
+EXIT_CONFIG = 3  # Missing or invalid configuration (e.g., API keys)
+
+# Report type saved by `navam ask`, keyed by agent name: the router plus the
+# specialist names of the shared agent pool (agents.registry.AGENT_FACTORIES)
+AGENT_REPORT_TYPES: Dict[str, str] = {
+    "router": "general",
+    "portfolio": "portfolio",
+    "research": "research",
+    "quill": "equity_research",
+    "screen_forge": "screening",
+    "macro_lens": "macro_analysis",
+    "earnings_whisperer": "earnings",
+    "news_sentry": "news_monitoring",
+    "risk_shield": "risk_analysis",
+    "tax_scout": "tax_optimization",
+    "hedge_smith": "options_strategies",
+}
+
+# Agents available to `navam ask`
+AGENTS: List[str] = ["router", *AGENT_FACTORIES]
+
+
+def _load_factory(module: str, name: str) -> Callable[[], Awaitable[Any]]:
+    """Import a graph factory only when its command runs."""
+    return cast(
+        Callable[[], Awaitable[Any]], getattr(importlib.import_module(module), name)
+    )
+
+
+class Emitter:
+    """Writes headless progress and results as rich text or JSON lines."""
+
+    def __init__(self, json_lines: bool = False, quiet: bool = False):
+        """
+        Initialize emitter.
+
+        Args:
+            json_lines: Emit one JSON object per line on stdout
+            quiet: Suppress progress events (results are always written)
+        """
+        self.json_lines = json_lines
+        self.quiet = quiet
+        self._tool_calls_shown: set = set()
+
+    def _emit(self, event: str, job: str, **fields: Any) -> None:
+        record = {"event": event, "job": job, **fields}
+        sys.stdout.write(json.dumps(record, default=str) + "\n")
+        sys.stdout.flush()
+
+    def progress(self, job: str, node: str, output: Dict[str, Any]) -> None:
+        """Report a finished graph node and the tool calls it made."""
+        if self.quiet:
+            return
+
+        tools = []
+        for msg in output.get("messages", []) if isinstance(output, dict) else []:
+            for tool_call in getattr(msg, "tool_calls", None) or []:
+                call_id = tool_call.get("id", "")
+                if call_id not in self._tool_calls_shown:
+                    self._tool_calls_shown.add(call_id)
+                    tools.append(tool_call.get("name", "unknown"))
+
+        if self.json_lines:
+            self._emit("progress", job, node=node, tools=tools)
+        else:
+            console.print(f"[dim]\\[{job}] {node}[/dim]")
+            for tool_name in tools:
+                console.print(f"[dim]\\[{job}]   → {tool_name}[/dim]")
+
+    def result(self, job: str, output: str, report_path: Optional[str] = None) -> None:
+        """Report a completed query."""
+        if self.json_lines:
+            self._emit("result", job, status="ok", output=output, report=report_path)
+            return
+
+        console.print(f"\n[bold green]{job}[/bold green]")
+        console.print(Markdown(output))
+        if report_path:
+            console.print(f"[dim]📄 Report saved to: {report_path}[/dim]")
+
+    def error(self, job: str, message: str) -> None:
+        """Report a failed query."""
+        if self.json_lines:
+            self._emit("result", job, status="error", error=message)
+        else:
+            err_console.print(f"[red]✗ {job}: {message}[/red]")
+
+
+async def _stream_graph(
+    graph: Any,
+    initial_state: Dict[str, Any],
+    on_progress: Callable[[str, Dict[str, Any]], None],
+) -> Dict[str, Any]:
+    """Run a compiled graph to completion, reporting node updates.
+
+    Returns:
+        Final top-level graph state
+    """
+    state: Dict[str, Any] = {}
+    async for namespace, event_type, event_data in graph.astream(
+        initial_state, stream_mode=["values", "updates"], subgraphs=True
+    ):
+        if event_type == "values" and not namespace:
+            state = event_data
+        elif event_type == "updates":
+            for node_name, node_output in event_data.items():
+                on_progress(node_name, node_output or {})
+    return state
+
+
+def _final_text(state: Dict[str, Any]) -> str:
+    """Content of the last message in a graph state."""
+    messages = state.get("messages") or []
+    return getattr(messages[-1], "content", "") if messages else ""
+
+
+@dataclass(frozen=True)
+class WorkflowSpec:
+    """How to run one headless workflow command."""
+
+    module: str
+    factory: str
+    title: str
+    report_type: str
+    default_query: str
+    build_state: Callable[[str], Dict[str, Any]]
+    sections: Tuple[Tuple[str, str], ...]  # (report heading, state key)
+    query_heading: str
+
+
+def _initial_state(query_key: str, *empty_keys: str) -> Callable[[str], Dict[str, Any]]:
+    """Build the initial state factory shared by the workflow commands."""
+
+    def build(query: str) -> Dict[str, Any]:
+        from langchain_core.messages import HumanMessage
+
+        state: Dict[str, Any] = {
+            "messages": [HumanMessage(content=query)],
+            query_key: query,
+        }
+        state.update({key: "" for key in empty_keys})
+        return state
+
+    return build
+
+
+WORKFLOWS: Dict[str, WorkflowSpec] = {
+    "discover": WorkflowSpec(
+        module="navam_invest.workflows.idea_discovery",
+        factory="create_idea_discovery_workflow",
+        title="Investment Idea Discovery",
+        report_type="idea_discovery",
+        default_query="Generate a balanced watchlist of quality growth stocks",
+        build_state=_initial_state(
+            "screening_criteria",
+            "screen_results",
+            "fundamental_analysis",
+            "risk_assessment",
+        ),
+        sections=(
+            ("Screen Results", "screen_results"),
+            ("Fundamental Analysis", "fundamental_analysis"),
+            ("Risk Assessment", "risk_assessment"),
+        ),
+        query_heading="Screening Criteria",
+    ),
+    "protect": WorkflowSpec(
+        module="navam_invest.workflows.portfolio_protection",
+        factory="create_portfolio_protection_workflow",
+        title="Portfolio Protection Strategy",
+        report_type="portfolio_protection",
+        default_query="Analyze my portfolio for hedging opportunities",
+        build_state=_initial_state(
+            "portfolio_context", "risk_assessment", "hedging_strategies"
+        ),
+        sections=(
+            ("Risk Assessment", "risk_assessment"),
+            ("Hedging Strategies", "hedging_strategies"),
+        ),
+        query_heading="Portfolio Context",
+    ),
+    "optimize-tax": WorkflowSpec(
+        module="navam_invest.workflows.tax_optimization",
+        factory="create_tax_optimization_workflow",
+        title="Tax Optimization Strategy",
+        report_type="tax_optimization",
+        default_query="Analyze my portfolio for tax-loss harvesting opportunities",
+        build_state=_initial_state(
+            "portfolio_context", "tax_loss_opportunities", "replacement_strategies"
+        ),
+        sections=(
+            ("Tax-Loss Opportunities", "tax_loss_opportunities"),
+            ("Replacement Strategies", "replacement_strategies"),
+        ),
+        query_heading="Portfolio Context",
+    ),
+}
+
+
+def _read_queries(args: List[str], file: Optional[Path]) -> List[str]:
+    """Combine command-line queries with one query per line of a file.
+
+    Blank lines and lines starting with '#' are skipped; '-' reads stdin.
+    """
+    queries = [arg for arg in args if arg.strip()]
+    if file is not None:
+        text = (
+            sys.stdin.read() if str(file) == "-" else file.read_text(encoding="utf-8")
+        )
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                queries.append(line)
+    return queries
+
+
+async def _run_queries(
+    queries: List[str],
+    run_one: Callable[[str, str], Awaitable[Tuple[str, Optional[str]]]],
+    emitter: Emitter,
+    concurrency: int,
+) -> int:
+    """Run queries concurrently and report each outcome.
+
+    Args:
+        queries: Query texts
+        run_one: Coroutine taking (job id, query), returning (output, report path)
+        emitter: Output writer
+        concurrency: Maximum queries in flight
+
+    Returns:
+        Exit code
+    """
+    from navam_invest.net import aclose_http_clients
+    from navam_invest.utils.event_bus import get_event_bus
+    from navam_invest.utils.tracing import trace_run
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    failures = 0
+
+    async def run(index: int, query: str) -> None:
+        nonlocal failures
+        job = query if len(query) <= 40 else f"{query[:39]}…"
+        async with semaphore:
+            try:
+                # Each query is its own run: own event run ID and trace
+                async with get_event_bus().run() as run_id, trace_run(query, run_id):
+                    output, report_path = await run_one(job, query)
+            except Exception as e:
+                failures += 1
+                emitter.error(job, str(e))
+                return
+        emitter.result(job, output, report_path)
+
+    try:
+        await asyncio.gather(*(run(i, query) for i, query in enumerate(queries)))
+    finally:
+        await aclose_http_clients()
+
+    return EXIT_FAILED if failures else EXIT_OK
+
+
+def _execute(coro_factory: Callable[[], Coroutine[Any, Any, int]]) -> None:
+    """Run a headless command and exit with its status."""
+    from navam_invest.config.settings import ConfigurationError
+
+    try:
+        code = asyncio.run(coro_factory())
+    except ConfigurationError as e:
+        err_console.print(f"[red]{e}[/red]", highlight=False)
+        code = EXIT_CONFIG
+    raise typer.Exit(code=code)
+
+
+def _run_workflow_command(
+    name: str,
+    queries: List[str],
+    json_lines: bool,
+    quiet: bool,
+    concurrency: int,
+    save_reports: bool,
+) -> None:
+    """Shared body of the discover/protect/optimize-tax commands."""
+    from navam_invest.utils import save_agent_report
+
+    spec = WORKFLOWS[name]
+    emitter = Emitter(json_lines=json_lines, quiet=quiet)
+    queries = queries or [spec.default_query]
+
+    async def main() -> int:
+        workflow = await _load_factory(spec.module, spec.factory)()
+
+        async def run_one(job: str, query: str) -> Tuple[str, Optional[str]]:
+            state = await _stream_graph(
+                workflow,
+                spec.build_state(query),
+                lambda node, output: emitter.progress(job, node, output),
+            )
+            final = _final_text(state)
+
+            report_path = None
+            if save_reports:
+                content = f"# {spec.title}\n\n## {spec.query_heading}\n{query}\n\n"
+                for heading, key in spec.sections:
+                    content += f"## {heading}\n{state.get(key, '')}\n\n"
+                content += f"## Final Recommendations\n{final}"
+                report_path = save_agent_report(
+                    content=content,
+                    report_type=spec.report_type,
+                    context={"query": query[:50]},
+                )
+            return final, report_path
+
+        return await _run_queries(queries, run_one, emitter, concurrency)
+
+    _execute(main)
+
+
+# Shared option declarations
+_FILE_OPTION = typer.Option(
+    None, "--file", "-f", help="Read one query per line from a file ('-' for stdin)"
+)
+_JSON_OPTION = typer.Option(False, "--json", help="Write JSON lines instead of text")
+_QUIET_OPTION = typer.Option(False, "--quiet", "-q", help="Only print results")
+_CONCURRENCY_OPTION = typer.Option(2, "--concurrency", "-c", help="Queries run at once")
+_REPORTS_OPTION = typer.Option(
+    True, "--save-reports/--no-save-reports", help="Write a report per query"
+)
 
 
 @app.command()
 def invest() -> None:
     """Launch the interactive investment advisor chat interface."""
+    from navam_invest.tui.app import run_tui
+
     console.print("[bold green]Launching Navam Invest...[/bold green]")
     asyncio.run(run_tui())
 
 
+@app.command()
+def analyze(
+    symbols: List[str] = typer.Argument(None, help="Stock symbols to analyze"),
+    file: Optional[Path] = _FILE_OPTION,
+    json_lines: bool = _JSON_OPTION,
+    quiet: bool = _QUIET_OPTION,
+    concurrency: Optional[int] = typer.Option(
+        None, "--concurrency", "-c", help="Symbols analyzed at once"
+    ),
+    save_reports: bool = _REPORTS_OPTION,
+) -> None:
+    """Run the investment analysis workflow for one or more symbols."""
+    from navam_invest.utils.symbols import parse_symbols
+
+    # A file line may list several symbols ("AAPL MSFT" or "AAPL,MSFT")
+    symbols, invalid = parse_symbols(_read_queries(symbols or [], file))
+    if invalid:
+        err_console.print(
+            f"[red]Not ticker symbols: {escape(', '.join(invalid))}[/red]",
+            highlight=False,
+        )
+        raise typer.Exit(code=EXIT_USAGE)
+    if not symbols:
+        err_console.print("[red]Provide at least one symbol or --file[/red]")
+        raise typer.Exit(code=EXIT_USAGE)
+
+    emitter = Emitter(json_lines=json_lines, quiet=quiet)
+
+    async def main() -> int:
+        from navam_invest.net import aclose_http_clients
+        from navam_invest.workflows import run_investment_analysis_batch
+
+        def on_result(result: Any) -> None:
+            if result.error:
+                emitter.error(result.symbol, result.error)
+            else:
+                emitter.result(result.symbol, result.recommendation, result.report_path)
+
+        try:
+            results = await run_investment_analysis_batch(
+                symbols,
+                max_concurrency=concurrency,
+                save_reports=save_reports,
+                on_progress=emitter.progress,
+                on_result=on_result,
+            )
+        finally:
+            await aclose_http_clients()
+        return EXIT_FAILED if any(result.error for result in results) else EXIT_OK
+
+    _execute(main)
+
+
+@app.command()
+def discover(
+    criteria: List[str] = typer.Argument(None, help="Screening criteria"),
+    file: Optional[Path] = _FILE_OPTION,
+    json_lines: bool = _JSON_OPTION,
+    quiet: bool = _QUIET_OPTION,
+    concurrency: int = _CONCURRENCY_OPTION,
+    save_reports: bool = _REPORTS_OPTION,
+) -> None:
+    """Run the idea discovery workflow (Screen Forge → Quill → Risk Shield)."""
+    queries = _read_queries([" ".join(criteria)] if criteria else [], file)
+    _run_workflow_command(
+        "discover", queries, json_lines, quiet, concurrency, save_reports
+    )
+
+
+@app.command()
+def protect(
+    portfolio: List[str] = typer.Argument(None, help="Portfolio description"),
+    file: Optional[Path] = _FILE_OPTION,
+    json_lines: bool = _JSON_OPTION,
+    quiet: bool = _QUIET_OPTION,
+    concurrency: int = _CONCURRENCY_OPTION,
+    save_reports: bool = _REPORTS_OPTION,
+) -> None:
+    """Run the portfolio protection workflow (Risk Shield → Hedge Smith)."""
+    queries = _read_queries([" ".join(portfolio)] if portfolio else [], file)
+    _run_workflow_command(
+        "protect", queries, json_lines, quiet, concurrency, save_reports
+    )
+
+
+@app.command("optimize-tax")
+def optimize_tax(
+    portfolio: List[str] = typer.Argument(None, help="Portfolio description"),
+    file: Optional[Path] = _FILE_OPTION,
+    json_lines: bool = _JSON_OPTION,
+    quiet: bool = _QUIET_OPTION,
+    concurrency: int = _CONCURRENCY_OPTION,
+    save_reports: bool = _REPORTS_OPTION,
+) -> None:
+    """Run the tax optimization workflow (Tax Scout → Hedge Smith)."""
+    queries = _read_queries([" ".join(portfolio)] if portfolio else [], file)
+    _run_workflow_command(
+        "optimize-tax", queries, json_lines, quiet, concurrency, save_reports
+    )
+
+
+@app.command()
+def ask(
+    question: List[str] = typer.Argument(None, help="Question for the agent"),
+    agent: str = typer.Option(
+        "router", "--agent", "-a", help=f"Agent to ask: {', '.join(AGENTS)}"
+    ),
+    file: Optional[Path] = _FILE_OPTION,
+    json_lines: bool = _JSON_OPTION,
+    quiet: bool = _QUIET_OPTION,
+    concurrency: int = _CONCURRENCY_OPTION,
+    save_reports: bool = _REPORTS_OPTION,
+) -> None:
+    """Ask one agent a question (or every question in --file)."""
+    if agent not in AGENTS:
+        err_console.print(
+            f"[red]Unknown agent '{agent}'. Choose from: {', '.join(AGENTS)}[/red]"
+        )
+        raise typer.Exit(code=EXIT_USAGE)
+
+    queries = _read_queries([" ".join(question)] if question else [], file)
+    if not queries:
+        err_console.print("[red]Provide a question or --file[/red]")
+        raise typer.Exit(code=EXIT_USAGE)
+
+    from langchain_core.messages import HumanMessage
+
+    from navam_invest.utils import save_agent_report
+
+    report_type = AGENT_REPORT_TYPES.get(agent, "general")
+    emitter = Emitter(json_lines=json_lines, quiet=quiet)
+
+    async def main() -> int:
+        if agent == "router":
+            graph = await _load_factory(
+                "navam_invest.agents.router", "create_router_agent"
+            )()
+        else:
+            graph = await get_agent_pool().get(agent)
+
+        async def run_one(job: str, query: str) -> Tuple[str, Optional[str]]:
+            state = await _stream_graph(
+                graph,
+                {"messages": [HumanMessage(content=query)]},
+                lambda node, output: emitter.progress(job, node, output),
+            )
+            answer = _final_text(state)
+
+            report_path = None
+            if save_reports and answer:
+                report_path = save_agent_report(
+                    content=answer,
+                    report_type=report_type,
+                    context={"query": query[:50]},
+                )
+            return answer, report_path
+
+        return await _run_queries(queries, run_one, emitter, concurrency)
+
+    _execute(main)
+
+
 @app.command()
 def version() -> None:
     """Show version information."""
@@ -40,6 +562,13 @@ def main(ctx: typer.Context) -> None:
             "[bold cyan]Navam Invest[/bold cyan] - AI-powered investment advisor\n"
         )
         console.print("Usage: [bold]navam invest[/bold] - Launch interactive interface")
+        console.print("       [bold]navam analyze AAPL MSFT[/bold] - Analyze symbols")
+        console.print(
+            "       [bold]navam discover|protect|optimize-tax[/bold] - Run a workflow"
+        )
+        console.print(
+            '       [bold]navam ask --agent quill "..."[/bold] - Ask one agent'
+        )
         console.print("       [bold]navam version[/bold] - Show version")
         console.print("\nRun [bold]navam --help[/bold] for more information.")
 
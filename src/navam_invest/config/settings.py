@@ -37,6 +37,68 @@ class Settings(BaseSettings):
     anthropic_model: str = "claude-3-7-sonnet-20250219"
     temperature: float = 0.0
 
+    # HTTP client pool (shared by all data-source tools)
+    http_max_connections: int = 20  # Per host
+    http_max_keepalive_connections: int = 10  # Per host
+    http_keepalive_expiry: float = 30.0  # Seconds an idle connection is kept
+    http_timeout: float = 30.0  # Read/write/pool timeout in seconds
+    http_connect_timeout: float = 10.0
+    http2_enabled: bool = True  # Used when the optional h2 package is installed
+
+    # Retries and circuit breaking for data-source requests
+    http_max_retries: int = 2  # Retries after the first attempt
+    http_backoff_base: float = 0.5  # Seconds, doubled per retry with full jitter
+    http_backoff_max: float = 8.0
+    http_max_retry_after: float = 30.0  # Longer Retry-After values are not waited on
+    circuit_breaker_threshold: int = 5  # Consecutive failures that open a circuit
+    circuit_breaker_reset_seconds: float = 30.0
+
+    # Provider rate limits ("<count>/<second|minute|hour|day>", empty disables)
+    sec_edgar_rate_limit: str = "10/second"
+    finnhub_rate_limit: str = "60/minute"
+    alpha_vantage_rate_limit: str = "5/minute"
+    newsapi_rate_limit: str = "1000/day"
+    fred_rate_limit: str = "120/minute"
+    tiingo_rate_limit: str = "50/hour"
+    fmp_rate_limit: str = "250/day"
+    treasury_rate_limit: str = ""
+    provider_max_concurrency: int = 4  # In-flight requests per provider
+    # Fail instead of queueing longer than this; never below one token interval
+    rate_limit_max_wait: float = 60.0
+
+    # Thread pool for blocking yfinance calls (network I/O plus pandas parsing)
+    yahoo_finance_max_workers: int = 4  # Yahoo tool calls run at once; others queue
+    yahoo_finance_timeout: float = 60.0  # Seconds per call, queueing included; 0 disables
+
+    # Workflows
+    analysis_workflow_parallel: bool = True  # False runs /analyze agents one by one
+    analysis_max_concurrency: int = 3  # Symbols analyzed at once by batch /analyze
+
+    # Router
+    router_max_parallel_agents: int = 3  # Specialists run at once per supervisor turn
+    router_fast_path: bool = True  # Send clear single-agent queries straight to the agent
+    router_fast_path_threshold: float = 0.6  # Minimum rule confidence for the fast path
+
+    # Progress events
+    event_queue_size: int = 1000  # Events buffered per subscriber before the oldest is dropped
+    event_log_file: str = ""  # Append every progress event to this JSONL file when set
+
+    # Tracing
+    tracing_enabled: bool = True  # Record a span tree per run (see /trace)
+    trace_dir: str = ""  # Export each run as JSONL and a Chrome trace here; empty keeps traces in memory only
+    trace_retention: int = 20  # Newest exported runs kept in trace_dir; older files are deleted
+
+    # Market snapshot (get_market_indices): comma-separated "Name=SYMBOL" entries
+    market_indices: str = "S&P 500=^GSPC,Dow Jones=^DJI,Nasdaq=^IXIC,Russell 2000=^RUT,VIX=^VIX"
+    market_sector_etfs: str = (
+        "Technology=XLK,Financials=XLF,Health Care=XLV,Energy=XLE,Industrials=XLI,"
+        "Consumer Discretionary=XLY,Consumer Staples=XLP,Utilities=XLU,Materials=XLB,"
+        "Real Estate=XLRE,Communication Services=XLC"
+    )
+
+    # TUI startup
+    tui_prewarm_agents: bool = True  # Build specialist agents in the background after startup
+
     # Application settings
     debug: bool = False
 
@@ -69,3 +131,21 @@ def get_settings() -> Settings:
                 f"Get your Anthropic API key at: https://console.anthropic.com/"
             ) from e
         raise
+
+
+def get_settings_or_defaults() -> Settings:
+    """Get application settings, falling back to the field defaults.
+
+    Infrastructure such as HTTP pools, rate limits, worker pools, tracing and
+    the event bus must keep working without a complete configuration (e.g.
+    before an API key is set), so it reads its settings through this instead
+    of ``get_settings()``.
+
+    Returns:
+        Configured settings, or settings holding only field defaults when the
+        configuration is incomplete
+    """
+    try:
+        return get_settings()
+    except Exception:
+        return Settings.model_construct()
@@ -0,0 +1,50 @@
+"""
+Networking layer shared by the data-source tools.
+
+Provides pooled HTTP clients with keep-alive connections per host,
+per-provider rate limiting, retries with per-host circuit breakers, and
+bounded thread pools for providers reached through blocking libraries,
+shared by all data-source tools.
+"""
+
+from navam_invest.net.client import (
+    HttpClientConfig,
+    aclose_http_clients,
+    configure_http_clients,
+    get_http_client,
+)
+from navam_invest.net.executor import (
+    BlockingExecutor,
+    get_blocking_executor,
+    get_executor_stats,
+)
+from navam_invest.net.fetcher import fetch
+from navam_invest.net.rate_limit import (
+    RateLimitExceededError,
+    get_rate_limit_stats,
+    get_rate_limiter,
+)
+from navam_invest.net.resilience import (
+    CircuitOpenError,
+    RetryPolicy,
+    configure_retry_policy,
+    get_circuit_stats,
+)
+
+__all__ = [
+    "BlockingExecutor",
+    "CircuitOpenError",
+    "HttpClientConfig",
+    "RateLimitExceededError",
+    "RetryPolicy",
+    "aclose_http_clients",
+    "configure_http_clients",
+    "configure_retry_policy",
+    "fetch",
+    "get_blocking_executor",
+    "get_circuit_stats",
+    "get_executor_stats",
+    "get_http_client",
+    "get_rate_limit_stats",
+    "get_rate_limiter",
+]
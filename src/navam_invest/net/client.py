@@ -0,0 +1,127 @@
+"""
+Shared HTTP client registry for data-source tools.
+
+Keeps one keep-alive connection pool per host so repeated API calls reuse
+TCP/TLS connections instead of paying a fresh handshake on every request.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class HttpClientConfig:
+    """Pool limits and timeouts applied to every pooled client."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+    http2: bool = True
+
+
+_config: Optional[HttpClientConfig] = None
+
+# httpx.AsyncClient is bound to the event loop that opened its connections,
+# so pools are kept per loop: loop -> {host: client}
+_clients: "weakref.WeakKeyDictionary[Any, Dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def get_http_config() -> HttpClientConfig:
+    """Get pool configuration from settings, falling back to defaults.
+
+    Returns:
+        HttpClientConfig for newly created clients
+    """
+    global _config
+
+    if _config is None:
+        from navam_invest.config.settings import get_settings_or_defaults
+
+        settings = get_settings_or_defaults()
+        _config = HttpClientConfig(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+            timeout=settings.http_timeout,
+            connect_timeout=settings.http_connect_timeout,
+            http2=settings.http2_enabled,
+        )
+
+    return _config
+
+
+def configure_http_clients(config: HttpClientConfig) -> None:
+    """Override pool configuration for clients created from now on.
+
+    Args:
+        config: Pool limits and timeouts to apply
+    """
+    global _config
+    _config = config
+
+
+def _create_client(config: HttpClientConfig) -> httpx.AsyncClient:
+    """Create a pooled client from configuration."""
+    return httpx.AsyncClient(
+        http2=config.http2 and HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+    )
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """Get the pooled client for the host of ``url`` on the running event loop.
+
+    Args:
+        url: Request URL (only scheme, host and port are used)
+
+    Returns:
+        Shared httpx.AsyncClient; callers must not close it
+    """
+    loop = asyncio.get_running_loop()
+    parsed = httpx.URL(url)
+    host = f"{parsed.scheme}://{parsed.host}:{parsed.port or ''}"
+
+    with _lock:
+        clients = _clients.setdefault(loop, {})
+        client = clients.get(host)
+        if client is None or client.is_closed:
+            client = _create_client(get_http_config())
+            clients[host] = client
+            logger.debug(f"Opened pooled HTTP client for {host}")
+        return client
+
+
+async def aclose_http_clients() -> None:
+    """Close all pooled clients opened on the running event loop."""
+    loop = asyncio.get_running_loop()
+
+    with _lock:
+        clients = _clients.pop(loop, {})
+
+    for host, client in clients.items():
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Error closing HTTP client for {host}: {e}")
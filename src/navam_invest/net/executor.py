@@ -0,0 +1,240 @@
+"""
+Bounded thread pools for blocking provider libraries.
+
+Some providers are only reachable through synchronous libraries (yfinance
+does network I/O and pandas parsing on the calling thread). Their tools run
+on a dedicated, size-bounded pool per provider instead of the event loop's
+default executor, so they neither starve other blocking work nor hide how
+long calls wait for a worker.
+
+A call that times out or is cancelled while still queued never runs; one
+that is already running finishes in the background and its result is
+discarded.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+
+class BlockingExecutor:
+    """Thread pool for one provider with queue-depth and run-time metrics."""
+
+    def __init__(
+        self,
+        provider: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize provider executor.
+
+        Args:
+            provider: Provider name (matches the cache source name)
+            max_workers: Threads running calls at once; further calls queue
+            timeout_seconds: Longest a call may take, queueing included
+                (0 disables the timeout)
+        """
+        self.provider = provider
+        self.max_workers = max(1, max_workers)
+        self.timeout_seconds = timeout_seconds
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"navam-{provider}"
+        )
+
+        self._stats_lock = threading.Lock()
+        self.calls = 0
+        self.queued = 0
+        self.running = 0
+        self.max_queued = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.errors = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_observed = 0.0
+        self.total_run_seconds = 0.0
+        self.max_run_observed = 0.0
+
+    def _execute(
+        self,
+        submitted: float,
+        context: contextvars.Context,
+        func: Callable[..., T],
+        args: tuple,
+        kwargs: dict,
+    ) -> T:
+        """Worker side of ``run``: record the wait, then call ``func``."""
+        started = time.monotonic()
+        waited = started - submitted
+        with self._stats_lock:
+            self.queued -= 1
+            self.running += 1
+            self.total_wait_seconds += waited
+            self.max_wait_observed = max(self.max_wait_observed, waited)
+
+        try:
+            # Run in the caller's context so tracing spans and run IDs carry over
+            return context.run(func, *args, **kwargs)
+        finally:
+            elapsed = time.monotonic() - started
+            with self._stats_lock:
+                self.running -= 1
+                self.total_run_seconds += elapsed
+                self.max_run_observed = max(self.max_run_observed, elapsed)
+
+    async def run(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run a blocking function on the pool and await its result.
+
+        Args:
+            func: Blocking function
+            *args: Positional arguments for ``func``
+            timeout: Override of the executor's timeout in seconds
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The function's return value
+
+        Raises:
+            asyncio.TimeoutError: If the call did not finish in time
+        """
+        timeout = self.timeout_seconds if timeout is None else timeout
+        with self._stats_lock:
+            self.calls += 1
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+        future = self._pool.submit(
+            self._execute,
+            time.monotonic(),
+            contextvars.copy_context(),
+            func,
+            args,
+            kwargs,
+        )
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=timeout or None
+            )
+        except asyncio.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            self._abandon(future)
+            logger.warning(f"{self.provider} call timed out after {timeout:.0f}s")
+            raise
+        except asyncio.CancelledError:
+            self._abandon(future)
+            raise
+        except Exception:
+            with self._stats_lock:
+                self.errors += 1
+            raise
+
+    def _abandon(self, future: concurrent.futures.Future) -> None:
+        """Drop a call nobody waits for; it only never runs if still queued."""
+        if future.cancel():
+            with self._stats_lock:
+                self.queued -= 1
+                self.cancelled += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queueing and execution metrics.
+
+        Returns:
+            Dictionary with call counts, queue depth and timings
+        """
+        with self._stats_lock:
+            started = self.calls - self.queued - self.cancelled
+            return {
+                "provider": self.provider,
+                "max_workers": self.max_workers,
+                "calls": self.calls,
+                "queued": self.queued,
+                "running": self.running,
+                "max_queued": self.max_queued,
+                "timeouts": self.timeouts,
+                "cancelled": self.cancelled,
+                "errors": self.errors,
+                "avg_wait_ms": round(self.total_wait_seconds * 1000 / started, 1)
+                if started
+                else 0.0,
+                "max_wait_ms": round(self.max_wait_observed * 1000, 1),
+                "avg_run_ms": round(self.total_run_seconds * 1000 / started, 1)
+                if started
+                else 0.0,
+                "max_run_ms": round(self.max_run_observed * 1000, 1),
+            }
+
+    def shutdown(self) -> None:
+        """Stop the pool, dropping queued calls."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+_executors: Dict[str, BlockingExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _create_executor(provider: str) -> BlockingExecutor:
+    """Create an executor from Settings, falling back to defaults."""
+    from navam_invest.config.settings import get_settings_or_defaults
+
+    settings = get_settings_or_defaults()
+    max_workers = getattr(settings, f"{provider}_max_workers", DEFAULT_MAX_WORKERS)
+    timeout = getattr(settings, f"{provider}_timeout", DEFAULT_TIMEOUT_SECONDS)
+    return BlockingExecutor(provider, max_workers, timeout)
+
+
+def get_blocking_executor(provider: str) -> BlockingExecutor:
+    """Get the shared executor for a provider.
+
+    Args:
+        provider: Provider name (matches the cache source name)
+
+    Returns:
+        BlockingExecutor instance
+    """
+    with _executors_lock:
+        executor = _executors.get(provider)
+        if executor is None:
+            executor = _create_executor(provider)
+            _executors[provider] = executor
+        return executor
+
+
+def get_executor_stats() -> Dict[str, Dict[str, Any]]:
+    """Get queueing and execution metrics for every executor used so far.
+
+    Returns:
+        Mapping of provider name to executor statistics
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+    return {executor.provider: executor.stats() for executor in executors}
+
+
+def reset_blocking_executors() -> None:
+    """Shut down all executors (used by tests and after settings changes)."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown()
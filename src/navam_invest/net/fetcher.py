@@ -0,0 +1,145 @@
+"""
+Fetch layer used by the data-source tool helpers.
+
+Routes every request through the host's circuit breaker, the provider's rate
+limiter and the shared pooled client, retrying transient failures.
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import httpx
+
+from navam_invest.net.client import get_http_client
+from navam_invest.net.rate_limit import get_rate_limiter
+from navam_invest.net.resilience import (
+    RETRYABLE_STATUS_CODES,
+    get_circuit_breaker,
+    get_retry_policy,
+    parse_retry_after,
+)
+from navam_invest.utils.tracing import FETCH, span
+
+logger = logging.getLogger(__name__)
+
+
+async def _send(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Optional[Dict[str, Any]],
+    headers: Optional[Dict[str, str]],
+    destination: Optional[Path],
+) -> httpx.Response:
+    """Send one GET, streaming a successful body to ``destination`` if given."""
+    if destination is None:
+        return await client.get(url, params=params, headers=headers)
+
+    async with client.stream("GET", url, params=params, headers=headers) as response:
+        if response.is_success:
+            with open(destination, "wb") as f:
+                async for chunk in response.aiter_bytes():
+                    f.write(chunk)
+        else:
+            await response.aread()
+        return response
+
+
+async def fetch(
+    provider: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    destination: Optional[Path] = None,
+) -> httpx.Response:
+    """Send a GET request within the provider's budget, retrying transient failures.
+
+    Timeouts, connection errors, 429 and 5xx responses are retried with
+    jittered exponential backoff (or the server's ``Retry-After``). Other
+    responses are returned as-is.
+
+    Args:
+        provider: Provider name (matches the cache source name)
+        url: Request URL
+        params: Query parameters
+        headers: Request headers
+        destination: If given, a successful response body is streamed to this
+            file instead of being held in memory
+
+    Returns:
+        HTTP response; callers decide how to handle error statuses
+
+    Raises:
+        RateLimitExceededError: If the provider budget cannot be met in time
+        CircuitOpenError: If the host is failing and its circuit is open
+        httpx.TransportError: If the last attempt failed at the transport level
+    """
+    with span(f"fetch {provider}", FETCH, host=httpx.URL(url).host) as traced:
+        response = await _fetch(provider, url, params, headers, destination, traced)
+        traced.set(status_code=response.status_code)
+        return response
+
+
+async def _fetch(
+    provider: str,
+    url: str,
+    params: Optional[Dict[str, Any]],
+    headers: Optional[Dict[str, str]],
+    destination: Optional[Path],
+    traced: Any,
+) -> httpx.Response:
+    """Untraced body of ``fetch``; records attempts on ``traced``."""
+    client = get_http_client(url)
+    limiter = get_rate_limiter(provider)
+    policy = get_retry_policy()
+    breaker = get_circuit_breaker(httpx.URL(url).host)
+
+    attempt = 0
+    while True:
+        breaker.before_request()
+
+        try:
+            async with limiter.slot():
+                response = await _send(client, url, params, headers, destination)
+        except httpx.TransportError as e:
+            breaker.record_failure()
+            if attempt >= policy.max_retries:
+                raise
+            delay = policy.backoff(attempt)
+            logger.info(
+                f"{provider} request failed ({type(e).__name__}); "
+                f"retry {attempt + 1}/{policy.max_retries} in {delay:.2f}s"
+            )
+        except BaseException:
+            # Cancelled or rejected by the rate limiter - no verdict on the host
+            breaker.record_abandoned()
+            raise
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                breaker.record_success()
+                return response
+
+            # 429 means the host is up; only server errors count as failures
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if attempt >= policy.max_retries:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None and retry_after > policy.max_retry_after:
+                # Not worth holding the agent this long
+                return response
+            delay = retry_after if retry_after is not None else policy.backoff(attempt)
+            logger.info(
+                f"{provider} returned HTTP {response.status_code}; "
+                f"retry {attempt + 1}/{policy.max_retries} in {delay:.2f}s"
+            )
+
+        breaker.record_retry()
+        attempt += 1
+        traced.set(retries=attempt)
+        await asyncio.sleep(delay)
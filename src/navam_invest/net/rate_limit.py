@@ -0,0 +1,314 @@
+"""
+Per-provider rate limiting and concurrency governance.
+
+Each data provider gets a token bucket sized from its published budget plus a
+concurrency semaphore. Callers over budget are queued (they sleep until their
+reserved token refills) instead of being sent upstream to collect a 429.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Published free-tier budgets, overridable through Settings
+DEFAULT_RATE_LIMITS: Dict[str, str] = {
+    "sec_edgar": "10/second",  # SEC fair access policy
+    "finnhub": "60/minute",
+    "alpha_vantage": "5/minute",
+    "newsapi": "1000/day",
+    "fred": "120/minute",
+    "tiingo": "50/hour",
+    "fmp": "250/day",
+    "treasury": "",  # No published limit
+}
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_WAIT_SECONDS = 60.0
+
+_PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0, "day": 86400.0}
+
+
+class RateLimitExceededError(Exception):
+    """Raised when a provider's budget cannot be met within the maximum wait."""
+
+    pass
+
+
+def parse_rate(spec: str) -> Optional[Tuple[int, float]]:
+    """Parse a rate specification such as ``"60/minute"``.
+
+    Args:
+        spec: ``"<count>/<second|minute|hour|day>"``; empty disables limiting
+
+    Returns:
+        Tuple of (requests, period in seconds), or None if unlimited
+
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    spec = spec.strip().lower()
+    if not spec:
+        return None
+
+    try:
+        count_str, unit = spec.split("/", 1)
+        count = int(count_str)
+        period = _PERIODS[unit.strip().rstrip("s")]
+    except (ValueError, KeyError):
+        raise ValueError(
+            f"Invalid rate limit '{spec}'. Expected '<count>/<second|minute|hour|day>'"
+        )
+
+    if count <= 0:
+        raise ValueError(f"Invalid rate limit '{spec}'. Count must be positive")
+
+    return count, period
+
+
+class TokenBucket:
+    """Thread-safe token bucket that lets callers reserve future tokens.
+
+    The token balance may go negative: each reservation returns how long the
+    caller has to wait, so concurrent callers queue in arrival order.
+    """
+
+    def __init__(self, requests: int, period_seconds: float):
+        """
+        Initialize token bucket.
+
+        Args:
+            requests: Requests allowed per period (also the burst size)
+            period_seconds: Length of the period in seconds
+        """
+        self.capacity = float(requests)
+        self.rate = requests / period_seconds
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """
+        Reserve one token.
+
+        Args:
+            max_wait: Maximum acceptable wait in seconds
+
+        Returns:
+            Seconds to wait before the reserved token may be used
+
+        Raises:
+            RateLimitExceededError: If the wait would exceed ``max_wait``
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+            wait = max(0.0, (1.0 - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                raise RateLimitExceededError(
+                    f"Rate limit budget exhausted (next slot in {wait:.0f}s)"
+                )
+
+            self._tokens -= 1.0
+            return wait
+
+    def refund(self) -> None:
+        """Return a reserved token that was not used."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1.0)
+
+
+class ProviderLimiter:
+    """Token bucket plus concurrency cap for one provider, with wait metrics."""
+
+    def __init__(
+        self,
+        provider: str,
+        rate: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+    ):
+        """
+        Initialize provider limiter.
+
+        Args:
+            provider: Provider name (matches the cache source name)
+            rate: Rate specification, see parse_rate()
+            max_concurrency: Maximum in-flight requests per event loop
+            max_wait_seconds: Longest a caller may be queued before failing.
+                Raised to one refill interval for slow budgets (e.g. 72s at
+                50/hour), so the next caller past the burst still queues.
+        """
+        parsed = parse_rate(rate)
+        self.provider = provider
+        self.rate = rate
+        self.bucket = TokenBucket(*parsed) if parsed else None
+        self.max_concurrency = max_concurrency
+        self.max_wait_seconds = (
+            max(max_wait_seconds, parsed[1] / parsed[0]) if parsed else max_wait_seconds
+        )
+
+        # asyncio primitives belong to one event loop
+        self._semaphores: weakref.WeakKeyDictionary[Any, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.rejected = 0
+        self.queued = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_observed = 0.0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a concurrency slot and a rate token, then hold the slot."""
+        semaphore = self._semaphore()
+        start = time.monotonic()
+        with self._stats_lock:
+            self.queued += 1
+
+        try:
+            await semaphore.acquire()
+            try:
+                await self._wait_for_token()
+            except BaseException:
+                semaphore.release()
+                raise
+        finally:
+            with self._stats_lock:
+                self.queued -= 1
+
+        self._record(time.monotonic() - start)
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    async def _wait_for_token(self) -> None:
+        """Reserve a rate token and sleep until it becomes usable."""
+        if self.bucket is None:
+            return
+
+        try:
+            wait = self.bucket.reserve(self.max_wait_seconds)
+        except RateLimitExceededError as e:
+            with self._stats_lock:
+                self.rejected += 1
+            raise RateLimitExceededError(f"{self.provider}: {e}") from None
+
+        if wait > 0:
+            logger.debug(f"Rate limit: {self.provider} queued {wait:.2f}s")
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.bucket.refund()
+                raise
+
+    def _record(self, waited: float) -> None:
+        """Record the time a request spent queued."""
+        with self._stats_lock:
+            self.requests += 1
+            self.total_wait_seconds += waited
+            self.max_wait_observed = max(self.max_wait_observed, waited)
+            if waited >= 0.001:
+                self.throttled += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get wait-time metrics.
+
+        Returns:
+            Dictionary with request counts and queueing times
+        """
+        with self._stats_lock:
+            return {
+                "provider": self.provider,
+                "rate": self.rate or "unlimited",
+                "max_concurrency": self.max_concurrency,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "rejected": self.rejected,
+                "queued": self.queued,
+                "total_wait_seconds": round(self.total_wait_seconds, 3),
+                "avg_wait_ms": round(
+                    self.total_wait_seconds * 1000 / self.requests, 1
+                )
+                if self.requests
+                else 0.0,
+                "max_wait_ms": round(self.max_wait_observed * 1000, 1),
+            }
+
+
+_limiters: Dict[str, ProviderLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _create_limiter(provider: str) -> ProviderLimiter:
+    """Create a limiter from Settings, falling back to published defaults."""
+    from navam_invest.config.settings import get_settings_or_defaults
+
+    settings = get_settings_or_defaults()
+    default_rate = DEFAULT_RATE_LIMITS.get(provider, "")
+    rate = getattr(settings, f"{provider}_rate_limit", default_rate)
+    max_concurrency = settings.provider_max_concurrency
+    max_wait = settings.rate_limit_max_wait
+
+    try:
+        return ProviderLimiter(provider, rate, max_concurrency, max_wait)
+    except ValueError as e:
+        logger.warning(f"{e}; using default for {provider}")
+        return ProviderLimiter(
+            provider, DEFAULT_RATE_LIMITS.get(provider, ""), max_concurrency, max_wait
+        )
+
+
+def get_rate_limiter(provider: str) -> ProviderLimiter:
+    """Get the shared limiter for a provider.
+
+    Args:
+        provider: Provider name (matches the cache source name)
+
+    Returns:
+        ProviderLimiter shared by all callers in the process
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = _create_limiter(provider)
+            _limiters[provider] = limiter
+        return limiter
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Get wait-time metrics for every provider used so far.
+
+    Returns:
+        Mapping of provider name to limiter statistics
+    """
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.provider: limiter.stats() for limiter in limiters}
+
+
+def reset_rate_limiters() -> None:
+    """Drop all limiters so they are rebuilt from current settings."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,277 @@
+"""
+Retry and circuit-breaker policies for the fetch layer.
+
+Idempotent GETs are retried on transient failures (timeouts, connection
+errors, 429 and 5xx responses) with bounded, jittered exponential backoff,
+honoring ``Retry-After``. A per-host circuit breaker fails fast while a
+provider is down instead of tying up every agent for the full timeout.
+"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised when a host's circuit breaker is open."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry and circuit-breaker configuration."""
+
+    max_retries: int = 2
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    max_retry_after: float = 30.0
+    breaker_threshold: int = 5
+    breaker_reset_seconds: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute a full-jitter exponential backoff delay.
+
+        Args:
+            attempt: Zero-based retry attempt
+
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, ceiling)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Delay in seconds, or None if absent or unparseable
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one host.
+
+    closed -> open after ``threshold`` consecutive failures; open -> half-open
+    once ``reset_seconds`` have passed, letting a single trial request through;
+    the trial's outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, host: str, threshold: int = 5, reset_seconds: float = 30.0):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            host: Host name, used in errors and statistics
+            threshold: Consecutive failures that open the circuit
+            reset_seconds: Time the circuit stays open before a trial request
+        """
+        self.host = host
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+        # Observable counters
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    def before_request(self) -> None:
+        """
+        Check whether a request may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a trial is in flight
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self.reset_seconds - (time.monotonic() - self._opened_at)
+                if remaining > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(
+                        f"{self.host} is unavailable after "
+                        f"{self._consecutive_failures} consecutive failures; "
+                        f"retry in {remaining:.0f}s"
+                    )
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self.state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    self.rejected += 1
+                    raise CircuitOpenError(
+                        f"{self.host} is recovering; a trial request is in flight"
+                    )
+                self._trial_in_flight = True
+
+            self.requests += 1
+
+    def record_success(self) -> None:
+        """Record a successful response and close the circuit."""
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit closed for {self.host}")
+            self.state = self.CLOSED
+            self._consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit past the threshold."""
+        with self._lock:
+            self.failures += 1
+            self._consecutive_failures += 1
+            self._trial_in_flight = False
+
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED
+                and self._consecutive_failures >= self.threshold
+            ):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self.times_opened += 1
+                logger.warning(
+                    f"Circuit opened for {self.host} after "
+                    f"{self._consecutive_failures} consecutive failures"
+                )
+
+    def record_abandoned(self) -> None:
+        """Release a trial slot for a request that ended without an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_retry(self) -> None:
+        """Record that a request is being retried."""
+        with self._lock:
+            self.retries += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get breaker state and counters.
+
+        Returns:
+            Dictionary with state, retry and failure counts
+        """
+        with self._lock:
+            return {
+                "host": self.host,
+                "state": self.state,
+                "requests": self.requests,
+                "retries": self.retries,
+                "failures": self.failures,
+                "consecutive_failures": self._consecutive_failures,
+                "rejected": self.rejected,
+                "times_opened": self.times_opened,
+            }
+
+
+_policy: Optional[RetryPolicy] = None
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Get retry policy from settings, falling back to defaults.
+
+    Returns:
+        Active RetryPolicy
+    """
+    global _policy
+
+    if _policy is None:
+        from navam_invest.config.settings import get_settings_or_defaults
+
+        settings = get_settings_or_defaults()
+        _policy = RetryPolicy(
+            max_retries=settings.http_max_retries,
+            backoff_base=settings.http_backoff_base,
+            backoff_max=settings.http_backoff_max,
+            max_retry_after=settings.http_max_retry_after,
+            breaker_threshold=settings.circuit_breaker_threshold,
+            breaker_reset_seconds=settings.circuit_breaker_reset_seconds,
+        )
+
+    return _policy
+
+
+def configure_retry_policy(policy: RetryPolicy) -> None:
+    """Override the retry policy and drop existing circuit breakers.
+
+    Args:
+        policy: Policy to apply from now on
+    """
+    global _policy
+    _policy = policy
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Get the shared circuit breaker for a host.
+
+    Args:
+        host: Host name
+
+    Returns:
+        CircuitBreaker shared by all callers in the process
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            policy = get_retry_policy()
+            breaker = CircuitBreaker(
+                host, policy.breaker_threshold, policy.breaker_reset_seconds
+            )
+            _breakers[host] = breaker
+        return breaker
+
+
+def get_circuit_stats() -> Dict[str, Dict[str, Any]]:
+    """Get retry counts and breaker state for every host used so far.
+
+    Returns:
+        Mapping of host name to breaker statistics
+    """
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.host: breaker.stats() for breaker in breakers}
@@ -1,133 +1,28 @@
 """Unified tools registry for navam-invest agents."""
 
 from functools import wraps
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from langchain_core.tools import BaseTool, StructuredTool
 
-# Alpha Vantage tools
-from navam_invest.tools.alpha_vantage import get_stock_overview, get_stock_price
-
-# File reading tools
-from navam_invest.tools.file_reader import list_local_files, read_local_file
-
-# FRED tools
-from navam_invest.tools.fred import get_economic_indicator, get_key_macro_indicators
-
-# NewsAPI tools
-from navam_invest.tools.newsapi import (
-    get_company_news,
-    get_top_financial_headlines,
-    search_market_news,
-)
-
-# Finnhub tools
-from navam_invest.tools.finnhub import (
-    get_company_news_sentiment,
-    get_finnhub_company_news,
-    get_insider_sentiment,
-    get_recommendation_trends,
-    get_social_sentiment,
-)
-
-# Tiingo tools
-from navam_invest.tools.tiingo import (
-    get_fundamentals_daily,
-    get_fundamentals_definitions,
-    get_fundamentals_statements,
-    get_historical_fundamentals,
-)
-
-# SEC EDGAR tools
-from navam_invest.tools.sec_edgar import (
-    get_company_facts,
-    get_company_filings,
-    get_insider_transactions,
-    get_institutional_holdings,
-    get_latest_10k,
-    get_latest_10q,
-    get_latest_8k,
-    search_company_by_ticker,
-    search_filings_by_form,
+from navam_invest.tools.registry import (
+    TOOL_MODULES,
+    LazyTool,
+    create_lazy_tools,
+    load_implementation,
 )
 
-# Treasury tools
-from navam_invest.tools.treasury import (
-    get_debt_to_gdp,
-    get_treasury_rate,
-    get_treasury_yield_curve,
-    get_treasury_yield_spread,
-)
+# Unified tools registry. Entries are LazyTool proxies built from the metadata
+# manifest; provider modules (yfinance, pandas, HTTP clients) are imported only
+# when one of their tools is first called.
+TOOLS: Dict[str, BaseTool] = create_lazy_tools()
 
-# Yahoo Finance tools
-from navam_invest.tools.yahoo_finance import (
-    get_analyst_recommendations,
-    get_company_info,
-    get_dividends,
-    get_earnings_calendar,
-    get_earnings_history,
-    get_financials,
-    get_historical_data,
-    get_institutional_holders,
-    get_market_indices,
-    get_options_chain,
-    get_quote,
-)
 
-# Unified tools registry
-TOOLS: Dict[str, BaseTool] = {
-    # Market Data (Alpha Vantage)
-    "get_stock_price": get_stock_price,
-    "get_stock_overview": get_stock_overview,
-    # File Reading (Local Data)
-    "read_local_file": read_local_file,
-    "list_local_files": list_local_files,
-    # Alternative Data & Sentiment (Finnhub)
-    "get_company_news_sentiment": get_company_news_sentiment,
-    "get_social_sentiment": get_social_sentiment,
-    "get_insider_sentiment": get_insider_sentiment,
-    "get_recommendation_trends": get_recommendation_trends,
-    "get_finnhub_company_news": get_finnhub_company_news,
-    # Historical Fundamentals (Tiingo)
-    "get_fundamentals_daily": get_fundamentals_daily,
-    "get_fundamentals_statements": get_fundamentals_statements,
-    "get_fundamentals_definitions": get_fundamentals_definitions,
-    "get_historical_fundamentals": get_historical_fundamentals,
-    # Macro Data (FRED)
-    "get_economic_indicator": get_economic_indicator,
-    "get_key_macro_indicators": get_key_macro_indicators,
-    # News & Sentiment (NewsAPI)
-    "search_market_news": search_market_news,
-    "get_top_financial_headlines": get_top_financial_headlines,
-    "get_company_news": get_company_news,
-    # Treasury Data
-    "get_treasury_yield_curve": get_treasury_yield_curve,
-    "get_treasury_rate": get_treasury_rate,
-    "get_treasury_yield_spread": get_treasury_yield_spread,
-    "get_debt_to_gdp": get_debt_to_gdp,
-    # SEC Filings
-    "search_company_by_ticker": search_company_by_ticker,
-    "get_company_filings": get_company_filings,
-    "get_latest_10k": get_latest_10k,
-    "get_latest_10q": get_latest_10q,
-    "get_latest_8k": get_latest_8k,
-    "get_company_facts": get_company_facts,
-    "search_filings_by_form": search_filings_by_form,
-    "get_insider_transactions": get_insider_transactions,
-    "get_institutional_holdings": get_institutional_holdings,
-    # Yahoo Finance
-    "get_quote": get_quote,
-    "get_historical_data": get_historical_data,
-    "get_financials": get_financials,
-    "get_earnings_history": get_earnings_history,
-    "get_earnings_calendar": get_earnings_calendar,
-    "get_analyst_recommendations": get_analyst_recommendations,
-    "get_institutional_holders": get_institutional_holders,
-    "get_company_info": get_company_info,
-    "get_dividends": get_dividends,
-    "get_options_chain": get_options_chain,
-    "get_market_indices": get_market_indices,
-}
+def __getattr__(name: str) -> Any:
+    """Resolve ``from navam_invest.tools import get_quote`` to the real tool."""
+    if name in TOOL_MODULES:
+        return load_implementation(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_all_tools() -> List[BaseTool]:
@@ -149,6 +44,7 @@ def get_tools_by_category(category: str) -> List[BaseTool]:
             "get_stock_price",
             "get_stock_overview",
             "get_quote",
+            "get_quotes",
             "get_historical_data",
             "get_market_indices",
         ],
@@ -192,6 +88,8 @@ def get_tools_by_category(category: str) -> List[BaseTool]:
             "get_latest_10q",
             "get_latest_8k",
             "get_company_facts",
+            "get_financial_time_series",
+            "compare_peer_financials",
             "search_filings_by_form",
             "get_insider_transactions",
             "get_institutional_holdings",
@@ -246,6 +144,8 @@ def get_tools_for_agent(agent_name: str) -> List[BaseTool]:
             "get_latest_10q",
             "get_latest_8k",
             "get_company_facts",
+            "get_financial_time_series",
+            "compare_peer_financials",
             "search_filings_by_form",
             "get_insider_transactions",
             "get_institutional_holdings",
@@ -373,6 +273,7 @@ def get_tools_for_agent(agent_name: str) -> List[BaseTool]:
             "list_local_files",
             # Market data for risk calculations (Yahoo Finance)
             "get_quote",
+            "get_quotes",
             "get_historical_data",
             "get_market_indices",
             # Volatility and beta data
@@ -399,6 +300,7 @@ def get_tools_for_agent(agent_name: str) -> List[BaseTool]:
             "list_local_files",
             # Market data for unrealized gain/loss calculations (Yahoo Finance)
             "get_quote",
+            "get_quotes",
             "get_historical_data",
             "get_stock_price",
             # Company info for substitute security identification
@@ -501,6 +403,24 @@ def _create_bound_wrapper(original_func, api_key: str):
     return wrapper
 
 
+def _bind_api_key(tool: BaseTool, api_key: str) -> BaseTool:
+    """Return a copy of ``tool`` that always receives ``api_key``."""
+    if isinstance(tool, LazyTool):
+        # Binding a lazy tool keeps the provider module unloaded
+        return tool.with_bound_args(api_key=api_key)
+
+    # Get the actual callable (coroutine for async tools, func for sync)
+    callable_func = tool.coroutine if tool.coroutine else tool.func
+    if not callable_func:
+        return tool
+    bound_func = _create_bound_wrapper(callable_func, api_key)
+    return StructuredTool.from_function(
+        coroutine=bound_func,
+        name=tool.name,
+        description=tool.description,
+    )
+
+
 def bind_api_keys_to_tools(
     tools: List[BaseTool],
     alpha_vantage_key: str = "",
@@ -530,19 +450,10 @@ def bind_api_keys_to_tools(
     for tool in tools:
         tool_name = tool.name
 
-        # Get the actual callable (coroutine for async tools, func for sync)
-        callable_func = tool.coroutine if tool.coroutine else tool.func
-
         # Alpha Vantage tools
         if tool_name in ["get_stock_price", "get_stock_overview"]:
-            if alpha_vantage_key and callable_func:
-                bound_func = _create_bound_wrapper(callable_func, alpha_vantage_key)
-                bound_tool = StructuredTool.from_function(
-                    coroutine=bound_func,
-                    name=tool.name,
-                    description=tool.description,
-                )
-                bound_tools.append(bound_tool)
+            if alpha_vantage_key:
+                bound_tools.append(_bind_api_key(tool, alpha_vantage_key))
             else:
                 bound_tools.append(tool)  # Keep original if no key
 
@@ -554,14 +465,8 @@ def bind_api_keys_to_tools(
             "get_recommendation_trends",
             "get_finnhub_company_news",
         ]:
-            if finnhub_key and callable_func:
-                bound_func = _create_bound_wrapper(callable_func, finnhub_key)
-                bound_tool = StructuredTool.from_function(
-                    coroutine=bound_func,
-                    name=tool.name,
-                    description=tool.description,
-                )
-                bound_tools.append(bound_tool)
+            if finnhub_key:
+                bound_tools.append(_bind_api_key(tool, finnhub_key))
             else:
                 bound_tools.append(tool)
 
@@ -572,27 +477,15 @@ def bind_api_keys_to_tools(
             "get_fundamentals_definitions",
             "get_historical_fundamentals",
         ]:
-            if tiingo_key and callable_func:
-                bound_func = _create_bound_wrapper(callable_func, tiingo_key)
-                bound_tool = StructuredTool.from_function(
-                    coroutine=bound_func,
-                    name=tool.name,
-                    description=tool.description,
-                )
-                bound_tools.append(bound_tool)
+            if tiingo_key:
+                bound_tools.append(_bind_api_key(tool, tiingo_key))
             else:
                 bound_tools.append(tool)
 
         # FRED tools
         elif tool_name in ["get_economic_indicator", "get_key_macro_indicators"]:
-            if fred_key and callable_func:
-                bound_func = _create_bound_wrapper(callable_func, fred_key)
-                bound_tool = StructuredTool.from_function(
-                    coroutine=bound_func,
-                    name=tool.name,
-                    description=tool.description,
-                )
-                bound_tools.append(bound_tool)
+            if fred_key:
+                bound_tools.append(_bind_api_key(tool, fred_key))
             else:
                 bound_tools.append(tool)
 
@@ -602,14 +495,8 @@ def bind_api_keys_to_tools(
             "get_top_financial_headlines",
             "get_company_news",
         ]:
-            if newsapi_key and callable_func:
-                bound_func = _create_bound_wrapper(callable_func, newsapi_key)
-                bound_tool = StructuredTool.from_function(
-                    coroutine=bound_func,
-                    name=tool.name,
-                    description=tool.description,
-                )
-                bound_tools.append(bound_tool)
+            if newsapi_key:
+                bound_tools.append(_bind_api_key(tool, newsapi_key))
             else:
                 bound_tools.append(tool)
 
@@ -662,11 +549,14 @@ __all__ = [
     "get_latest_10q",
     "get_latest_8k",
     "get_company_facts",
+    "get_financial_time_series",
+    "compare_peer_financials",
     "search_filings_by_form",
     "get_insider_transactions",
     "get_institutional_holdings",
     # Yahoo Finance
     "get_quote",
+    "get_quotes",
     "get_historical_data",
     "get_financials",
     "get_earnings_history",
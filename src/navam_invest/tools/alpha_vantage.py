@@ -2,28 +2,26 @@
 
 from typing import Any, Dict, Optional
 
-import httpx
 from langchain_core.tools import tool
 
 from navam_invest.cache import cached
+from navam_invest.net import fetch
 
 
 async def _fetch_alpha_vantage(
     function: str, symbol: str, api_key: str, **kwargs: Any
 ) -> Dict[str, Any]:
     """Fetch data from Alpha Vantage API."""
-    async with httpx.AsyncClient() as client:
-        params = {
-            "function": function,
-            "symbol": symbol,
-            "apikey": api_key,
-            **kwargs,
-        }
-        response = await client.get(
-            "https://www.alphavantage.co/query", params=params, timeout=30.0
-        )
-        response.raise_for_status()
-        return response.json()
+    url = "https://www.alphavantage.co/query"
+    params = {
+        "function": function,
+        "symbol": symbol,
+        "apikey": api_key,
+        **kwargs,
+    }
+    response = await fetch("alpha_vantage", url, params=params)
+    response.raise_for_status()
+    return response.json()
 
 
 @cached(source="alpha_vantage")
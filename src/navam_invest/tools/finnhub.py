@@ -7,35 +7,35 @@ import httpx
 from langchain_core.tools import tool
 
 from navam_invest.cache import cached
+from navam_invest.net import fetch
 
 
 async def _fetch_finnhub(
     endpoint: str, api_key: str, **params: Any
 ) -> Dict[str, Any] | List[Dict[str, Any]]:
     """Fetch data from Finnhub API."""
-    async with httpx.AsyncClient() as client:
-        url = f"https://finnhub.io/api/v1/{endpoint}"
-        params_with_key = {"token": api_key, **params}
-        try:
-            response = await client.get(url, params=params_with_key, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            status_code = e.response.status_code
-            if status_code == 403:
-                raise Exception(
-                    "Finnhub API access denied. Please check your API key is valid and has sufficient permissions."
-                )
-            elif status_code == 401:
-                raise Exception(
-                    "Finnhub API authentication failed. Please verify your API key."
-                )
-            elif status_code == 429:
-                raise Exception(
-                    "Finnhub API rate limit exceeded. Free tier: 60 calls/minute."
-                )
-            else:
-                raise Exception(f"Finnhub API error: HTTP {status_code}")
+    url = f"https://finnhub.io/api/v1/{endpoint}"
+    params_with_key = {"token": api_key, **params}
+    try:
+        response = await fetch("finnhub", url, params=params_with_key)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        status_code = e.response.status_code
+        if status_code == 403:
+            raise Exception(
+                "Finnhub API access denied. Please check your API key is valid and has sufficient permissions."
+            )
+        elif status_code == 401:
+            raise Exception(
+                "Finnhub API authentication failed. Please verify your API key."
+            )
+        elif status_code == 429:
+            raise Exception(
+                "Finnhub API rate limit exceeded. Free tier: 60 calls/minute."
+            )
+        else:
+            raise Exception(f"Finnhub API error: HTTP {status_code}")
 
 
 @cached(source="finnhub")
@@ -2,22 +2,21 @@
 
 from typing import Any, Dict, Optional
 
-import httpx
 from langchain_core.tools import tool
 
 from navam_invest.cache import cached
+from navam_invest.net import fetch
 
 
 async def _fetch_fred(
     endpoint: str, api_key: str, **params: Any
 ) -> Dict[str, Any]:
     """Fetch data from FRED API."""
-    async with httpx.AsyncClient() as client:
-        url = f"https://api.stlouisfed.org/fred/{endpoint}"
-        params_with_key = {"api_key": api_key, "file_type": "json", **params}
-        response = await client.get(url, params=params_with_key, timeout=30.0)
-        response.raise_for_status()
-        return response.json()
+    url = f"https://api.stlouisfed.org/fred/{endpoint}"
+    params_with_key = {"api_key": api_key, "file_type": "json", **params}
+    response = await fetch("fred", url, params=params_with_key)
+    response.raise_for_status()
+    return response.json()
 
 
 @cached(source="fred")
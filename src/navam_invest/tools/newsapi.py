@@ -11,6 +11,7 @@ import httpx
 from langchain_core.tools import tool
 
 from navam_invest.cache import cached
+from navam_invest.net import fetch
 
 
 async def _fetch_newsapi(endpoint: str, api_key: str, **params: Any) -> Dict[str, Any]:
@@ -27,16 +28,16 @@ async def _fetch_newsapi(endpoint: str, api_key: str, **params: Any) -> Dict[str
     Raises:
         httpx.HTTPStatusError: If the request fails
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"https://newsapi.org/v2/{endpoint}",
-            params=params,
-            headers={"X-Api-Key": api_key},
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        data: Dict[str, Any] = response.json()
-        return data
+    url = f"https://newsapi.org/v2/{endpoint}"
+    response = await fetch(
+        "newsapi",
+        url,
+        params=params,
+        headers={"X-Api-Key": api_key},
+    )
+    response.raise_for_status()
+    data: Dict[str, Any] = response.json()
+    return data
 
 
 @cached(source="newsapi")
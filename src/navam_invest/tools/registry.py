@@ -0,0 +1,229 @@
+"""Lazy tool registry backed by a static metadata manifest.
+
+Agents need every tool's name, description and argument schema to build their
+prompts, but only call a handful of them per session. The metadata lives in
+``manifest.json`` next to this module so that ``navam_invest.tools`` can be
+imported without loading yfinance, pandas or any provider client. A tool's
+implementation module is imported the first time the tool runs.
+
+Regenerate the manifest after adding a tool or changing a tool's signature or
+docstring::
+
+    python scripts/update_tool_manifest.py
+"""
+
+import importlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Type, cast
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import patch_config
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel
+
+MANIFEST_PATH = Path(__file__).with_name("manifest.json")
+
+# Implementation module (under navam_invest.tools) of every registered tool
+TOOL_MODULES: Dict[str, str] = {
+    # Market Data (Alpha Vantage)
+    "get_stock_price": "alpha_vantage",
+    "get_stock_overview": "alpha_vantage",
+    # File Reading (Local Data)
+    "read_local_file": "file_reader",
+    "list_local_files": "file_reader",
+    # Alternative Data & Sentiment (Finnhub)
+    "get_company_news_sentiment": "finnhub",
+    "get_social_sentiment": "finnhub",
+    "get_insider_sentiment": "finnhub",
+    "get_recommendation_trends": "finnhub",
+    "get_finnhub_company_news": "finnhub",
+    # Historical Fundamentals (Tiingo)
+    "get_fundamentals_daily": "tiingo",
+    "get_fundamentals_statements": "tiingo",
+    "get_fundamentals_definitions": "tiingo",
+    "get_historical_fundamentals": "tiingo",
+    # Macro Data (FRED)
+    "get_economic_indicator": "fred",
+    "get_key_macro_indicators": "fred",
+    # News & Sentiment (NewsAPI)
+    "search_market_news": "newsapi",
+    "get_top_financial_headlines": "newsapi",
+    "get_company_news": "newsapi",
+    # Treasury Data
+    "get_treasury_yield_curve": "treasury",
+    "get_treasury_rate": "treasury",
+    "get_treasury_yield_spread": "treasury",
+    "get_debt_to_gdp": "treasury",
+    # SEC Filings
+    "search_company_by_ticker": "sec_edgar",
+    "get_company_filings": "sec_edgar",
+    "get_latest_10k": "sec_edgar",
+    "get_latest_10q": "sec_edgar",
+    "get_latest_8k": "sec_edgar",
+    "get_company_facts": "sec_edgar",
+    "get_financial_time_series": "sec_edgar",
+    "compare_peer_financials": "sec_edgar",
+    "search_filings_by_form": "sec_edgar",
+    "get_insider_transactions": "sec_edgar",
+    "get_institutional_holdings": "sec_edgar",
+    # Yahoo Finance
+    "get_quote": "yahoo_finance",
+    "get_quotes": "yahoo_finance",
+    "get_historical_data": "yahoo_finance",
+    "get_financials": "yahoo_finance",
+    "get_earnings_history": "yahoo_finance",
+    "get_earnings_calendar": "yahoo_finance",
+    "get_analyst_recommendations": "yahoo_finance",
+    "get_institutional_holders": "yahoo_finance",
+    "get_company_info": "yahoo_finance",
+    "get_dividends": "yahoo_finance",
+    "get_options_chain": "yahoo_finance",
+    "get_market_indices": "yahoo_finance",
+}
+
+
+def load_implementation(name: str) -> BaseTool:
+    """Import and return the real tool object for a registered tool name.
+
+    Args:
+        name: Registered tool name
+
+    Returns:
+        The tool as defined in its provider module
+    """
+    module = importlib.import_module(f"navam_invest.tools.{TOOL_MODULES[name]}")
+    return cast(BaseTool, getattr(module, name))
+
+
+class LazyTool(BaseTool):
+    """Tool proxy that imports its implementation on first call.
+
+    The name, description and JSON args schema come from the manifest, so
+    binding the tool to a model or listing it never touches the provider
+    module. Arguments in ``bound_args`` (e.g. API keys) are hidden from the
+    model and passed to the implementation on every call.
+    """
+
+    module: str
+    bound_args: Dict[str, Any] = {}
+
+    def load(self) -> BaseTool:
+        """Return the implementation, importing its module if needed."""
+        module = importlib.import_module(f"navam_invest.tools.{self.module}")
+        return cast(BaseTool, getattr(module, self.name))
+
+    def with_bound_args(self, **bound_args: Any) -> "LazyTool":
+        """Return a copy that supplies ``bound_args`` and hides them from the model.
+
+        Args:
+            **bound_args: Argument values passed to every call
+
+        Returns:
+            New LazyTool with the arguments bound
+        """
+        # Lazy tools always carry the JSON schema from the manifest
+        schema = dict(cast(Dict[str, Any], self.args_schema))
+        schema["properties"] = {
+            key: value
+            for key, value in schema.get("properties", {}).items()
+            if key not in bound_args
+        }
+        if "required" in schema:
+            schema["required"] = [
+                key for key in schema["required"] if key not in bound_args
+            ]
+        return self.model_copy(
+            update={
+                "args_schema": schema,
+                "bound_args": {**self.bound_args, **bound_args},
+            }
+        )
+
+    def _call_input(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # Bound values win over anything the model passed for the same argument
+        return {**kwargs, **self.bound_args}
+
+    def _run(
+        self,
+        *args: Any,
+        config: RunnableConfig,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+        **kwargs: Any,
+    ) -> Any:
+        child = patch_config(
+            config, callbacks=run_manager.get_child() if run_manager else None
+        )
+        return self.load().invoke(self._call_input(kwargs), config=child)
+
+    async def _arun(
+        self,
+        *args: Any,
+        config: RunnableConfig,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+        **kwargs: Any,
+    ) -> Any:
+        child = patch_config(
+            config, callbacks=run_manager.get_child() if run_manager else None
+        )
+        return await self.load().ainvoke(self._call_input(kwargs), config=child)
+
+
+def tool_metadata(tool: BaseTool) -> Dict[str, Any]:
+    """Extract the manifest entry (description and args schema) for a tool.
+
+    Args:
+        tool: Implementation tool object
+
+    Returns:
+        Dictionary with ``description`` and ``args_schema`` keys
+    """
+    schema = tool.tool_call_schema
+    if not isinstance(schema, dict):
+        schema = cast(Type[BaseModel], schema).model_json_schema()
+    # The description is kept once, at the top level of the entry
+    schema = {key: value for key, value in schema.items() if key != "description"}
+    return {"description": tool.description, "args_schema": schema}
+
+
+def build_manifest() -> Dict[str, Dict[str, Any]]:
+    """Import every tool implementation and collect its metadata.
+
+    Returns:
+        Manifest mapping tool name to its description and args schema
+    """
+    return {name: tool_metadata(load_implementation(name)) for name in TOOL_MODULES}
+
+
+def load_manifest() -> Dict[str, Dict[str, Any]]:
+    """Read the tool metadata manifest shipped with the package."""
+    with MANIFEST_PATH.open(encoding="utf-8") as f:
+        manifest: Dict[str, Dict[str, Any]] = json.load(f)
+    return manifest
+
+
+def create_lazy_tools() -> Dict[str, BaseTool]:
+    """Create a LazyTool for every registered tool, in registry order.
+
+    Tools not yet in the manifest are left out, so that the manifest script
+    can still import the package right after a tool is registered.
+
+    Returns:
+        Dictionary mapping tool name to its lazy proxy
+    """
+    manifest = load_manifest()
+    return {
+        name: LazyTool(
+            name=name,
+            module=module,
+            description=manifest[name]["description"],
+            args_schema=manifest[name]["args_schema"],
+        )
+        for name, module in TOOL_MODULES.items()
+        if name in manifest
+    }
+
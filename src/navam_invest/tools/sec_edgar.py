@@ -1,52 +1,221 @@
 """SEC EDGAR API tools for corporate filings and regulatory data."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import os
+import tempfile
+import time
+import weakref
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, cast
 
-import httpx
 from langchain_core.tools import tool
 
 from navam_invest.cache import cached
+from navam_invest.cache.ticker_index import CompanyEntry, TickerIndex, get_ticker_index
+from navam_invest.cache.xbrl_store import XbrlFactStore, get_xbrl_store
+from navam_invest.net import fetch
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between ticker map refresh attempts after a failure
+_TICKER_REFRESH_RETRY_SECONDS = 300
+
+# SEC requires a User-Agent with contact info
+_SEC_HEADERS = {
+    "User-Agent": "navam-invest investment-advisor (contact@navam.io)",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# Common shorthand for SEC form types
+_FORM_ALIASES = {"13F": "13F-HR"}
 
 
 async def _fetch_sec(
-    endpoint: str, headers: Optional[Dict[str, str]] = None, **params: Any
+    endpoint: str,
+    headers: Optional[Dict[str, str]] = None,
+    base_url: str = "https://data.sec.gov",
+    **params: Any,
 ) -> Dict[str, Any] | List[Dict[str, Any]]:
     """Fetch data from SEC EDGAR API.
 
     Note: SEC requires User-Agent header with contact info.
     """
-    default_headers = {
-        "User-Agent": "navam-invest investment-advisor (contact@navam.io)",
-        "Accept-Encoding": "gzip, deflate",
-    }
-
+    default_headers = dict(_SEC_HEADERS)
     if headers:
         default_headers.update(headers)
 
-    async with httpx.AsyncClient() as client:
-        url = f"https://data.sec.gov/{endpoint}"
-        response = await client.get(
-            url, params=params, headers=default_headers, timeout=30.0
+    url = f"{base_url}/{endpoint}"
+    response = await fetch("sec_edgar", url, params=params, headers=default_headers)
+    response.raise_for_status()
+    return response.json()
+
+
+# Serializes ticker map refreshes per event loop
+_ticker_refresh_locks: "weakref.WeakKeyDictionary[Any, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+_last_ticker_refresh_attempt = 0.0
+
+
+async def _get_ticker_index() -> TickerIndex:
+    """Get the ticker index, refreshing it from SEC when it is stale.
+
+    A failed refresh falls back to the persisted map if there is one.
+    """
+    global _last_ticker_refresh_attempt
+
+    index = get_ticker_index()
+    if not index.needs_refresh():
+        return index
+
+    loop = asyncio.get_running_loop()
+    lock = _ticker_refresh_locks.setdefault(loop, asyncio.Lock())
+
+    async with lock:
+        retry_at = _last_ticker_refresh_attempt + _TICKER_REFRESH_RETRY_SECONDS
+        if not index.needs_refresh() or (len(index) and time.monotonic() < retry_at):
+            return index
+
+        _last_ticker_refresh_attempt = time.monotonic()
+        try:
+            data = cast(
+                Dict[str, Any],
+                await _fetch_sec(
+                    "files/company_tickers.json", base_url="https://www.sec.gov"
+                ),
+            )
+            index.replace(
+                CompanyEntry(row["ticker"], row["cik_str"], row["title"])
+                for row in data.values()
+            )
+        except Exception as e:
+            if not len(index):
+                raise
+            logger.warning(f"Ticker index refresh failed, using persisted map: {e}")
+
+    return index
+
+
+async def _resolve_cik(identifier: str) -> str:
+    """Resolve a CIK or ticker symbol to an unpadded CIK.
+
+    Args:
+        identifier: CIK (e.g., '320193' or '0000320193') or ticker (e.g., 'AAPL')
+
+    Returns:
+        CIK without leading zeros
+
+    Raises:
+        ValueError: If the ticker is not in the SEC ticker map
+    """
+    identifier = identifier.strip()
+    if identifier.isdigit():
+        return str(int(identifier))
+
+    entry = (await _get_ticker_index()).lookup(identifier)
+    if entry is None:
+        raise ValueError(
+            f"Unknown ticker '{identifier}'. Use search_company_by_ticker to find the company"
         )
-        response.raise_for_status()
-        return response.json()
+    return str(entry.cik)
 
 
-@cached(source="sec_edgar")
-async def _get_company_filings_cached(symbol: str, filing_type: str = "10-K", limit: int = 5) -> str:
-    """Cached implementation of get_company_filings."""
-    # First, get company CIK from ticker
-    # Note: SEC doesn't have direct ticker lookup, would need mapping
-    # For now, return instructive message
-    return (
-        f"**SEC Filings for {symbol}**\n\n"
-        f"To access SEC EDGAR filings:\n"
-        f"1. Visit: https://www.sec.gov/cgi-bin/browse-edgar\n"
-        f"2. Search for company: {symbol}\n"
-        f"3. Filter by form type: {filing_type}\n\n"
-        f"*Note: Direct SEC API access requires CIK mapping.*\n"
-        f"*Future versions will include automated filing retrieval.*"
+# Columns of filings["recent"] used by the filing tools
+_SUBMISSION_COLUMNS = (
+    "accessionNumber",
+    "filingDate",
+    "reportDate",
+    "form",
+    "primaryDocument",
+)
+
+
+def _index_submissions(cik: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse a submissions document into a columnar, form-indexed structure.
+
+    Only the columns the filing tools read are kept. ``by_form`` maps each
+    form type to row indices sorted newest filing first, so lookups never
+    scan the full filing list. The result is plain JSON so the cache can
+    store it.
+
+    Args:
+        cik: Zero-padded Central Index Key
+        data: Parsed ``submissions/CIK##########.json`` document
+
+    Returns:
+        Dictionary with ``cik``, ``name``, ``columns`` and ``by_form``
+    """
+    recent = data.get("filings", {}).get("recent") or {}
+    count = len(recent.get("form", []))
+
+    columns = {
+        name: list(recent.get(name) or [""] * count) for name in _SUBMISSION_COLUMNS
+    }
+
+    by_form: Dict[str, List[int]] = {}
+    newest_first = sorted(
+        range(count), key=lambda i: columns["filingDate"][i], reverse=True
     )
+    for i in newest_first:
+        by_form.setdefault(columns["form"][i], []).append(i)
+
+    return {
+        "cik": cik,
+        "name": data.get("name", "Unknown"),
+        "filings": count,
+        "columns": columns,
+        "by_form": by_form,
+    }
+
+
+@cached(source="sec_edgar")
+async def _get_submissions_index(cik: str) -> Dict[str, Any]:
+    """Fetch a company's submissions once and cache the parsed index."""
+    data = await _fetch_sec(f"submissions/CIK{cik}.json")
+    return _index_submissions(cik, cast(Dict[str, Any], data))
+
+
+async def _get_submissions(cik: str) -> Dict[str, Any]:
+    """Get the shared submissions index for a CIK in any padding."""
+    return await _get_submissions_index(cik.strip().zfill(10))
+
+
+def _find_filings(
+    submissions: Dict[str, Any], cik: str, form_type: str, limit: int
+) -> List[Dict[str, str]]:
+    """Get the newest filings of one form type from a submissions index.
+
+    Args:
+        submissions: Index built by _index_submissions()
+        cik: CIK without leading zeros, used in archive links
+        form_type: SEC form type (e.g., '10-K')
+        limit: Maximum number of filings to return
+
+    Returns:
+        Filing rows with date, report date, accession, document and link
+    """
+    columns = submissions["columns"]
+    filings = []
+
+    for i in submissions["by_form"].get(form_type, [])[:limit]:
+        accession = columns["accessionNumber"][i]
+        primary_doc = columns["primaryDocument"][i]
+        filings.append(
+            {
+                "date": columns["filingDate"][i],
+                "report_date": columns["reportDate"][i] or "N/A",
+                "accession": accession,
+                "document": primary_doc,
+                "url": (
+                    f"https://www.sec.gov/Archives/edgar/data/"
+                    f"{cik}/{accession.replace('-', '')}/{primary_doc}"
+                ),
+            }
+        )
+
+    return filings
 
 
 @tool
@@ -62,48 +231,34 @@ async def get_company_filings(symbol: str, filing_type: str = "10-K", limit: int
         List of recent filings with dates and links
     """
     try:
-        return await _get_company_filings_cached(symbol, filing_type, limit)
+        cik = await _resolve_cik(symbol)
+        form_type = _FORM_ALIASES.get(filing_type.upper(), filing_type.upper())
+        return _render_filings_by_form(
+            cik, await _get_submissions(cik), form_type, limit
+        )
     except Exception as e:
         return f"Error fetching SEC filings for {symbol}: {str(e)}"
 
 
-@cached(source="sec_edgar")
-async def _get_latest_10k_cached(cik: str) -> str:
-    """Cached implementation of get_latest_10k."""
-    # Pad CIK to 10 digits
-    cik_padded = cik.zfill(10)
-
-    # Fetch company submissions
-    data = await _fetch_sec(f"submissions/CIK{cik_padded}.json")
-
-    if "filings" not in data or "recent" not in data["filings"]:
+def _render_latest_10k(cik: str, submissions: Dict[str, Any]) -> str:
+    """Render the latest 10-K from a submissions index."""
+    if not submissions["filings"]:
         return f"No filings found for CIK {cik}"
 
-    recent = data["filings"]["recent"]
-
-    # Find latest 10-K
-    for i, form in enumerate(recent["form"]):
-        if form == "10-K":
-            filing_date = recent["filingDate"][i]
-            accession = recent["accessionNumber"][i].replace("-", "")
-            primary_doc = recent["primaryDocument"][i]
-
-            filing_url = (
-                f"https://www.sec.gov/Archives/edgar/data/"
-                f"{cik}/{accession}/{primary_doc}"
-            )
-
-            return (
-                f"**Latest 10-K Filing**\n\n"
-                f"CIK: {cik}\n"
-                f"Filing Date: {filing_date}\n"
-                f"Accession Number: {recent['accessionNumber'][i]}\n"
-                f"Document: {primary_doc}\n\n"
-                f"**Link:** {filing_url}\n\n"
-                f"*Note: Full XBRL parsing will be added in future versions*"
-            )
+    filings = _find_filings(submissions, cik, "10-K", 1)
+    if not filings:
+        return f"No 10-K filings found for CIK {cik}"
 
-    return f"No 10-K filings found for CIK {cik}"
+    filing = filings[0]
+    return (
+        f"**Latest 10-K Filing**\n\n"
+        f"CIK: {cik}\n"
+        f"Filing Date: {filing['date']}\n"
+        f"Accession Number: {filing['accession']}\n"
+        f"Document: {filing['document']}\n\n"
+        f"**Link:** {filing['url']}\n\n"
+        f"*Note: Full XBRL parsing will be added in future versions*"
+    )
 
 
 @tool
@@ -111,54 +266,37 @@ async def get_latest_10k(cik: str) -> str:
     """Get latest 10-K annual report for a company.
 
     Args:
-        cik: Central Index Key (CIK) for the company
+        cik: Central Index Key (CIK) or stock ticker symbol (e.g., '320193' or 'AAPL')
 
     Returns:
         Summary of latest 10-K filing
     """
     try:
-        return await _get_latest_10k_cached(cik)
+        cik = await _resolve_cik(cik)
+        return _render_latest_10k(cik, await _get_submissions(cik))
     except Exception as e:
         return f"Error fetching 10-K for CIK {cik}: {str(e)}"
 
 
-@cached(source="sec_edgar")
-async def _get_latest_10q_cached(cik: str) -> str:
-    """Cached implementation of get_latest_10q."""
-    # Pad CIK to 10 digits
-    cik_padded = cik.zfill(10)
-
-    # Fetch company submissions
-    data = await _fetch_sec(f"submissions/CIK{cik_padded}.json")
-
-    if "filings" not in data or "recent" not in data["filings"]:
+def _render_latest_10q(cik: str, submissions: Dict[str, Any]) -> str:
+    """Render the latest 10-Q from a submissions index."""
+    if not submissions["filings"]:
         return f"No filings found for CIK {cik}"
 
-    recent = data["filings"]["recent"]
-
-    # Find latest 10-Q
-    for i, form in enumerate(recent["form"]):
-        if form == "10-Q":
-            filing_date = recent["filingDate"][i]
-            accession = recent["accessionNumber"][i].replace("-", "")
-            primary_doc = recent["primaryDocument"][i]
-
-            filing_url = (
-                f"https://www.sec.gov/Archives/edgar/data/"
-                f"{cik}/{accession}/{primary_doc}"
-            )
-
-            return (
-                f"**Latest 10-Q Filing**\n\n"
-                f"CIK: {cik}\n"
-                f"Filing Date: {filing_date}\n"
-                f"Accession Number: {recent['accessionNumber'][i]}\n"
-                f"Document: {primary_doc}\n\n"
-                f"**Link:** {filing_url}\n\n"
-                f"*Note: Full XBRL parsing will be added in future versions*"
-            )
+    filings = _find_filings(submissions, cik, "10-Q", 1)
+    if not filings:
+        return f"No 10-Q filings found for CIK {cik}"
 
-    return f"No 10-Q filings found for CIK {cik}"
+    filing = filings[0]
+    return (
+        f"**Latest 10-Q Filing**\n\n"
+        f"CIK: {cik}\n"
+        f"Filing Date: {filing['date']}\n"
+        f"Accession Number: {filing['accession']}\n"
+        f"Document: {filing['document']}\n\n"
+        f"**Link:** {filing['url']}\n\n"
+        f"*Note: Full XBRL parsing will be added in future versions*"
+    )
 
 
 @tool
@@ -166,91 +304,80 @@ async def get_latest_10q(cik: str) -> str:
     """Get latest 10-Q quarterly report for a company.
 
     Args:
-        cik: Central Index Key (CIK) for the company
+        cik: Central Index Key (CIK) or stock ticker symbol (e.g., '320193' or 'AAPL')
 
     Returns:
         Summary of latest 10-Q filing
     """
     try:
-        return await _get_latest_10q_cached(cik)
+        cik = await _resolve_cik(cik)
+        return _render_latest_10q(cik, await _get_submissions(cik))
     except Exception as e:
         return f"Error fetching 10-Q for CIK {cik}: {str(e)}"
 
 
-@cached(source="sec_edgar")
-async def _search_company_by_ticker_cached(ticker: str) -> str:
-    """Cached implementation of search_company_by_ticker."""
-    # Fetch company tickers mapping
-    data = await _fetch_sec("files/company_tickers.json")
-
-    # Search for ticker
-    ticker_upper = ticker.upper()
-
-    for cik, info in data.items():
-        if info.get("ticker", "").upper() == ticker_upper:
-            return (
-                f"**Company Information**\n\n"
-                f"Ticker: {info.get('ticker')}\n"
-                f"Name: {info.get('title')}\n"
-                f"CIK: {info.get('cik_str')}\n\n"
-                f"*Use CIK {info.get('cik_str')} to fetch specific filings*"
-            )
+def _render_company_search(index: TickerIndex, ticker: str) -> str:
+    """Render an exact ticker match, or close matches by ticker and name."""
+    entry = index.lookup(ticker)
+    if entry is not None:
+        return (
+            f"**Company Information**\n\n"
+            f"Ticker: {entry.ticker}\n"
+            f"Name: {entry.name}\n"
+            f"CIK: {entry.cik}\n\n"
+            f"*Use CIK {entry.cik} (or the ticker) to fetch specific filings*"
+        )
+
+    suggestions: Dict[str, CompanyEntry] = {}
+    for match in index.prefix(ticker, 5) + index.search_name(ticker, 5):
+        suggestions.setdefault(match.ticker, match)
 
-    return f"No company found with ticker {ticker}"
+    if not suggestions:
+        return f"No company found with ticker {ticker}"
+
+    output = f"No exact match for ticker {ticker}. Closest matches:\n\n"
+    for match in list(suggestions.values())[:8]:
+        output += f"- **{match.ticker}**: {match.name} (CIK {match.cik})\n"
+    return output
 
 
 @tool
 async def search_company_by_ticker(ticker: str) -> str:
     """Search for company information by ticker symbol.
 
+    Falls back to ticker-prefix and fuzzy company-name matches when there
+    is no exact ticker match.
+
     Args:
-        ticker: Stock ticker symbol
+        ticker: Stock ticker symbol, or part of a company name
 
     Returns:
         Company name, CIK, and filing information
     """
     try:
-        return await _search_company_by_ticker_cached(ticker)
+        return _render_company_search(await _get_ticker_index(), ticker)
     except Exception as e:
         return f"Error searching for ticker {ticker}: {str(e)}"
 
 
-@cached(source="sec_edgar")
-async def _get_institutional_holdings_cached(cik: str) -> str:
-    """Cached implementation of get_institutional_holdings."""
-    # Pad CIK to 10 digits
-    cik_padded = cik.zfill(10)
-
-    # Fetch company submissions
-    data = await _fetch_sec(f"submissions/CIK{cik_padded}.json")
-
-    if "filings" not in data or "recent" not in data["filings"]:
+def _render_institutional_holdings(cik: str, submissions: Dict[str, Any]) -> str:
+    """Render the latest 13F-HR from a submissions index."""
+    if not submissions["filings"]:
         return f"No filings found for CIK {cik}"
 
-    recent = data["filings"]["recent"]
-
-    # Find latest 13F
-    for i, form in enumerate(recent["form"]):
-        if form == "13F-HR":
-            filing_date = recent["filingDate"][i]
-            accession = recent["accessionNumber"][i].replace("-", "")
-            primary_doc = recent["primaryDocument"][i]
-
-            filing_url = (
-                f"https://www.sec.gov/Archives/edgar/data/"
-                f"{cik}/{accession}/{primary_doc}"
-            )
-
-            return (
-                f"**Latest 13F Holdings Report**\n\n"
-                f"Institution CIK: {cik}\n"
-                f"Filing Date: {filing_date}\n"
-                f"Accession Number: {recent['accessionNumber'][i]}\n\n"
-                f"**Link:** {filing_url}\n\n"
-                f"*Note: Detailed holdings parsing will be added in future versions*"
-            )
+    filings = _find_filings(submissions, cik, "13F-HR", 1)
+    if not filings:
+        return f"No 13F filings found for CIK {cik}"
 
-    return f"No 13F filings found for CIK {cik}"
+    filing = filings[0]
+    return (
+        f"**Latest 13F Holdings Report**\n\n"
+        f"Institution CIK: {cik}\n"
+        f"Filing Date: {filing['date']}\n"
+        f"Accession Number: {filing['accession']}\n\n"
+        f"**Link:** {filing['url']}\n\n"
+        f"*Note: Detailed holdings parsing will be added in future versions*"
+    )
 
 
 @tool
@@ -258,50 +385,24 @@ async def get_institutional_holdings(cik: str) -> str:
     """Get 13F institutional holdings for an investment company.
 
     Args:
-        cik: Central Index Key (CIK) for the institutional investor
+        cik: Central Index Key (CIK) or ticker of the institutional investor
 
     Returns:
         Summary of latest 13F holdings
     """
     try:
-        return await _get_institutional_holdings_cached(cik)
+        cik = await _resolve_cik(cik)
+        return _render_institutional_holdings(cik, await _get_submissions(cik))
     except Exception as e:
         return f"Error fetching 13F for CIK {cik}: {str(e)}"
 
 
-@cached(source="sec_edgar")
-async def _get_latest_8k_cached(cik: str, limit: int = 5) -> str:
-    """Cached implementation of get_latest_8k."""
-    # Pad CIK to 10 digits
-    cik_padded = cik.zfill(10)
-
-    # Fetch company submissions
-    data = await _fetch_sec(f"submissions/CIK{cik_padded}.json")
-
-    if "filings" not in data or "recent" not in data["filings"]:
+def _render_latest_8k(cik: str, submissions: Dict[str, Any], limit: int = 5) -> str:
+    """Render recent 8-Ks from a submissions index."""
+    if not submissions["filings"]:
         return f"No filings found for CIK {cik}"
 
-    recent = data["filings"]["recent"]
-
-    # Find recent 8-Ks
-    eightks = []
-    for i, form in enumerate(recent["form"]):
-        if form == "8-K" and len(eightks) < limit:
-            filing_date = recent["filingDate"][i]
-            accession = recent["accessionNumber"][i].replace("-", "")
-            primary_doc = recent["primaryDocument"][i]
-
-            filing_url = (
-                f"https://www.sec.gov/Archives/edgar/data/"
-                f"{cik}/{accession}/{primary_doc}"
-            )
-
-            eightks.append({
-                "date": filing_date,
-                "accession": recent["accessionNumber"][i],
-                "url": filing_url
-            })
-
+    eightks = _find_filings(submissions, cik, "8-K", limit)
     if not eightks:
         return f"No 8-K filings found for CIK {cik}"
 
@@ -324,85 +425,115 @@ async def get_latest_8k(cik: str, limit: int = 5) -> str:
     management changes, acquisitions, bankruptcy, etc.
 
     Args:
-        cik: Central Index Key (CIK) for the company
+        cik: Central Index Key (CIK) or stock ticker symbol (e.g., '320193' or 'AAPL')
         limit: Number of recent 8-Ks to return (default: 5)
 
     Returns:
         List of recent 8-K filings with dates and links
     """
     try:
-        return await _get_latest_8k_cached(cik, limit)
+        cik = await _resolve_cik(cik)
+        return _render_latest_8k(cik, await _get_submissions(cik), limit)
     except Exception as e:
         return f"Error fetching 8-K filings for CIK {cik}: {str(e)}"
 
 
-@cached(source="sec_edgar")
-async def _get_company_facts_cached(cik: str) -> str:
-    """Cached implementation of get_company_facts."""
-    # Pad CIK to 10 digits
-    cik_padded = cik.zfill(10)
+# Serializes company facts ingestion per (event loop, CIK)
+_facts_locks: "weakref.WeakKeyDictionary[Any, Dict[int, asyncio.Lock]]" = (
+    weakref.WeakKeyDictionary()
+)
 
-    # Fetch company facts
-    data = await _fetch_sec(f"api/xbrl/companyfacts/CIK{cik_padded}.json")
+# Headline metrics shown by get_company_facts
+_FACT_METRICS = {
+    "Assets": "Total Assets",
+    "Liabilities": "Total Liabilities",
+    "StockholdersEquity": "Stockholders Equity",
+    "Revenues": "Total Revenues",
+    "NetIncomeLoss": "Net Income",
+    "EarningsPerShareBasic": "EPS (Basic)",
+    "EarningsPerShareDiluted": "EPS (Diluted)",
+    "OperatingIncomeLoss": "Operating Income",
+    "CashAndCashEquivalentsAtCarryingValue": "Cash & Equivalents",
+}
 
-    if "facts" not in data:
-        return f"No company facts found for CIK {cik}"
 
-    company_name = data.get("entityName", "Unknown")
-    facts = data["facts"]
-
-    # Extract US-GAAP facts
-    us_gaap = facts.get("us-gaap", {})
-
-    # Common financial metrics
-    metrics_of_interest = {
-        "Assets": "Total Assets",
-        "Liabilities": "Total Liabilities",
-        "StockholdersEquity": "Stockholders Equity",
-        "Revenues": "Total Revenues",
-        "NetIncomeLoss": "Net Income",
-        "EarningsPerShareBasic": "EPS (Basic)",
-        "EarningsPerShareDiluted": "EPS (Diluted)",
-        "OperatingIncomeLoss": "Operating Income",
-        "CashAndCashEquivalentsAtCarryingValue": "Cash & Equivalents",
-    }
+async def _ensure_company_facts(cik: str) -> XbrlFactStore:
+    """Make sure a company's XBRL facts are in the fact store and fresh.
+
+    The companyfacts document (often tens of MB) is streamed to a temporary
+    file and bulk-loaded, then served from the store until it goes stale.
+
+    Args:
+        cik: Unpadded CIK
+
+    Returns:
+        Fact store holding the company's facts
+    """
+    store = get_xbrl_store()
+    cik_int = int(cik)
+    if not store.needs_refresh(cik_int):
+        return store
+
+    loop = asyncio.get_running_loop()
+    lock = _facts_locks.setdefault(loop, {}).setdefault(cik_int, asyncio.Lock())
+
+    async with lock:
+        if not store.needs_refresh(cik_int):
+            return store
+
+        fd, path = tempfile.mkstemp(prefix="navam-companyfacts-", suffix=".json")
+        os.close(fd)
+        try:
+            url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik.zfill(10)}.json"
+            response = await fetch(
+                "sec_edgar", url, headers=_SEC_HEADERS, destination=Path(path)
+            )
+            response.raise_for_status()
+            # JSON parsing and the bulk load are CPU-bound; keep the loop free
+            await asyncio.to_thread(store.ingest_file, cik_int, Path(path))
+        finally:
+            os.unlink(path)
+
+    return store
+
+
+def _format_fact_value(value: Any, unit: str) -> str:
+    """Format a fact value for display."""
+    if not isinstance(value, (int, float)):
+        return str(value)
+    if unit == "USD/shares":
+        return f"${value:,.2f}"
+    if unit != "USD":
+        return f"{value:,.0f} {unit}"
+
+    magnitude = abs(value)
+    if magnitude >= 1e12:
+        return f"${value/1e12:.2f}T"
+    elif magnitude >= 1e9:
+        return f"${value/1e9:.2f}B"
+    elif magnitude >= 1e6:
+        return f"${value/1e6:.2f}M"
+    return f"${value:,.2f}"
+
+
+def _render_company_facts(cik: str, store: XbrlFactStore) -> str:
+    """Render headline metrics from the fact store."""
+    latest = store.latest_values(int(cik), list(_FACT_METRICS))
+    if not latest:
+        return f"No company facts found for CIK {cik}"
 
+    company_name = store.entity_name(int(cik)) or "Unknown"
     output = f"**{company_name} - Company Facts (XBRL)**\n\n"
 
-    for metric_key, metric_label in metrics_of_interest.items():
-        if metric_key in us_gaap:
-            metric_data = us_gaap[metric_key]
-            units = metric_data.get("units", {})
-
-            # Get most recent value (usually in USD)
-            if "USD" in units:
-                values = units["USD"]
-                if values:
-                    # Sort by filing date and get most recent
-                    sorted_values = sorted(
-                        values,
-                        key=lambda x: x.get("filed", ""),
-                        reverse=True
-                    )
-                    latest = sorted_values[0]
-                    value = latest.get("val", "N/A")
-                    end_date = latest.get("end", "N/A")
-                    form = latest.get("form", "N/A")
-
-                    # Format large numbers
-                    if isinstance(value, (int, float)):
-                        if value >= 1e12:
-                            value_str = f"${value/1e12:.2f}T"
-                        elif value >= 1e9:
-                            value_str = f"${value/1e9:.2f}B"
-                        elif value >= 1e6:
-                            value_str = f"${value/1e6:.2f}M"
-                        else:
-                            value_str = f"${value:,.2f}"
-                    else:
-                        value_str = str(value)
-
-                    output += f"**{metric_label}:** {value_str} (as of {end_date}, {form})\n"
+    for metric_key, metric_label in _FACT_METRICS.items():
+        fact = latest.get(metric_key)
+        if fact is None:
+            continue
+        value_str = _format_fact_value(fact["val"], fact["unit"])
+        output += (
+            f"**{metric_label}:** {value_str} "
+            f"(as of {fact['period_end']}, {fact['form']})\n"
+        )
 
     return output
 
@@ -415,53 +546,141 @@ async def get_company_facts(cik: str) -> str:
     assets, revenues, net income, EPS, and other standardized data points.
 
     Args:
-        cik: Central Index Key (CIK) for the company
+        cik: Central Index Key (CIK) or stock ticker symbol (e.g., '320193' or 'AAPL')
 
     Returns:
         Key financial facts and metrics
     """
     try:
-        return await _get_company_facts_cached(cik)
+        cik = await _resolve_cik(cik)
+        return _render_company_facts(cik, await _ensure_company_facts(cik))
     except Exception as e:
         return f"Error fetching company facts for CIK {cik}: {str(e)}"
 
 
-@cached(source="sec_edgar")
-async def _search_filings_by_form_cached(cik: str, form_type: str, limit: int = 10) -> str:
-    """Cached implementation of search_filings_by_form."""
-    # Pad CIK to 10 digits
-    cik_padded = cik.zfill(10)
+def _render_financial_time_series(
+    cik: str, store: XbrlFactStore, concept: str, years: int, period: str
+) -> str:
+    """Render one concept's history from the fact store."""
+    since = date.today() - timedelta(days=round(365.25 * years))
+    rows = store.series(int(cik), concept, period=period, since=since)
+    if not rows:
+        return (
+            f"No {period} values of '{concept}' reported by CIK {cik} "
+            f"in the last {years} years"
+        )
 
-    # Fetch company submissions
-    data = await _fetch_sec(f"submissions/CIK{cik_padded}.json")
+    company_name = store.entity_name(int(cik)) or "Unknown"
+    output = f"**{company_name} - {concept} ({period}, {rows[0]['unit']})**\n\n"
+    output += "| Period | Value | Fiscal | Form | Filed |\n"
+    output += "|--------|-------|--------|------|-------|\n"
 
-    if "filings" not in data or "recent" not in data["filings"]:
-        return f"No filings found for CIK {cik}"
+    for row in rows:
+        span = (
+            f"{row['period_start']} to {row['period_end']}"
+            if row["period_start"]
+            else str(row["period_end"])
+        )
+        fiscal = f"{row['fy'] or ''} {row['fp'] or ''}".strip() or "N/A"
+        output += (
+            f"| {span} | {_format_fact_value(row['val'], row['unit'])} | "
+            f"{fiscal} | {row['form'] or 'N/A'} | {row['filed']} |\n"
+        )
 
-    company_name = data.get("name", "Unknown")
-    recent = data["filings"]["recent"]
+    return output
 
-    # Find matching filings
-    filings = []
-    for i, form in enumerate(recent["form"]):
-        if form == form_type and len(filings) < limit:
-            filing_date = recent["filingDate"][i]
-            accession = recent["accessionNumber"][i].replace("-", "")
-            primary_doc = recent["primaryDocument"][i]
-            report_date = recent.get("reportDate", ["N/A"] * len(recent["form"]))[i]
-
-            filing_url = (
-                f"https://www.sec.gov/Archives/edgar/data/"
-                f"{cik}/{accession}/{primary_doc}"
-            )
 
-            filings.append({
-                "date": filing_date,
-                "report_date": report_date,
-                "accession": recent["accessionNumber"][i],
-                "url": filing_url
-            })
+@tool
+async def get_financial_time_series(
+    cik: str, concept: str, years: int = 5, period: str = "annual"
+) -> str:
+    """Get the history of any XBRL financial concept for a company.
+
+    Reads from a local columnar store of all facts the company has reported,
+    so any us-gaap concept can be queried (e.g., 'Revenues', 'NetIncomeLoss',
+    'ResearchAndDevelopmentExpense', 'LongTermDebt').
+
+    Args:
+        cik: Central Index Key (CIK) or stock ticker symbol (e.g., '320193' or 'AAPL')
+        concept: us-gaap concept name (e.g., 'Revenues')
+        years: Number of years of history (default: 5)
+        period: 'annual', 'quarterly' or 'all' (default: 'annual')
+
+    Returns:
+        Table of values per period, oldest first
+    """
+    try:
+        cik = await _resolve_cik(cik)
+        store = await _ensure_company_facts(cik)
+        return _render_financial_time_series(cik, store, concept, years, period)
+    except Exception as e:
+        return f"Error fetching {concept} history for CIK {cik}: {str(e)}"
+
 
+def _render_peer_financials(
+    store: XbrlFactStore, ciks: List[str], concept: str, fiscal_year: Optional[int]
+) -> str:
+    """Render one concept across a peer set from the fact store."""
+    rows = store.peer_values([int(cik) for cik in ciks], concept, fiscal_year=fiscal_year)
+    year_label = f"FY{fiscal_year}" if fiscal_year else "latest annual"
+    if not rows:
+        return f"No {year_label} values of '{concept}' found for the peer set"
+
+    output = f"**Peer Comparison - {concept} ({year_label}, {rows[0]['unit']})**\n\n"
+    output += "| Rank | Company | CIK | Value | Period End | Form |\n"
+    output += "|------|---------|-----|-------|------------|------|\n"
+
+    for rank, row in enumerate(rows, 1):
+        output += (
+            f"| {rank} | {row['entity_name'] or 'Unknown'} | {row['cik']} | "
+            f"{_format_fact_value(row['val'], row['unit'])} | {row['period_end']} | "
+            f"{row['form'] or 'N/A'} |\n"
+        )
+
+    missing = {int(cik) for cik in ciks} - {row["cik"] for row in rows}
+    if missing:
+        listed = ", ".join(str(cik) for cik in sorted(missing))
+        output += f"\n*No matching values for CIK(s): {listed}*\n"
+
+    return output
+
+
+@tool
+async def compare_peer_financials(
+    ciks: str, concept: str, fiscal_year: Optional[int] = None
+) -> str:
+    """Compare one XBRL financial concept across a set of peer companies.
+
+    Args:
+        ciks: Comma-separated CIKs or ticker symbols (e.g., 'AAPL,MSFT,GOOGL')
+        concept: us-gaap concept name (e.g., 'Revenues', 'NetIncomeLoss')
+        fiscal_year: Fiscal year to compare (default: latest reported annual value)
+
+    Returns:
+        Peer set ranked by the concept's value
+    """
+    try:
+        identifiers = [part for part in ciks.split(",") if part.strip()]
+        if not identifiers:
+            return "Error: provide at least one CIK or ticker symbol"
+
+        resolved = await asyncio.gather(*(_resolve_cik(i) for i in identifiers))
+        peers = list(dict.fromkeys(resolved))
+        await asyncio.gather(*(_ensure_company_facts(cik) for cik in peers))
+        return _render_peer_financials(get_xbrl_store(), peers, concept, fiscal_year)
+    except Exception as e:
+        return f"Error comparing {concept} across {ciks}: {str(e)}"
+
+
+def _render_filings_by_form(
+    cik: str, submissions: Dict[str, Any], form_type: str, limit: int = 10
+) -> str:
+    """Render filings of one form type from a submissions index."""
+    if not submissions["filings"]:
+        return f"No filings found for CIK {cik}"
+
+    company_name = submissions["name"]
+    filings = _find_filings(submissions, cik, form_type, limit)
     if not filings:
         return f"No {form_type} filings found for {company_name} (CIK {cik})"
 
@@ -481,7 +700,7 @@ async def search_filings_by_form(cik: str, form_type: str, limit: int = 10) -> s
     """Search for specific SEC filing types.
 
     Args:
-        cik: Central Index Key (CIK) for the company
+        cik: Central Index Key (CIK) or stock ticker symbol (e.g., '320193' or 'AAPL')
         form_type: SEC form type (e.g., '10-K', '10-Q', '8-K', 'DEF 14A', 'S-1', '4')
         limit: Maximum number of filings to return (default: 10)
 
@@ -489,45 +708,23 @@ async def search_filings_by_form(cik: str, form_type: str, limit: int = 10) -> s
         List of filings matching the form type
     """
     try:
-        return await _search_filings_by_form_cached(cik, form_type, limit)
+        cik = await _resolve_cik(cik)
+        return _render_filings_by_form(
+            cik, await _get_submissions(cik), form_type, limit
+        )
     except Exception as e:
         return f"Error searching {form_type} filings for CIK {cik}: {str(e)}"
 
 
-@cached(source="sec_edgar")
-async def _get_insider_transactions_cached(cik: str, limit: int = 10) -> str:
-    """Cached implementation of get_insider_transactions."""
-    # Pad CIK to 10 digits
-    cik_padded = cik.zfill(10)
-
-    # Fetch company submissions
-    data = await _fetch_sec(f"submissions/CIK{cik_padded}.json")
-
-    if "filings" not in data or "recent" not in data["filings"]:
+def _render_insider_transactions(
+    cik: str, submissions: Dict[str, Any], limit: int = 10
+) -> str:
+    """Render recent Form 4 filings from a submissions index."""
+    if not submissions["filings"]:
         return f"No filings found for CIK {cik}"
 
-    company_name = data.get("name", "Unknown")
-    recent = data["filings"]["recent"]
-
-    # Find Form 4 filings
-    form4s = []
-    for i, form in enumerate(recent["form"]):
-        if form == "4" and len(form4s) < limit:
-            filing_date = recent["filingDate"][i]
-            accession = recent["accessionNumber"][i].replace("-", "")
-            primary_doc = recent["primaryDocument"][i]
-
-            filing_url = (
-                f"https://www.sec.gov/Archives/edgar/data/"
-                f"{cik}/{accession}/{primary_doc}"
-            )
-
-            form4s.append({
-                "date": filing_date,
-                "accession": recent["accessionNumber"][i],
-                "url": filing_url
-            })
-
+    company_name = submissions["name"]
+    form4s = _find_filings(submissions, cik, "4", limit)
     if not form4s:
         return f"No Form 4 (insider trading) filings found for {company_name}"
 
@@ -552,14 +749,15 @@ async def get_insider_transactions(cik: str, limit: int = 10) -> str:
     (officers, directors, and >10% shareholders).
 
     Args:
-        cik: Central Index Key (CIK) for the company
+        cik: Central Index Key (CIK) or stock ticker symbol (e.g., '320193' or 'AAPL')
         limit: Maximum number of Form 4 filings to return (default: 10)
 
     Returns:
         Recent insider trading transactions
     """
     try:
-        return await _get_insider_transactions_cached(cik, limit)
+        cik = await _resolve_cik(cik)
+        return _render_insider_transactions(cik, await _get_submissions(cik), limit)
     except Exception as e:
         return f"Error fetching insider transactions for CIK {cik}: {str(e)}"
 
@@ -7,6 +7,7 @@ import httpx
 from langchain_core.tools import tool
 
 from navam_invest.cache import cached
+from navam_invest.net import fetch
 
 
 async def _fetch_tiingo(
@@ -22,37 +23,36 @@ async def _fetch_tiingo(
     Returns:
         JSON response data
     """
-    async with httpx.AsyncClient() as client:
-        url = f"https://api.tiingo.com/{endpoint}"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Token {api_key}",
-        }
-        try:
-            response = await client.get(url, headers=headers, params=params, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            status_code = e.response.status_code
-            if status_code == 403:
-                raise Exception(
-                    "Tiingo API access denied. Free tier may not have access to fundamentals. "
-                    "Please check your API key and subscription level."
-                )
-            elif status_code == 401:
-                raise Exception(
-                    "Tiingo API authentication failed. Please verify your API key."
-                )
-            elif status_code == 429:
-                raise Exception(
-                    "Tiingo API rate limit exceeded. Free tier: 50 symbols/hour, 1000 requests/day."
-                )
-            elif status_code == 404:
-                raise Exception(
-                    "Tiingo API endpoint not found. This endpoint may require a paid subscription."
-                )
-            else:
-                raise Exception(f"Tiingo API error: HTTP {status_code} - {e.response.text}")
+    url = f"https://api.tiingo.com/{endpoint}"
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Token {api_key}",
+    }
+    try:
+        response = await fetch("tiingo", url, headers=headers, params=params)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        status_code = e.response.status_code
+        if status_code == 403:
+            raise Exception(
+                "Tiingo API access denied. Free tier may not have access to fundamentals. "
+                "Please check your API key and subscription level."
+            )
+        elif status_code == 401:
+            raise Exception(
+                "Tiingo API authentication failed. Please verify your API key."
+            )
+        elif status_code == 429:
+            raise Exception(
+                "Tiingo API rate limit exceeded. Free tier: 50 symbols/hour, 1000 requests/day."
+            )
+        elif status_code == 404:
+            raise Exception(
+                "Tiingo API endpoint not found. This endpoint may require a paid subscription."
+            )
+        else:
+            raise Exception(f"Tiingo API error: HTTP {status_code} - {e.response.text}")
 
 
 @cached(source="tiingo")
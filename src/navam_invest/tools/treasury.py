@@ -2,21 +2,20 @@
 
 from typing import Any, Dict, List, Optional
 
-import httpx
 from langchain_core.tools import tool
 
 from navam_invest.cache import cached
+from navam_invest.net import fetch
 
 
 async def _fetch_treasury(
     endpoint: str, **params: Any
 ) -> Dict[str, Any] | List[Dict[str, Any]]:
     """Fetch data from U.S. Treasury Fiscal Data API (no API key required)."""
-    async with httpx.AsyncClient() as client:
-        url = f"https://api.fiscaldata.treasury.gov/services/api/fiscal_service/{endpoint}"
-        response = await client.get(url, params=params, timeout=30.0)
-        response.raise_for_status()
-        return response.json()
+    url = f"https://api.fiscaldata.treasury.gov/services/api/fiscal_service/{endpoint}"
+    response = await fetch("treasury", url, params=params)
+    response.raise_for_status()
+    return response.json()
 
 
 @cached(source="treasury")
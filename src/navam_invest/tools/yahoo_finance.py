@@ -4,9 +4,11 @@ Uses yfinance library (unofficial Yahoo Finance API wrapper).
 No API key required - free and unlimited access.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 
 try:
     import yfinance as yf
@@ -16,6 +18,10 @@ except ImportError:
     pd = None
 
 from navam_invest.cache import cached
+from navam_invest.cache.price_store import get_price_store
+from navam_invest.net.executor import get_blocking_executor
+
+logger = logging.getLogger(__name__)
 
 
 def _check_yfinance_available() -> Optional[str]:
@@ -28,36 +34,97 @@ def _check_yfinance_available() -> Optional[str]:
     return None
 
 
-@cached(source="yahoo_finance")
-def _get_quote_cached(symbol: str) -> str:
-    """Cached implementation of get_quote."""
-    ticker = yf.Ticker(symbol)
-    info = ticker.info
+def _yahoo_tool(func: Callable[..., str]) -> StructuredTool:
+    """Make a Yahoo tool whose async calls run on the Yahoo executor.
+
+    yfinance blocks on network I/O and pandas parsing. Agents call tools
+    asynchronously, and those calls go to a dedicated bounded thread pool
+    (YAHOO_FINANCE_MAX_WORKERS) instead of the event loop's default executor.
+    Synchronous calls run ``func`` directly.
+    """
+
+    async def coroutine(**kwargs: Any) -> str:
+        executor = get_blocking_executor("yahoo_finance")
+        try:
+            return await executor.run(func, **kwargs)
+        except asyncio.TimeoutError:
+            return (
+                f"Error: Yahoo Finance did not answer {func.__name__} within "
+                f"{executor.timeout_seconds:.0f}s; try again later"
+            )
+
+    return StructuredTool.from_function(func=func, coroutine=coroutine)
+
+
+@cached(source="yahoo_info")
+def _get_info_cached(symbol: str) -> Dict[str, Any]:
+    """Cached ``Ticker.info`` snapshot, shared by every Yahoo tool."""
+    info = yf.Ticker(symbol).info or {}
+    snapshot = {key: value for key, value in info.items() if value is not None}
+    snapshot["symbol"] = symbol
+    return snapshot
+
+
+def get_info(symbol: str) -> Dict[str, Any]:
+    """Get the per-symbol ``Ticker.info`` snapshot.
+
+    One info download per symbol serves the quote, company profile, earnings,
+    analyst, dividend and options tools until the ``yahoo_info`` TTL expires;
+    each tool only formats the fields it needs.
+
+    Args:
+        symbol: Stock ticker symbol (case-insensitive)
+
+    Returns:
+        Info fields with None values dropped
+    """
+    return _get_info_cached(symbol.strip().upper())
+
+
+# Yahoo's bulk quote endpoint returns many symbols per request
+_BULK_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+_BULK_QUOTE_CHUNK = 50
+
+# Bulk quote field -> Ticker.info key used by the quote formatter
+_BULK_QUOTE_FIELDS = {
+    "regularMarketVolume": "volume",
+    "averageDailyVolume3Month": "averageVolume",
+    "trailingAnnualDividendYield": "dividendYield",
+}
 
+
+def _format_market_cap(market_cap: Any) -> str:
+    """Format a market cap as $1.23T / $4.56B / $7.89M."""
+    if isinstance(market_cap, (int, float)):
+        if market_cap >= 1e12:
+            return f"${market_cap/1e12:.2f}T"
+        elif market_cap >= 1e9:
+            return f"${market_cap/1e9:.2f}B"
+        elif market_cap >= 1e6:
+            return f"${market_cap/1e6:.2f}M"
+        return f"${market_cap:,.0f}"
+    return str(market_cap)
+
+
+def _format_count(value: Any) -> str:
+    """Format a share count with thousands separators."""
+    if isinstance(value, (int, float)):
+        return f"{value:,.0f}"
+    return str(value)
+
+
+def _format_quote(symbol: str, info: Dict[str, Any]) -> str:
+    """Format a quote from ``Ticker.info``-style fields."""
     # Extract key metrics
     price = info.get("currentPrice") or info.get("regularMarketPrice", "N/A")
     change = info.get("regularMarketChange", "N/A")
     change_pct = info.get("regularMarketChangePercent", "N/A")
     volume = info.get("volume", "N/A")
     avg_volume = info.get("averageVolume", "N/A")
-    market_cap = info.get("marketCap", "N/A")
     pe_ratio = info.get("trailingPE", "N/A")
     forward_pe = info.get("forwardPE", "N/A")
     div_yield = info.get("dividendYield", "N/A")
 
-    # Format market cap
-    if isinstance(market_cap, (int, float)):
-        if market_cap >= 1e12:
-            market_cap_str = f"${market_cap/1e12:.2f}T"
-        elif market_cap >= 1e9:
-            market_cap_str = f"${market_cap/1e9:.2f}B"
-        elif market_cap >= 1e6:
-            market_cap_str = f"${market_cap/1e6:.2f}M"
-        else:
-            market_cap_str = f"${market_cap:,.0f}"
-    else:
-        market_cap_str = str(market_cap)
-
     # Format dividend yield
     if isinstance(div_yield, float):
         div_yield = f"{div_yield*100:.2f}%"
@@ -66,15 +133,145 @@ def _get_quote_cached(symbol: str) -> str:
         f"**{symbol} - {info.get('longName', 'N/A')}**\n\n"
         f"**Price:** ${price}\n"
         f"**Change:** {change} ({change_pct}%)\n"
-        f"**Volume:** {volume:,} (Avg: {avg_volume:,})\n"
-        f"**Market Cap:** {market_cap_str}\n"
+        f"**Volume:** {_format_count(volume)} (Avg: {_format_count(avg_volume)})\n"
+        f"**Market Cap:** {_format_market_cap(info.get('marketCap', 'N/A'))}\n"
         f"**P/E (TTM):** {pe_ratio}\n"
         f"**Forward P/E:** {forward_pe}\n"
         f"**Dividend Yield:** {div_yield}\n"
     )
 
 
-@tool
+def _get_quote(symbol: str) -> str:
+    """Implementation of get_quote.
+
+    Prices come from the quote fields of a recent bulk request when cached,
+    since ``get_quotes`` refreshes those more often than the info snapshot;
+    the snapshot fills in the other fields. The snapshot is only downloaded
+    when neither is cached.
+    """
+    symbol = symbol.strip().upper()
+    info = _get_info_cached.peek(symbol)
+    quote = _get_quote_fields_cached.peek(symbol)
+    if quote is None:
+        return _format_quote(symbol, info or get_info(symbol))
+
+    # A snapshot currentPrice would shadow the bulk regularMarketPrice
+    fields = {k: v for k, v in (info or {}).items() if k != "currentPrice"}
+    fields.update(quote)
+    return _format_quote(symbol, fields)
+
+
+@cached(source="yahoo_finance")
+def _get_quote_fields_cached(symbol: str) -> Dict[str, Any]:
+    """Cached quote fields for one symbol (filled in bulk by fetch_quotes)."""
+    quotes = _fetch_bulk_quotes([symbol])
+    if symbol not in quotes:
+        raise ValueError(f"No quote found for {symbol}")
+    return quotes[symbol]
+
+
+def _fetch_bulk_quotes(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch quote fields for many symbols from Yahoo's bulk quote endpoint.
+
+    Issues one request per ``_BULK_QUOTE_CHUNK`` symbols. Fields are renamed
+    to their ``Ticker.info`` equivalents so ``_format_quote`` handles both.
+    The endpoint is reached through yfinance internals; if they are missing
+    or the request fails, the chunk falls back to per-symbol ``get_info``.
+
+    Args:
+        symbols: Upper-case ticker symbols
+
+    Returns:
+        Quote fields by symbol; symbols Yahoo does not know are omitted
+    """
+    quotes: Dict[str, Dict[str, Any]] = {}
+    for i in range(0, len(symbols), _BULK_QUOTE_CHUNK):
+        chunk = symbols[i : i + _BULK_QUOTE_CHUNK]
+        try:
+            rows = _request_bulk_quotes(chunk)
+        except Exception as e:
+            logger.warning(f"Bulk quote request failed ({e}); fetching one by one")
+            quotes.update(_fetch_quotes_one_by_one(chunk))
+            continue
+
+        for row in rows:
+            if not row.get("symbol") or row.get("regularMarketPrice") is None:
+                continue
+            fields = dict(row)
+            for bulk_key, info_key in _BULK_QUOTE_FIELDS.items():
+                if bulk_key in row:
+                    fields[info_key] = row[bulk_key]
+            fields.setdefault("longName", row.get("shortName", "N/A"))
+            quotes[row["symbol"].upper()] = fields
+    return quotes
+
+
+def _request_bulk_quotes(symbols: List[str]) -> List[Dict[str, Any]]:
+    """Result rows of one bulk quote request (raises if the API is unusable)."""
+    from yfinance.data import YfData
+
+    response = YfData().get_raw_json(
+        _BULK_QUOTE_URL,
+        params={"symbols": ",".join(symbols), "formatted": "false"},
+    )
+    return (response.get("quoteResponse") or {}).get("result") or []
+
+
+def _fetch_quotes_one_by_one(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Quote fields from each symbol's ``Ticker.info`` snapshot.
+
+    Snapshots download one after another on the calling thread, which is
+    already a worker of the bounded Yahoo executor; starting more threads
+    here would exceed YAHOO_FINANCE_MAX_WORKERS.
+    """
+    quotes: Dict[str, Dict[str, Any]] = {}
+    for symbol in symbols:
+        try:
+            info = get_info(symbol)
+        except Exception as e:
+            logger.debug(f"No info snapshot for {symbol}: {e}")
+            continue
+        price = info.get("regularMarketPrice", info.get("currentPrice"))
+        if price is None:
+            continue
+        quotes[symbol] = {"regularMarketPrice": price, **info}
+    return quotes
+
+
+def fetch_quotes(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Get quote fields for many symbols with one bulk request for cache misses.
+
+    Symbols already cached are served from the cache; the rest are fetched
+    together. Every fetched symbol is cached on its own, and ``get_quote``
+    serves later calls for it from that entry.
+
+    Args:
+        symbols: Ticker symbols (case-insensitive, duplicates ignored)
+
+    Returns:
+        Quote fields by upper-case symbol, in request order; unknown symbols
+        are omitted
+    """
+    wanted = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+    quotes: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    for symbol in wanted:
+        fields = _get_quote_fields_cached.peek(symbol)
+        if fields is None:
+            missing.append(symbol)
+        else:
+            quotes[symbol] = fields
+
+    if missing:
+        fetched = _fetch_bulk_quotes(missing)
+        for symbol, fields in fetched.items():
+            _get_quote_fields_cached.prime(fields, symbol)
+        quotes.update(fetched)
+
+    return {symbol: quotes[symbol] for symbol in wanted if symbol in quotes}
+
+
+@_yahoo_tool
 def get_quote(symbol: str) -> str:
     """Get real-time stock quote with extended metrics.
 
@@ -88,16 +285,67 @@ def get_quote(symbol: str) -> str:
         return error
 
     try:
-        return _get_quote_cached(symbol)
+        return _get_quote(symbol)
     except Exception as e:
         return f"Error fetching quote for {symbol}: {str(e)}"
 
 
+@_yahoo_tool
+def get_quotes(symbols: List[str]) -> str:
+    """Get real-time quotes for many stocks in one request.
+
+    Prefer this over repeated get_quote calls when pricing a portfolio or
+    comparing several stocks.
+
+    Args:
+        symbols: Stock ticker symbols (e.g., ['AAPL', 'MSFT', 'NVDA'])
+
+    Returns:
+        Compact table with price, daily change, volume, market cap and P/E
+        for each symbol
+    """
+    if error := _check_yfinance_available():
+        return error
+
+    try:
+        quotes = fetch_quotes(symbols)
+    except Exception as e:
+        return f"Error fetching quotes for {', '.join(symbols)}: {str(e)}"
+
+    def number(value: Any, fmt: str) -> str:
+        return format(value, fmt) if isinstance(value, (int, float)) else "N/A"
+
+    lines = [
+        f"**Quotes ({len(quotes)} symbols)**\n",
+        "| Symbol | Price | Change % | Volume | Market Cap | P/E |",
+        "|--------|-------|----------|--------|------------|-----|",
+    ]
+    for symbol, fields in quotes.items():
+        lines.append(
+            f"| {symbol} "
+            f"| ${number(fields.get('regularMarketPrice'), '.2f')} "
+            f"| {number(fields.get('regularMarketChangePercent'), '+.2f')}% "
+            f"| {_format_count(fields.get('volume', 'N/A'))} "
+            f"| {_format_market_cap(fields.get('marketCap', 'N/A'))} "
+            f"| {number(fields.get('trailingPE'), '.1f')} |"
+        )
+
+    requested = dict.fromkeys(s.strip().upper() for s in symbols if s.strip())
+    not_found = [symbol for symbol in requested if symbol not in quotes]
+    if not_found:
+        lines.append(f"\n**Not found:** {', '.join(not_found)}")
+
+    return "\n".join(lines)
+
+
 @cached(source="yahoo_finance")
 def _get_historical_data_cached(symbol: str, period: str = "1y", interval: str = "1d") -> str:
-    """Cached implementation of get_historical_data."""
-    ticker = yf.Ticker(symbol)
-    hist = ticker.history(period=period, interval=interval)
+    """Cached implementation of get_historical_data.
+
+    Bars come from the local price store, which downloads only the bars it
+    is missing.
+    """
+    hist = get_price_store().history(symbol, period=period, interval=interval)
 
     if hist.empty:
         return f"No historical data found for {symbol}"
@@ -123,7 +371,7 @@ def _get_historical_data_cached(symbol: str, period: str = "1y", interval: str =
     )
 
 
-@tool
+@_yahoo_tool
 def get_historical_data(
     symbol: str, period: str = "1y", interval: str = "1d"
 ) -> str:
@@ -208,7 +456,7 @@ def _get_financials_cached(symbol: str) -> str:
     )
 
 
-@tool
+@_yahoo_tool
 def get_financials(symbol: str) -> str:
     """Get financial statements (income statement, balance sheet, cash flow).
 
@@ -256,7 +504,7 @@ def _get_earnings_history_cached(symbol: str) -> str:
     return output or f"No historical earnings data available for {symbol}"
 
 
-@tool
+@_yahoo_tool
 def get_earnings_history(symbol: str) -> str:
     """Get historical earnings data with surprises.
 
@@ -276,12 +524,32 @@ def get_earnings_history(symbol: str) -> str:
 
 
 @cached(source="yahoo_finance")
-def _get_earnings_calendar_cached(symbol: str) -> str:
-    """Cached implementation of get_earnings_calendar."""
-    ticker = yf.Ticker(symbol)
-    info = ticker.info
+def _get_earnings_estimates_cached(symbol: str) -> Dict[str, Any]:
+    """Cached ``Ticker.calendar`` estimates as plain values."""
+    calendar = yf.Ticker(symbol).calendar
+    if calendar is None:
+        return {}
+    if isinstance(calendar, dict):
+        fields = calendar
+    elif calendar.empty:
+        return {}
+    else:
+        fields = {key: calendar[key].iloc[0] for key in calendar.columns}
+    keys = ("Earnings Average", "Earnings Low", "Earnings High", "Revenue Average")
+    estimates = {key: fields.get(key, "N/A") for key in keys}
+    dates = fields.get("Earnings Date")
+    if dates is not None:
+        dates = dates if isinstance(dates, (list, tuple)) else [dates]
+        estimates["Earnings Date"] = [str(d) for d in dates]
+    return estimates
+
+
+def _get_earnings_calendar(symbol: str) -> str:
+    """Implementation of get_earnings_calendar."""
+    info = get_info(symbol)
+    estimates = _get_earnings_estimates_cached(symbol)
 
-    earnings_date = info.get("earningsDate")
+    earnings_date = info.get("earningsDate") or estimates.get("Earnings Date")
 
     if earnings_date:
         # Format dates
@@ -292,15 +560,10 @@ def _get_earnings_calendar_cached(symbol: str) -> str:
     else:
         date_str = "N/A"
 
-    # Get earnings info
-    calendar = ticker.calendar
-    if calendar is not None and not calendar.empty:
-        eps_estimate = calendar.get("Earnings Average", "N/A")
-        eps_low = calendar.get("Earnings Low", "N/A")
-        eps_high = calendar.get("Earnings High", "N/A")
-        revenue_estimate = calendar.get("Revenue Average", "N/A")
-    else:
-        eps_estimate = eps_low = eps_high = revenue_estimate = "N/A"
+    eps_estimate = estimates.get("Earnings Average", "N/A")
+    eps_low = estimates.get("Earnings Low", "N/A")
+    eps_high = estimates.get("Earnings High", "N/A")
+    revenue_estimate = estimates.get("Revenue Average", "N/A")
 
     return (
         f"**{symbol} Upcoming Earnings**\n\n"
@@ -310,7 +573,7 @@ def _get_earnings_calendar_cached(symbol: str) -> str:
     )
 
 
-@tool
+@_yahoo_tool
 def get_earnings_calendar(symbol: str) -> str:
     """Get upcoming earnings date.
 
@@ -324,30 +587,47 @@ def get_earnings_calendar(symbol: str) -> str:
         return error
 
     try:
-        return _get_earnings_calendar_cached(symbol)
+        return _get_earnings_calendar(symbol)
     except Exception as e:
         return f"Error fetching earnings calendar for {symbol}: {str(e)}"
 
 
 @cached(source="yahoo_finance")
-def _get_analyst_recommendations_cached(symbol: str) -> str:
-    """Cached implementation of get_analyst_recommendations."""
+def _get_rating_changes_cached(symbol: str) -> Optional[Dict[str, Any]]:
+    """Cached summary of the 10 latest rating changes, or None without data."""
     ticker = yf.Ticker(symbol)
     recommendations = ticker.recommendations
 
     if recommendations is None or recommendations.empty:
-        return f"No analyst recommendations found for {symbol}"
+        return None
 
     # Get latest recommendations summary
     recent = recommendations.tail(10)
 
     # Count recommendation types
-    buy_count = len(recent[recent["To Grade"].str.contains("Buy|Overweight", case=False, na=False)])
-    hold_count = len(recent[recent["To Grade"].str.contains("Hold|Neutral", case=False, na=False)])
-    sell_count = len(recent[recent["To Grade"].str.contains("Sell|Underweight", case=False, na=False)])
+    grades = recent["To Grade"].str
+    return {
+        "buy": len(recent[grades.contains("Buy|Overweight", case=False, na=False)]),
+        "hold": len(recent[grades.contains("Hold|Neutral", case=False, na=False)]),
+        "sell": len(recent[grades.contains("Sell|Underweight", case=False, na=False)]),
+        "recent": [
+            {
+                key: row.get(key, "N/A")
+                for key in ("Firm", "From Grade", "To Grade", "Action")
+            }
+            for _, row in recent.tail(3).iterrows()
+        ],
+    }
+
+
+def _get_analyst_recommendations(symbol: str) -> str:
+    """Implementation of get_analyst_recommendations."""
+    ratings = _get_rating_changes_cached(symbol)
+    if ratings is None:
+        return f"No analyst recommendations found for {symbol}"
 
     # Get price targets
-    info = ticker.info
+    info = get_info(symbol)
     target_high = info.get("targetHighPrice", "N/A")
     target_low = info.get("targetLowPrice", "N/A")
     target_mean = info.get("targetMeanPrice", "N/A")
@@ -357,9 +637,9 @@ def _get_analyst_recommendations_cached(symbol: str) -> str:
     output = (
         f"**{symbol} Analyst Recommendations**\n\n"
         f"**Latest 10 Ratings:**\n"
-        f"  - Buy/Overweight: {buy_count}\n"
-        f"  - Hold/Neutral: {hold_count}\n"
-        f"  - Sell/Underweight: {sell_count}\n\n"
+        f"  - Buy/Overweight: {ratings['buy']}\n"
+        f"  - Hold/Neutral: {ratings['hold']}\n"
+        f"  - Sell/Underweight: {ratings['sell']}\n\n"
         f"**Price Targets:**\n"
         f"  - Mean: ${target_mean}\n"
         f"  - Median: ${target_median}\n"
@@ -370,18 +650,16 @@ def _get_analyst_recommendations_cached(symbol: str) -> str:
     )
 
     # Add 3 most recent rating changes
-    for _, row in recent.tail(3).iterrows():
-        firm = row.get("Firm", "N/A")
-        from_grade = row.get("From Grade", "N/A")
-        to_grade = row.get("To Grade", "N/A")
-        action = row.get("Action", "N/A")
-
-        output += f"  - {firm}: {from_grade} → {to_grade} ({action})\n"
+    for row in ratings["recent"]:
+        output += (
+            f"  - {row['Firm']}: {row['From Grade']} → {row['To Grade']} "
+            f"({row['Action']})\n"
+        )
 
     return output
 
 
-@tool
+@_yahoo_tool
 def get_analyst_recommendations(symbol: str) -> str:
     """Get analyst recommendations and price targets.
 
@@ -395,7 +673,7 @@ def get_analyst_recommendations(symbol: str) -> str:
         return error
 
     try:
-        return _get_analyst_recommendations_cached(symbol)
+        return _get_analyst_recommendations(symbol)
     except Exception as e:
         return f"Error fetching analyst recommendations for {symbol}: {str(e)}"
 
@@ -439,7 +717,7 @@ def _get_institutional_holders_cached(symbol: str) -> str:
     return output
 
 
-@tool
+@_yahoo_tool
 def get_institutional_holders(symbol: str) -> str:
     """Get top institutional holders.
 
@@ -458,11 +736,9 @@ def get_institutional_holders(symbol: str) -> str:
         return f"Error fetching institutional holders for {symbol}: {str(e)}"
 
 
-@cached(source="yahoo_finance")
-def _get_company_info_cached(symbol: str) -> str:
-    """Cached implementation of get_company_info."""
-    ticker = yf.Ticker(symbol)
-    info = ticker.info
+def _get_company_info(symbol: str) -> str:
+    """Implementation of get_company_info."""
+    info = get_info(symbol)
 
     name = info.get("longName", "N/A")
     sector = info.get("sector", "N/A")
@@ -482,13 +758,13 @@ def _get_company_info_cached(symbol: str) -> str:
         f"**Sector:** {sector}\n"
         f"**Industry:** {industry}\n"
         f"**Location:** {city}, {state}, {country}\n"
-        f"**Employees:** {employees:,}\n"
+        f"**Employees:** {_format_count(employees)}\n"
         f"**Website:** {website}\n\n"
         f"**Business Description:**\n{description}\n"
     )
 
 
-@tool
+@_yahoo_tool
 def get_company_info(symbol: str) -> str:
     """Get comprehensive company profile and business description.
 
@@ -502,19 +778,21 @@ def get_company_info(symbol: str) -> str:
         return error
 
     try:
-        return _get_company_info_cached(symbol)
+        return _get_company_info(symbol)
     except Exception as e:
         return f"Error fetching company info for {symbol}: {str(e)}"
 
 
 @cached(source="yahoo_finance")
-def _get_dividends_cached(symbol: str, period: str = "5y") -> str:
-    """Cached implementation of get_dividends."""
+def _get_dividend_history_cached(
+    symbol: str, period: str = "5y"
+) -> Optional[Dict[str, Any]]:
+    """Cached dividend statistics for a period, or None without data."""
     ticker = yf.Ticker(symbol)
     dividends = ticker.dividends
 
     if dividends is None or dividends.empty:
-        return f"No dividend data found for {symbol}"
+        return None
 
     # Filter by period
     if period != "max":
@@ -522,14 +800,28 @@ def _get_dividends_cached(symbol: str, period: str = "5y") -> str:
         dividends = dividends[dividends.index >= dividends.index[-1] - pd.Timedelta(days=365*years)]
 
     # Calculate statistics
-    total_paid = dividends.sum()
-    avg_dividend = dividends.mean()
-    latest_dividend = dividends.iloc[-1]
-    dividend_count = len(dividends)
+    return {
+        "count": len(dividends),
+        "total": float(dividends.sum()),
+        "average": float(dividends.mean()),
+        "latest": float(dividends.iloc[-1]),
+        "latest_date": str(dividends.index[-1].date()),
+        # Last 5 payments
+        "recent": [
+            [str(date.date()), float(amount)]
+            for date, amount in dividends.tail(5).items()
+        ],
+    }
+
+
+def _get_dividends(symbol: str, period: str = "5y") -> str:
+    """Implementation of get_dividends."""
+    history = _get_dividend_history_cached(symbol, period)
+    if history is None:
+        return f"No dividend data found for {symbol}"
 
     # Get current yield
-    info = ticker.info
-    dividend_yield = info.get("dividendYield", 0)
+    dividend_yield = get_info(symbol).get("dividendYield", 0)
     if isinstance(dividend_yield, float):
         yield_str = f"{dividend_yield*100:.2f}%"
     else:
@@ -537,22 +829,21 @@ def _get_dividends_cached(symbol: str, period: str = "5y") -> str:
 
     output = (
         f"**{symbol} Dividend History ({period})**\n\n"
-        f"**Total Payments:** {dividend_count}\n"
-        f"**Total Amount:** ${total_paid:.2f}\n"
-        f"**Average Dividend:** ${avg_dividend:.2f}\n"
-        f"**Latest Dividend:** ${latest_dividend:.2f} ({dividends.index[-1].date()})\n"
+        f"**Total Payments:** {history['count']}\n"
+        f"**Total Amount:** ${history['total']:.2f}\n"
+        f"**Average Dividend:** ${history['average']:.2f}\n"
+        f"**Latest Dividend:** ${history['latest']:.2f} ({history['latest_date']})\n"
         f"**Current Yield:** {yield_str}\n\n"
         f"**Recent Payments:**\n"
     )
 
-    # Show last 5 payments
-    for date, amount in dividends.tail(5).items():
-        output += f"  - {date.date()}: ${amount:.2f}\n"
+    for date, amount in history["recent"]:
+        output += f"  - {date}: ${amount:.2f}\n"
 
     return output
 
 
-@tool
+@_yahoo_tool
 def get_dividends(symbol: str, period: str = "5y") -> str:
     """Get dividend history.
 
@@ -567,60 +858,77 @@ def get_dividends(symbol: str, period: str = "5y") -> str:
         return error
 
     try:
-        return _get_dividends_cached(symbol, period)
+        return _get_dividends(symbol, period)
     except Exception as e:
         return f"Error fetching dividend data for {symbol}: {str(e)}"
 
 
+_OPTION_COLUMNS = [
+    "strike",
+    "lastPrice",
+    "bid",
+    "ask",
+    "volume",
+    "openInterest",
+    "impliedVolatility",
+]
+
+
 @cached(source="yahoo_finance")
-def _get_options_chain_cached(symbol: str, expiration: Optional[str] = None) -> str:
-    """Cached implementation of get_options_chain."""
+def _get_option_contracts_cached(
+    symbol: str, expiration: Optional[str] = None
+) -> Dict[str, Any]:
+    """Cached calls and puts for one expiration.
+
+    Returns:
+        ``{"expiration", "calls", "puts"}`` with contract rows, or
+        ``{"error"}`` when the symbol or expiration has no options
+    """
     ticker = yf.Ticker(symbol)
 
     # Get available expiration dates
     expirations = ticker.options
     if not expirations:
-        return f"No options data found for {symbol}"
+        return {"error": f"No options data found for {symbol}"}
 
     # Use provided or nearest expiration
     exp_date = expiration if expiration else expirations[0]
 
     if exp_date not in expirations:
-        return (
-            f"Expiration {exp_date} not available for {symbol}.\n"
-            f"Available expirations: {', '.join(expirations[:5])}"
-        )
+        return {
+            "error": (
+                f"Expiration {exp_date} not available for {symbol}.\n"
+                f"Available expirations: {', '.join(expirations[:5])}"
+            )
+        }
 
     # Get options chain
     opt_chain = ticker.option_chain(exp_date)
-    calls = opt_chain.calls
-    puts = opt_chain.puts
 
-    # Get ATM strike
-    current_price = ticker.info.get("currentPrice", 0)
+    def rows(frame: Any) -> List[Dict[str, Any]]:
+        columns = [c for c in _OPTION_COLUMNS if c in frame.columns]
+        records: List[Dict[str, Any]] = frame[columns].fillna(0).to_dict("records")
+        return records
+
+    return {
+        "expiration": exp_date,
+        "calls": rows(opt_chain.calls),
+        "puts": rows(opt_chain.puts),
+    }
 
+
+def _format_option_rows(contracts: List[Dict[str, Any]], current_price: float) -> str:
+    """Format up to five contracts within 10% of the underlying price."""
     # Filter for near-the-money options (within 10% of current price)
     if current_price:
-        calls_atm = calls[
-            (calls["strike"] >= current_price * 0.9) &
-            (calls["strike"] <= current_price * 1.1)
-        ]
-        puts_atm = puts[
-            (puts["strike"] >= current_price * 0.9) &
-            (puts["strike"] <= current_price * 1.1)
+        contracts = [
+            row
+            for row in contracts
+            if current_price * 0.9 <= row["strike"] <= current_price * 1.1
         ]
-    else:
-        calls_atm = calls.head(5)
-        puts_atm = puts.head(5)
-
-    output = (
-        f"**{symbol} Options Chain**\n"
-        f"**Expiration:** {exp_date}\n"
-        f"**Underlying Price:** ${current_price:.2f}\n\n"
-        f"**Near-the-Money Calls:**\n"
-    )
 
-    for _, row in calls_atm.head(5).iterrows():
+    output = ""
+    for row in contracts[:5]:
         strike = row["strike"]
         last = row.get("lastPrice", 0)
         bid = row.get("bid", 0)
@@ -632,30 +940,33 @@ def _get_options_chain_cached(symbol: str, expiration: Optional[str] = None) ->
         output += (
             f"  Strike ${strike:.2f}: Last ${last:.2f}, "
             f"Bid/Ask ${bid:.2f}/${ask:.2f}, "
-            f"Vol {volume:,}, OI {oi:,}, IV {iv*100:.1f}%\n"
+            f"Vol {volume:,.0f}, OI {oi:,.0f}, IV {iv*100:.1f}%\n"
         )
+    return output
 
-    output += "\n**Near-the-Money Puts:**\n"
 
-    for _, row in puts_atm.head(5).iterrows():
-        strike = row["strike"]
-        last = row.get("lastPrice", 0)
-        bid = row.get("bid", 0)
-        ask = row.get("ask", 0)
-        volume = row.get("volume", 0)
-        oi = row.get("openInterest", 0)
-        iv = row.get("impliedVolatility", 0)
+def _get_options_chain(symbol: str, expiration: Optional[str] = None) -> str:
+    """Implementation of get_options_chain."""
+    chain = _get_option_contracts_cached(symbol, expiration)
+    if "error" in chain:
+        return str(chain["error"])
 
-        output += (
-            f"  Strike ${strike:.2f}: Last ${last:.2f}, "
-            f"Bid/Ask ${bid:.2f}/${ask:.2f}, "
-            f"Vol {volume:,}, OI {oi:,}, IV {iv*100:.1f}%\n"
-        )
+    # Get ATM strike
+    info = get_info(symbol)
+    current_price = info.get("currentPrice") or info.get("regularMarketPrice") or 0
 
-    return output
+    return (
+        f"**{symbol} Options Chain**\n"
+        f"**Expiration:** {chain['expiration']}\n"
+        f"**Underlying Price:** ${current_price:.2f}\n\n"
+        f"**Near-the-Money Calls:**\n"
+        f"{_format_option_rows(chain['calls'], current_price)}"
+        f"\n**Near-the-Money Puts:**\n"
+        f"{_format_option_rows(chain['puts'], current_price)}"
+    )
 
 
-@tool
+@_yahoo_tool
 def get_options_chain(symbol: str, expiration: Optional[str] = None) -> str:
     """Get options chain data (calls and puts).
 
@@ -670,51 +981,90 @@ def get_options_chain(symbol: str, expiration: Optional[str] = None) -> str:
         return error
 
     try:
-        return _get_options_chain_cached(symbol, expiration)
+        return _get_options_chain(symbol, expiration)
     except Exception as e:
         return f"Error fetching options chain for {symbol}: {str(e)}"
 
 
-@cached(source="yahoo_finance")
-def _get_market_indices_cached() -> str:
-    """Cached implementation of get_market_indices."""
-    indices = {
-        "S&P 500": "^GSPC",
-        "Dow Jones": "^DJI",
-        "Nasdaq": "^IXIC",
-        "Russell 2000": "^RUT",
-        "VIX": "^VIX"
-    }
+def parse_symbol_list(value: str) -> Dict[str, str]:
+    """Parse a "Name=SYMBOL,..." list; a bare SYMBOL is its own name.
+
+    Args:
+        value: Comma-separated entries
+
+    Returns:
+        Symbol by display name, in list order
+    """
+    symbols: Dict[str, str] = {}
+    for entry in value.split(","):
+        name, _, symbol = entry.rpartition("=")
+        symbol = symbol.strip().upper()
+        if symbol:
+            symbols[name.strip() or symbol] = symbol
+    return symbols
 
-    output = "**Major Market Indices**\n\n"
 
-    for name, symbol in indices.items():
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+def _market_index_lists() -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Configured (indices, sector ETFs), falling back to the Settings defaults."""
+    from navam_invest.config.settings import get_settings_or_defaults
 
-        price = info.get("regularMarketPrice", "N/A")
-        change = info.get("regularMarketChange", "N/A")
-        change_pct = info.get("regularMarketChangePercent", "N/A")
+    settings = get_settings_or_defaults()
+    return (
+        parse_symbol_list(settings.market_indices),
+        parse_symbol_list(settings.market_sector_etfs),
+    )
 
-        if isinstance(change_pct, float):
-            change_pct = f"{change_pct:+.2f}%"
 
-        output += f"**{name}:** {price:.2f} ({change:+.2f}, {change_pct})\n"
+def _format_index_line(name: str, fields: Optional[Dict[str, Any]]) -> str:
+    """Format one index as "**Name:** price (change, change%)"."""
+    fields = fields or {}
+    price = fields.get("regularMarketPrice")
+    change = fields.get("regularMarketChange")
+    change_pct = fields.get("regularMarketChangePercent")
+    if not isinstance(price, (int, float)):
+        return f"**{name}:** N/A"
+    line = f"**{name}:** {price:.2f}"
+    if isinstance(change, (int, float)) and isinstance(change_pct, (int, float)):
+        line += f" ({change:+.2f}, {change_pct:+.2f}%)"
+    return line
 
-    return output
+
+def _get_market_indices(include_sectors: bool = False) -> str:
+    """Implementation of get_market_indices.
+
+    All configured symbols are priced through ``fetch_quotes``: one bulk
+    request for the symbols not already cached, with each index cached on
+    its own so a partial refresh only fetches the expired ones.
+    """
+    indices, sectors = _market_index_lists()
+    groups = [("Major Market Indices", indices)]
+    if include_sectors:
+        groups.append(("Sector ETFs", sectors))
+
+    quotes = fetch_quotes([symbol for _, group in groups for symbol in group.values()])
+
+    sections = []
+    for title, group in groups:
+        lines = [_format_index_line(name, quotes.get(s)) for name, s in group.items()]
+        sections.append(f"**{title}**\n\n" + "\n".join(lines) + "\n")
+    return "\n".join(sections)
 
 
-@tool
-def get_market_indices() -> str:
+@_yahoo_tool
+def get_market_indices(include_sectors: bool = False) -> str:
     """Get current prices for major market indices.
 
+    Args:
+        include_sectors: Also include the S&P 500 sector ETFs (XLK, XLF, ...)
+
     Returns:
-        Current prices and changes for S&P 500, Dow Jones, Nasdaq, and Russell 2000
+        Current prices and changes for S&P 500, Dow Jones, Nasdaq, Russell 2000
+        and VIX, plus sector ETFs when requested
     """
     if error := _check_yfinance_available():
         return error
 
     try:
-        return _get_market_indices_cached()
+        return _get_market_indices(include_sectors)
     except Exception as e:
         return f"Error fetching market indices: {str(e)}"
@@ -1,10 +1,11 @@
 """Textual-based TUI for Navam Invest."""
 
 import asyncio
+import importlib
 import random
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage
 from rich.markdown import Markdown
 from rich.table import Table
 from textual.app import App, ComposeResult
@@ -12,25 +13,76 @@ from textual.containers import Container, Vertical
 from textual.widgets import Footer, Header, Input, RichLog
 from textual.worker import Worker, WorkerState
 
-from navam_invest.agents.portfolio import create_portfolio_agent
-from navam_invest.agents.research import create_research_agent
-from navam_invest.agents.quill import create_quill_agent
-from navam_invest.agents.screen_forge import create_screen_forge_agent
-from navam_invest.agents.macro_lens import create_macro_lens_agent
-from navam_invest.agents.earnings_whisperer import create_earnings_whisperer_agent
-from navam_invest.agents.news_sentry import create_news_sentry_agent
-from navam_invest.agents.risk_shield import create_risk_shield_agent
-from navam_invest.agents.tax_scout import create_tax_scout_agent
-from navam_invest.agents.hedge_smith import create_hedge_smith_agent
-from navam_invest.agents.router import create_router_agent, set_streaming_queue
-from navam_invest.workflows import (
-    create_investment_analysis_workflow,
-    create_idea_discovery_workflow,
-    create_portfolio_protection_workflow,
-    create_tax_optimization_workflow,
+from navam_invest.agents.registry import get_agent_pool
+from navam_invest.config.settings import ConfigurationError, get_settings
+from navam_invest.net import (
+    aclose_http_clients,
+    get_circuit_stats,
+    get_executor_stats,
+    get_rate_limit_stats,
 )
-from navam_invest.config.settings import ConfigurationError
-from navam_invest.utils import check_all_apis, save_investment_report, save_agent_report
+from navam_invest.net.executor import reset_blocking_executors
+from navam_invest.utils import check_all_apis, parse_symbols, save_agent_report
+from navam_invest.utils.event_bus import (
+    AGENT_END,
+    ERROR,
+    TOOL_END,
+    TOOL_START,
+    Subscription,
+    get_event_bus,
+    get_event_metrics,
+    new_run_id,
+)
+from navam_invest.utils.tracing import recent_traces, summarize_trace, trace_run
+
+if TYPE_CHECKING:
+    from navam_invest.workflows import AnalysisResult
+
+
+# The router and workflow modules import the LLM client (langchain_anthropic),
+# most of the startup time. They load on a worker thread after first paint.
+async def _import_off_loop(module: str) -> Any:
+    """Import a module on a worker thread so the UI keeps painting."""
+    return await asyncio.to_thread(importlib.import_module, module)
+
+
+async def create_router_agent() -> Any:
+    """Import the router module and build the router agent."""
+    router = await _import_off_loop("navam_invest.agents.router")
+    return await router.create_router_agent()
+
+
+async def run_investment_analysis_batch(
+    symbols: List[str], **kwargs: Any
+) -> List["AnalysisResult"]:
+    """Import the workflows package and run a batch investment analysis."""
+    workflows = await _import_off_loop("navam_invest.workflows")
+    return await workflows.run_investment_analysis_batch(symbols, **kwargs)
+
+
+def _workflow_factory(name: str) -> Callable[[], Awaitable[Any]]:
+    """Factory that imports the workflows package before building ``name``."""
+
+    async def build() -> Any:
+        workflows = await _import_off_loop("navam_invest.workflows")
+        return await getattr(workflows, name)()
+
+    return build
+
+
+# Workflows built on first use, keyed by their ChatUI attribute
+LAZY_WORKFLOWS: Dict[str, Callable[[], Awaitable[Any]]] = {
+    "investment_workflow": _workflow_factory("create_investment_analysis_workflow"),
+    "idea_discovery_workflow": _workflow_factory("create_idea_discovery_workflow"),
+    "portfolio_protection_workflow": _workflow_factory(
+        "create_portfolio_protection_workflow"
+    ),
+    "tax_optimization_workflow": _workflow_factory("create_tax_optimization_workflow"),
+}
+
+# Commands whose inline workflow runs are traced (see /trace); /analyze
+# traces each symbol inside run_investment_analysis_batch
+TRACED_COMMANDS = ("/discover",)
 
 # Example prompts for each agent
 PORTFOLIO_EXAMPLES = [
@@ -148,6 +200,7 @@ WORKFLOW_EXAMPLES = [
     "/analyze MSFT - Should I invest? Get both bottom-up and top-down view",
     "/analyze NVDA - Multi-agent analysis combining Quill and Macro Lens",
     "/analyze GOOGL - Comprehensive thesis with macro timing validation",
+    "/analyze AAPL MSFT NVDA - Batch analysis of a watchlist",
 ]
 
 
@@ -185,16 +238,6 @@ class ChatUI(App):
 
     def __init__(self) -> None:
         super().__init__()
-        self.portfolio_agent: Optional[object] = None
-        self.research_agent: Optional[object] = None
-        self.quill_agent: Optional[object] = None
-        self.screen_forge_agent: Optional[object] = None
-        self.macro_lens_agent: Optional[object] = None
-        self.earnings_whisperer_agent: Optional[object] = None
-        self.news_sentry_agent: Optional[object] = None
-        self.risk_shield_agent: Optional[object] = None
-        self.tax_scout_agent: Optional[object] = None
-        self.hedge_smith_agent: Optional[object] = None
         self.router_agent: Optional[object] = None
         self.investment_workflow: Optional[object] = None
         self.idea_discovery_workflow: Optional[object] = None
@@ -203,10 +246,13 @@ class ChatUI(App):
         self.current_agent: str = "portfolio"
         self.router_mode: bool = True  # True = automatic routing, False = manual agent selection
         self.agents_initialized: bool = False
-        self.streaming_queue: Optional[asyncio.Queue] = None  # Queue for sub-agent tool call streaming
-        self.streaming_task: Optional[asyncio.Task] = None  # Background task for queue consumption
+        self.event_subscription: Optional[Subscription] = None  # Progress events of the current run
+        self.streaming_task: Optional[asyncio.Task] = None  # Background task for event consumption
         self.agent_worker: Optional[Worker] = None  # Worker for agent execution
         self.cancellation_requested: bool = False  # Flag to track cancellation request
+        self._workflow_locks: dict = {}  # One build at a time per lazy workflow
+        self.router_task: Optional[asyncio.Task] = None  # Router load started after first paint
+        self.warmup_task: Optional[asyncio.Task] = None  # Background build of agents and workflows
 
     def compose(self) -> ComposeResult:
         """Compose the UI."""
@@ -221,54 +267,49 @@ class ChatUI(App):
         )
         yield Footer()
 
-    async def _consume_streaming_events(self, chat_log: RichLog) -> None:
-        """Background task to consume and display sub-agent tool call events from queue.
+    async def _consume_streaming_events(
+        self, chat_log: RichLog, subscription: Subscription
+    ) -> None:
+        """Background task to display sub-agent progress events of one run.
 
         This task runs concurrently with agent execution to provide progressive disclosure
-        of tool calls made by sub-agents within router tools.
+        of tool calls made by sub-agents within router tools. It ends once the
+        subscription is closed and drained.
 
         Args:
             chat_log: The RichLog widget to write events to
+            subscription: Event bus subscription for the run
         """
         try:
-            while True:
-                # Wait for event from queue (with timeout to allow task cancellation)
-                try:
-                    event = await asyncio.wait_for(self.streaming_queue.get(), timeout=0.1)
-                except asyncio.TimeoutError:
-                    continue
-
-                # Process event based on type
-                event_type = event.get("type")
-
-                if event_type == "tool_call":
+            async for event in subscription:
+                if event.type == TOOL_START:
                     # Display sub-agent tool call in real-time
-                    agent_name = event.get("agent", "Unknown")
-                    tool_name = event.get("tool_name", "unknown")
-                    tool_args = event.get("args", {})
-
-                    # Format args for display (limit length)
-                    args_str = str(tool_args)
+                    args_str = str(event.data.get("args", {}))
                     if len(args_str) > 80:
                         args_str = args_str[:77] + "..."
 
                     # Write to chat log with proper indentation (showing hierarchy)
-                    chat_log.write(f"[dim]      → {tool_name}({args_str})[/dim]\n")
+                    chat_log.write(f"[dim]      → {event.tool}({args_str})[/dim]\n")
 
-                elif event_type == "tool_complete":
-                    # Optional: Show tool completion
-                    tool_name = event.get("tool_name", "unknown")
-                    chat_log.write(f"[dim]      ✓ {tool_name}[/dim]\n")
+                elif event.type == TOOL_END:
+                    mark = "✓" if event.status == "ok" else "✗"
+                    took = f" {event.seconds:.1f}s" if event.seconds is not None else ""
+                    chat_log.write(f"[dim]      {mark} {event.tool}{took}[/dim]\n")
 
-                elif event_type == "error":
+                elif event.type == AGENT_END:
+                    # Specialists dispatched together finish independently
+                    agent_name = (event.agent or "unknown").replace("_", " ").title()
+                    mark = "✓" if event.status == "ok" else "✗"
+                    chat_log.write(
+                        f"[dim]    {mark} {agent_name} finished in {event.seconds or 0:.1f}s[/dim]\n"
+                    )
+
+                elif event.type == ERROR:
                     # Show errors from sub-agents
-                    agent_name = event.get("agent", "Unknown")
-                    error_msg = event.get("message", "Unknown error")
+                    agent_name = (event.agent or "unknown").replace("_", " ").title()
+                    error_msg = event.data.get("message", "Unknown error")
                     chat_log.write(f"[dim red]      ✗ {agent_name} error: {error_msg}[/dim]\n")
 
-                # Mark task as done
-                self.streaming_queue.task_done()
-
         except asyncio.CancelledError:
             # Task cancelled - clean shutdown
             pass
@@ -276,10 +317,28 @@ class ChatUI(App):
             # Log unexpected errors but don't crash
             chat_log.write(f"[dim yellow]⚠️ Streaming error: {str(e)}[/dim]\n")
 
+    def _stop_streaming(self, drain: bool = True) -> None:
+        """Close the current run's event subscription.
+
+        Args:
+            drain: Let the consumer show events still queued; otherwise cancel it
+        """
+        if self.event_subscription is not None:
+            self.event_subscription.close()
+            self.event_subscription = None
+        if not drain and self.streaming_task and not self.streaming_task.done():
+            self.streaming_task.cancel()
+        self.streaming_task = None
+
+    async def _within_run(self, run_id: str, name: str, coro: Awaitable) -> object:
+        """Await ``coro`` as one run: events tagged by ``run_id``, spans traced."""
+        async with get_event_bus().run(run_id), trace_run(name, trace_id=run_id):
+            return await coro
+
     async def on_mount(self) -> None:
-        """Initialize agents when app mounts."""
+        """Show the welcome screen and start loading the router."""
         # Set initial status
-        self.sub_title = "Initializing agents..."
+        self.sub_title = "Loading router..."
 
         chat_log = self.query_one("#chat-log", RichLog)
         chat_log.write(
@@ -304,7 +363,7 @@ class ChatUI(App):
                 "- `/research` - Macro research agent\n\n"
                 "**⚙️ Other Commands:**\n"
                 "- `/router on|off` - Toggle automatic routing\n"
-                "- `/analyze <SYMBOL>` - Multi-agent investment analysis workflow\n"
+                "- `/analyze <SYMBOL> [SYMBOL ...]` - Multi-agent investment analysis workflow\n"
                 "- `/discover [CRITERIA]` - Systematic idea generation workflow\n"
                 "- `/protect [PORTFOLIO]` - Portfolio hedging workflow\n"
                 "- `/optimize-tax [PORTFOLIO]` - Tax-loss harvesting workflow\n"
@@ -315,33 +374,27 @@ class ChatUI(App):
             )
         )
 
-        # Initialize streaming queue for progressive disclosure of sub-agent tool calls
-        self.streaming_queue = asyncio.Queue()
-        set_streaming_queue(self.streaming_queue)
+        # The welcome screen paints first; the router (the only agent needed for
+        # the first query) loads right after. Specialists and workflows are
+        # built on first use or in the background once the router is ready.
+        self.call_after_refresh(self._start_router)
 
-        # Initialize agents
+    def _start_router(self) -> None:
+        """Start loading the router agent in the background."""
+        self.router_task = asyncio.create_task(self._init_router())
+
+    async def _init_router(self) -> None:
+        """Build the router, then report Ready and schedule the warm-up."""
+        chat_log = self.query_one("#chat-log", RichLog)
         try:
-            self.portfolio_agent = await create_portfolio_agent()
-            self.research_agent = await create_research_agent()
-            self.quill_agent = await create_quill_agent()
-            self.screen_forge_agent = await create_screen_forge_agent()
-            self.macro_lens_agent = await create_macro_lens_agent()
-            self.earnings_whisperer_agent = await create_earnings_whisperer_agent()
-            self.news_sentry_agent = await create_news_sentry_agent()
-            self.risk_shield_agent = await create_risk_shield_agent()
-            self.tax_scout_agent = await create_tax_scout_agent()
-            self.hedge_smith_agent = await create_hedge_smith_agent()
             self.router_agent = await create_router_agent()
-            self.investment_workflow = await create_investment_analysis_workflow()
-            self.idea_discovery_workflow = await create_idea_discovery_workflow()
-            self.portfolio_protection_workflow = await create_portfolio_protection_workflow()
-            self.tax_optimization_workflow = await create_tax_optimization_workflow()
             self.agents_initialized = True
             self.sub_title = "Router: Active | Ready"
-            chat_log.write("[green]✓ Agents initialized successfully (Portfolio, Research, Quill, Screen Forge, Macro Lens, Earnings Whisperer, News Sentry, Risk Shield, Tax Scout, Hedge Smith)[/green]")
             chat_log.write("[green]✓ Router agent initialized - automatic intent-based routing enabled![/green]")
-            chat_log.write("[green]✓ Multi-agent workflows ready (Investment Analysis, Idea Discovery, Portfolio Protection, Tax Optimization)[/green]")
+            chat_log.write("[dim]✓ Specialist agents and workflows load on first use[/dim]")
             chat_log.write("[dim]✓ Progressive streaming enabled for sub-agent tool calls[/dim]")
+            if get_settings().tui_prewarm_agents:
+                self.call_after_refresh(self._start_warmup)
         except ConfigurationError as e:
             self.agents_initialized = False
             # Show helpful setup instructions for missing API keys
@@ -368,6 +421,57 @@ class ChatUI(App):
                 )
             )
 
+    async def on_unmount(self) -> None:
+        """Stop background loading and the event consumer when the app closes."""
+        for task in (self.router_task, self.warmup_task):
+            if task and not task.done():
+                task.cancel()
+        self._stop_streaming(drain=False)
+
+    def _start_warmup(self) -> None:
+        """Start building the specialist agents and workflows in the background."""
+        self.warmup_task = asyncio.create_task(self._warm_up())
+
+    async def _warm_up(self) -> None:
+        """Build every agent and workflow not yet requested by the user.
+
+        Failures are ignored here; the same error surfaces when the agent or
+        workflow is first used.
+        """
+        await get_agent_pool().warm_up()
+        for attr in LAZY_WORKFLOWS:
+            try:
+                await self._get_workflow(attr)
+            except Exception:
+                continue
+            # Yield between builds so queued input is handled promptly
+            await asyncio.sleep(0)
+
+    async def _get_workflow(self, attr: str) -> Any:
+        """Return a workflow, building it on first use.
+
+        Specialist agents live in the shared agent pool; workflows compile their
+        own agent nodes and are kept on the app. Concurrent callers (e.g. the
+        background warm-up and a user command) share a single build.
+
+        Args:
+            attr: ChatUI attribute name from ``LAZY_WORKFLOWS``
+
+        Returns:
+            The compiled workflow graph
+        """
+        workflow = getattr(self, attr)
+        if workflow is not None:
+            return workflow
+
+        lock = self._workflow_locks.setdefault(attr, asyncio.Lock())
+        async with lock:
+            workflow = getattr(self, attr)
+            if workflow is None:
+                workflow = await LAZY_WORKFLOWS[attr]()
+                setattr(self, attr, workflow)
+        return workflow
+
     async def _run_workflow_stream(
         self,
         workflow: object,
@@ -541,6 +645,14 @@ class ChatUI(App):
                                         else:
                                             chat_log.write(f"[dim]  ✓ {tool_name} completed[/dim]\n")
 
+                            # Router pre-classifier picked a specialist without the LLM
+                            elif node_name == "classify" and node_output.get("intent", {}).get("fast_path"):
+                                intent = node_output["intent"]
+                                chat_log.write(
+                                    f"[dim]  ⚡ Fast path → {intent['agent']} "
+                                    f"(confidence {intent['confidence']:.2f})[/dim]\n"
+                                )
+
                             # Show agent making tool calls
                             elif node_name == "agent" and "messages" in node_output:
                                 for msg in node_output["messages"]:
@@ -594,11 +706,22 @@ class ChatUI(App):
                         if "messages" in event_data and event_data["messages"]:
                             last_msg = event_data["messages"][-1]
                             if hasattr(last_msg, "content") and last_msg.content:
-                                # Show final response only
-                                if not hasattr(last_msg, "tool_calls") or not last_msg.tool_calls:
+                                # Show final response only (not the echoed user message)
+                                if getattr(last_msg, "type", "") == "ai" and not getattr(last_msg, "tool_calls", None):
                                     agent_response = last_msg.content
                                     chat_log.write(Markdown(agent_response))
 
+                                    # Router runs report how long the specialists took
+                                    dispatch = getattr(last_msg, "response_metadata", {}).get("agent_dispatch")
+                                    if dispatch and dispatch["agents"]:
+                                        latencies = ", ".join(
+                                            f"{a['agent']} {a['seconds']:.1f}s" for a in dispatch["agents"]
+                                        )
+                                        chat_log.write(
+                                            f"\n[dim]⏱ Specialists: {dispatch['wall_clock_seconds']:.1f}s wall clock "
+                                            f"({dispatch['agent_seconds']:.1f}s of agent time) - {latencies}[/dim]\n"
+                                        )
+
         except asyncio.CancelledError:
             # Worker was cancelled - clean up the stream
             was_cancelled = True
@@ -628,6 +751,11 @@ class ChatUI(App):
         if not text:
             return
 
+        # Queries typed while the router loads wait for it
+        if self.router_task is not None and not self.router_task.done():
+            self.sub_title = "Loading router..."
+            await asyncio.shield(self.router_task)
+
         # Prevent input if agents failed to initialize
         if not self.agents_initialized:
             return
@@ -651,7 +779,12 @@ class ChatUI(App):
         try:
             # Handle commands
             if text.startswith("/"):
-                await self._handle_command(text, chat_log)
+                if text.startswith(TRACED_COMMANDS):
+                    # Inline workflows are traced here; worker-based ones trace themselves
+                    async with trace_run(text):
+                        await self._handle_command(text, chat_log)
+                else:
+                    await self._handle_command(text, chat_log)
                 # Commands like /help, /router, /examples, /api don't spawn workers
                 # Only workflow commands (/optimize-tax, /protect) spawn workers via _handle_command
                 # Check if a worker was spawned (it will be set in self.agent_worker)
@@ -677,47 +810,47 @@ class ChatUI(App):
             else:
                 # Manual agent selection
                 if self.current_agent == "portfolio":
-                    agent = self.portfolio_agent
+                    agent = await get_agent_pool().get("portfolio")
                     agent_name = "Portfolio Analyst"
                     report_type = "portfolio"
                 elif self.current_agent == "research":
-                    agent = self.research_agent
+                    agent = await get_agent_pool().get("research")
                     agent_name = "Market Researcher"
                     report_type = "research"
                 elif self.current_agent == "quill":
-                    agent = self.quill_agent
+                    agent = await get_agent_pool().get("quill")
                     agent_name = "Quill (Equity Research)"
                     report_type = "equity_research"
                 elif self.current_agent == "screen":
-                    agent = self.screen_forge_agent
+                    agent = await get_agent_pool().get("screen_forge")
                     agent_name = "Screen Forge (Equity Screening)"
                     report_type = "screening"
                 elif self.current_agent == "macro":
-                    agent = self.macro_lens_agent
+                    agent = await get_agent_pool().get("macro_lens")
                     agent_name = "Macro Lens (Market Strategist)"
                     report_type = "macro_analysis"
                 elif self.current_agent == "earnings":
-                    agent = self.earnings_whisperer_agent
+                    agent = await get_agent_pool().get("earnings_whisperer")
                     agent_name = "Earnings Whisperer"
                     report_type = "earnings"
                 elif self.current_agent == "news":
-                    agent = self.news_sentry_agent
+                    agent = await get_agent_pool().get("news_sentry")
                     agent_name = "News Sentry"
                     report_type = "news_monitoring"
                 elif self.current_agent == "risk":
-                    agent = self.risk_shield_agent
+                    agent = await get_agent_pool().get("risk_shield")
                     agent_name = "Risk Shield Manager"
                     report_type = "risk_analysis"
                 elif self.current_agent == "tax":
-                    agent = self.tax_scout_agent
+                    agent = await get_agent_pool().get("tax_scout")
                     agent_name = "Tax Scout"
                     report_type = "tax_optimization"
                 elif self.current_agent == "hedge":
-                    agent = self.hedge_smith_agent
+                    agent = await get_agent_pool().get("hedge_smith")
                     agent_name = "Hedge Smith"
                     report_type = "options_strategies"
                 else:
-                    agent = self.portfolio_agent
+                    agent = await get_agent_pool().get("portfolio")
                     agent_name = "Portfolio Analyst"
                     report_type = "portfolio"
 
@@ -727,9 +860,14 @@ class ChatUI(App):
 
             chat_log.write(f"[bold green]{agent_name}:[/bold green] ")
 
-            # Start background streaming consumer for progressive disclosure
+            # Start background consumer of this run's events for progressive disclosure
+            run_id = new_run_id()
             if self.router_mode:
-                self.streaming_task = asyncio.create_task(self._consume_streaming_events(chat_log))
+                self._stop_streaming(drain=False)
+                self.event_subscription = get_event_bus().subscribe(run_id=run_id)
+                self.streaming_task = asyncio.create_task(
+                    self._consume_streaming_events(chat_log, self.event_subscription)
+                )
 
             # Reset cancellation flag
             self.cancellation_requested = False
@@ -740,7 +878,7 @@ class ChatUI(App):
 
             # Run agent in worker (non-blocking)
             self.agent_worker = self.run_worker(
-                self._run_agent_stream(agent, text, agent_name, chat_log),
+                self._within_run(run_id, text, self._run_agent_stream(agent, text, agent_name, chat_log)),
                 name="agent_execution",
                 group="agent",
                 exclusive=True,
@@ -873,10 +1011,8 @@ class ChatUI(App):
                 except Exception as save_error:
                     chat_log.write(f"\n[dim yellow]⚠️  Could not save report: {str(save_error)}[/dim]\n")
 
-            # Stop streaming consumer task if running
-            if self.streaming_task and not self.streaming_task.done():
-                self.streaming_task.cancel()
-                self.streaming_task = None
+            # Stop streaming consumer once it has shown the remaining events
+            self._stop_streaming()
 
             # Always re-enable input
             input_widget.disabled = False
@@ -909,9 +1045,7 @@ class ChatUI(App):
             chat_log.write(f"\n[red]Worker error: {event.worker.error}[/red]\n")
 
             # Cleanup and re-enable input
-            if self.streaming_task and not self.streaming_task.done():
-                self.streaming_task.cancel()
-                self.streaming_task = None
+            self._stop_streaming(drain=False)
 
             input_widget.disabled = False
             input_widget.placeholder = "Ask about stocks or economic indicators (/examples for ideas, /help for commands)..."
@@ -927,93 +1061,88 @@ class ChatUI(App):
     async def _handle_command(self, command: str, chat_log: RichLog) -> None:
         """Handle slash commands."""
         if command.startswith("/analyze"):
-            # Extract symbol from command
-            parts = command.split()
-            if len(parts) != 2:
+            # Extract symbols from command; any non-ticker word rejects it
+            symbols, invalid = parse_symbols([command[len("/analyze"):]])
+            if invalid or not symbols:
+                skipped = (
+                    f"Not ticker symbols: {', '.join(f'`{t}`' for t in invalid)}\n\n"
+                    if invalid
+                    else ""
+                )
                 chat_log.write(
                     Markdown(
-                        "\n**Usage**: `/analyze <SYMBOL>`\n\n"
-                        "Example: `/analyze AAPL`\n"
+                        f"\n{skipped}"
+                        "**Usage**: `/analyze <SYMBOL> [SYMBOL ...]`\n\n"
+                        "Example: `/analyze AAPL` or `/analyze AAPL MSFT NVDA`\n"
                     )
                 )
                 return
 
-            symbol = parts[1].upper()
-            chat_log.write(f"\n[bold cyan]You:[/bold cyan] Analyze {symbol}\n")
-            chat_log.write(f"[bold green]Investment Analysis Workflow:[/bold green] Starting multi-agent analysis...\n")
-
-            try:
-                # Track analysis sections for report saving
-                quill_analysis = ""
-                macro_context = ""
-                final_recommendation = ""
-
-                # Run the workflow
-                tool_calls_shown = set()
-                async for event in self.investment_workflow.astream(
-                    {
-                        "messages": [HumanMessage(content=f"Analyze {symbol}")],
-                        "symbol": symbol,
-                        "quill_analysis": "",
-                        "macro_context": "",
-                    },
-                    stream_mode=["values", "updates"]
-                ):
-                    # Parse the event tuple
-                    if isinstance(event, tuple) and len(event) == 2:
-                        event_type, event_data = event
-
-                        # Handle node updates
-                        if event_type == "updates":
-                            for node_name, node_output in event_data.items():
-                                # Show which agent is working
-                                if node_name == "quill":
-                                    chat_log.write("[dim]  📊 Quill analyzing fundamentals...[/dim]\n")
-                                elif node_name == "macro_lens":
-                                    chat_log.write("[dim]  🌍 Macro Lens validating timing...[/dim]\n")
-                                elif node_name == "synthesize":
-                                    chat_log.write("[dim]  🎯 Synthesizing recommendation...[/dim]\n")
-
-                                # Show tool calls
-                                if "messages" in node_output:
-                                    for msg in node_output["messages"]:
-                                        if hasattr(msg, "tool_calls") and msg.tool_calls:
-                                            for tool_call in msg.tool_calls:
-                                                call_id = tool_call.get("id", "")
-                                                if call_id not in tool_calls_shown:
-                                                    tool_calls_shown.add(call_id)
-                                                    tool_name = tool_call.get("name", "unknown")
-                                                    chat_log.write(f"[dim]    → {tool_name}[/dim]\n")
-
-                        # Handle final values
-                        elif event_type == "values":
-                            # Capture state data for report
-                            if "quill_analysis" in event_data:
-                                quill_analysis = event_data["quill_analysis"]
-                            if "macro_context" in event_data:
-                                macro_context = event_data["macro_context"]
+            analysis_progress = {
+                "quill": "📊 Quill analyzing fundamentals...",
+                "news_sentry": "📰 News Sentry checking events...",
+                "macro_lens": "🌍 Macro Lens validating timing...",
+                "risk_shield": "🛡️ Risk Shield assessing risk...",
+                "tax_scout": "🧾 Tax Scout reviewing tax implications...",
+                "synthesize": "🎯 Synthesizing recommendation...",
+            }
+            batch = len(symbols) > 1
+            chat_log.write(f"\n[bold cyan]You:[/bold cyan] Analyze {', '.join(symbols)}\n")
+            if batch:
+                chat_log.write(
+                    f"[bold green]Investment Analysis Workflow:[/bold green] Starting batch analysis "
+                    f"of {len(symbols)} symbols (shared market data fetched once)...\n"
+                )
+            else:
+                chat_log.write(f"[bold green]Investment Analysis Workflow:[/bold green] Starting multi-agent analysis...\n")
+
+            tool_calls_shown = set()
+
+            def show_progress(symbol: str, node_name: str, node_output: dict) -> None:
+                prefix = f"[{symbol}] " if batch else ""
+                # Show which agent is working
+                if node_name in analysis_progress:
+                    chat_log.write(f"[dim]  {prefix}{analysis_progress[node_name]}[/dim]\n")
+
+                # Show tool calls
+                for msg in node_output.get("messages", []):
+                    if hasattr(msg, "tool_calls") and msg.tool_calls:
+                        for tool_call in msg.tool_calls:
+                            call_id = tool_call.get("id", "")
+                            if call_id not in tool_calls_shown:
+                                tool_calls_shown.add(call_id)
+                                tool_name = tool_call.get("name", "unknown")
+                                chat_log.write(f"[dim]    {prefix}→ {tool_name}[/dim]\n")
+
+            def show_result(result: "AnalysisResult") -> None:
+                title = f"Final Recommendation ({result.symbol})" if batch else "Final Recommendation"
+                if result.error:
+                    chat_log.write(f"\n[red]Error analyzing {result.symbol}: {result.error}[/red]\n")
+                    return
 
-                            if "messages" in event_data and event_data["messages"]:
-                                last_msg = event_data["messages"][-1]
-                                if hasattr(last_msg, "content") and last_msg.content:
-                                    # Show final recommendation
-                                    if not hasattr(last_msg, "tool_calls") or not last_msg.tool_calls:
-                                        final_recommendation = last_msg.content
-                                        chat_log.write("\n[bold green]Final Recommendation:[/bold green]\n")
-                                        chat_log.write(Markdown(final_recommendation))
+                chat_log.write(f"\n[bold green]{title}:[/bold green]\n")
+                chat_log.write(Markdown(result.recommendation))
+                if result.report_path:
+                    chat_log.write(f"\n[dim]📄 Report saved to: {result.report_path}[/dim]\n")
 
-                # Save the complete report
-                try:
-                    report_path = save_investment_report(
-                        symbol=symbol,
-                        final_recommendation=final_recommendation,
-                        quill_analysis=quill_analysis,
-                        macro_context=macro_context,
+            try:
+                results = await run_investment_analysis_batch(
+                    symbols,
+                    workflow=await self._get_workflow("investment_workflow"),
+                    on_progress=show_progress,
+                    on_result=show_result,
+                )
+                if batch:
+                    failed_symbols = [r.symbol for r in results if r.error]
+                    summary = (
+                        "\n[bold]Batch complete:[/bold] "
+                        f"{len(results) - len(failed_symbols)}/{len(results)} succeeded"
                     )
-                    chat_log.write(f"\n[dim]📄 Report saved to: {report_path}[/dim]\n")
-                except Exception as save_error:
-                    chat_log.write(f"\n[dim yellow]⚠️  Could not save report: {str(save_error)}[/dim]\n")
-
+                    if failed_symbols:
+                        summary += (
+                            f" [red](failed: {', '.join(failed_symbols)})[/red]"
+                        )
+                    chat_log.write(summary + "\n")
             except Exception as e:
                 chat_log.write(f"\n[red]Error running workflow: {str(e)}[/red]")
 
@@ -1036,7 +1165,8 @@ class ChatUI(App):
 
                 # Run the workflow
                 tool_calls_shown = set()
-                async for event in self.idea_discovery_workflow.astream(
+                idea_discovery_workflow = await self._get_workflow("idea_discovery_workflow")
+                async for event in idea_discovery_workflow.astream(
                     {
                         "messages": [HumanMessage(content=criteria)],
                         "screening_criteria": criteria,
@@ -1132,6 +1262,8 @@ class ChatUI(App):
                 "synthesize": "🎯 Synthesizing final tax optimization plan...",
             }
 
+            workflow = await self._get_workflow("tax_optimization_workflow")
+
             # Disable input and show processing state
             input_widget = self.query_one("#user-input", Input)
             input_widget.disabled = True
@@ -1147,12 +1279,16 @@ class ChatUI(App):
 
             # Run workflow in worker (non-blocking)
             self.agent_worker = self.run_worker(
-                self._run_workflow_stream(
-                    self.tax_optimization_workflow,
-                    initial_state,
-                    "Tax Optimization",
-                    chat_log,
-                    node_messages,
+                self._within_run(
+                    new_run_id(),
+                    command,
+                    self._run_workflow_stream(
+                        workflow,
+                        initial_state,
+                        "Tax Optimization",
+                        chat_log,
+                        node_messages,
+                    ),
                 ),
                 name="workflow_execution",
                 group="workflow",
@@ -1184,6 +1320,8 @@ class ChatUI(App):
                 "synthesize": "🎯 Synthesizing final protection plan...",
             }
 
+            workflow = await self._get_workflow("portfolio_protection_workflow")
+
             # Disable input and show processing state
             input_widget = self.query_one("#user-input", Input)
             input_widget.disabled = True
@@ -1199,12 +1337,16 @@ class ChatUI(App):
 
             # Run workflow in worker (non-blocking)
             self.agent_worker = self.run_worker(
-                self._run_workflow_stream(
-                    self.portfolio_protection_workflow,
-                    initial_state,
-                    "Portfolio Protection",
-                    chat_log,
-                    node_messages,
+                self._within_run(
+                    new_run_id(),
+                    command,
+                    self._run_workflow_stream(
+                        workflow,
+                        initial_state,
+                        "Portfolio Protection",
+                        chat_log,
+                        node_messages,
+                    ),
                 ),
                 name="workflow_execution",
                 group="workflow",
@@ -1304,6 +1446,7 @@ class ChatUI(App):
                 table.add_column("Tool", style="green", width=25)
                 table.add_column("Hits", justify="right", width=10)
                 table.add_column("Misses", justify="right", width=10)
+                table.add_column("Coalesced", justify="right", width=10)
                 table.add_column("Hit Rate", justify="right", width=12)
 
                 # Add rows from statistics
@@ -1312,6 +1455,7 @@ class ChatUI(App):
                     tool_name = tool_stat["tool_name"]
                     hits = tool_stat["hits"]
                     misses = tool_stat["misses"]
+                    coalesced = tool_stat.get("coalesced", 0)
                     hit_rate = tool_stat.get("hit_rate", 0)
 
                     # Color code hit rate
@@ -1327,6 +1471,7 @@ class ChatUI(App):
                         tool_name,
                         f"{hits:,}",
                         f"{misses:,}",
+                        f"{coalesced:,}",
                         hit_rate_str,
                     )
 
@@ -1340,6 +1485,7 @@ class ChatUI(App):
                         f"- Total cache entries: {stats['cache_size']:,}\n"
                         f"- Total hits: {stats['total_hits']:,}\n"
                         f"- Total misses: {stats['total_misses']:,}\n"
+                        f"- Coalesced requests: {stats.get('total_coalesced', 0):,}\n"
                         f"- Overall hit rate: {stats['overall_hit_rate']:.1f}%\n\n"
                         f"**Cache Location:** `~/.navam-invest/cache/api_cache.duckdb`\n\n"
                         f"**Cache TTL Strategy:**\n"
@@ -1347,7 +1493,9 @@ class ChatUI(App):
                         f"- Market data (Alpha Vantage, Tiingo): 5 minutes\n"
                         f"- Fundamental data (FMP, SEC EDGAR): 1 hour\n"
                         f"- Economic data (FRED, Treasury): 24 hours\n"
-                        f"- News (NewsAPI): 5 minutes\n\n"
+                        f"- News (NewsAPI): 5 minutes\n"
+                        f"- Yahoo and Finnhub entries are served up to 5 minutes stale "
+                        f"while refreshing in the background\n\n"
                         f"💡 **Tip:** Higher hit rates mean fewer API calls and faster responses!\n"
                     )
                 )
@@ -1355,6 +1503,101 @@ class ChatUI(App):
             except Exception as e:
                 chat_log.write(f"\n[red]Error fetching cache statistics: {str(e)}[/red]")
 
+        elif command.startswith("/agents"):
+            pool = get_agent_pool()
+            parts = command.split()
+
+            # Handle /agents release subcommand
+            if len(parts) == 2 and parts[1].lower() == "release":
+                released = pool.instance_count
+                pool.clear()
+                chat_log.write(
+                    f"\n[green]✓ Released {released} agent instance(s); "
+                    f"they are rebuilt on next use[/green]\n"
+                )
+                return
+
+            stats = pool.stats()
+            workflows = [attr for attr in LAZY_WORKFLOWS if getattr(self, attr) is not None]
+            chat_log.write(
+                Markdown(
+                    f"\n**Agent Pool** (shared by the router and manual agents)\n\n"
+                    f"- **Instances:** {stats['instances']} of {len(pool.names)}\n"
+                    f"- **Built:** {', '.join(stats['built']) or 'none'}\n"
+                    f"- **Not built yet:** {', '.join(stats['pending']) or 'none'}\n"
+                    f"- **Workflows built:** {len(workflows)} of {len(LAZY_WORKFLOWS)}\n\n"
+                    f"💡 **Tip:** `/agents release` frees all agent instances.\n"
+                )
+            )
+
+        elif command.startswith("/trace"):
+            traces = recent_traces()
+            parts = command.split()
+
+            if not traces:
+                chat_log.write(
+                    "\n[yellow]No traces yet. Ask a question or run a workflow first "
+                    "(tracing is controlled by TRACING_ENABLED).[/yellow]\n"
+                )
+                return
+
+            # Handle /trace list subcommand
+            if len(parts) == 2 and parts[1].lower() == "list":
+                rows = "\n".join(
+                    f"| `{t.trace_id}` | {t.started_at.strftime('%H:%M:%S')} | {t.seconds:.1f}s | {t.name[:50]} |"
+                    for t in reversed(traces)
+                )
+                chat_log.write(
+                    Markdown(
+                        "\n**Recent Traces**\n\n"
+                        "| ID | Started | Duration | Run |\n|---|---|---|---|\n"
+                        f"{rows}\n\n"
+                        "💡 **Tip:** `/trace <id>` summarizes one run.\n"
+                    )
+                )
+                return
+
+            if len(parts) == 2:
+                trace = next((t for t in traces if t.trace_id == parts[1]), None)
+                if trace is None:
+                    chat_log.write(f"\n[red]Unknown trace '{parts[1]}'. Use /trace list.[/red]\n")
+                    return
+            else:
+                trace = traces[-1]
+
+            trace_summary = summarize_trace(trace)
+            kind_labels = {
+                "llm": "LLM calls",
+                "tool": "Tool calls",
+                "node": "Graph nodes",
+                "cache": "Cache operations",
+                "provider": "Upstream calls (cache misses)",
+                "fetch": "HTTP fetches",
+            }
+            kind_rows = "\n".join(
+                f"| {kind_labels.get(kind, kind)} | {stats['calls']} | {stats['seconds']:.2f}s |"
+                for kind, stats in trace_summary["kinds"].items()
+            )
+            slow_rows = "\n".join(
+                f"| {entry['name']} | {entry['calls']} | {entry['seconds']:.2f}s |"
+                for entry in trace_summary["tools"] + trace_summary["providers"]
+            ) or "| none | | |"
+            files = "\n".join(f"- **{fmt.upper()}:** `{path}`" for fmt, path in trace_summary["files"].items())
+            chat_log.write(
+                Markdown(
+                    f"\n**Trace `{trace_summary['trace_id']}`** - {trace_summary['name'][:60]} "
+                    f"({trace_summary['seconds']:.2f}s)\n\n"
+                    "| Span kind | Count | Time |\n|---|---|---|\n"
+                    f"{kind_rows}\n\n"
+                    f"- **Tokens:** {trace_summary['tokens']['input']:,} in / {trace_summary['tokens']['output']:,} out\n"
+                    f"- **Cache:** {trace_summary['cache']['hits']} hits, {trace_summary['cache']['misses']} misses\n\n"
+                    "**Slowest tools and providers**\n\n"
+                    "| Name | Calls | Time |\n|---|---|---|\n"
+                    f"{slow_rows}\n\n"
+                    + (f"{files}\n\nOpen the Chrome trace in chrome://tracing or ui.perfetto.dev.\n" if files else "")
+                )
+            )
+
         elif command == "/api":
             chat_log.write("\n[bold cyan]Checking API Status...[/bold cyan]\n")
             chat_log.write("[dim]Testing connectivity to all configured APIs...\n\n[/dim]")
@@ -1412,6 +1655,119 @@ class ChatUI(App):
                     )
                 )
 
+                # Rate limiter wait-time metrics for providers used this session
+                limiter_stats = get_rate_limit_stats()
+                if limiter_stats:
+                    limits_table = Table(
+                        title="Provider Rate Limits (This Session)",
+                        show_header=True,
+                        header_style="bold magenta",
+                    )
+                    limits_table.add_column("Provider", style="cyan", width=15)
+                    limits_table.add_column("Budget", width=12)
+                    limits_table.add_column("Requests", justify="right", width=10)
+                    limits_table.add_column("Throttled", justify="right", width=10)
+                    limits_table.add_column("Avg Wait", justify="right", width=10)
+                    limits_table.add_column("Max Wait", justify="right", width=10)
+
+                    for provider_stats in limiter_stats.values():
+                        limits_table.add_row(
+                            provider_stats["provider"],
+                            provider_stats["rate"],
+                            f"{provider_stats['requests']:,}",
+                            f"{provider_stats['throttled']:,}",
+                            f"{provider_stats['avg_wait_ms']:,.0f} ms",
+                            f"{provider_stats['max_wait_ms']:,.0f} ms",
+                        )
+
+                    chat_log.write(limits_table)
+
+                # Queue depth and run time of blocking-library worker pools
+                executor_stats = get_executor_stats()
+                if executor_stats:
+                    pools_table = Table(
+                        title="Provider Worker Pools (This Session)",
+                        show_header=True,
+                        header_style="bold magenta",
+                    )
+                    pools_table.add_column("Provider", style="cyan", width=15)
+                    pools_table.add_column("Workers", justify="right", width=8)
+                    pools_table.add_column("Calls", justify="right", width=8)
+                    pools_table.add_column("Queued", justify="right", width=8)
+                    pools_table.add_column("Max Queued", justify="right", width=10)
+                    pools_table.add_column("Avg Wait", justify="right", width=10)
+                    pools_table.add_column("Avg Run", justify="right", width=10)
+                    pools_table.add_column("Timeouts", justify="right", width=8)
+
+                    for pool_stats in executor_stats.values():
+                        pools_table.add_row(
+                            pool_stats["provider"],
+                            str(pool_stats["max_workers"]),
+                            f"{pool_stats['calls']:,}",
+                            f"{pool_stats['queued']:,}",
+                            f"{pool_stats['max_queued']:,}",
+                            f"{pool_stats['avg_wait_ms']:,.0f} ms",
+                            f"{pool_stats['avg_run_ms']:,.0f} ms",
+                            f"{pool_stats['timeouts']:,}",
+                        )
+
+                    chat_log.write(pools_table)
+
+                # Specialist and tool latency from this session's progress events
+                event_stats = get_event_metrics().snapshot()
+                if event_stats["agents"] or event_stats["tools"]:
+                    latency_table = Table(
+                        title="Agent & Tool Latency (This Session)",
+                        show_header=True,
+                        header_style="bold magenta",
+                    )
+                    latency_table.add_column("Name", style="cyan", width=24)
+                    latency_table.add_column("Kind", width=6)
+                    latency_table.add_column("Calls", justify="right", width=8)
+                    latency_table.add_column("Errors", justify="right", width=8)
+                    latency_table.add_column("Avg", justify="right", width=10)
+                    latency_table.add_column("Max", justify="right", width=10)
+
+                    for kind in ("agents", "tools"):
+                        for name, stats in event_stats[kind].items():
+                            latency_table.add_row(
+                                name,
+                                kind[:-1],
+                                f"{stats['calls']:,}",
+                                f"{stats['errors']:,}",
+                                f"{stats['total_seconds'] / stats['calls']:.1f} s",
+                                f"{stats['max_seconds']:.1f} s",
+                            )
+
+                    chat_log.write(latency_table)
+
+                # Retry counts and circuit breaker state per host
+                circuit_stats = get_circuit_stats()
+                if circuit_stats:
+                    circuits_table = Table(
+                        title="Provider Hosts (This Session)",
+                        show_header=True,
+                        header_style="bold magenta",
+                    )
+                    circuits_table.add_column("Host", style="cyan", width=30)
+                    circuits_table.add_column("Circuit", width=10)
+                    circuits_table.add_column("Requests", justify="right", width=10)
+                    circuits_table.add_column("Retries", justify="right", width=8)
+                    circuits_table.add_column("Failures", justify="right", width=9)
+
+                    circuit_colors = {"closed": "green", "half_open": "yellow", "open": "red"}
+                    for host_stats in circuit_stats.values():
+                        color = circuit_colors.get(host_stats["state"], "dim")
+                        circuits_table.add_row(
+                            host_stats["host"],
+                            f"[{color}]{host_stats['state']}[/{color}]",
+                            f"{host_stats['requests']:,}",
+                            f"{host_stats['retries']:,}",
+                            f"{host_stats['failures']:,}",
+                        )
+
+                    chat_log.write(circuits_table)
+
             except Exception as e:
                 chat_log.write(f"\n[red]Error checking APIs: {str(e)}[/red]")
 
@@ -1479,12 +1835,14 @@ class ChatUI(App):
                     "- `/tax` - Tax Scout tax optimization agent\n"
                     "- `/hedge` - Hedge Smith options strategies agent\n\n"
                     "**Multi-Agent Workflows:**\n"
-                    "- `/analyze <SYMBOL>` - Complete investment analysis (Quill + Macro Lens + News Sentry + Risk Shield + Tax Scout)\n"
+                    "- `/analyze <SYMBOL> [SYMBOL ...]` - Complete investment analysis (Quill + Macro Lens + News Sentry + Risk Shield + Tax Scout); several symbols run as a batch\n"
                     "- `/discover [CRITERIA]` - Systematic idea generation (Screen Forge + Quill + Risk Shield)\n"
                     "- `/protect [PORTFOLIO]` - Portfolio hedging workflow (Risk Shield + Hedge Smith)\n"
                     "- `/optimize-tax [PORTFOLIO]` - Tax-loss harvesting workflow (Tax Scout + Hedge Smith)\n\n"
                     "**Utilities:**\n"
                     "- `/api` - Check API connectivity and status\n"
+                    "- `/agents` - Show which specialist agents are loaded (`/agents release` frees them)\n"
+                    "- `/trace` - Where the last run spent its time (`/trace list` for recent runs)\n"
                     "- `/cache` - View API cache statistics and performance metrics\n"
                     "- `/cache warm` - Pre-populate cache with common queries (market indices, popular stocks)\n"
                     "- `/cache clear` - Clear all cached API responses\n"
@@ -1629,4 +1987,10 @@ class ChatUI(App):
 async def run_tui() -> None:
     """Run the TUI application."""
     app = ChatUI()
-    await app.run_async()
+    try:
+        await app.run_async()
+    finally:
+        # Release pooled HTTP connections opened by tools on this event loop
+        await aclose_http_clients()
+        # Drop Yahoo calls still queued for a worker thread
+        reset_blocking_executors()
@@ -1,6 +1,34 @@
 """Utility functions for Navam Invest."""
 
-from navam_invest.utils.api_checker import check_all_apis
-from navam_invest.utils.report_saver import save_agent_report, save_investment_report
+import importlib
+from typing import Any
 
-__all__ = ["check_all_apis", "save_agent_report", "save_investment_report"]
+# Exported name -> submodule. Submodules load on first access, so low-level
+# modules (cache, net) can use utils.tracing without importing httpx here.
+_EXPORTS = {
+    "check_all_apis": "api_checker",
+    "EventBus": "event_bus",
+    "get_event_bus": "event_bus",
+    "get_event_metrics": "event_bus",
+    "parse_symbols": "symbols",
+    "save_agent_report": "report_saver",
+    "save_investment_report": "report_saver",
+}
+
+__all__ = [
+    "EventBus",
+    "check_all_apis",
+    "get_event_bus",
+    "get_event_metrics",
+    "parse_symbols",
+    "save_agent_report",
+    "save_investment_report",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``from navam_invest.utils import check_all_apis`` lazily."""
+    if name in _EXPORTS:
+        module = importlib.import_module(f"{__name__}.{_EXPORTS[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,376 @@
+"""
+Typed publish/subscribe bus for agent progress events.
+
+Agents publish run, sub-agent and tool start/finish events; any number of
+consumers (the TUI, a JSONL event log, metrics) receive them. Every event
+carries the correlation ID of the run that produced it, so concurrent runs can
+be told apart and a subscriber can follow just one run.
+
+Subscriptions have bounded queues. By default a full queue drops its oldest
+event; a subscription created with ``block=True`` instead makes publishers wait
+(backpressure). Without subscribers, events are only passed to listeners and
+nothing is retained, so headless runs never accumulate undrained events.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+logger = logging.getLogger(__name__)
+
+# Event types
+RUN_START = "run_start"
+RUN_END = "run_end"
+AGENT_START = "agent_start"
+AGENT_END = "agent_end"
+TOOL_START = "tool_start"
+TOOL_END = "tool_end"
+ERROR = "error"
+
+EVENT_TYPES: FrozenSet[str] = frozenset(
+    {RUN_START, RUN_END, AGENT_START, AGENT_END, TOOL_START, TOOL_END, ERROR}
+)
+
+_current_run: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "navam_event_run", default=None
+)
+
+
+def new_run_id() -> str:
+    """Create a short random run correlation ID."""
+    return uuid.uuid4().hex[:12]
+
+
+def current_run_id() -> Optional[str]:
+    """Correlation ID of the run active in this task, if any."""
+    return _current_run.get()
+
+
+@dataclass(frozen=True)
+class Event:
+    """One progress event.
+
+    ``seconds`` and ``status`` are set on *_end events; ``data`` holds
+    type-specific details such as tool arguments.
+    """
+
+    type: str
+    run_id: Optional[str] = None
+    agent: Optional[str] = None
+    tool: Optional[str] = None
+    seconds: Optional[float] = None
+    status: Optional[str] = None  # "ok" or "error"
+    data: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+    def __post_init__(self) -> None:
+        if self.type not in EVENT_TYPES:
+            raise ValueError(
+                f"Unknown event type '{self.type}'. "
+                f"Choose from: {', '.join(sorted(EVENT_TYPES))}"
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Event as a JSON-serializable dictionary, without empty fields."""
+        return {
+            key: value
+            for key, value in asdict(self).items()
+            if value is not None and value != {}
+        }
+
+
+class Subscription:
+    """Bounded queue of events delivered to one consumer.
+
+    Iterate with ``async for``; iteration ends once the subscription is closed
+    and its queued events are drained.
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        maxsize: int,
+        run_id: Optional[str] = None,
+        types: Optional[Iterable[str]] = None,
+        block: bool = False,
+    ) -> None:
+        self._bus = bus
+        self._queue: asyncio.Queue[Optional[Event]] = asyncio.Queue(
+            maxsize=max(1, maxsize)
+        )
+        self.run_id = run_id
+        self.types = frozenset(types) if types else None
+        self.block = block
+        self.dropped = 0
+        self.closed = False
+
+    def matches(self, event: Event) -> bool:
+        """Whether this subscription wants the event."""
+        if self.run_id is not None and event.run_id != self.run_id:
+            return False
+        return self.types is None or event.type in self.types
+
+    async def _deliver(self, event: Event) -> None:
+        if self.closed:
+            return
+        if self.block:
+            await self._queue.put(event)
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    @property
+    def pending(self) -> int:
+        """Number of queued events not yet consumed."""
+        return self._queue.qsize()
+
+    async def get(self) -> Optional[Event]:
+        """Wait for the next event.
+
+        Returns:
+            The next event, or None once the subscription is closed and drained
+        """
+        if self.closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+    def close(self) -> None:
+        """Stop receiving events; already queued events can still be read."""
+        if self.closed:
+            return
+        self.closed = True
+        self._bus._unsubscribe(self)
+        # Wake a waiting consumer (a full queue ends when it is drained)
+        if not self._queue.full():
+            self._queue.put_nowait(None)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Event:
+        event = await self.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class EventBus:
+    """Fan-out of progress events to subscriptions and listeners.
+
+    Subscriptions are queues for async consumers. Listeners are plain
+    callables invoked synchronously on publish, suited to cheap consumers such
+    as file writers and counters; a failing listener is logged and skipped.
+    """
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        """Initialize an empty bus.
+
+        Args:
+            maxsize: Default queue bound for new subscriptions
+        """
+        self.maxsize = maxsize
+        self._subscriptions: List[Subscription] = []
+        self._listeners: List[Callable[[Event], None]] = []
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of open subscriptions."""
+        return len(self._subscriptions)
+
+    def subscribe(
+        self,
+        run_id: Optional[str] = None,
+        types: Optional[Iterable[str]] = None,
+        maxsize: Optional[int] = None,
+        block: bool = False,
+    ) -> Subscription:
+        """Open a subscription.
+
+        Args:
+            run_id: Only receive events from this run (default: all runs)
+            types: Only receive these event types (default: all)
+            maxsize: Queue bound (default: the bus default)
+            block: Make publishers wait when the queue is full instead of
+                dropping the oldest event
+
+        Returns:
+            Subscription; close it (or use it as a context manager) when done
+        """
+        subscription = Subscription(
+            self, maxsize or self.maxsize, run_id=run_id, types=types, block=block
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def add_listener(self, listener: Callable[[Event], None]) -> None:
+        """Call ``listener`` with every published event."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Event], None]) -> None:
+        """Stop calling a listener added with ``add_listener``."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    async def publish(self, type: str, **fields: Any) -> Event:
+        """Publish an event tagged with the current run's correlation ID.
+
+        Args:
+            type: One of ``EVENT_TYPES``
+            **fields: Other ``Event`` fields (agent, tool, seconds, status, data)
+
+        Returns:
+            The published event
+        """
+        fields.setdefault("run_id", current_run_id())
+        event = Event(type=type, **fields)
+
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Event listener %r failed", listener)
+
+        for subscription in list(self._subscriptions):
+            if subscription.matches(event):
+                await subscription._deliver(event)
+        return event
+
+    @asynccontextmanager
+    async def run(self, run_id: Optional[str] = None) -> AsyncIterator[str]:
+        """Scope the enclosed code to one run.
+
+        Events published inside (including from tasks started inside) carry
+        the run's ID; run_start and run_end events bracket the run.
+
+        Args:
+            run_id: Correlation ID to use (default: a new one)
+
+        Yields:
+            The run's correlation ID
+        """
+        run_id = run_id or new_run_id()
+        token = _current_run.set(run_id)
+        start = time.perf_counter()
+        status = "error"
+        try:
+            await self.publish(RUN_START)
+            yield run_id
+            status = "ok"
+        finally:
+            try:
+                await self.publish(
+                    RUN_END, seconds=time.perf_counter() - start, status=status
+                )
+            finally:
+                _current_run.reset(token)
+
+
+class JsonlEventWriter:
+    """Listener appending every event to a JSON Lines file."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __call__(self, event: Event) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(event.to_dict(), default=str) + "\n")
+
+
+class EventMetrics:
+    """Listener keeping counts and latency totals per event type, agent and tool."""
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+        self.agents: Dict[str, Dict[str, float]] = {}
+        self.tools: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def _record(table: Dict[str, Dict[str, float]], name: str, event: Event) -> None:
+        stats = table.setdefault(
+            name, {"calls": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        )
+        seconds = event.seconds or 0.0
+        stats["calls"] += 1
+        stats["errors"] += event.status == "error"
+        stats["total_seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+    def __call__(self, event: Event) -> None:
+        self.counts[event.type] = self.counts.get(event.type, 0) + 1
+        if event.type == AGENT_END and event.agent:
+            self._record(self.agents, event.agent, event)
+        elif event.type == TOOL_END and event.tool:
+            self._record(self.tools, event.tool, event)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of the collected metrics."""
+        return {
+            "counts": dict(self.counts),
+            "agents": {name: dict(stats) for name, stats in self.agents.items()},
+            "tools": {name: dict(stats) for name, stats in self.tools.items()},
+        }
+
+
+# Global bus instance and the metrics it always feeds
+_event_bus: Optional[EventBus] = None
+_event_metrics = EventMetrics()
+
+
+def get_event_metrics() -> EventMetrics:
+    """Get the metrics collected from every event on the global bus.
+
+    Returns:
+        Shared EventMetrics instance
+    """
+    return _event_metrics
+
+
+def get_event_bus() -> EventBus:
+    """Get or create the global event bus.
+
+    The bus feeds ``get_event_metrics()``. When the ``EVENT_LOG_FILE`` setting
+    is set, it also appends every event to that file.
+
+    Returns:
+        Shared EventBus instance
+    """
+    global _event_bus
+    if _event_bus is None:
+        from navam_invest.config.settings import get_settings_or_defaults
+
+        settings = get_settings_or_defaults()
+        _event_bus = EventBus(maxsize=settings.event_queue_size)
+        _event_bus.add_listener(_event_metrics)
+        if settings.event_log_file:
+            _event_bus.add_listener(JsonlEventWriter(settings.event_log_file))
+    return _event_bus
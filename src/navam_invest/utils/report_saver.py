@@ -1,11 +1,26 @@
 """Report saving utilities for agent responses."""
 
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 
 
+def _unique_path(path: Path) -> Path:
+    """Add a numeric suffix if a report with this name was already written.
+
+    Reports saved within the same second (e.g., batch runs) would otherwise
+    overwrite each other.
+    """
+    candidate = path
+    counter = 2
+    while candidate.exists():
+        candidate = path.with_name(f"{path.stem}_{counter}{path.suffix}")
+        counter += 1
+    return candidate
+
+
 def save_agent_report(
     content: str,
     report_type: str,
@@ -56,12 +71,12 @@ def save_agent_report(
     if context:
         # Extract key identifier (symbol, portfolio name, etc.)
         identifier = context.get("symbol") or context.get("portfolio_name") or context.get("query", "report")
-        identifier = identifier.replace(" ", "_").lower()
+        identifier = re.sub(r"[^\w.-]+", "_", identifier).strip("_").lower() or "report"
         filename = f"{identifier}_{report_type}_{timestamp}.md"
     else:
         filename = f"{report_type}_{timestamp}.md"
 
-    filepath = reports_dir / filename
+    filepath = _unique_path(reports_dir / filename)
 
     # Add metadata header to content if not already present
     if not content.startswith("#"):
@@ -123,7 +138,7 @@ def save_investment_report(
     # Generate filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{symbol}_analysis_{timestamp}.md"
-    filepath = reports_dir / filename
+    filepath = _unique_path(reports_dir / filename)
 
     # Build report content
     report_lines = [
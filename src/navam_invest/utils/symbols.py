@@ -0,0 +1,41 @@
+"""Parse and validate stock symbols typed by users.
+
+Shared by the TUI ``/analyze`` command and the headless ``navam analyze``
+command, so both accept the same input and reject it the same way before
+any workflow starts.
+"""
+
+import re
+from typing import Iterable, List, Tuple
+
+# Ticker symbol: letter first, then letters, digits, '.' or '-' (BRK.B, BF-B)
+SYMBOL_PATTERN = re.compile(r"^[A-Z][A-Z0-9.\-]{0,9}$")
+
+_SEPARATORS = re.compile(r"[\s,]+")
+
+
+def parse_symbols(lines: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """Split text into upper-case ticker symbols.
+
+    Symbols are separated by whitespace or commas; text after '#' on a line
+    is a comment.
+
+    Args:
+        lines: Lines of text listing symbols (e.g. "AAPL, MSFT NVDA")
+
+    Returns:
+        Tuple of (valid symbols without duplicates, invalid tokens), both in
+        input order
+    """
+    symbols: List[str] = []
+    invalid: List[str] = []
+    for line in lines:
+        for token in _SEPARATORS.split(line.split("#", 1)[0]):
+            if not token:
+                continue
+            symbol = token.upper()
+            if not SYMBOL_PATTERN.match(symbol):
+                invalid.append(token)
+            elif symbol not in symbols:
+                symbols.append(symbol)
+    return symbols, invalid
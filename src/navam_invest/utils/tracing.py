@@ -0,0 +1,599 @@
+"""
+Per-run latency tracing as a tree of spans.
+
+A trace covers one user run (a chat query or a workflow such as /analyze).
+Inside it:
+
+- LLM calls (with token counts), tool executions and LangGraph nodes are
+  recorded by a LangChain callback handler. The handler is attached to every
+  runnable started in the trace's context through a configure hook, so agent
+  ``call_model`` nodes and ``ToolNode`` executions are covered without passing
+  callbacks around.
+- Cache lookups/stores, provider fetches and cached upstream calls open
+  explicit spans with ``span()``.
+
+Finished traces are kept in memory for the TUI's ``/trace`` command. When
+``TRACE_DIR`` is set they are also written there as JSON Lines and as a Chrome
+trace (``chrome://tracing`` or https://ui.perfetto.dev), keeping only the
+newest ``TRACE_RETENTION`` runs.
+
+Outside a trace, ``span()`` costs one context-variable lookup.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Span kinds
+RUN = "run"
+NODE = "node"
+LLM = "llm"
+TOOL = "tool"
+CACHE = "cache"
+FETCH = "fetch"  # HTTP request to a provider (net.fetch)
+PROVIDER = "provider"  # Cached function computing a fresh upstream result
+
+_current_trace: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar(
+    "navam_trace", default=None
+)
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "navam_trace_span", default=None
+)
+# Holds the active trace's LangChain handler (see _install_configure_hook)
+_handler_var: contextvars.ContextVar[Optional[Any]] = contextvars.ContextVar(
+    "navam_trace_handler", default=None
+)
+
+# Finished traces, newest last
+_recent_traces: Deque["Trace"] = deque(maxlen=20)
+
+
+def _lane() -> int:
+    """Identify the asyncio task (or thread) a span runs in."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return id(task) if task is not None else threading.get_ident()
+
+
+def _langchain_run_id() -> Optional[uuid.UUID]:
+    """ID of the LangChain run (tool, node, ...) the caller executes inside."""
+    if "langchain_core" not in sys.modules:
+        return None
+    from langchain_core.runnables.config import var_child_runnable_config
+
+    config = var_child_runnable_config.get()
+    callbacks = config.get("callbacks") if config else None
+    return getattr(callbacks, "parent_run_id", None)
+
+
+@dataclass
+class Span:
+    """One timed operation; times are seconds since the trace started."""
+
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    kind: str
+    start: float
+    end: Optional[float] = None
+    status: str = "ok"
+    lane: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    lc_run: Optional[uuid.UUID] = field(default=None, repr=False)
+
+    @property
+    def seconds(self) -> float:
+        """Duration (0 while the span is open)."""
+        return 0.0 if self.end is None else self.end - self.start
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes such as token counts or cache results."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Span as a JSON-serializable dictionary."""
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start": round(self.start, 6),
+            "seconds": round(self.seconds, 6),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NullSpan:
+    """Stand-in yielded by ``span()`` outside a trace."""
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Trace:
+    """Span tree of one run."""
+
+    def __init__(self, name: str, trace_id: Optional[str] = None) -> None:
+        self.trace_id = trace_id or uuid.uuid4().hex[:12]
+        self.name = name
+        self.started_at = datetime.now()
+        self.files: Dict[str, Path] = {}
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self.spans: List[Span] = []
+        self._runs: Dict[uuid.UUID, Span] = {}  # LangChain run -> span
+        self.root = self.start_span(name, RUN, None)
+
+    def now(self) -> float:
+        """Seconds since the trace started."""
+        return time.perf_counter() - self._t0
+
+    def start_span(
+        self,
+        name: str,
+        kind: str,
+        parent: Optional[Span],
+        lc_run: Optional[uuid.UUID] = None,
+        **attributes: Any,
+    ) -> Span:
+        """Open a span under ``parent`` (None only for the root)."""
+        with self._lock:
+            self._next_id += 1
+            span = Span(
+                span_id=self._next_id,
+                parent_id=parent.span_id if parent else None,
+                name=name,
+                kind=kind,
+                start=self.now(),
+                lane=_lane(),
+                attributes=attributes,
+                lc_run=lc_run,
+            )
+            self.spans.append(span)
+            if lc_run is not None:
+                self._runs[lc_run] = span
+        return span
+
+    def end_span(self, span: Span, status: str = "ok") -> None:
+        """Close a span."""
+        span.end = self.now()
+        span.status = status
+
+    def alias_run(self, run_id: uuid.UUID, span: Span) -> None:
+        """Attribute an untraced LangChain run's children to ``span``."""
+        with self._lock:
+            self._runs[run_id] = span
+
+    def span_for_run(self, run_id: Optional[uuid.UUID]) -> Optional[Span]:
+        """Span recorded for a LangChain run, if any."""
+        return self._runs.get(run_id) if run_id is not None else None
+
+    @property
+    def seconds(self) -> float:
+        """Duration of the whole run."""
+        return self.root.seconds if self.root.end is not None else self.now()
+
+    def tree(self) -> Dict[str, Any]:
+        """Spans nested under the root as dictionaries with ``children``."""
+        nodes = {
+            span.span_id: {**span.to_dict(), "children": []} for span in self.spans
+        }
+        for span in self.spans:
+            if span.parent_id is not None and span.parent_id in nodes:
+                nodes[span.parent_id]["children"].append(nodes[span.span_id])
+        return nodes[self.root.span_id]
+
+    def write_jsonl(self, path: Path) -> Path:
+        """Write one line per span, preceded by a trace header line."""
+        with open(path, "w", encoding="utf-8") as f:
+            header = {
+                "trace_id": self.trace_id,
+                "name": self.name,
+                "started_at": self.started_at.isoformat(),
+                "seconds": round(self.seconds, 6),
+            }
+            f.write(json.dumps(header) + "\n")
+            for span in self.spans:
+                f.write(json.dumps(span.to_dict(), default=str) + "\n")
+        return path
+
+    def write_chrome(self, path: Path) -> Path:
+        """Write Chrome trace-event JSON (one row per asyncio task or thread)."""
+        lanes: Dict[int, int] = {}
+        events = []
+        for span in self.spans:
+            tid = lanes.setdefault(span.lane, len(lanes) + 1)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.kind,
+                    "ph": "X",
+                    "ts": round(span.start * 1e6),
+                    "dur": round(span.seconds * 1e6),
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"status": span.status, **span.attributes},
+                }
+            )
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+        return path
+
+    def export(self, directory: Path) -> Dict[str, Path]:
+        """Write the JSONL and Chrome files into ``directory``.
+
+        Returns:
+            Paths by format ("jsonl", "chrome")
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = f"{self.started_at.strftime('%Y%m%d_%H%M%S')}_{self.trace_id}"
+        self.files = {
+            "jsonl": self.write_jsonl(directory / f"{stem}.jsonl"),
+            "chrome": self.write_chrome(directory / f"{stem}.trace.json"),
+        }
+        return self.files
+
+
+def prune_trace_files(directory: Path, keep: int) -> int:
+    """Delete all but the newest ``keep`` exported runs in ``directory``.
+
+    Args:
+        directory: Trace export directory
+        keep: Number of runs to keep (both files of a run count as one)
+
+    Returns:
+        Number of runs deleted
+    """
+    runs: Dict[str, List[Path]] = {}
+    for path in directory.glob("*.jsonl"):
+        runs.setdefault(path.stem, []).append(path)
+    for path in directory.glob("*.trace.json"):
+        runs.setdefault(path.name[: -len(".trace.json")], []).append(path)
+
+    # Stems start with the run's start time, so name order is age order
+    stale = sorted(runs)[: max(0, len(runs) - keep)]
+    for stem in stale:
+        for path in runs[stem]:
+            path.unlink(missing_ok=True)
+    return len(stale)
+
+
+def summarize_trace(trace: Trace, top: int = 5) -> Dict[str, Any]:
+    """Aggregate a trace by span kind, tool and provider.
+
+    Args:
+        trace: Finished (or running) trace
+        top: Number of slowest tools and providers to list
+
+    Returns:
+        Dictionary with total seconds, per-kind call counts and seconds, LLM
+        token totals, cache hits/misses and the slowest tools and providers
+    """
+    kinds: Dict[str, Dict[str, float]] = {}
+    tools: Dict[str, Dict[str, float]] = {}
+    providers: Dict[str, Dict[str, float]] = {}
+    tokens = {"input": 0, "output": 0}
+    cache = {"hits": 0, "misses": 0}
+
+    for span in trace.spans:
+        if span is trace.root:
+            continue
+        stats = kinds.setdefault(span.kind, {"calls": 0, "seconds": 0.0})
+        stats["calls"] += 1
+        stats["seconds"] += span.seconds
+
+        if span.kind == LLM:
+            tokens["input"] += span.attributes.get("input_tokens", 0) or 0
+            tokens["output"] += span.attributes.get("output_tokens", 0) or 0
+        elif span.kind == CACHE and "hit" in span.attributes:
+            cache["hits" if span.attributes["hit"] else "misses"] += 1
+
+        table = (
+            tools
+            if span.kind == TOOL
+            else providers if span.kind in (FETCH, PROVIDER) else None
+        )
+        if table is not None:
+            entry = table.setdefault(span.name, {"calls": 0, "seconds": 0.0})
+            entry["calls"] += 1
+            entry["seconds"] += span.seconds
+
+    def slowest(table: Dict[str, Dict[str, float]]) -> List[Dict[str, Any]]:
+        ranked = sorted(
+            table.items(), key=lambda item: item[1]["seconds"], reverse=True
+        )
+        return [
+            {
+                "name": name,
+                "calls": int(stats["calls"]),
+                "seconds": round(stats["seconds"], 3),
+            }
+            for name, stats in ranked[:top]
+        ]
+
+    return {
+        "trace_id": trace.trace_id,
+        "name": trace.name,
+        "seconds": round(trace.seconds, 3),
+        "kinds": {
+            kind: {"calls": int(stats["calls"]), "seconds": round(stats["seconds"], 3)}
+            for kind, stats in sorted(kinds.items())
+        },
+        "tokens": tokens,
+        "cache": cache,
+        "tools": slowest(tools),
+        "providers": slowest(providers),
+        "files": {fmt: str(path) for fmt, path in trace.files.items()},
+    }
+
+
+def current_trace() -> Optional[Trace]:
+    """Trace active in this context, if any."""
+    return _current_trace.get()
+
+
+def recent_traces() -> List[Trace]:
+    """Finished traces of this process, oldest first."""
+    return list(_recent_traces)
+
+
+def _parent_span(trace: Trace) -> Span:
+    """Parent for an explicit span: the innermost open span of this code path."""
+    lc_run = _langchain_run_id()
+    current = _current_span.get()
+    # An explicit span opened inside the same LangChain run is the closer parent
+    if current is not None and current.lc_run == lc_run:
+        return current
+    return trace.span_for_run(lc_run) or current or trace.root
+
+
+@contextmanager
+def span(name: str, kind: str, **attributes: Any) -> Iterator[Any]:
+    """Time the enclosed block as a child of the current span.
+
+    Outside a trace this yields a no-op span.
+
+    Args:
+        name: Span name (e.g. "yahoo_info._get_info_cached")
+        kind: Span kind (``CACHE``, ``FETCH``, ``PROVIDER``, ...)
+        **attributes: Initial attributes
+
+    Yields:
+        The span; call ``set()`` on it to add attributes
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield NULL_SPAN
+        return
+
+    opened = trace.start_span(name, kind, _parent_span(trace), **attributes)
+    opened.lc_run = _langchain_run_id()
+    token = _current_span.set(opened)
+    status = "error"
+    try:
+        yield opened
+        status = "ok"
+    finally:
+        _current_span.reset(token)
+        trace.end_span(opened, status)
+
+
+_hook_installed = False
+_handler_class: Optional[type] = None
+
+
+def _install_configure_hook() -> None:
+    """Make LangChain attach ``_handler_var``'s handler to every run."""
+    global _hook_installed
+    if _hook_installed:
+        return
+    from langchain_core.tracers.context import register_configure_hook
+
+    register_configure_hook(_handler_var, inheritable=True)
+    _hook_installed = True
+
+
+def _make_handler(trace: Trace) -> Any:
+    """Create the LangChain callback handler recording into ``trace``."""
+    global _handler_class
+    if _handler_class is None:
+        from langchain_core.callbacks import BaseCallbackHandler
+
+        class TraceCallbackHandler(BaseCallbackHandler):
+            """Records LLM calls, tools and LangGraph nodes as spans."""
+
+            run_inline = True  # Keep span order and task lanes exact
+
+            def __init__(self, trace: Trace) -> None:
+                self.trace = trace
+
+            def _parent(self, parent_run_id: Optional[uuid.UUID]) -> Span:
+                return self.trace.span_for_run(parent_run_id) or self.trace.root
+
+            def _end(self, run_id: uuid.UUID, status: str = "ok") -> Optional[Span]:
+                span = self.trace.span_for_run(run_id)
+                if span is not None and span.lc_run == run_id:
+                    self.trace.end_span(span, status)
+                    return span
+                return None
+
+            def on_chain_start(
+                self,
+                serialized: Optional[Dict[str, Any]],
+                inputs: Any,
+                *,
+                run_id: uuid.UUID,
+                parent_run_id: Optional[uuid.UUID] = None,
+                metadata: Optional[Dict[str, Any]] = None,
+                **kwargs: Any,
+            ) -> None:
+                name = kwargs.get("name") or (serialized or {}).get("name")
+                node = (metadata or {}).get("langgraph_node")
+                parent = self._parent(parent_run_id)
+                if node and name == node:
+                    self.trace.start_span(node, NODE, parent, lc_run=run_id)
+                else:
+                    # Graphs, sequences and other plumbing are not shown
+                    self.trace.alias_run(run_id, parent)
+
+            def on_chain_end(
+                self, outputs: Any, *, run_id: uuid.UUID, **kwargs: Any
+            ) -> None:
+                self._end(run_id)
+
+            def on_chain_error(
+                self, error: BaseException, *, run_id: uuid.UUID, **kwargs: Any
+            ) -> None:
+                self._end(run_id, "error")
+
+            def on_chat_model_start(
+                self,
+                serialized: Optional[Dict[str, Any]],
+                messages: List[List[Any]],
+                *,
+                run_id: uuid.UUID,
+                parent_run_id: Optional[uuid.UUID] = None,
+                metadata: Optional[Dict[str, Any]] = None,
+                **kwargs: Any,
+            ) -> None:
+                params = kwargs.get("invocation_params") or {}
+                model = (
+                    params.get("model")
+                    or params.get("model_name")
+                    or (metadata or {}).get("ls_model_name")
+                    or params.get("_type")
+                    or "llm"
+                )
+                self.trace.start_span(
+                    model,
+                    LLM,
+                    self._parent(parent_run_id),
+                    lc_run=run_id,
+                    messages=sum(len(batch) for batch in messages),
+                )
+
+            def on_llm_end(
+                self, response: Any, *, run_id: uuid.UUID, **kwargs: Any
+            ) -> None:
+                span = self._end(run_id)
+                if span is None:
+                    return
+                usage: Dict[str, Any] = {}
+                try:
+                    usage = response.generations[0][0].message.usage_metadata or {}
+                except (AttributeError, IndexError):
+                    usage = (response.llm_output or {}).get("usage") or {}
+                span.set(
+                    input_tokens=usage.get("input_tokens", 0),
+                    output_tokens=usage.get("output_tokens", 0),
+                )
+
+            def on_llm_error(
+                self, error: BaseException, *, run_id: uuid.UUID, **kwargs: Any
+            ) -> None:
+                self._end(run_id, "error")
+
+            def on_tool_start(
+                self,
+                serialized: Optional[Dict[str, Any]],
+                input_str: str,
+                *,
+                run_id: uuid.UUID,
+                parent_run_id: Optional[uuid.UUID] = None,
+                **kwargs: Any,
+            ) -> None:
+                name = kwargs.get("name") or (serialized or {}).get("name") or "tool"
+                parent = self._parent(parent_run_id)
+                if parent.kind == TOOL and parent.name == name:
+                    # Lazy tool proxy delegating to its implementation
+                    self.trace.alias_run(run_id, parent)
+                    return
+                self.trace.start_span(name, TOOL, parent, lc_run=run_id)
+
+            def on_tool_end(
+                self, output: Any, *, run_id: uuid.UUID, **kwargs: Any
+            ) -> None:
+                failed = getattr(output, "status", None) == "error" or str(
+                    getattr(output, "content", output)
+                ).startswith("Error")
+                self._end(run_id, "error" if failed else "ok")
+
+            def on_tool_error(
+                self, error: BaseException, *, run_id: uuid.UUID, **kwargs: Any
+            ) -> None:
+                self._end(run_id, "error")
+
+        _handler_class = TraceCallbackHandler
+
+    return _handler_class(trace)
+
+
+@asynccontextmanager
+async def trace_run(
+    name: str, trace_id: Optional[str] = None
+) -> AsyncIterator[Optional[Trace]]:
+    """Trace the enclosed run.
+
+    Does nothing (yields None) when ``TRACING_ENABLED`` is off or a trace is
+    already active, so nested runs stay part of the outer trace.
+
+    Args:
+        name: Run name shown by /trace (e.g. the user's query)
+        trace_id: ID to use (default: a new one), e.g. the event-bus run ID
+
+    Yields:
+        The Trace, or None when not tracing
+    """
+    from navam_invest.config.settings import get_settings_or_defaults
+
+    settings = get_settings_or_defaults()
+    directory: Optional[Path] = None
+    if settings.trace_dir:
+        directory = Path(settings.trace_dir).expanduser()
+
+    if not settings.tracing_enabled or _current_trace.get() is not None:
+        yield None
+        return
+
+    _install_configure_hook()
+    trace = Trace(name, trace_id)
+    tokens: List[Tuple[contextvars.ContextVar[Any], contextvars.Token[Any]]] = [
+        (_current_trace, _current_trace.set(trace)),
+        (_current_span, _current_span.set(None)),
+        (_handler_var, _handler_var.set(_make_handler(trace))),
+    ]
+    status = "error"
+    try:
+        yield trace
+        status = "ok"
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+        trace.end_span(trace.root, status)
+        _recent_traces.append(trace)
+        if directory is not None:
+            try:
+                trace.export(directory)
+                prune_trace_files(directory, settings.trace_retention)
+            except OSError as e:
+                logger.warning(f"Could not write trace {trace.trace_id}: {e}")
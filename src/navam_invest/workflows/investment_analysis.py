@@ -1,4 +1,4 @@
-"""Investment Analysis Workflow - Comprehensive 5-agent sequential analysis.
+"""Investment Analysis Workflow - Comprehensive 5-agent analysis.
 
 This workflow coordinates five specialized agents to provide comprehensive investment analysis:
 1. Quill (Equity Research) - Bottom-up fundamental analysis
@@ -8,24 +8,54 @@ This workflow coordinates five specialized agents to provide comprehensive inves
 5. Tax Scout (Tax Advisor) - Tax implications of buying/selling
 
 The workflow combines all perspectives to deliver a complete investment recommendation.
+
+Two execution modes are available:
+- **parallel** (default): News Sentry, Macro Lens and Tax Scout gather data at
+  the same time as Quill; only Risk Shield waits for Quill's thesis. Latency is
+  max(Quill + Risk Shield, News Sentry, Macro Lens, Tax Scout) + synthesis.
+- **sequential**: each agent sees every prior analysis, one after another. Latency
+  is the sum of all five agent tool loops.
 """
 
-from typing import Annotated, TypedDict
+import asyncio
+import logging
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+)
 
 from langchain_anthropic import ChatAnthropic
+from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, START, StateGraph, add_messages
-from langgraph.prebuilt import ToolNode
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.prebuilt import ToolNode, tools_condition
 
 from navam_invest.config.settings import get_settings
-from navam_invest.tools import bind_api_keys_to_tools, get_tools_for_agent
+from navam_invest.tools import TOOLS, bind_api_keys_to_tools, get_tools_for_agent
+from navam_invest.utils.event_bus import get_event_bus
+from navam_invest.utils.report_saver import save_investment_report
+from navam_invest.utils.tracing import trace_run
+
+logger = logging.getLogger(__name__)
 
 
 class InvestmentAnalysisState(TypedDict):
     """State for investment analysis workflow.
 
-    This state is shared across all agents in the sequential workflow,
-    allowing each agent to see prior analyses when providing their perspective.
+    In sequential mode this state is shared across all agents, allowing each
+    agent to see prior analyses when providing their perspective. In parallel
+    mode each agent runs its tool loop on a private copy and only its analysis
+    field is merged back.
     """
 
     messages: Annotated[list, add_messages]
@@ -35,10 +65,48 @@ class InvestmentAnalysisState(TypedDict):
     macro_context: str  # Results from Macro Lens's regime analysis
     risk_assessment: str  # Results from Risk Shield's risk analysis
     tax_implications: str  # Results from Tax Scout's tax analysis
+    market_context: str  # Symbol-independent market data shared across a batch
+
+
+def _prior_analyses(symbol: str, sections: Sequence[Tuple[str, str]]) -> str:
+    """Format the analyses an agent builds on, or nothing if none are available."""
+    available = [(label, text) for label, text in sections if text]
+    if not available:
+        return ""
+
+    block = f" You've received analyses of {symbol} from previous agents."
+    for label, text in available:
+        block += f"\n\n**{label}**:\n{text}"
+    return block
+
+
+def _build_agent_loop(name: str, agent_node: Callable, tools: List[Any]) -> Any:
+    """Compile one agent's model/tool loop as a standalone graph.
+
+    Args:
+        name: Node name of the agent (tool node is ``<name>_tools``)
+        agent_node: Agent node function
+        tools: Tools the agent may call
+
+    Returns:
+        Compiled graph that runs until the agent stops calling tools
+    """
+    loop = StateGraph(InvestmentAnalysisState)
+    loop.add_node(name, agent_node)
+    loop.add_node(f"{name}_tools", ToolNode(tools))
+    loop.add_edge(START, name)
+    loop.add_conditional_edges(
+        name, tools_condition, {"tools": f"{name}_tools", END: END}
+    )
+    loop.add_edge(f"{name}_tools", name)
+    return loop.compile()
 
 
-async def create_investment_analysis_workflow() -> StateGraph:
-    """Create a sequential multi-agent workflow for comprehensive investment analysis.
+async def create_investment_analysis_workflow(
+    parallel: Optional[bool] = None,
+    llm: Optional[BaseChatModel] = None,
+) -> CompiledStateGraph:
+    """Create a multi-agent workflow for comprehensive investment analysis.
 
     Workflow sequence:
     1. User provides symbol via /analyze command
@@ -49,18 +117,30 @@ async def create_investment_analysis_workflow() -> StateGraph:
     6. Tax Scout analyzes tax implications of buying/selling
     7. Synthesis combines all perspectives into final recommendation
 
+    In parallel mode steps 2, 3, 4 and 6 run concurrently and step 5 follows
+    step 2; synthesis waits for all of them.
+
+    Args:
+        parallel: Run independent agents concurrently. Defaults to the
+            ``analysis_workflow_parallel`` setting.
+        llm: Chat model shared by all agents. Defaults to the configured
+            Anthropic model.
+
     Returns:
         Compiled LangGraph workflow
     """
     settings = get_settings()
+    if parallel is None:
+        parallel = settings.analysis_workflow_parallel
 
     # Initialize LLM
-    llm = ChatAnthropic(
-        model=settings.anthropic_model,
-        api_key=settings.anthropic_api_key,
-        temperature=settings.temperature,
-        max_tokens=8192,  # Ensure full responses without truncation
-    )
+    if llm is None:
+        llm = ChatAnthropic(
+            model=settings.anthropic_model,
+            api_key=settings.anthropic_api_key,
+            temperature=settings.temperature,
+            max_tokens=8192,  # Ensure full responses without truncation
+        )
 
     # Get tools for each agent
     quill_tools = get_tools_for_agent("quill")
@@ -137,10 +217,9 @@ Format your response as a concise investment thesis (3-4 paragraphs) that will b
         symbol = state["symbol"]
         quill_analysis = state.get("quill_analysis", "")
 
-        system_prompt = f"""You are News Sentry, an expert event detection analyst. You've received a fundamental analysis of {symbol} from Quill.
+        prior = _prior_analyses(symbol, [("Quill's Analysis", quill_analysis)])
 
-**Quill's Analysis**:
-{quill_analysis}
+        system_prompt = f"""You are News Sentry, an expert event detection analyst.{prior}
 
 Your task: Check for **material events and recent news** that could impact the investment thesis:
 1. **8-K Filings**: Any material events filed recently (M&A, management changes, bankruptcy)?
@@ -174,13 +253,19 @@ Use 8-K monitoring, Form 4 checks, and news analysis tools."""
         quill_analysis = state.get("quill_analysis", "")
         news_events = state.get("news_events", "")
 
-        system_prompt = f"""You are Macro Lens, an expert market strategist. You've received analyses of {symbol} from previous agents.
+        prior = _prior_analyses(
+            symbol,
+            [("Quill's Analysis", quill_analysis), ("News Sentry's Check", news_events)],
+        )
 
-**Quill's Analysis**:
-{quill_analysis}
+        market_data = state.get("market_context", "")
+        if market_data:
+            prior += (
+                "\n\n**Current Market Data** (already gathered - do not fetch "
+                f"the yield curve, key indicators or indices again):\n{market_data}"
+            )
 
-**News Sentry's Check**:
-{news_events}
+        system_prompt = f"""You are Macro Lens, an expert market strategist.{prior}
 
 Your task: Assess whether **NOW is the right time** to invest in {symbol} based on:
 1. **Current Macro Regime**: What economic cycle phase are we in?
@@ -215,16 +300,16 @@ Use treasury yield curve, economic indicators, and current regime analysis."""
         news_events = state.get("news_events", "")
         macro_context = state.get("macro_context", "")
 
-        system_prompt = f"""You are Risk Shield, an expert risk management analyst. You've received analyses of {symbol} from previous agents.
-
-**Quill's Analysis**:
-{quill_analysis}
-
-**News Sentry's Check**:
-{news_events}
+        prior = _prior_analyses(
+            symbol,
+            [
+                ("Quill's Analysis", quill_analysis),
+                ("News Sentry's Check", news_events),
+                ("Macro Lens's Context", macro_context),
+            ],
+        )
 
-**Macro Lens's Context**:
-{macro_context}
+        system_prompt = f"""You are Risk Shield, an expert risk management analyst.{prior}
 
 Your task: Assess **portfolio fit and risk exposure** for investing in {symbol}:
 1. **Concentration Risk**: Would adding {symbol} increase sector/stock concentration?
@@ -258,13 +343,15 @@ Use volatility analysis and correlation tools."""
         quill_analysis = state.get("quill_analysis", "")
         risk_assessment = state.get("risk_assessment", "")
 
-        system_prompt = f"""You are Tax Scout, an expert tax optimization analyst. You've received analyses of {symbol} from previous agents.
-
-**Quill's Analysis**:
-{quill_analysis}
+        prior = _prior_analyses(
+            symbol,
+            [
+                ("Quill's Analysis", quill_analysis),
+                ("Risk Shield's Assessment", risk_assessment),
+            ],
+        )
 
-**Risk Shield's Assessment**:
-{risk_assessment}
+        system_prompt = f"""You are Tax Scout, an expert tax optimization analyst.{prior}
 
 Your task: Analyze **tax implications** of investing in {symbol}:
 1. **Capital Gains**: If buying, when to sell for long-term gains?
@@ -331,6 +418,89 @@ Keep it concise (4-5 sentences total)."""
 
         return {"messages": [final_response]}
 
+    if parallel:
+        quill_loop = _build_agent_loop("quill", quill_agent, quill_tools_with_keys)
+        news_sentry_loop = _build_agent_loop(
+            "news_sentry", news_sentry_agent, news_sentry_tools_with_keys
+        )
+        macro_loop = _build_agent_loop(
+            "macro_lens", macro_lens_agent, macro_tools_with_keys
+        )
+        risk_shield_loop = _build_agent_loop(
+            "risk_shield", risk_shield_agent, risk_shield_tools_with_keys
+        )
+        tax_scout_loop = _build_agent_loop(
+            "tax_scout", tax_scout_agent, tax_scout_tools_with_keys
+        )
+
+        def branch_input(
+            state: InvestmentAnalysisState, **analyses: str
+        ) -> Dict[str, Any]:
+            """Private starting state for one agent loop."""
+            return {
+                "messages": list(state["messages"]),
+                "symbol": state["symbol"],
+                "market_context": state.get("market_context", ""),
+                **analyses,
+            }
+
+        # Each branch runs its whole tool loop inside one node, so a slow agent
+        # never holds the others at a superstep boundary. The node config is
+        # passed on explicitly: Python < 3.11 can't carry it into the child run
+        # through contextvars, which would drop subgraph progress and callbacks
+        async def fundamentals_branch(
+            state: InvestmentAnalysisState, config: RunnableConfig
+        ) -> dict:
+            """Quill's thesis, then Risk Shield's assessment of it."""
+            quill_state = await quill_loop.ainvoke(branch_input(state), config)
+            quill_analysis = quill_state.get("quill_analysis", "")
+            risk_state = await risk_shield_loop.ainvoke(
+                branch_input(state, quill_analysis=quill_analysis), config
+            )
+            return {
+                "quill_analysis": quill_analysis,
+                "risk_assessment": risk_state.get("risk_assessment", ""),
+            }
+
+        async def news_sentry_branch(
+            state: InvestmentAnalysisState, config: RunnableConfig
+        ) -> dict:
+            """News Sentry's event check."""
+            result = await news_sentry_loop.ainvoke(branch_input(state), config)
+            return {"news_events": result.get("news_events", "")}
+
+        async def macro_lens_branch(
+            state: InvestmentAnalysisState, config: RunnableConfig
+        ) -> dict:
+            """Macro Lens's regime and timing view."""
+            result = await macro_loop.ainvoke(branch_input(state), config)
+            return {"macro_context": result.get("macro_context", "")}
+
+        async def tax_scout_branch(
+            state: InvestmentAnalysisState, config: RunnableConfig
+        ) -> dict:
+            """Tax Scout's tax assessment."""
+            result = await tax_scout_loop.ainvoke(branch_input(state), config)
+            return {"tax_implications": result.get("tax_implications", "")}
+
+        # Fan out from START, fan in at synthesis
+        # START → {Quill → Risk Shield, News Sentry, Macro Lens, Tax Scout} → Synthesis
+        workflow = StateGraph(InvestmentAnalysisState)
+        branches = {
+            "fundamentals": fundamentals_branch,
+            "news_sentry_branch": news_sentry_branch,
+            "macro_lens_branch": macro_lens_branch,
+            "tax_scout_branch": tax_scout_branch,
+        }
+        for name, branch in branches.items():
+            workflow.add_node(name, branch)
+            workflow.add_edge(START, name)
+        workflow.add_node("synthesize", synthesize_recommendation)
+        workflow.add_edge(list(branches), "synthesize")
+        workflow.add_edge("synthesize", END)
+
+        return workflow.compile()
+
     # Build the sequential workflow graph
     workflow = StateGraph(InvestmentAnalysisState)
 
@@ -432,3 +602,146 @@ Keep it concise (4-5 sentences total)."""
     workflow.add_edge("synthesize", END)
 
     return workflow.compile()
+
+
+async def gather_market_context() -> str:
+    """Fetch symbol-independent market data once for a batch of analyses.
+
+    Returns:
+        Yield curve, key macro indicators and market indices as one text block
+        (sections that fail to load are left out)
+    """
+    settings = get_settings()
+    requests = [
+        ("Treasury Yield Curve", TOOLS["get_treasury_yield_curve"].ainvoke({})),
+        ("Market Indices", TOOLS["get_market_indices"].ainvoke({})),
+    ]
+    if settings.fred_api_key:
+        indicators = TOOLS["get_key_macro_indicators"].ainvoke(
+            {"api_key": settings.fred_api_key}
+        )
+        requests.append(("Key Macro Indicators", indicators))
+
+    results = await asyncio.gather(
+        *(request for _, request in requests), return_exceptions=True
+    )
+
+    sections = []
+    for (label, _), result in zip(requests, results):
+        if isinstance(result, Exception) or str(result).startswith("Error"):
+            logger.warning(f"Skipping {label} in shared market context: {result}")
+            continue
+        sections.append(f"### {label}\n{result}")
+    return "\n\n".join(sections)
+
+
+class AnalysisResult(NamedTuple):
+    """Outcome of one symbol in a batch analysis."""
+
+    symbol: str
+    state: Dict[str, Any]  # Final workflow state (empty on error)
+    recommendation: str
+    report_path: Optional[str] = None
+    error: Optional[str] = None
+
+
+async def run_investment_analysis_batch(
+    symbols: Sequence[str],
+    workflow: Any = None,
+    max_concurrency: Optional[int] = None,
+    share_market_context: Optional[bool] = None,
+    save_reports: bool = True,
+    on_progress: Optional[Callable[[str, str, Dict[str, Any]], None]] = None,
+    on_result: Optional[Callable[[AnalysisResult], None]] = None,
+) -> List[AnalysisResult]:
+    """Run the investment analysis workflow over several symbols.
+
+    Symbols are analyzed concurrently up to ``max_concurrency`` at a time.
+    Market data that does not depend on the symbol is fetched once and handed
+    to every run. Each symbol is its own event-bus run and trace, and gets its
+    own saved report.
+
+    Args:
+        symbols: Stock symbols to analyze (duplicates are ignored)
+        workflow: Compiled workflow to reuse; created when omitted
+        max_concurrency: Maximum symbols in flight. Defaults to the
+            ``analysis_max_concurrency`` setting.
+        share_market_context: Gather market data up front and share it.
+            Defaults to True for more than one symbol.
+        save_reports: Save a report per successful symbol
+        on_progress: Called with (symbol, node name, node output) as agents work
+        on_result: Called with each symbol's result as soon as it finishes
+
+    Returns:
+        One result per symbol, in input order
+    """
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+    if not symbols:
+        return []
+
+    if max_concurrency is None:
+        max_concurrency = get_settings().analysis_max_concurrency
+    if share_market_context is None:
+        share_market_context = len(symbols) > 1
+    if workflow is None:
+        workflow = await create_investment_analysis_workflow()
+
+    market_context = await gather_market_context() if share_market_context else ""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def analyze_symbol(symbol: str) -> AnalysisResult:
+        """Run the workflow for one symbol and save its report."""
+        state: Dict[str, Any] = {}
+        try:
+            async for namespace, event_type, event_data in workflow.astream(
+                {
+                    "messages": [HumanMessage(content=f"Analyze {symbol}")],
+                    "symbol": symbol,
+                    "market_context": market_context,
+                },
+                stream_mode=["values", "updates"],
+                subgraphs=True,
+            ):
+                if event_type == "values" and not namespace:
+                    state = event_data
+                elif event_type == "updates" and on_progress is not None:
+                    for node_name, node_output in event_data.items():
+                        on_progress(symbol, node_name, node_output or {})
+
+            last_msg = state["messages"][-1] if state.get("messages") else None
+            recommendation = (
+                str(last_msg.content) if isinstance(last_msg, AIMessage) else ""
+            )
+        except Exception as e:
+            logger.exception(f"Investment analysis failed for {symbol}")
+            result = AnalysisResult(symbol, state, "", error=str(e))
+        else:
+            report_path = None
+            if save_reports and recommendation:
+                try:
+                    report_path = save_investment_report(
+                        symbol=symbol,
+                        final_recommendation=recommendation,
+                        quill_analysis=state.get("quill_analysis", ""),
+                        macro_context=state.get("macro_context", ""),
+                    )
+                except Exception as e:
+                    # A finished analysis is kept even if its report can't be written
+                    logger.warning(f"Could not save report for {symbol}: {e}")
+            result = AnalysisResult(symbol, state, recommendation, report_path)
+
+        return result
+
+    async def analyze(symbol: str) -> AnalysisResult:
+        async with semaphore:
+            # Each symbol is its own run: own event run ID and trace
+            async with get_event_bus().run() as run_id, trace_run(
+                f"/analyze {symbol}", run_id
+            ):
+                result = await analyze_symbol(symbol)
+
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    return list(await asyncio.gather(*(analyze(symbol) for symbol in symbols)))
@@ -0,0 +1,57 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from navam_invest.agents import registry as agent_registry
+from navam_invest.cache import manager as cache_manager
+from navam_invest.cache import price_store, ticker_index, xbrl_store
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    """Give every test a fresh in-memory cache instead of ~/.navam-invest."""
+    cache = cache_manager.CacheManager()
+    monkeypatch.setattr(cache_manager, "_cache_manager", cache)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_ticker_index(monkeypatch):
+    """Give every test an empty in-memory ticker index."""
+    index = ticker_index.TickerIndex()
+    monkeypatch.setattr(ticker_index, "_ticker_index", index)
+    yield index
+    index.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_xbrl_store(monkeypatch):
+    """Give every test an empty in-memory XBRL fact store."""
+    store = xbrl_store.XbrlFactStore()
+    monkeypatch.setattr(xbrl_store, "_xbrl_store", store)
+    yield store
+    store.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_price_store(monkeypatch):
+    """Give every test an empty in-memory price store."""
+    store = price_store.PriceStore()
+    monkeypatch.setattr(price_store, "_price_store", store)
+    yield store
+    store.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_agent_pool(monkeypatch):
+    """Give every test an empty agent pool."""
+    pool = agent_registry.AgentPool()
+    monkeypatch.setattr(agent_registry, "_agent_pool", pool)
+    return pool
+
+
+@pytest.fixture(autouse=True)
+def isolated_traces(monkeypatch, tmp_path):
+    """Write run traces to a temporary directory instead of ~/.navam-invest."""
+    monkeypatch.setenv("TRACE_DIR", str(tmp_path / "traces"))
@@ -0,0 +1,87 @@
+"""Tests for the shared agent pool."""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from navam_invest.agents import registry
+from navam_invest.agents.registry import AgentPool, get_agent_pool
+
+
+class EchoAgent:
+    """Compiled-agent stand-in that answers with its own name."""
+
+    def __init__(self, name):
+        self.name = name
+
+    async def astream(self, state, **kwargs):
+        yield "values", {"messages": [AIMessage(content=f"{self.name} answer")]}
+
+
+def _counting_factories(builds):
+    def factory(name):
+        async def build():
+            builds.append(name)
+            await asyncio.sleep(0.01)
+            return EchoAgent(name)
+
+        return build
+
+    return {name: factory(name) for name in registry.AGENT_FACTORIES}
+
+
+@pytest.mark.asyncio
+async def test_pool_builds_each_agent_once():
+    """Concurrent and repeated requests share one instance per agent."""
+    builds = []
+    pool = AgentPool(_counting_factories(builds))
+
+    first, second = await asyncio.gather(pool.get("quill"), pool.get("quill"))
+    assert first is second is await pool.get("quill")
+    assert builds == ["quill"]
+
+    assert pool.stats() == {
+        "instances": 1,
+        "built": ["quill"],
+        "pending": [name for name in registry.AGENT_FACTORIES if name != "quill"],
+        "builds": 1,
+    }
+
+    with pytest.raises(KeyError):
+        await pool.get("atlas")
+
+
+@pytest.mark.asyncio
+async def test_pool_lifecycle():
+    """Warm-up builds everything; released agents are rebuilt on demand."""
+    builds = []
+    pool = AgentPool(_counting_factories(builds))
+
+    assert await pool.warm_up() == []
+    assert pool.instance_count == len(registry.AGENT_FACTORIES)
+
+    old = await pool.get("tax_scout")
+    assert pool.release("tax_scout") and "tax_scout" not in pool
+    assert await pool.get("tax_scout") is not old
+
+    pool.clear()
+    assert pool.instance_count == 0
+    assert pool.stats()["builds"] == len(registry.AGENT_FACTORIES) + 1
+
+
+@pytest.mark.asyncio
+async def test_router_tools_draw_from_shared_pool(monkeypatch):
+    """route_to_* tools reuse the instance other callers got from the pool."""
+    from navam_invest.agents.router import route_to_macro_lens
+
+    builds = []
+    pool = AgentPool(_counting_factories(builds))
+    monkeypatch.setattr(registry, "_agent_pool", pool)
+
+    manual = await get_agent_pool().get("macro_lens")
+    result = await route_to_macro_lens.ainvoke({"query": "Recession risk?"})
+
+    assert result == "macro_lens answer"
+    assert builds == ["macro_lens"]
+    assert manual is await pool.get("macro_lens")
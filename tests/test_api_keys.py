@@ -273,7 +273,7 @@ class TestAPIKeyBinding:
                 "get_top_financial_headlines",
                 "get_company_news",
             ]
-            print(f"  - {tool.name}: {'bound' if tool.coroutine else 'original'}")
+            print(f"  - {tool.name}: {'bound' if tool.bound_args else 'original'}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,344 @@
+"""Tests for the API response cache."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from navam_invest.cache import CacheManager
+
+
+@pytest.fixture
+def cache():
+    """In-memory cache manager."""
+    manager = CacheManager()
+    yield manager
+    manager.close()
+
+
+def test_memory_tier_serves_hits_without_duckdb(cache):
+    """Hot keys are served from L1 even if the DuckDB row disappears."""
+    cache.set("yahoo_finance", "get_quote", ("AAPL",), {}, "AAPL quote")
+
+    cache.conn.execute("DELETE FROM cache_entries")
+
+    assert cache.get("yahoo_finance", "get_quote", ("AAPL",), {}) == "AAPL quote"
+
+
+def test_duckdb_hit_is_promoted_to_memory_tier(cache):
+    """An L2 hit populates L1 for subsequent lookups."""
+    cache.set("fred", "get_indicator", ("GDP",), {}, {"value": 1})
+    cache._memory.clear()
+
+    assert cache.get("fred", "get_indicator", ("GDP",), {}) == {"value": 1}
+    assert len(cache._memory) == 1
+
+
+def test_memory_tier_is_bounded_lru():
+    """Least recently used keys are evicted once the L1 tier is full."""
+    cache = CacheManager(memory_max_entries=2)
+    try:
+        for symbol in ("AAPL", "MSFT"):
+            cache.set("yahoo_finance", "get_quote", (symbol,), {}, symbol)
+
+        # Touch AAPL so MSFT becomes least recently used
+        cache.get("yahoo_finance", "get_quote", ("AAPL",), {})
+        cache.set("yahoo_finance", "get_quote", ("NVDA",), {}, "NVDA")
+
+        keys = list(cache._memory)
+        assert len(keys) == 2
+        assert cache._generate_cache_key("yahoo_finance", "get_quote", ("MSFT",), {}) not in keys
+    finally:
+        cache.close()
+
+
+def test_expired_memory_entry_is_not_served(cache):
+    """Expired L1 entries are dropped instead of returned."""
+    key = cache._generate_cache_key("fred", "get_indicator", ("GDP",), {})
+    cache._memory[key] = ("stale", datetime.now() - timedelta(seconds=1))
+
+    assert cache.get("fred", "get_indicator", ("GDP",), {}) is None
+    assert key not in cache._memory
+
+
+def test_statistics_are_batched_and_accurate(cache):
+    """Hit/miss counters are aggregated in memory but reported accurately."""
+    cache.get("yahoo_finance", "get_quote", ("AAPL",), {})
+    cache.set("yahoo_finance", "get_quote", ("AAPL",), {}, "quote")
+    for _ in range(3):
+        cache.get("yahoo_finance", "get_quote", ("AAPL",), {})
+
+    # Nothing written yet - below the flush threshold
+    assert cache.conn.execute("SELECT COUNT(*) FROM cache_statistics").fetchone()[0] == 0
+
+    stats = cache.get_statistics()
+    assert stats["total_hits"] == 3
+    assert stats["total_misses"] == 1
+    assert cache.conn.execute("SELECT hits FROM cache_entries").fetchone()[0] == 3
+
+
+def test_invalidate_clears_memory_tier(cache):
+    """Invalidation removes matching keys from both tiers."""
+    cache.set("yahoo_finance", "get_quote", ("AAPL",), {}, "quote")
+    cache.set("fred", "get_indicator", ("GDP",), {}, "gdp")
+
+    assert cache.invalidate(source="yahoo_finance") == 1
+    assert cache.get("yahoo_finance", "get_quote", ("AAPL",), {}) is None
+    assert cache.get("fred", "get_indicator", ("GDP",), {}) == "gdp"
+
+
+def test_write_behind_coalesces_deltas():
+    """Repeated events on the same keys collapse into one row per key."""
+    from navam_invest.cache.manager import WriteBehindQueue
+
+    queue = WriteBehindQueue()
+    for _ in range(5):
+        queue.record("yahoo_finance", "get_quote", hit=True, cache_key="k1")
+    queue.record("yahoo_finance", "get_quote", hit=False)
+
+    assert queue.events == 6
+    assert len(queue.stats) == 1
+    assert list(queue.stats.values())[0] == [5, 1, 0]
+    assert queue.hits == {"k1": 5}
+
+
+def test_write_behind_flushes_on_timer():
+    """The background timer writes pending statistics without a read."""
+    import time
+
+    cache = CacheManager(stats_flush_interval_seconds=0.05)
+    try:
+        cache.get("yahoo_finance", "get_quote", ("AAPL",), {})
+        deadline = time.time() + 2
+        while time.time() < deadline:
+            with cache._lock:
+                rows = cache.conn.execute(
+                    "SELECT misses FROM cache_statistics"
+                ).fetchall()
+            if rows:
+                break
+            time.sleep(0.02)
+        assert rows == [(1,)]
+    finally:
+        cache.close()
+
+
+def test_write_behind_flushes_on_threshold():
+    """Reaching the size threshold triggers a flush."""
+    cache = CacheManager(stats_flush_threshold=3, stats_flush_interval_seconds=0)
+    try:
+        for _ in range(3):
+            cache.get("yahoo_finance", "get_quote", ("AAPL",), {})
+        assert cache._write_behind.events == 0
+        assert cache.conn.execute("SELECT misses FROM cache_statistics").fetchall() == [(3,)]
+    finally:
+        cache.close()
+
+
+def test_write_behind_flushes_on_close(tmp_path):
+    """Closing the manager persists statistics still queued in memory."""
+    db_path = tmp_path / "cache.duckdb"
+    cache = CacheManager(db_path, stats_flush_interval_seconds=0)
+    cache.set("fred", "get_indicator", ("GDP",), {}, "gdp")
+    cache.get("fred", "get_indicator", ("GDP",), {})
+    cache.close()
+
+    reopened = CacheManager(db_path, stats_flush_interval_seconds=0)
+    try:
+        stats = reopened.get_statistics()
+        assert stats["total_hits"] == 1
+        assert reopened.conn.execute("SELECT hits FROM cache_entries").fetchone()[0] == 1
+    finally:
+        reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_coalesces_concurrent_async_calls(isolated_cache):
+    """Concurrent identical async calls share one upstream fetch."""
+    import asyncio
+
+    from navam_invest.cache import cached
+
+    calls = 0
+
+    @cached(source="sec_edgar")
+    async def fetch_submissions(cik: str) -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"cik": cik}
+
+    results = await asyncio.gather(*(fetch_submissions("320193") for _ in range(5)))
+
+    assert calls == 1
+    assert all(result == {"cik": "320193"} for result in results)
+
+    stats = isolated_cache.get_statistics()
+    assert stats["total_coalesced"] == 4
+    assert stats["by_tool"][0]["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_coalesced_callers_share_errors():
+    """Waiting callers see the leader's exception and nothing is cached."""
+    import asyncio
+
+    from navam_invest.cache import cached
+
+    calls = 0
+
+    @cached(source="sec_edgar")
+    async def failing_fetch(cik: str) -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        *(failing_fetch("1") for _ in range(3)), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_cached_coalesces_concurrent_sync_calls(isolated_cache):
+    """Concurrent identical calls from worker threads share one fetch."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from navam_invest.cache import cached
+
+    calls = 0
+    calls_lock = threading.Lock()
+
+    @cached(source="yahoo_finance")
+    def fetch_quote(symbol: str) -> str:
+        nonlocal calls
+        with calls_lock:
+            calls += 1
+        time.sleep(0.1)
+        return f"{symbol} quote"
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(fetch_quote, ["NVDA"] * 5))
+
+    assert calls == 1
+    assert results == ["NVDA quote"] * 5
+    assert isolated_cache.get_statistics()["total_coalesced"] == 4
+
+
+def test_cached_sync_rechecks_cache_after_missing(isolated_cache, monkeypatch):
+    """A miss racing a just-finished fetch reuses its result, not a new fetch."""
+    from navam_invest.cache import cached
+
+    calls = 0
+
+    @cached(source="yahoo_finance")
+    def fetch_quote(symbol: str) -> str:
+        nonlocal calls
+        calls += 1
+        return f"{symbol} quote {calls}"
+
+    assert fetch_quote("NVDA") == "NVDA quote 1"
+
+    # The next caller's lookup ran just before the first fetch was stored
+    monkeypatch.setattr(isolated_cache, "lookup", lambda *args, **kwargs: None)
+    assert fetch_quote("NVDA") == "NVDA quote 1"
+    assert calls == 1
+
+
+def _expire(cache, source, tool_name, args, seconds_ago):
+    """Backdate an entry's expiry in both tiers."""
+    key = cache._generate_cache_key(source, tool_name, args, {})
+    expires_at = datetime.now() - timedelta(seconds=seconds_ago)
+    cache._memory.pop(key, None)
+    cache.conn.execute(
+        "UPDATE cache_entries SET expires_at = ? WHERE cache_key = ?", [expires_at, key]
+    )
+
+
+def test_lookup_serves_stale_entries_inside_grace(cache):
+    """Expired entries inside the source grace window are tagged stale."""
+    cache.set("yahoo_finance", "get_quote", ("AAPL",), {}, "old quote")
+    _expire(cache, "yahoo_finance", "get_quote", ("AAPL",), seconds_ago=10)
+
+    result = cache.lookup("yahoo_finance", "get_quote", ("AAPL",), {})
+    assert result == ("old quote", True)
+    # Strict reads keep the original TTL semantics
+    assert cache.get("yahoo_finance", "get_quote", ("AAPL",), {}) is None
+
+    _expire(cache, "yahoo_finance", "get_quote", ("AAPL",), seconds_ago=3600)
+    assert cache.lookup("yahoo_finance", "get_quote", ("AAPL",), {}) is None
+
+
+def test_lookup_has_no_grace_for_other_sources(cache):
+    """Sources without a grace window expire exactly at their TTL."""
+    cache.set("fred", "get_indicator", ("GDP",), {}, "gdp")
+    _expire(cache, "fred", "get_indicator", ("GDP",), seconds_ago=10)
+
+    assert cache.lookup("fred", "get_indicator", ("GDP",), {}) is None
+
+
+def test_cleanup_keeps_entries_inside_grace(cache):
+    """Cleanup only removes entries past both expiry and grace."""
+    cache.set("yahoo_finance", "get_quote", ("AAPL",), {}, "quote")
+    cache.set("fred", "get_indicator", ("GDP",), {}, "gdp")
+    _expire(cache, "yahoo_finance", "get_quote", ("AAPL",), seconds_ago=10)
+    _expire(cache, "fred", "get_indicator", ("GDP",), seconds_ago=10)
+
+    assert cache.cleanup_expired() == 1
+    assert cache.lookup("yahoo_finance", "get_quote", ("AAPL",), {}).stale
+
+
+@pytest.mark.asyncio
+async def test_cached_revalidates_stale_entries_in_background(isolated_cache):
+    """A stale hit returns immediately and schedules one refresh."""
+    import asyncio
+
+    from navam_invest.cache import cached
+
+    calls = 0
+
+    @cached(source="finnhub")
+    async def fetch_sentiment(symbol: str) -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return {"symbol": symbol, "version": calls}
+
+    assert await fetch_sentiment("AAPL") == {"symbol": "AAPL", "version": 1}
+    _expire(isolated_cache, "finnhub", "fetch_sentiment", ("AAPL",), seconds_ago=10)
+
+    stale = await asyncio.gather(*(fetch_sentiment("AAPL") for _ in range(3)))
+    assert all(result["version"] == 1 for result in stale)
+
+    await asyncio.sleep(0.1)
+    assert calls == 2
+    assert await fetch_sentiment("AAPL") == {"symbol": "AAPL", "version": 2}
+
+
+def test_cached_revalidates_stale_sync_entries(isolated_cache):
+    """Sync tools refresh stale entries on the background worker pool."""
+    import time
+
+    from navam_invest.cache import cached
+
+    calls = 0
+
+    @cached(source="yahoo_finance")
+    def fetch_quote(symbol: str) -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert fetch_quote("NVDA") == 1
+    _expire(isolated_cache, "yahoo_finance", "fetch_quote", ("NVDA",), seconds_ago=10)
+
+    assert fetch_quote("NVDA") == 1
+
+    deadline = time.time() + 2
+    while calls < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    assert fetch_quote("NVDA") == 2
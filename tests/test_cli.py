@@ -0,0 +1,157 @@
+"""Tests for the headless CLI commands."""
+
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+from typer.testing import CliRunner
+
+from navam_invest import cli
+from navam_invest.agents import registry
+
+runner = CliRunner()
+
+
+class FakeGraph:
+    """Compiled-graph stand-in that echoes the query and fails on 'boom'."""
+
+    def __init__(self):
+        self.queries = []
+
+    async def astream(self, state, **kwargs):
+        query = state["messages"][-1].content
+        self.queries.append(query)
+        if "boom" in query:
+            raise RuntimeError("model unavailable")
+
+        tool_call = {"name": "get_quote", "args": {}, "id": f"call-{query}"}
+        call = AIMessage(content="", tool_calls=[tool_call])
+        yield (), "updates", {"agent": {"messages": [call]}}
+        answer = AIMessage(content=f"answer: {query}")
+        yield (), "values", {**state, "messages": [answer]}
+
+
+@pytest.fixture
+def fake_graph(monkeypatch, tmp_path):
+    """Serve every agent/workflow factory with one FakeGraph."""
+    graph = FakeGraph()
+
+    async def factory():
+        return graph
+
+    monkeypatch.setattr(cli, "_load_factory", lambda module, name: factory)
+    pool = registry.AgentPool({name: factory for name in registry.AGENT_FACTORIES})
+    monkeypatch.setattr(registry, "_agent_pool", pool)
+    monkeypatch.chdir(tmp_path)
+    return graph
+
+
+def _records(output: str) -> list:
+    return [json.loads(line) for line in output.splitlines() if line.strip()]
+
+
+def test_ask_streams_json_lines_and_saves_report(fake_graph, tmp_path):
+    """Progress and results are JSON lines; a report is written per answer."""
+    result = runner.invoke(
+        cli.app, ["ask", "--agent", "quill", "--json", "Value", "AAPL"]
+    )
+
+    assert result.exit_code == cli.EXIT_OK
+    progress, final = _records(result.stdout)
+    assert progress == {
+        "event": "progress",
+        "job": "Value AAPL",
+        "node": "agent",
+        "tools": ["get_quote"],
+    }
+    assert final["status"] == "ok" and final["output"] == "answer: Value AAPL"
+    assert (tmp_path / "reports").exists() and final["report"].endswith(".md")
+
+
+def test_queries_from_file_run_and_failures_set_exit_code(fake_graph, tmp_path):
+    """Every query in the file runs; one failure yields EXIT_FAILED."""
+    queries = tmp_path / "queries.txt"
+    queries.write_text("# watchlist\nfirst question\n\nboom question\nthird question\n")
+
+    result = runner.invoke(
+        cli.app,
+        ["ask", "--file", str(queries), "--json", "--quiet", "--no-save-reports"],
+    )
+
+    assert result.exit_code == cli.EXIT_FAILED
+    assert sorted(fake_graph.queries) == ["boom question", "first question", "third question"]
+    records = {r["job"]: r for r in _records(result.stdout)}
+    assert records["boom question"] == {
+        "event": "result",
+        "job": "boom question",
+        "status": "error",
+        "error": "model unavailable",
+    }
+    assert records["third question"]["report"] is None
+
+
+def test_workflow_command_builds_state_and_report(fake_graph, tmp_path):
+    """Workflow commands seed their state and save a sectioned report."""
+    result = runner.invoke(cli.app, ["protect", "60% tech, 40% bonds"])
+
+    assert result.exit_code == cli.EXIT_OK
+    assert fake_graph.queries == ["60% tech, 40% bonds"]
+    (report,) = (tmp_path / "reports").iterdir()
+    content = report.read_text()
+    assert content.startswith("# Portfolio Protection Strategy")
+    assert "## Hedging Strategies" in content
+
+
+def test_configuration_error_exit_code(monkeypatch):
+    """Missing configuration maps to EXIT_CONFIG."""
+    from navam_invest.config.settings import ConfigurationError
+
+    async def factory():
+        raise ConfigurationError("Missing required configuration: ANTHROPIC_API_KEY")
+
+    monkeypatch.setattr(cli, "_load_factory", lambda module, name: factory)
+
+    result = runner.invoke(cli.app, ["discover"])
+
+    assert result.exit_code == cli.EXIT_CONFIG
+
+
+def test_usage_errors():
+    """Unknown agents and empty queries are usage errors."""
+    unknown = runner.invoke(cli.app, ["ask", "--agent", "nope", "hi"])
+    assert unknown.exit_code == cli.EXIT_USAGE
+    assert runner.invoke(cli.app, ["analyze"]).exit_code == cli.EXIT_USAGE
+
+
+def test_analyze_parses_symbol_files_and_rejects_non_tickers(monkeypatch, tmp_path):
+    """Comma lists and comments parse; any invalid token stops before running."""
+    calls = []
+
+    async def fake_batch(symbols, **kwargs):
+        calls.append(list(symbols))
+        return []
+
+    import navam_invest.workflows as workflows
+
+    monkeypatch.setattr(workflows, "run_investment_analysis_batch", fake_batch)
+    watchlist = tmp_path / "watchlist.txt"
+    watchlist.write_text("# tech\nAAPL,MSFT\n\nnvda  # chips\n")
+
+    ok = runner.invoke(cli.app, ["analyze", "--file", str(watchlist)])
+    assert ok.exit_code == cli.EXIT_OK
+    assert calls == [["AAPL", "MSFT", "NVDA"]]
+
+    bad = runner.invoke(cli.app, ["analyze", "AAPL", "should", "I", "buy?"])
+    assert bad.exit_code == cli.EXIT_USAGE
+    assert calls == [["AAPL", "MSFT", "NVDA"]]
+
+
+def test_ask_builds_specialists_through_the_shared_pool(fake_graph):
+    """`ask` reuses the pool instance instead of building its own agent."""
+    result = runner.invoke(
+        cli.app, ["ask", "--agent", "risk_shield", "--no-save-reports", "hi"]
+    )
+
+    assert result.exit_code == cli.EXIT_OK
+    assert registry.get_agent_pool().stats()["built"] == ["risk_shield"]
+    assert set(cli.AGENT_REPORT_TYPES) == set(cli.AGENTS)
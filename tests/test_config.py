@@ -5,7 +5,11 @@ from unittest.mock import patch
 
 import pytest
 
-from navam_invest.config.settings import Settings, get_settings
+from navam_invest.config.settings import (
+    Settings,
+    get_settings,
+    get_settings_or_defaults,
+)
 
 
 def test_settings_with_env_vars() -> None:
@@ -41,3 +45,13 @@ def test_get_settings() -> None:
         settings = get_settings()
         assert isinstance(settings, Settings)
         assert settings.anthropic_api_key == "test-key"
+
+
+def test_get_settings_or_defaults_without_api_key(monkeypatch, tmp_path) -> None:
+    """Incomplete configuration falls back to field defaults instead of raising."""
+    monkeypatch.chdir(tmp_path)  # no .env
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    settings = get_settings_or_defaults()
+    defaults = Settings.model_fields
+    assert settings.http_max_retries == defaults["http_max_retries"].default
+    assert settings.trace_dir == ""
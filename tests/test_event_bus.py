@@ -0,0 +1,238 @@
+"""Tests for the progress event bus."""
+
+import asyncio
+import json
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from navam_invest.utils import event_bus
+from navam_invest.utils.event_bus import (
+    AGENT_END,
+    AGENT_START,
+    ERROR,
+    RUN_END,
+    RUN_START,
+    TOOL_END,
+    TOOL_START,
+    Event,
+    EventBus,
+    EventMetrics,
+    JsonlEventWriter,
+)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_are_correlated():
+    """Each run tags its events; a run-scoped subscriber sees only its own."""
+    bus = EventBus()
+    everything = bus.subscribe()
+
+    async def run(name):
+        async with bus.run() as run_id:
+            await asyncio.sleep(0)
+            await bus.publish(TOOL_START, tool=name)
+        return run_id
+
+    first = bus.subscribe(run_id="first")
+    ids = await asyncio.gather(run("a"), run("b"))
+    async with bus.run("first"):
+        await bus.publish(TOOL_START, tool="c")
+    first.close()
+    everything.close()
+
+    assert [e.type for e in [e async for e in first]] == [
+        RUN_START,
+        TOOL_START,
+        RUN_END,
+    ]
+    events = [e async for e in everything]
+    by_run = {e.run_id: e.tool for e in events if e.type == TOOL_START}
+    assert by_run == {ids[0]: "a", ids[1]: "b", "first": "c"}
+    assert all(e.run_id for e in events)
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_drops_oldest():
+    bus = EventBus(maxsize=2)
+    subscription = bus.subscribe()
+    for i in range(5):
+        await bus.publish(TOOL_START, tool=f"t{i}")
+
+    assert subscription.pending == 2 and subscription.dropped == 3
+    subscription.close()
+    assert [e.tool async for e in subscription] == ["t3", "t4"]
+    assert bus.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_blocking_subscriber_applies_backpressure():
+    """A full blocking subscription makes the publisher wait for the consumer."""
+    bus = EventBus()
+    subscription = bus.subscribe(maxsize=1, block=True)
+    await bus.publish(TOOL_START, tool="first")
+
+    second = asyncio.create_task(bus.publish(TOOL_START, tool="second"))
+    await asyncio.sleep(0.01)
+    assert not second.done()
+
+    assert (await subscription.get()).tool == "first"
+    await asyncio.wait_for(second, 1)
+    assert (await subscription.get()).tool == "second"
+
+
+@pytest.mark.asyncio
+async def test_no_subscribers_retains_nothing():
+    """Headless runs publish into the void without queueing events."""
+    bus = EventBus()
+    with bus.subscribe() as subscription:
+        pass
+    for _ in range(100):
+        await bus.publish(TOOL_START, tool="t")
+    assert bus.subscriber_count == 0
+    assert subscription.pending == 1  # only the close marker
+
+
+@pytest.mark.asyncio
+async def test_listeners_write_jsonl_and_metrics(tmp_path):
+    bus = EventBus()
+    writer = JsonlEventWriter(tmp_path / "events" / "run.jsonl")
+    metrics = EventMetrics()
+    bus.add_listener(writer)
+    bus.add_listener(metrics)
+    bus.add_listener(lambda event: 1 / 0)  # a broken consumer is skipped
+
+    async with bus.run("r1"):
+        await bus.publish(TOOL_END, tool="get_quote", seconds=0.5, status="ok")
+        await bus.publish(TOOL_END, tool="get_quote", seconds=1.5, status="error")
+
+    lines = [json.loads(line) for line in writer.path.read_text().splitlines()]
+    assert [line["type"] for line in lines] == [RUN_START, TOOL_END, TOOL_END, RUN_END]
+    assert lines[1] == {
+        "type": TOOL_END,
+        "run_id": "r1",
+        "tool": "get_quote",
+        "seconds": 0.5,
+        "status": "ok",
+        "timestamp": lines[1]["timestamp"],
+    }
+    assert metrics.snapshot()["tools"]["get_quote"] == {
+        "calls": 2,
+        "errors": 1,
+        "total_seconds": 2.0,
+        "max_seconds": 1.5,
+    }
+
+
+def test_unknown_event_type_rejected():
+    with pytest.raises(ValueError):
+        Event(type="tool_call")
+
+
+class FastPathOnly:
+    """Supervisor placeholder; the fast path answers without it."""
+
+    def bind_tools(self, tools):
+        return self
+
+
+class ToolUsingAgent:
+    """Specialist stand-in that makes one tool call."""
+
+    async def astream(self, state, **kwargs):
+        call = {"name": "get_quote", "args": {"symbol": "AAPL"}, "id": "c1"}
+        yield "updates", {
+            "agent": {"messages": [AIMessage(content="", tool_calls=[call])]}
+        }
+        await asyncio.sleep(0.01)
+        tool_message = ToolMessage(
+            content="AAPL 100", name="get_quote", tool_call_id="c1"
+        )
+        yield "updates", {"tools": {"messages": [tool_message]}}
+        yield "values", {"messages": [AIMessage(content="AAPL trades at 100")]}
+
+
+@pytest.mark.asyncio
+async def test_router_publishes_agent_and_tool_events(monkeypatch):
+    from navam_invest.agents import registry
+    from navam_invest.agents.router import create_router_agent
+
+    async def build():
+        return ToolUsingAgent()
+
+    monkeypatch.setattr(
+        registry, "_agent_pool", registry.AgentPool({"portfolio": build})
+    )
+    bus = EventBus()
+    monkeypatch.setattr(event_bus, "_event_bus", bus)
+
+    router = await create_router_agent(llm=FastPathOnly())
+    subscription = bus.subscribe()
+    async with bus.run() as run_id:
+        await router.ainvoke(
+            {"messages": [HumanMessage(content="What's AAPL's stock price?")]}
+        )
+    subscription.close()
+
+    events = [e async for e in subscription]
+    assert [e.type for e in events] == [
+        RUN_START,
+        AGENT_START,
+        TOOL_START,
+        TOOL_END,
+        AGENT_END,
+        RUN_END,
+    ]
+    assert {e.run_id for e in events} == {run_id}
+    tool_end = events[3]
+    assert tool_end.tool == "get_quote" and tool_end.status == "ok"
+    assert tool_end.seconds >= 0.01
+    assert events[4].agent == "portfolio" and events[4].seconds >= tool_end.seconds
+
+
+class FailingAgent:
+    """Specialist stand-in whose run fails."""
+
+    async def astream(self, state, **kwargs):
+        raise RuntimeError("model overloaded")
+        yield  # pragma: no cover
+
+
+class AnsweringSupervisor(FastPathOnly):
+    """Supervisor that answers directly once the fast path failed."""
+
+    async def ainvoke(self, messages, config=None):
+        return AIMessage(content="Portfolio is unavailable right now.")
+
+
+@pytest.mark.asyncio
+async def test_failing_specialist_publishes_one_error(monkeypatch):
+    """The failure is reported once and counted by the global metrics."""
+    from navam_invest.agents import registry
+    from navam_invest.agents.router import create_router_agent
+
+    async def build():
+        return FailingAgent()
+
+    monkeypatch.setattr(
+        registry, "_agent_pool", registry.AgentPool({"portfolio": build})
+    )
+    metrics = EventMetrics()
+    monkeypatch.setattr(event_bus, "_event_bus", None)
+    monkeypatch.setattr(event_bus, "_event_metrics", metrics)
+    bus = event_bus.get_event_bus()
+
+    router = await create_router_agent(llm=AnsweringSupervisor())
+    subscription = bus.subscribe()
+    await router.ainvoke(
+        {"messages": [HumanMessage(content="What's AAPL's stock price?")]}
+    )
+    subscription.close()
+
+    events = [e async for e in subscription]
+    errors = [e for e in events if e.type == ERROR]
+    assert len(errors) == 1
+    assert errors[0].data["message"] == "model overloaded"
+    assert events[-1].type == AGENT_END and events[-1].status == "error"
+    assert metrics.snapshot()["agents"]["portfolio"]["errors"] == 1
+    assert metrics.snapshot()["counts"][ERROR] == 1
@@ -0,0 +1,196 @@
+"""Tests for the rule-based intent pre-classifier."""
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from navam_invest.agents.intent import (
+    classify_intent,
+    detect_tickers,
+    evaluate_intents,
+    fast_path_agent,
+)
+from navam_invest.config.settings import get_settings
+
+# Labeled queries: expected specialist, or None where the supervisor should
+# decide (decisions, multi-agent questions, vague requests)
+LABELED_QUERIES = [
+    ("What's AAPL's stock price?", "portfolio"),
+    ("Get me a quote for MSFT", "portfolio"),
+    ("How much is NVDA trading at right now?", "portfolio"),
+    ("What is the share price of Amazon?", "portfolio"),
+    ("What's the current GDP?", "research"),
+    ("Show me the latest CPI reading", "research"),
+    ("What is the unemployment rate?", "research"),
+    ("Current fed funds rate", "research"),
+    ("Pull the 10-year yield from FRED", "research"),
+    ("Is recession risk high?", "macro_lens"),
+    ("Where are we in the business cycle?", "macro_lens"),
+    ("What sector rotation makes sense now?", "macro_lens"),
+    ("Give me your macro outlook for next year", "macro_lens"),
+    ("Is the market risk-on or risk-off?", "macro_lens"),
+    ("Find undervalued growth stocks", "screen_forge"),
+    ("Screen for high-dividend stocks with low debt", "screen_forge"),
+    ("Show me small-cap stocks with strong momentum", "screen_forge"),
+    ("Identify companies with rising margins", "screen_forge"),
+    ("TSLA earnings analysis", "earnings_whisperer"),
+    ("Did MSFT beat earnings last quarter?", "earnings_whisperer"),
+    ("When is the next earnings date for GOOGL?", "earnings_whisperer"),
+    ("Any post-earnings drift setups this week?", "earnings_whisperer"),
+    ("Material events for META", "news_sentry"),
+    ("Latest news on AMD", "news_sentry"),
+    ("Any insider buying at NFLX?", "news_sentry"),
+    ("Were there any 8-K filings from ORCL this month?", "news_sentry"),
+    ("What happened to INTC today?", "news_sentry"),
+    ("Portfolio risk assessment", "risk_shield"),
+    ("What's the value at risk of my holdings?", "risk_shield"),
+    ("Stress test my portfolio for a 2008 scenario", "risk_shield"),
+    ("Am I over-exposed to tech? Check concentration", "risk_shield"),
+    ("Tax-loss harvest opportunities", "tax_scout"),
+    ("Would selling TSLA trigger a wash-sale?", "tax_scout"),
+    ("How can I reduce capital gains this year?", "tax_scout"),
+    ("Protect my NVDA position", "hedge_smith"),
+    ("Set up a covered call on AAPL", "hedge_smith"),
+    ("What collar would you use on my META shares?", "hedge_smith"),
+    ("Hedging ideas for a concentrated position", "hedge_smith"),
+    ("What's the fair value of KO?", "quill"),
+    ("Build a DCF for COST", "quill"),
+    ("Write an investment thesis on V", "quill"),
+    ("Deep dive into the fundamentals of ADBE", "quill"),
+    ("Does MSFT have a durable moat?", "quill"),
+    ("Should I buy AAPL?", None),
+    ("Should I sell my TSLA shares before earnings?", None),
+    ("Is NVDA a buy?", None),
+    ("Hello", None),
+    ("What do you think about the market?", None),
+    ("Help me plan my retirement", None),
+    ("Compare AMD and INTC", None),
+    ("Analyze AAPL", None),
+    ("Hedge my NVDA position and tell me the tax impact of selling", None),
+    ("Check portfolio risk and suggest options hedges", None),
+    ("News and earnings recap for AAPL", None),
+    ("Screen for stocks then value the top pick with a DCF", None),
+    ("What does the inverted yield curve mean for my portfolio risk?", None),
+    ("Does the latest CPI reading raise recession odds?", None),
+    ("What's the price target on AAPL after the downgrade?", None),
+    ("Find covered call candidates among dividend stocks", None),
+]
+
+
+def test_detect_tickers():
+    """Cashtags and upper-case symbols are found; common acronyms are not."""
+    assert detect_tickers("Should I buy AAPL or $msft after the CPI print?") == (
+        "AAPL",
+        "MSFT",
+    )
+    assert detect_tickers("What is the GDP and the CEO's view?") == ()
+
+
+def test_decision_questions_use_supervisor():
+    """Buy/sell decisions need several specialists, so the rules step aside."""
+    match = classify_intent("Should I buy NVDA?")
+    assert match.agent is None
+    assert match.tickers == ("NVDA",)
+
+
+def test_mixed_intents_lower_confidence():
+    """A query matching two specialists is less confident than a clear one."""
+    clear = classify_intent("Tax-loss harvest opportunities")
+    mixed = classify_intent("Tax-loss harvest ideas and hedging with options")
+    assert clear.agent == "tax_scout"
+    assert mixed.confidence < clear.confidence
+
+
+def test_classifier_logs_confidence(caplog):
+    with caplog.at_level("INFO", logger="navam_invest.agents.intent"):
+        classify_intent("Latest news on AMD")
+    assert "Intent news_sentry (confidence" in caplog.text
+
+
+def test_labeled_accuracy_and_llm_calls_saved():
+    """Offline evaluation: fast-path routes are right and save supervisor calls."""
+    threshold = get_settings().router_fast_path_threshold
+    report = evaluate_intents(LABELED_QUERIES, threshold)
+
+    wrong = [
+        (query, expected, fast_path_agent(query, threshold)[0])
+        for query, expected in LABELED_QUERIES
+        if fast_path_agent(query, threshold)[0] not in (None, expected)
+    ]
+    assert report["precision"] >= 0.95, (report, wrong)
+    assert report["coverage"] >= 0.6, report
+    # Two supervisor calls (routing + final answer) per correct fast-path query
+    assert report["llm_calls_saved"] == 2 * report["fast_path"], report
+
+
+class NoCallSupervisor(BaseChatModel):
+    """Supervisor that fails the test if it is ever asked anything."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "no-call"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, **kwargs):
+        raise AssertionError("supervisor LLM should not be called")
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        raise AssertionError("supervisor LLM should not be called")
+
+
+class EchoAgent:
+    def __init__(self, name):
+        self.name = name
+
+    async def astream(self, state, **kwargs):
+        query = state["messages"][-1].content
+        yield "values", {"messages": [AIMessage(content=f"{self.name}: {query}")]}
+
+
+@pytest.fixture
+def echo_agents(monkeypatch):
+    from navam_invest.agents import registry
+
+    def factory(name):
+        async def build():
+            return EchoAgent(name)
+
+        return build
+
+    pool = registry.AgentPool(
+        {name: factory(name) for name in registry.AGENT_FACTORIES}
+    )
+    monkeypatch.setattr(registry, "_agent_pool", pool)
+
+
+@pytest.mark.asyncio
+async def test_router_fast_path_skips_supervisor(echo_agents):
+    """A confident classification answers without any supervisor LLM call."""
+    from navam_invest.agents.router import create_router_agent
+
+    router = await create_router_agent(llm=NoCallSupervisor())
+    result = await router.ainvoke(
+        {"messages": [HumanMessage(content="Tax-loss harvest opportunities")]}
+    )
+
+    final = result["messages"][-1]
+    assert final.content == "tax_scout: Tax-loss harvest opportunities"
+    assert final.response_metadata["intent"]["agent"] == "tax_scout"
+    assert (
+        final.response_metadata["agent_dispatch"]["agents"][0]["agent"] == "tax_scout"
+    )
+
+
+@pytest.mark.asyncio
+async def test_router_fast_path_disabled(echo_agents, monkeypatch):
+    """With the fast path off, every query goes to the supervisor."""
+    from navam_invest.agents.router import create_router_agent
+
+    monkeypatch.setenv("ROUTER_FAST_PATH", "false")
+    router = await create_router_agent(llm=NoCallSupervisor())
+    with pytest.raises(AssertionError, match="should not be called"):
+        await router.ainvoke(
+            {"messages": [HumanMessage(content="Tax-loss harvest opportunities")]}
+        )
@@ -0,0 +1,230 @@
+"""Tests for the investment analysis workflow execution modes."""
+
+import asyncio
+from typing import Any, List
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from navam_invest.workflows import create_investment_analysis_workflow
+
+AGENT_PREFIXES = {
+    "You are Quill": "quill",
+    "You are News Sentry": "news_sentry",
+    "You are Macro Lens": "macro_lens",
+    "You are Risk Shield": "risk_shield",
+    "You are Tax Scout": "tax_scout",
+}
+
+
+class RecordingChatModel(BaseChatModel):
+    """Answers every agent after a short delay and records what it was asked."""
+
+    calls: List[tuple] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "recording"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "RecordingChatModel":
+        return self
+
+    def _generate(self, messages: List[BaseMessage], **kwargs: Any) -> ChatResult:
+        raise NotImplementedError
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Any = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        system = kwargs.get("system", "")
+        agent = next(
+            (name for prefix, name in AGENT_PREFIXES.items() if system.startswith(prefix)),
+            "synthesize",
+        )
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.sleep(0.05)
+        self.calls.append((agent, start, loop.time(), system or messages[-1].content))
+        return ChatResult(
+            generations=[ChatGeneration(message=AIMessage(content=f"{agent} view"))]
+        )
+
+
+async def _run(parallel: bool) -> tuple:
+    llm = RecordingChatModel(calls=[])
+    workflow = await create_investment_analysis_workflow(parallel=parallel, llm=llm)
+    result = await workflow.ainvoke(
+        {"messages": [HumanMessage(content="Analyze AAPL")], "symbol": "AAPL"}
+    )
+    return result, {agent: (start, end, prompt) for agent, start, end, prompt in llm.calls}
+
+
+@pytest.mark.asyncio
+async def test_parallel_mode_runs_independent_agents_together():
+    """Only Risk Shield waits for Quill; synthesis waits for everyone once."""
+    result, calls = await _run(parallel=True)
+
+    quill_start, quill_end, _ = calls["quill"]
+    for agent in ("news_sentry", "macro_lens", "tax_scout"):
+        start, _, prompt = calls[agent]
+        assert start < quill_end
+        assert "quill view" not in prompt
+
+    risk_start, risk_end, risk_prompt = calls["risk_shield"]
+    assert risk_start >= quill_end
+    assert "quill view" in risk_prompt
+
+    synth_start, _, synth_prompt = calls["synthesize"]
+    assert synth_start >= max(
+        end for agent, (_, end, _) in calls.items() if agent != "synthesize"
+    )
+    for agent in ("quill", "news_sentry", "macro_lens", "risk_shield", "tax_scout"):
+        assert f"{agent} view" in synth_prompt
+
+    # Agent tool loops stay private; only the final recommendation is shared
+    assert [m.content for m in result["messages"]] == ["Analyze AAPL", "synthesize view"]
+    assert result["tax_implications"] == "tax_scout view"
+
+
+@pytest.mark.asyncio
+async def test_sequential_mode_passes_every_prior_analysis():
+    """Sequential mode keeps the original chain and full context."""
+    result, calls = await _run(parallel=False)
+
+    order = sorted(calls, key=lambda agent: calls[agent][0])
+    assert order == [
+        "quill",
+        "news_sentry",
+        "macro_lens",
+        "risk_shield",
+        "tax_scout",
+        "synthesize",
+    ]
+    assert "quill view" in calls["news_sentry"][2]
+    assert "risk_shield view" in calls["tax_scout"][2]
+    assert result["messages"][-1].content == "synthesize view"
+
+
+@pytest.mark.asyncio
+async def test_batch_shares_market_context_and_saves_reports(monkeypatch, tmp_path):
+    """Market data is gathered once; symbols respect the concurrency cap."""
+    from unittest.mock import AsyncMock
+
+    from navam_invest.workflows import investment_analysis
+
+    monkeypatch.chdir(tmp_path)
+    gather = AsyncMock(return_value="SHARED MARKET DATA")
+    monkeypatch.setattr(investment_analysis, "gather_market_context", gather)
+
+    llm = RecordingChatModel(calls=[])
+    workflow = await create_investment_analysis_workflow(parallel=True, llm=llm)
+    finished = []
+
+    results = await investment_analysis.run_investment_analysis_batch(
+        ["aapl", "MSFT", "AAPL"],
+        workflow=workflow,
+        max_concurrency=1,
+        on_result=lambda result: finished.append(result.symbol),
+    )
+
+    gather.assert_awaited_once()
+    assert [r.symbol for r in results] == ["AAPL", "MSFT"]
+    assert finished == ["AAPL", "MSFT"]
+    assert all(r.error is None and r.recommendation == "synthesize view" for r in results)
+    assert sorted(p.name.split("_")[0] for p in (tmp_path / "reports").iterdir()) == [
+        "AAPL",
+        "MSFT",
+    ]
+
+    macro_prompts = [prompt for agent, _, _, prompt in llm.calls if agent == "macro_lens"]
+    assert len(macro_prompts) == 2
+    assert all("SHARED MARKET DATA" in prompt for prompt in macro_prompts)
+
+    # With a cap of one, MSFT starts only after AAPL is synthesized
+    aapl_done = max(end for _, _, end, p in llm.calls if "AAPL" in p)
+    msft_start = min(start for _, start, _, p in llm.calls if "MSFT" in p)
+    assert msft_start >= aapl_done
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_failures_per_symbol(monkeypatch, tmp_path):
+    """One failing symbol does not sink the rest of the batch."""
+    from navam_invest.workflows import investment_analysis
+
+    monkeypatch.chdir(tmp_path)
+
+    class FailingWorkflow:
+        async def astream(self, state, **kwargs):
+            if state["symbol"] == "BAD":
+                raise RuntimeError("model unavailable")
+            yield (), "values", {
+                "messages": [AIMessage(content=f"{state['symbol']} rec")]
+            }
+
+    results = await investment_analysis.run_investment_analysis_batch(
+        ["GOOD", "BAD"],
+        workflow=FailingWorkflow(),
+        share_market_context=False,
+        save_reports=False,
+    )
+
+    assert results[0].recommendation == "GOOD rec" and results[0].error is None
+    assert results[1].error == "model unavailable"
+
+
+@pytest.mark.asyncio
+async def test_batch_keeps_recommendation_when_report_save_fails(monkeypatch):
+    """A report that can't be written doesn't turn the analysis into an error."""
+    from navam_invest.workflows import investment_analysis
+
+    class DoneWorkflow:
+        async def astream(self, state, **kwargs):
+            yield (), "values", {"messages": [AIMessage(content="BUY")]}
+
+    def failing_save(**kwargs):
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(investment_analysis, "save_investment_report", failing_save)
+
+    (result,) = await investment_analysis.run_investment_analysis_batch(
+        ["AAPL"], workflow=DoneWorkflow(), share_market_context=False
+    )
+
+    assert result.error is None
+    assert result.recommendation == "BUY" and result.report_path is None
+
+
+@pytest.mark.asyncio
+async def test_batch_traces_each_symbol(monkeypatch):
+    """Every symbol is its own run: one trace and one run ID per symbol."""
+    from collections import deque
+
+    from navam_invest.utils import event_bus, tracing
+    from navam_invest.workflows import investment_analysis
+
+    bus = event_bus.EventBus()
+    monkeypatch.setattr(event_bus, "_event_bus", bus)
+    monkeypatch.setattr(tracing, "_recent_traces", deque(maxlen=20))
+
+    class DoneWorkflow:
+        async def astream(self, state, **kwargs):
+            yield (), "values", {"messages": [AIMessage(content="BUY")]}
+
+    subscription = bus.subscribe()
+    await investment_analysis.run_investment_analysis_batch(
+        ["AAPL", "MSFT"],
+        workflow=DoneWorkflow(),
+        share_market_context=False,
+        save_reports=False,
+    )
+    subscription.close()
+
+    traces = tracing.recent_traces()
+    assert sorted(trace.name for trace in traces) == ["/analyze AAPL", "/analyze MSFT"]
+    run_ids = {e.run_id for e in [e async for e in subscription]}
+    assert run_ids == {trace.trace_id for trace in traces}
@@ -0,0 +1,402 @@
+"""Tests for the shared HTTP client registry, provider rate limits and worker pools."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from navam_invest.net import (
+    HttpClientConfig,
+    RateLimitExceededError,
+    aclose_http_clients,
+    configure_http_clients,
+    get_http_client,
+)
+from navam_invest.net.executor import BlockingExecutor
+from navam_invest.net.rate_limit import ProviderLimiter, TokenBucket, parse_rate
+
+
+@pytest.fixture(autouse=True)
+def default_config(monkeypatch):
+    """Use default pool settings regardless of the local environment."""
+    monkeypatch.setattr("navam_invest.net.client._config", HttpClientConfig())
+
+
+@pytest.mark.asyncio
+async def test_client_is_shared_per_host():
+    """Requests to the same host reuse one pooled client."""
+    sec = get_http_client("https://data.sec.gov/submissions/CIK0000320193.json")
+    sec_again = get_http_client("https://data.sec.gov/api/xbrl/companyfacts/x.json")
+    fred = get_http_client("https://api.stlouisfed.org/fred/series")
+
+    assert sec is sec_again
+    assert sec is not fred
+
+    await aclose_http_clients()
+    assert sec.is_closed and fred.is_closed
+
+
+@pytest.mark.asyncio
+async def test_closed_client_is_replaced():
+    """A fresh client is opened after shutdown."""
+    first = get_http_client("https://api.fiscaldata.treasury.gov/x")
+    await aclose_http_clients()
+
+    second = get_http_client("https://api.fiscaldata.treasury.gov/x")
+    assert second is not first
+    assert not second.is_closed
+    await aclose_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_client_uses_configured_limits_and_timeouts():
+    """Pool limits and timeouts come from the active configuration."""
+    configure_http_clients(HttpClientConfig(timeout=12.0, connect_timeout=3.0))
+
+    client = get_http_client("https://finnhub.io/api/v1/quote")
+    assert client.timeout == httpx.Timeout(12.0, connect=3.0)
+    await aclose_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_fetch_helpers_use_shared_client(monkeypatch):
+    """Tool helpers send requests through the pooled client."""
+    from navam_invest.tools.fred import _fetch_fred
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"seriess": []})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("navam_invest.net.fetcher.get_http_client", lambda url: client)
+
+    for _ in range(3):
+        assert await _fetch_fred("series", "key", series_id="GDP") == {"seriess": []}
+
+    assert len(requests) == 3
+    assert not client.is_closed
+    await client.aclose()
+
+
+def test_parse_rate():
+    """Rate specifications accept common units and reject garbage."""
+    assert parse_rate("60/minute") == (60, 60.0)
+    assert parse_rate("10/second") == (10, 1.0)
+    assert parse_rate("1000/days") == (1000, 86400.0)
+    assert parse_rate("") is None
+
+    with pytest.raises(ValueError):
+        parse_rate("fast")
+    with pytest.raises(ValueError):
+        parse_rate("0/minute")
+
+
+def test_token_bucket_queues_reservations():
+    """Reservations past the burst are spaced out at the refill rate."""
+    bucket = TokenBucket(2, 1.0)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.5, abs=0.05)
+    assert waits[3] == pytest.approx(1.0, abs=0.05)
+
+
+def test_token_bucket_rejects_waits_past_limit():
+    """A reservation that would wait too long fails without consuming a token."""
+    bucket = TokenBucket(1, 60.0)
+    bucket.reserve()
+
+    with pytest.raises(RateLimitExceededError):
+        bucket.reserve(max_wait=1.0)
+    assert bucket.reserve(max_wait=120.0) == pytest.approx(60.0, abs=0.1)
+
+
+def test_default_rate_limits_match_documented_budgets():
+    """Shipped limits equal the free-tier budgets quoted in the provider tools."""
+    from navam_invest.config.settings import Settings
+    from navam_invest.net.rate_limit import DEFAULT_RATE_LIMITS
+
+    documented = {
+        "finnhub": "60/minute",  # tools/finnhub.py: 60 calls/minute
+        "newsapi": "1000/day",  # tools/newsapi.py: 1,000 requests/day
+        "tiingo": "50/hour",  # tools/tiingo.py: 50 symbols/hour
+    }
+    for provider, budget in documented.items():
+        assert DEFAULT_RATE_LIMITS[provider] == budget
+    for provider, rate in DEFAULT_RATE_LIMITS.items():
+        assert Settings.model_fields[f"{provider}_rate_limit"].default == rate
+
+
+def test_slow_budget_queues_for_one_refill_interval():
+    """At 50/hour the next token is 72s away, past the 60s default max wait."""
+    limiter = ProviderLimiter("tiingo", "50/hour", max_wait_seconds=60.0)
+
+    assert limiter.max_wait_seconds == pytest.approx(72.0)
+    for _ in range(50):
+        limiter.bucket.reserve()
+    assert limiter.bucket.reserve(limiter.max_wait_seconds) == pytest.approx(
+        72.0, abs=0.1
+    )
+
+
+@pytest.mark.asyncio
+async def test_provider_limiter_queues_instead_of_failing():
+    """Requests over budget wait for tokens and are counted as throttled."""
+    limiter = ProviderLimiter("test", "20/second", max_concurrency=10)
+
+    async def request() -> None:
+        async with limiter.slot():
+            pass
+
+    start = time.monotonic()
+    await asyncio.gather(*(request() for _ in range(25)))
+    elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.2
+    stats = limiter.stats()
+    assert stats["requests"] == 25
+    assert stats["throttled"] >= 4
+    assert stats["queued"] == 0
+    assert stats["max_wait_ms"] >= 200
+
+
+@pytest.mark.asyncio
+async def test_provider_limiter_caps_concurrency():
+    """No more than max_concurrency requests run at once."""
+    limiter = ProviderLimiter("test", "", max_concurrency=2)
+    active = 0
+    peak = 0
+
+    async def request() -> None:
+        nonlocal active, peak
+        async with limiter.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.stats()["rate"] == "unlimited"
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    """Retry quickly and start every test with fresh circuit breakers."""
+    from navam_invest.net import RetryPolicy
+
+    policy = RetryPolicy(
+        max_retries=2, backoff_base=0.001, backoff_max=0.01, breaker_threshold=3
+    )
+    monkeypatch.setattr("navam_invest.net.resilience._policy", policy)
+    monkeypatch.setattr("navam_invest.net.resilience._breakers", {})
+
+
+def _mock_client(monkeypatch, handler):
+    """Route the fetch layer through a mock transport."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("navam_invest.net.fetcher.get_http_client", lambda url: client)
+    return client
+
+
+def test_parse_retry_after():
+    """Retry-After accepts delta seconds and HTTP dates."""
+    from datetime import datetime, timedelta, timezone
+    from email.utils import format_datetime
+
+    from navam_invest.net.resilience import parse_retry_after
+
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    future = format_datetime(
+        datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True
+    )
+    assert 8 <= parse_retry_after(future) <= 10
+
+
+@pytest.mark.asyncio
+async def test_fetch_retries_transient_errors(monkeypatch, fast_retries):
+    """5xx responses and timeouts are retried until a success."""
+    from navam_invest.net import fetch, get_circuit_stats
+
+    outcomes = [
+        httpx.ReadTimeout("slow"),
+        httpx.Response(503),
+        httpx.Response(200, json={}),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    _mock_client(monkeypatch, handler)
+
+    response = await fetch("treasury", "https://retry.example.com/data")
+
+    assert response.status_code == 200
+    stats = get_circuit_stats()["retry.example.com"]
+    assert stats["retries"] == 2
+    assert stats["failures"] == 2
+    assert stats["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_fetch_honors_retry_after(monkeypatch, fast_retries):
+    """A 429 waits for the Retry-After delay before retrying."""
+    from navam_invest.net import fetch
+
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0.2"}),
+        httpx.Response(200),
+    ]
+    _mock_client(monkeypatch, lambda request: responses.pop(0))
+
+    start = time.monotonic()
+    response = await fetch("treasury", "https://ratelimited.example.com/data")
+
+    assert response.status_code == 200
+    assert time.monotonic() - start >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_fetch_does_not_retry_client_errors(monkeypatch, fast_retries):
+    """Non-retryable responses are returned to the caller immediately."""
+    from navam_invest.net import fetch
+
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(403)
+
+    _mock_client(monkeypatch, handler)
+
+    response = await fetch("treasury", "https://forbidden.example.com/data")
+
+    assert response.status_code == 403
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_fails_fast(monkeypatch, fast_retries):
+    """After repeated failures the breaker rejects requests without I/O."""
+    from navam_invest.net import CircuitOpenError, fetch
+
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        raise httpx.ConnectError("down")
+
+    _mock_client(monkeypatch, handler)
+
+    with pytest.raises(httpx.ConnectError):
+        await fetch("treasury", "https://down.example.com/data")
+    assert calls == 3
+
+    with pytest.raises(CircuitOpenError):
+        await fetch("treasury", "https://down.example.com/data")
+    assert calls == 3
+
+
+def test_circuit_half_open_trial():
+    """After the reset period one trial request decides the circuit state."""
+    from navam_invest.net import CircuitOpenError
+    from navam_invest.net.resilience import CircuitBreaker
+
+    breaker = CircuitBreaker("api.example.com", threshold=1, reset_seconds=0.05)
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    breaker.before_request()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_blocking_executor_bounds_concurrency_and_measures_queue():
+    executor = BlockingExecutor("test", max_workers=2)
+    running, peak = 0, 0
+
+    def work(i):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        time.sleep(0.02)
+        running -= 1
+        return i
+
+    try:
+        results = await asyncio.gather(*(executor.run(work, i) for i in range(6)))
+    finally:
+        executor.shutdown()
+
+    assert results == list(range(6))
+    assert peak == 2
+    stats = executor.stats()
+    assert stats["calls"] == 6 and stats["queued"] == 0
+    assert stats["max_queued"] >= 4
+    assert stats["max_wait_ms"] >= 20 and stats["avg_run_ms"] >= 20
+
+
+@pytest.mark.asyncio
+async def test_blocking_executor_timeout_cancels_queued_work():
+    """A call that times out while waiting for a worker never runs."""
+    executor = BlockingExecutor("test", max_workers=1)
+    ran = []
+
+    try:
+        blocker = asyncio.ensure_future(executor.run(time.sleep, 0.1))
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run(ran.append, "queued", timeout=0.02)
+        await blocker
+    finally:
+        executor.shutdown()
+
+    assert ran == []
+    stats = executor.stats()
+    assert stats["timeouts"] == 1 and stats["cancelled"] == 1
+    assert stats["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_yahoo_tools_run_on_the_yahoo_executor(monkeypatch):
+    from navam_invest.net import executor as executor_module
+    from navam_invest.tools import yahoo_finance
+
+    yahoo = BlockingExecutor("yahoo_finance", max_workers=1)
+    monkeypatch.setitem(executor_module._executors, "yahoo_finance", yahoo)
+    threads = []
+
+    def fake_quote(symbol):
+        threads.append(threading.current_thread().name)
+        return f"{symbol} 100"
+
+    monkeypatch.setattr(yahoo_finance, "_get_quote", fake_quote)
+    try:
+        result = await yahoo_finance.get_quote.ainvoke({"symbol": "AAPL"})
+    finally:
+        yahoo.shutdown()
+
+    assert result == "AAPL 100"
+    assert threads[0].startswith("navam-yahoo_finance")
+    assert yahoo.stats()["calls"] == 1
@@ -0,0 +1,155 @@
+"""Tests for the incremental OHLCV price store."""
+
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from navam_invest.cache.price_store import PriceStore, clamp_start, period_start
+
+
+class FakeYahoo:
+    """Daily bars for every business day of the last six years."""
+
+    def __init__(self):
+        days = pd.bdate_range(end=date.today(), periods=6 * 260)
+        closes = [100.0 + i for i in range(len(days))]
+        self.frame = pd.DataFrame(
+            {
+                "Open": closes,
+                "High": [c + 2 for c in closes],
+                "Low": [c - 2 for c in closes],
+                "Close": closes,
+                "Volume": [1000] * len(days),
+                "Dividends": [0.0] * len(days),
+                "Stock Splits": [0.0] * len(days),
+            },
+            index=days.tz_localize("America/New_York"),
+        )
+        self.calls = []
+
+    def __call__(self, symbol, interval, start, end):
+        self.calls.append((symbol, interval, start, end))
+        index = self.frame.index.tz_localize(None)
+        mask = [True] * len(index)
+        if start is not None:
+            mask &= index >= pd.Timestamp(start)
+        if end is not None:
+            mask &= index < pd.Timestamp(end)
+        return self.frame[mask]
+
+
+@pytest.fixture
+def yahoo():
+    return FakeYahoo()
+
+
+@pytest.fixture
+def store(yahoo):
+    store = PriceStore(fetcher=yahoo)
+    yield store
+    store.close()
+
+
+def test_longer_period_downloads_only_the_missing_head(store, yahoo):
+    one_year = store.history("aapl", "1y")
+    five_years = store.history("AAPL", "5y")
+
+    assert yahoo.calls == [
+        ("AAPL", "1d", period_start("1y"), None),
+        ("AAPL", "1d", period_start("5y"), period_start("1y")),
+    ]
+    assert five_years.index[0].date() >= period_start("5y")
+    assert five_years.index.is_unique
+    assert five_years["Close"].iloc[-1] == yahoo.frame["Close"].iloc[-1]
+    assert len(five_years) > 4 * len(one_year)
+
+    # Shorter periods are answered locally
+    assert len(store.history("AAPL", "6mo")) < len(one_year)
+    assert len(yahoo.calls) == 2
+
+
+def test_stale_series_fetches_only_new_bars(store, yahoo):
+    store.history("AAPL", "1y")
+    last_bar = store.series_info("AAPL").last_bar
+    store.refresh_interval = timedelta(0)
+
+    store.history("AAPL", "1y")
+    assert yahoo.calls[-1] == ("AAPL", "1d", last_bar.date(), None)
+    assert store.bars("AAPL").index.is_unique
+
+
+def test_new_dividend_reloads_the_adjusted_series(store, yahoo):
+    store.history("AAPL", "1y")
+    store.refresh_interval = timedelta(0)
+
+    # A new bar with a dividend; adjusted history before it shifts
+    next_day = yahoo.frame.index[-1] + pd.offsets.BDay()
+    yahoo.frame.loc[next_day] = [200.0, 202.0, 198.0, 200.0, 1000, 0.5, 0.0]
+    yahoo.frame.iloc[:-1, :4] -= 0.5
+
+    history = store.history("AAPL", "1y")
+    assert yahoo.calls[-1] == ("AAPL", "1d", period_start("1y"), None)
+    assert history["Close"].iloc[-2] == yahoo.frame["Close"].iloc[-2]
+
+
+def test_weekly_and_monthly_bars_resample_daily_series(store, yahoo):
+    daily = store.history("AAPL", "1y")
+    weekly = store.history("AAPL", "1y", "1wk")
+    monthly = store.history("AAPL", "1y", "1mo")
+
+    assert len(yahoo.calls) == 1
+    week = daily[daily.index >= weekly.index[1]].iloc[:5]
+    assert weekly.iloc[1]["Open"] == week["Open"].iloc[0]
+    assert weekly.iloc[1]["High"] == week["High"].max()
+    assert weekly.iloc[1]["Close"] == week["Close"].iloc[-1]
+    assert weekly.iloc[1]["Volume"] == week["Volume"].sum()
+    assert all(ts.weekday() == 0 for ts in weekly.index)
+    assert all(ts.day == 1 for ts in monthly.index)
+
+
+def test_day_periods_count_trading_days(store):
+    bars = store.history("AAPL", "5d")
+    assert len(bars) == 5
+
+
+def test_intraday_periods_stay_within_yahoo_lookback():
+    """1-minute bars are only requested from the last 7 days."""
+    days = pd.bdate_range(end=date.today(), periods=20)
+    minutes = pd.DatetimeIndex(
+        [day + pd.Timedelta(hours=9, minutes=30 + m) for day in days for m in range(3)]
+    )
+    frame = pd.DataFrame(
+        {"Open": 1.0, "High": 1.0, "Low": 1.0, "Close": 1.0, "Volume": 10},
+        index=minutes,
+    )
+    calls = []
+
+    def fetcher(symbol, interval, start, end):
+        calls.append(start)
+        if start is None or start < date.today() - timedelta(days=7):
+            return frame.iloc[:0]  # Yahoo rejects older 1m requests
+        return frame[frame.index >= pd.Timestamp(start)]
+
+    store = PriceStore(fetcher=fetcher)
+    try:
+        assert len(store.history("AAPL", "5d", "1m")) == 5 * 3
+        assert len(store.history("AAPL", "1d", "1m")) == 3
+        assert calls == [clamp_start("1m", period_start("5d"))]
+    finally:
+        store.close()
+
+
+def test_store_persists_across_instances(tmp_path, yahoo):
+    path = tmp_path / "prices.duckdb"
+    first = PriceStore(path, fetcher=yahoo)
+    first.history("AAPL", "1y")
+    first.close()
+
+    second = PriceStore(path, fetcher=yahoo)
+    try:
+        assert len(second.history("AAPL", "3mo")) > 50
+        assert len(yahoo.calls) == 1
+        assert second.series_info("AAPL").updated_at <= datetime.now()
+    finally:
+        second.close()
@@ -1,6 +1,12 @@
 """Tests for Router agent."""
 
+import asyncio
+
 import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
 from navam_invest.agents.router import create_router_agent
 
 
@@ -232,3 +238,109 @@ async def test_router_agent_structure():
     # Should have stream method for streaming
     assert hasattr(router, "stream")
     assert hasattr(router, "astream")
+
+
+# Parallel Dispatch Tests
+class SlowAgent:
+    """Specialist stand-in that takes a while and records overlap."""
+
+    running = 0
+    peak = 0
+    cancelled = []
+
+    def __init__(self, name):
+        self.name = name
+
+    async def astream(self, state, **kwargs):
+        cls = SlowAgent
+        cls.running += 1
+        cls.peak = max(cls.peak, cls.running)
+        try:
+            await asyncio.sleep(0.1)
+        except asyncio.CancelledError:
+            cls.cancelled.append(self.name)
+            raise
+        finally:
+            cls.running -= 1
+        yield "values", {"messages": [AIMessage(content=f"{self.name} view")]}
+
+
+class ScriptedSupervisor(BaseChatModel):
+    """Asks for three specialists at once, then answers."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, **kwargs):
+        raise NotImplementedError
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        if isinstance(messages[-1], ToolMessage):
+            message = AIMessage(content="Combined: " + ", ".join(
+                m.content for m in messages if isinstance(m, ToolMessage)
+            ))
+        else:
+            calls = [
+                {"name": f"route_to_{name}", "args": {"query": "Buy AAPL?"}, "id": name}
+                for name in ("quill", "macro_lens", "risk_shield")
+            ]
+            message = AIMessage(content="", tool_calls=calls)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+@pytest.fixture
+def slow_agents(monkeypatch):
+    from navam_invest.agents import registry
+
+    SlowAgent.running = SlowAgent.peak = 0
+    SlowAgent.cancelled = []
+
+    def factory(name):
+        async def build():
+            return SlowAgent(name)
+
+        return build
+
+    pool = registry.AgentPool({name: factory(name) for name in registry.AGENT_FACTORIES})
+    monkeypatch.setattr(registry, "_agent_pool", pool)
+    monkeypatch.setenv("ROUTER_MAX_PARALLEL_AGENTS", "2")
+
+
+@pytest.mark.asyncio
+async def test_router_dispatches_specialists_concurrently(slow_agents):
+    """One supervisor turn runs its specialists together, up to the cap."""
+    router = await create_router_agent(llm=ScriptedSupervisor())
+
+    result = await router.ainvoke({"messages": [HumanMessage(content="Buy AAPL?")]})
+
+    final = result["messages"][-1]
+    assert final.content == "Combined: quill view, macro_lens view, risk_shield view"
+    assert SlowAgent.peak == 2
+
+    dispatch = final.response_metadata["agent_dispatch"]
+    assert dispatch["turns"] == 1
+    assert [a["agent"] for a in dispatch["agents"]] == ["quill", "macro_lens", "risk_shield"]
+    assert all(a["status"] == "ok" and a["seconds"] >= 0.1 for a in dispatch["agents"])
+    # Three 0.1s agents, two at a time: about 0.2s instead of 0.3s
+    assert dispatch["wall_clock_seconds"] < dispatch["agent_seconds"]
+
+
+@pytest.mark.asyncio
+async def test_router_cancellation_stops_all_specialists(slow_agents):
+    """Cancelling the run cancels every in-flight specialist."""
+    router = await create_router_agent(llm=ScriptedSupervisor())
+
+    task = asyncio.create_task(
+        router.ainvoke({"messages": [HumanMessage(content="Buy AAPL?")]})
+    )
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert sorted(SlowAgent.cancelled) == ["macro_lens", "quill"]
+    assert SlowAgent.running == 0
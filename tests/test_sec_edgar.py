@@ -0,0 +1,243 @@
+"""Tests for SEC EDGAR filing tools."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from navam_invest.tools.sec_edgar import (
+    _index_submissions,
+    compare_peer_financials,
+    get_company_facts,
+    get_company_filings,
+    get_financial_time_series,
+    get_insider_transactions,
+    get_institutional_holdings,
+    get_latest_8k,
+    get_latest_10k,
+    get_latest_10q,
+    search_company_by_ticker,
+    search_filings_by_form,
+)
+
+MOCK_SUBMISSIONS = {
+    "cik": "320193",
+    "name": "Apple Inc.",
+    "filings": {
+        "recent": {
+            "accessionNumber": [
+                "0000320193-24-000010",
+                "0000320193-24-000123",
+                "0000320193-24-000081",
+                "0000320193-23-000106",
+                "0000320193-24-000069",
+                "0000320193-24-000200",
+            ],
+            "filingDate": [
+                "2024-02-01",
+                "2024-11-01",
+                "2024-08-02",
+                "2023-11-03",
+                "2024-05-03",
+                "2024-11-15",
+            ],
+            "reportDate": [
+                "2023-12-30",
+                "2024-09-28",
+                "2024-06-29",
+                "2023-09-30",
+                "",
+                "",
+            ],
+            "form": ["10-Q", "10-K", "10-Q", "10-K", "8-K", "4"],
+            "primaryDocument": [
+                "aapl-20231230.htm",
+                "aapl-20240928.htm",
+                "aapl-20240629.htm",
+                "aapl-20230930.htm",
+                "aapl-20240502.htm",
+                "xslF345X05/wk-form4.xml",
+            ],
+            "isXBRL": [1, 1, 1, 1, 0, 0],
+        }
+    },
+}
+
+
+def test_index_submissions_is_columnar_and_form_indexed():
+    """Rows are indexed by form, newest first, with unused columns dropped."""
+    index = _index_submissions("0000320193", MOCK_SUBMISSIONS)
+
+    assert index["name"] == "Apple Inc."
+    assert index["filings"] == 6
+    assert index["by_form"]["10-K"] == [1, 3]
+    assert index["by_form"]["10-Q"] == [2, 0]
+    assert "isXBRL" not in index["columns"]
+
+
+def test_index_submissions_without_recent_filings():
+    """Companies without filings produce an empty index."""
+    index = _index_submissions("0000000001", {"name": "Shell Co"})
+
+    assert index["filings"] == 0
+    assert index["by_form"] == {}
+
+
+@pytest.mark.asyncio
+async def test_filing_tools_share_one_submissions_fetch():
+    """All six filing tools are served from a single submissions download."""
+    with patch(
+        "navam_invest.tools.sec_edgar._fetch_sec", new_callable=AsyncMock
+    ) as mock_fetch:
+        mock_fetch.return_value = MOCK_SUBMISSIONS
+
+        results = await asyncio.gather(
+            get_latest_10k.ainvoke({"cik": "320193"}),
+            get_latest_10q.ainvoke({"cik": "320193"}),
+            get_latest_8k.ainvoke({"cik": "320193"}),
+            get_institutional_holdings.ainvoke({"cik": "0000320193"}),
+            search_filings_by_form.ainvoke({"cik": "320193", "form_type": "10-K"}),
+            get_insider_transactions.ainvoke({"cik": "320193"}),
+        )
+
+    mock_fetch.assert_awaited_once_with("submissions/CIK0000320193.json")
+
+    ten_k, ten_q, eight_k, holdings, by_form, insider = results
+    assert "Filing Date: 2024-11-01" in ten_k
+    assert "320193/000032019324000123/aapl-20240928.htm" in ten_k
+    assert "Filing Date: 2024-08-02" in ten_q
+    assert "2024-05-03" in eight_k
+    assert "No 13F filings found" in holdings
+    assert by_form.index("2024-11-01") < by_form.index("2023-11-03")
+    assert "Period: 2024-09-28" in by_form
+    assert "Apple Inc. - Recent Insider Transactions" in insider
+
+
+@pytest.mark.asyncio
+async def test_filing_tool_reports_fetch_errors():
+    """Fetch errors are returned as tool output rather than raised."""
+    with patch(
+        "navam_invest.tools.sec_edgar._fetch_sec", new_callable=AsyncMock
+    ) as mock_fetch:
+        mock_fetch.side_effect = Exception("HTTP 503")
+
+        result = await get_latest_10k.ainvoke({"cik": "320193"})
+
+    assert "Error fetching 10-K for CIK 320193" in result
+
+
+MOCK_COMPANY_TICKERS = {
+    "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    "1": {"cik_str": 789019, "ticker": "MSFT", "title": "MICROSOFT CORP"},
+}
+
+
+@pytest.mark.asyncio
+async def test_filing_tools_accept_tickers(isolated_ticker_index):
+    """Tickers resolve through the local index; the map is downloaded once."""
+
+    async def fake_fetch(
+        endpoint, headers=None, base_url="https://data.sec.gov", **params
+    ):
+        if endpoint == "files/company_tickers.json":
+            assert base_url == "https://www.sec.gov"
+            return MOCK_COMPANY_TICKERS
+        return MOCK_SUBMISSIONS
+
+    with patch(
+        "navam_invest.tools.sec_edgar._fetch_sec", new_callable=AsyncMock
+    ) as mock_fetch:
+        mock_fetch.side_effect = fake_fetch
+
+        ten_k = await get_latest_10k.ainvoke({"cik": "aapl"})
+        filings = await get_company_filings.ainvoke(
+            {"symbol": "AAPL", "filing_type": "10-Q"}
+        )
+
+    endpoints = [call.args[0] for call in mock_fetch.await_args_list]
+    assert endpoints == ["files/company_tickers.json", "submissions/CIK0000320193.json"]
+    assert "CIK: 320193" in ten_k
+    assert "Apple Inc. - 10-Q Filings" in filings
+    assert len(isolated_ticker_index) == 2
+
+
+@pytest.mark.asyncio
+async def test_search_company_by_ticker_uses_index(isolated_ticker_index):
+    """Exact matches and suggestions are served without network access."""
+    from navam_invest.cache.ticker_index import CompanyEntry
+
+    isolated_ticker_index.replace(
+        CompanyEntry(row["ticker"], row["cik_str"], row["title"])
+        for row in MOCK_COMPANY_TICKERS.values()
+    )
+
+    with patch(
+        "navam_invest.tools.sec_edgar._fetch_sec", new_callable=AsyncMock
+    ) as mock_fetch:
+        exact = await search_company_by_ticker.ainvoke({"ticker": "msft"})
+        fuzzy = await search_company_by_ticker.ainvoke({"ticker": "microsoft"})
+        missing = await search_company_by_ticker.ainvoke({"ticker": "ZZZZ"})
+
+    mock_fetch.assert_not_awaited()
+    assert "CIK: 789019" in exact
+    assert "**MSFT**: MICROSOFT CORP" in fuzzy
+    assert "No company found with ticker ZZZZ" in missing
+
+
+@pytest.mark.asyncio
+async def test_unknown_ticker_is_reported(isolated_ticker_index):
+    """An unknown ticker yields a helpful error instead of a bad request."""
+    from navam_invest.cache.ticker_index import CompanyEntry
+
+    isolated_ticker_index.replace([CompanyEntry("AAPL", 320193, "Apple Inc.")])
+
+    result = await get_latest_10k.ainvoke({"cik": "NOPE"})
+
+    assert "Unknown ticker 'NOPE'" in result
+
+
+@pytest.mark.asyncio
+async def test_company_facts_tools_share_one_download(isolated_xbrl_store):
+    """Facts are streamed to disk, ingested once and queried locally."""
+    import json
+
+    from tests.test_xbrl_store import COMPANY_FACTS
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+    urls = []
+
+    async def fake_fetch(provider, url, params=None, headers=None, destination=None):
+        urls.append(url)
+        destination.write_text(json.dumps(COMPANY_FACTS))
+        return FakeResponse()
+
+    with patch("navam_invest.tools.sec_edgar.fetch", side_effect=fake_fetch):
+        facts, series = await asyncio.gather(
+            get_company_facts.ainvoke({"cik": "320193"}),
+            get_financial_time_series.ainvoke(
+                {"cik": "320193", "concept": "Revenues", "years": 50}
+            ),
+        )
+        peers = await compare_peer_financials.ainvoke(
+            {"ciks": "320193, 0000320193", "concept": "Revenues"}
+        )
+
+    assert urls == ["https://data.sec.gov/api/xbrl/companyfacts/CIK0000320193.json"]
+    assert "**Total Assets:** $364.98B (as of 2024-09-28, 10-K)" in facts
+    assert "**EPS (Diluted):** $6.08" in facts
+    assert series.index("$383.30B") < series.index("2023-10-01 to 2024-09-28")
+    assert "| 1 | Apple Inc. | 320193 | $391.0" in peers
+
+
+@pytest.mark.asyncio
+async def test_company_facts_reports_fetch_errors():
+    """Download failures are returned as tool output."""
+    with patch(
+        "navam_invest.tools.sec_edgar.fetch", side_effect=Exception("HTTP 503")
+    ):
+        result = await get_company_facts.ainvoke({"cik": "320193"})
+
+    assert "Error fetching company facts for CIK 320193: HTTP 503" in result
@@ -0,0 +1,76 @@
+"""Tests for the persistent ticker/CIK index."""
+
+from datetime import datetime, timedelta
+
+from navam_invest.cache.ticker_index import CompanyEntry, TickerIndex, normalize_ticker
+
+ENTRIES = [
+    CompanyEntry("NVDA", 1045810, "NVIDIA CORP"),
+    CompanyEntry("MSFT", 789019, "MICROSOFT CORP"),
+    CompanyEntry("BRK-B", 1067983, "BERKSHIRE HATHAWAY INC"),
+    CompanyEntry("BRK-A", 1067983, "BERKSHIRE HATHAWAY INC"),
+    CompanyEntry("MSTR", 1050446, "MICROSTRATEGY INC"),
+    CompanyEntry("AAPL", 320193, "Apple Inc."),
+]
+
+
+def test_normalize_ticker():
+    """Class-share separators and case are normalized to SEC form."""
+    assert normalize_ticker(" brk.b ") == "BRK-B"
+    assert normalize_ticker("BF/B") == "BF-B"
+
+
+def test_exact_and_cik_lookup(isolated_ticker_index):
+    """Tickers and CIKs resolve via dictionary lookups."""
+    index = isolated_ticker_index
+    index.replace(ENTRIES)
+
+    assert index.lookup("nvda") == ENTRIES[0]
+    assert index.lookup("brk.b").cik == 1067983
+    assert index.lookup("ZZZZ") is None
+    # The first listing in the SEC map is the primary ticker
+    assert index.by_cik(1067983).ticker == "BRK-B"
+
+
+def test_prefix_lookup(isolated_ticker_index):
+    """Prefix lookups return sorted tickers within the prefix range."""
+    index = isolated_ticker_index
+    index.replace(ENTRIES)
+
+    assert [e.ticker for e in index.prefix("ms")] == ["MSFT", "MSTR"]
+    assert [e.ticker for e in index.prefix("BRK")] == ["BRK-A", "BRK-B"]
+    assert index.prefix("Q") == []
+
+
+def test_name_search_is_fuzzy(isolated_ticker_index):
+    """Name search matches whole words, word prefixes and close spellings."""
+    index = isolated_ticker_index
+    index.replace(ENTRIES)
+
+    assert index.search_name("nvidia")[0].ticker == "NVDA"
+    assert index.search_name("microsft")[0].ticker == "MSFT"
+    assert {e.ticker for e in index.search_name("micro")} == {"MSFT", "MSTR"}
+    assert index.search_name("berkshire hathaway")[0].ticker == "BRK-B"
+    assert index.search_name("nonexistent widgets") == []
+
+
+def test_index_persists_and_tracks_refresh(tmp_path):
+    """Rows and refresh time survive a reopen; staleness follows the interval."""
+    db_path = tmp_path / "tickers.duckdb"
+    index = TickerIndex(db_path)
+    assert index.needs_refresh()
+
+    index.replace(ENTRIES)
+    assert not index.needs_refresh()
+    index.close()
+
+    reopened = TickerIndex(db_path)
+    try:
+        assert len(reopened) == len(ENTRIES)
+        assert reopened.by_cik(1067983).ticker == "BRK-B"
+        assert not reopened.needs_refresh()
+
+        reopened.refreshed_at = datetime.now() - timedelta(days=2)
+        assert reopened.needs_refresh()
+    finally:
+        reopened.close()
@@ -0,0 +1,89 @@
+"""Tests for the lazy tool registry."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from navam_invest.tools import TOOLS, bind_api_keys_to_tools
+from navam_invest.tools.registry import (
+    TOOL_MODULES,
+    build_manifest,
+    load_implementation,
+    load_manifest,
+)
+
+# Modules that must not load just because the registry was imported
+HEAVY_MODULES = {
+    "yfinance",
+    "pandas",
+    "httpx",
+    *(f"navam_invest.tools.{module}" for module in set(TOOL_MODULES.values())),
+}
+
+
+def _imported_modules(statement: str) -> set:
+    """Modules imported by ``statement`` in a fresh interpreter (-X importtime)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def test_registry_import_does_not_load_providers():
+    """Importing the registry, cache-warming queries or the CLI stays light."""
+    imported = _imported_modules(
+        "import navam_invest.tools, navam_invest.cache.common_queries, navam_invest.cli"
+    )
+
+    assert "navam_invest.tools.registry" in imported
+    assert not imported & HEAVY_MODULES
+
+
+def test_manifest_matches_implementations():
+    """manifest.json is regenerated whenever a tool changes."""
+    assert load_manifest() == build_manifest(), (
+        "Tool manifest is stale; run scripts/update_tool_manifest.py"
+    )
+
+
+def test_lazy_tools_expose_the_same_schema():
+    """Models see identical tool definitions from the proxies."""
+    for name, tool in TOOLS.items():
+        real = load_implementation(name)
+        assert convert_to_openai_tool(tool) == convert_to_openai_tool(real)
+
+
+@pytest.mark.asyncio
+async def test_bound_api_key_is_hidden_and_passed():
+    """Bound keys leave the schema and override whatever the model sends."""
+    (tool,) = bind_api_keys_to_tools(
+        [TOOLS["get_stock_price"]], alpha_vantage_key="secret"
+    )
+    parameters = convert_to_openai_tool(tool)["function"]["parameters"]
+    assert parameters["required"] == ["symbol"]
+    assert "api_key" not in parameters["properties"]
+
+    quote = {
+        "Global Quote": {
+            "05. price": "150.00",
+            "09. change": "2.50",
+            "10. change percent": "1.69%",
+            "06. volume": "50000000",
+        }
+    }
+    with patch("navam_invest.tools.alpha_vantage._fetch_alpha_vantage") as fetch:
+        fetch.return_value = quote
+        result = await tool.ainvoke({"symbol": "AAPL", "api_key": "from-model"})
+
+    assert "150.00" in result
+    fetch.assert_called_once_with("GLOBAL_QUOTE", "AAPL", "secret")
@@ -0,0 +1,173 @@
+"""Tests for per-run span tracing."""
+
+import json
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
+from langgraph.graph import END, START, MessagesState, StateGraph
+from langgraph.prebuilt import ToolNode
+
+from navam_invest.cache import cached
+from navam_invest.utils import tracing
+from navam_invest.utils.tracing import span, summarize_trace, trace_run
+
+upstream_calls = []
+
+
+@cached(source="yahoo_finance")
+def _price_cached(symbol: str) -> str:
+    upstream_calls.append(symbol)
+    return f"{symbol} 100"
+
+
+@tool
+def price(symbol: str) -> str:
+    """Get a price."""
+    return _price_cached(symbol)
+
+
+class OneToolModel(BaseChatModel):
+    """Calls the price tool once, then answers; reports token usage."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "one-tool"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        if messages[-1].type == "tool":
+            message = AIMessage(content=f"Done: {messages[-1].content}")
+        else:
+            call = {"name": "price", "args": {"symbol": "AAPL"}, "id": "c1"}
+            message = AIMessage(content="", tool_calls=[call])
+        message.usage_metadata = {
+            "input_tokens": 10,
+            "output_tokens": 5,
+            "total_tokens": 15,
+        }
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def _agent():
+    llm = OneToolModel()
+
+    async def call_model(state: MessagesState) -> dict:
+        return {"messages": [await llm.ainvoke(state["messages"])]}
+
+    def should_continue(state: MessagesState) -> str:
+        return "tools" if state["messages"][-1].tool_calls else END
+
+    workflow = StateGraph(MessagesState)
+    workflow.add_node("agent", call_model)
+    workflow.add_node("tools", ToolNode([price]))
+    workflow.add_edge(START, "agent")
+    workflow.add_conditional_edges(
+        "agent", should_continue, {"tools": "tools", END: END}
+    )
+    workflow.add_edge("tools", "agent")
+    return workflow.compile()
+
+
+@pytest.fixture
+def trace_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("TRACE_DIR", str(tmp_path))
+    upstream_calls.clear()
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_agent_run_produces_span_tree(trace_dir):
+    """LLM calls, tools, cache and upstream calls nest under graph nodes."""
+    agent = _agent()
+    async with trace_run("price check") as trace:
+        await agent.ainvoke({"messages": [HumanMessage(content="AAPL?")]})
+        await agent.ainvoke({"messages": [HumanMessage(content="AAPL again?")]})
+
+    assert upstream_calls == ["AAPL"]
+    by_id = {s.span_id: s for s in trace.spans}
+
+    def path(s):
+        names = []
+        while s.parent_id is not None:
+            names.append(f"{s.kind}:{s.name}")
+            s = by_id[s.parent_id]
+        return "/".join(reversed(names))
+
+    paths = [path(s) for s in trace.spans[1:]]
+    assert paths.count("node:agent/llm:one-tool") == 4
+    assert paths.count("node:tools/tool:price") == 2
+    assert "node:tools/tool:price/cache:cache.get yahoo_finance._price_cached" in paths
+    assert "node:tools/tool:price/provider:yahoo_finance._price_cached" in paths
+    assert all(s.end is not None for s in trace.spans)
+
+    summary = summarize_trace(trace)
+    assert summary["kinds"]["llm"]["calls"] == 4
+    assert summary["tokens"] == {"input": 40, "output": 20}
+    assert summary["cache"] == {"hits": 1, "misses": 1}
+    assert summary["tools"][0]["name"] == "price" and summary["tools"][0]["calls"] == 2
+
+    # Exported as JSONL and as a Chrome trace
+    lines = trace.files["jsonl"].read_text().splitlines()
+    assert json.loads(lines[0])["trace_id"] == trace.trace_id
+    assert len(lines) == len(trace.spans) + 1
+    chrome = json.loads(trace.files["chrome"].read_text())
+    assert {e["cat"] for e in chrome["traceEvents"]} >= {
+        "run",
+        "node",
+        "llm",
+        "tool",
+        "cache",
+    }
+    assert tracing.recent_traces()[-1] is trace
+
+
+@pytest.mark.asyncio
+async def test_spans_are_free_outside_a_trace(trace_dir):
+    with span("anything", tracing.CACHE) as s:
+        s.set(hit=True)
+    assert s is tracing.NULL_SPAN
+    assert tracing.current_trace() is None
+
+
+@pytest.mark.asyncio
+async def test_nested_runs_join_the_outer_trace(trace_dir, monkeypatch):
+    async with trace_run("outer") as outer:
+        async with trace_run("inner") as inner:
+            with span("work", tracing.FETCH):
+                pass
+    assert inner is None
+    assert [s.name for s in outer.spans] == ["outer", "work"]
+
+    monkeypatch.setenv("TRACING_ENABLED", "false")
+    async with trace_run("off") as trace:
+        pass
+    assert trace is None
+
+
+@pytest.mark.asyncio
+async def test_exported_traces_are_pruned(trace_dir, monkeypatch):
+    """Only the newest TRACE_RETENTION runs stay on disk."""
+    monkeypatch.setenv("TRACE_RETENTION", "2")
+    stems = [f"20240101_00000{i}_run{i}" for i in range(3)]
+    for stem in stems:
+        (trace_dir / f"{stem}.jsonl").write_text("{}")
+        (trace_dir / f"{stem}.trace.json").write_text("{}")
+
+    async with trace_run("latest") as trace:
+        pass
+
+    kept = sorted(p.name for p in trace_dir.iterdir())
+    assert kept == sorted(
+        [
+            f"{stems[2]}.jsonl",
+            f"{stems[2]}.trace.json",
+            trace.files["jsonl"].name,
+            trace.files["chrome"].name,
+        ]
+    )
@@ -0,0 +1,65 @@
+"""Tests for the TUI /analyze command's symbol handling."""
+
+import pytest
+
+from navam_invest.tui import app as tui
+from navam_invest.utils.symbols import parse_symbols
+
+
+class FakeLog:
+    """RichLog stand-in that keeps what was written."""
+
+    def __init__(self):
+        self.lines = []
+
+    def write(self, content):
+        self.lines.append(getattr(content, "markup", content))
+
+
+@pytest.fixture
+def batch_calls(monkeypatch):
+    """Record the symbols of every batch analysis instead of running it."""
+    calls = []
+
+    async def fake_batch(symbols, **kwargs):
+        calls.append(list(symbols))
+        return []
+
+    async def fake_workflow(self, name):
+        return object()
+
+    monkeypatch.setattr(tui, "run_investment_analysis_batch", fake_batch)
+    monkeypatch.setattr(tui.ChatUI, "_get_workflow", fake_workflow)
+    return calls
+
+
+def test_parse_symbols_splits_on_commas_and_flags_non_tickers():
+    """Commas and whitespace separate symbols; other words are invalid."""
+    assert parse_symbols(["aapl,MSFT  brk.b, AAPL # watchlist"]) == (
+        ["AAPL", "MSFT", "BRK.B"],
+        [],
+    )
+    assert parse_symbols(["MSFT - Should I invest?"]) == (
+        ["MSFT", "SHOULD", "I"],
+        ["-", "invest?"],
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("example", tui.WORKFLOW_EXAMPLES)
+async def test_shipped_examples_do_not_fan_out(batch_calls, example):
+    """The /examples strings include descriptions and only print usage."""
+    log = FakeLog()
+
+    await tui.ChatUI()._handle_command(example, log)
+
+    assert batch_calls == []
+    assert any("Usage" in str(line) for line in log.lines)
+
+
+@pytest.mark.asyncio
+async def test_comma_separated_watchlist_runs_one_batch(batch_calls):
+    """A valid watchlist starts a single batch over its symbols."""
+    await tui.ChatUI()._handle_command("/analyze aapl, MSFT,NVDA", FakeLog())
+
+    assert batch_calls == [["AAPL", "MSFT", "NVDA"]]
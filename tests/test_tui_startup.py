@@ -0,0 +1,88 @@
+"""Tests for lazy agent and workflow construction in the TUI."""
+
+import asyncio
+
+import pytest
+
+from navam_invest.agents import registry
+from navam_invest.tui import app as tui
+
+
+@pytest.fixture
+def counted_factories(monkeypatch, isolated_agent_pool):
+    """Replace every agent/workflow factory with one that counts its builds."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    builds = []
+
+    def factory(name):
+        async def build():
+            builds.append(name)
+            await asyncio.sleep(0.01)
+            return object()
+
+        return build
+
+    pool = registry.AgentPool({name: factory(name) for name in registry.AGENT_FACTORIES})
+    monkeypatch.setattr(registry, "_agent_pool", pool)
+    monkeypatch.setattr(
+        tui, "LAZY_WORKFLOWS", {name: factory(name) for name in tui.LAZY_WORKFLOWS}
+    )
+    monkeypatch.setattr(tui, "create_router_agent", factory("router"))
+    return builds
+
+
+@pytest.mark.asyncio
+async def test_startup_builds_only_the_router(counted_factories):
+    """The app is ready once the router exists; the rest warms up afterwards."""
+    app = tui.ChatUI()
+    async with app.run_test() as pilot:
+        while not app.agents_initialized:
+            await pilot.pause(0.001)
+        # Nothing else is built before the router is ready
+        assert counted_factories[0] == "router"
+
+        while app.warmup_task is None:
+            await pilot.pause(0.001)
+        await app.warmup_task
+
+    expected = ["router", *registry.AGENT_FACTORIES, *tui.LAZY_WORKFLOWS]
+    assert sorted(counted_factories) == sorted(expected)
+    assert registry.get_agent_pool().instance_count == len(registry.AGENT_FACTORIES)
+    assert app.investment_workflow is not None
+
+
+@pytest.mark.asyncio
+async def test_ui_paints_before_the_router_loads(counted_factories, monkeypatch):
+    """The welcome screen shows while the router loads; queries wait for it."""
+    release = asyncio.Event()
+
+    async def slow_router():
+        await release.wait()
+        return object()
+
+    monkeypatch.setattr(tui, "create_router_agent", slow_router)
+    app = tui.ChatUI()
+    async with app.run_test() as pilot:
+        while app.router_task is None:
+            await pilot.pause(0.001)
+        assert app.query_one("#chat-log").lines
+        assert not app.agents_initialized
+
+        release.set()
+        await app.router_task
+        assert app.agents_initialized
+        assert app.sub_title == "Router: Active | Ready"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_build(counted_factories):
+    """A user command racing the warm-up does not build a workflow twice."""
+    app = tui.ChatUI()
+
+    first, second = await asyncio.gather(
+        app._get_workflow("investment_workflow"),
+        app._get_workflow("investment_workflow"),
+    )
+
+    assert first is second is app.investment_workflow
+    assert counted_factories == ["investment_workflow"]
@@ -0,0 +1,197 @@
+"""Tests for the columnar XBRL company-facts store."""
+
+from datetime import date, datetime, timedelta
+
+from navam_invest.cache.xbrl_store import XbrlFactStore, iter_fact_rows
+
+
+def _fact(start, end, val, fy, fp, form, filed):
+    fact = {"end": end, "val": val, "fy": fy, "fp": fp, "form": form, "filed": filed}
+    if start:
+        fact["start"] = start
+    return fact
+
+
+COMPANY_FACTS = {
+    "cik": 320193,
+    "entityName": "Apple Inc.",
+    "facts": {
+        "dei": {
+            "EntityCommonStockSharesOutstanding": {
+                "units": {
+                    "shares": [
+                        _fact(None, "2024-10-18", 15115823000, 2024, "FY", "10-K", "2024-11-01")
+                    ]
+                }
+            }
+        },
+        "us-gaap": {
+            "Revenues": {
+                "units": {
+                    "USD": [
+                        _fact("2022-09-25", "2023-09-30", 383285000000, 2023, "FY", "10-K", "2023-11-03"),
+                        # Restated in the next annual report; the later filing wins
+                        _fact("2022-09-25", "2023-09-30", 383300000000, 2024, "FY", "10-K", "2024-11-01"),
+                        _fact("2023-10-01", "2024-09-28", 391035000000, 2024, "FY", "10-K", "2024-11-01"),
+                        _fact("2024-06-30", "2024-09-28", 94930000000, 2024, "FY", "10-K", "2024-11-01"),
+                        _fact("2024-03-31", "2024-06-29", 85777000000, 2024, "Q3", "10-Q", "2024-08-02"),
+                    ]
+                }
+            },
+            "Assets": {
+                "units": {
+                    "USD": [
+                        _fact(None, "2023-09-30", 352583000000, 2023, "FY", "10-K", "2023-11-03"),
+                        _fact(None, "2024-09-28", 364980000000, 2024, "FY", "10-K", "2024-11-01"),
+                    ]
+                }
+            },
+            "EarningsPerShareDiluted": {
+                "units": {
+                    "USD/shares": [
+                        _fact("2023-10-01", "2024-09-28", 6.08, 2024, "FY", "10-K", "2024-11-01")
+                    ]
+                }
+            },
+        },
+    },
+}
+
+PEER_FACTS = {
+    "entityName": "MICROSOFT CORP",
+    "facts": {
+        "us-gaap": {
+            "Revenues": {
+                "units": {
+                    "USD": [
+                        _fact("2023-07-01", "2024-06-30", 245122000000, 2024, "FY", "10-K", "2024-07-30"),
+                    ]
+                }
+            }
+        }
+    },
+}
+
+
+def test_iter_fact_rows_flattens_every_value():
+    """Each reported value becomes one row across taxonomies and units."""
+    rows = list(iter_fact_rows(320193, COMPANY_FACTS))
+
+    assert len(rows) == 9
+    assert {row[1] for row in rows} == {"dei", "us-gaap"}
+    assert (320193, "us-gaap", "EarningsPerShareDiluted", "USD/shares") == rows[-1][:4]
+
+
+def test_ingest_replaces_company_facts():
+    """Re-ingesting a company replaces its rows instead of duplicating them."""
+    store = XbrlFactStore()
+
+    assert store.needs_refresh(320193)
+    assert store.ingest(320193, COMPANY_FACTS) == 9
+    assert store.ingest(320193, COMPANY_FACTS) == 9
+
+    count = store.conn.execute("SELECT COUNT(*) FROM xbrl_facts").fetchone()[0]
+    assert count == 9
+    assert store.entity_name(320193) == "Apple Inc."
+    assert not store.needs_refresh(320193)
+
+
+def test_series_filters_periods_and_dedupes_restatements():
+    """Annual and quarterly series pick matching durations, latest filing first."""
+    store = XbrlFactStore()
+    store.ingest(320193, COMPANY_FACTS)
+
+    annual = store.series(320193, "Revenues")
+    assert [(r["period_end"], r["val"]) for r in annual] == [
+        (date(2023, 9, 30), 383300000000),
+        (date(2024, 9, 28), 391035000000),
+    ]
+
+    quarterly = store.series(320193, "Revenues", period="quarterly")
+    assert [r["val"] for r in quarterly] == [85777000000, 94930000000]
+
+    recent = store.series(320193, "Revenues", since=date(2024, 1, 1))
+    assert [r["val"] for r in recent] == [391035000000]
+
+    # Instant values (balance sheet items) have no start date
+    assets = store.series(320193, "Assets")
+    assert [r["period_start"] for r in assets] == [None, None]
+
+    assert store.series(320193, "NoSuchConcept") == []
+
+
+def test_latest_values_by_concept():
+    """The latest filed value is returned per concept, in the allowed units."""
+    store = XbrlFactStore()
+    store.ingest(320193, COMPANY_FACTS)
+
+    latest = store.latest_values(320193, ["Revenues", "Assets", "EarningsPerShareDiluted"])
+
+    assert latest["Assets"]["val"] == 364980000000
+    assert latest["EarningsPerShareDiluted"]["unit"] == "USD/shares"
+    assert latest["Revenues"]["filed"] == date(2024, 11, 1)
+
+
+def test_peer_values_rank_companies():
+    """Peer comparisons return one annual value per company, largest first."""
+    store = XbrlFactStore()
+    store.ingest(320193, COMPANY_FACTS)
+    store.ingest(789019, PEER_FACTS)
+
+    peers = store.peer_values([320193, 789019], "Revenues")
+    assert [(p["entity_name"], p["val"]) for p in peers] == [
+        ("Apple Inc.", 391035000000),
+        ("MICROSOFT CORP", 245122000000),
+    ]
+
+    fy2023 = store.peer_values([320193, 789019], "Revenues", fiscal_year=2023)
+    assert [(p["cik"], p["val"]) for p in fy2023] == [(320193, 383300000000)]
+
+
+def test_peer_values_follow_the_filing_fiscal_year():
+    """A fiscal year ending in the next calendar year is still that fiscal year."""
+    store = XbrlFactStore()
+    store.ingest(
+        27419,
+        {
+            "entityName": "TARGET CORP",
+            "facts": {
+                "us-gaap": {
+                    "Revenues": {
+                        "units": {
+                            "USD": [
+                                _fact("2023-01-29", "2024-02-03", 107412000000, 2023, "FY", "10-K", "2024-03-13"),
+                                _fact("2023-01-29", "2024-02-03", 107412000000, 2024, "FY", "10-K", "2025-03-12"),
+                                _fact("2024-02-04", "2025-02-01", 106566000000, 2024, "FY", "10-K", "2025-03-12"),
+                            ]
+                        }
+                    }
+                }
+            },
+        },
+    )
+
+    fy2024 = store.peer_values([27419], "Revenues", fiscal_year=2024)
+    assert [(p["val"], p["period_end"]) for p in fy2024] == [
+        (106566000000, date(2025, 2, 1))
+    ]
+    fy2023 = store.peer_values([27419], "Revenues", fiscal_year=2023)
+    assert [p["period_end"] for p in fy2023] == [date(2024, 2, 3)]
+
+
+def test_store_persists_and_tracks_refresh(tmp_path):
+    """Facts survive a reopen; staleness follows the refresh interval."""
+    db_path = tmp_path / "facts.duckdb"
+    store = XbrlFactStore(db_path)
+    store.ingest(320193, COMPANY_FACTS)
+    store.close()
+
+    reopened = XbrlFactStore(db_path, refresh_interval_hours=1)
+    assert reopened.latest_values(320193, ["Assets"])["Assets"]["val"] == 364980000000
+    assert not reopened.needs_refresh(320193)
+
+    reopened.conn.execute(
+        "UPDATE xbrl_companies SET ingested_at = ?", [datetime.now() - timedelta(hours=2)]
+    )
+    assert reopened.needs_refresh(320193)
+    reopened.close()
@@ -0,0 +1,301 @@
+"""Tests for the Yahoo Finance tools."""
+
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from navam_invest.tools import yahoo_finance
+from navam_invest.tools.yahoo_finance import (
+    fetch_quotes,
+    get_analyst_recommendations,
+    get_company_info,
+    get_dividends,
+    get_earnings_calendar,
+    get_market_indices,
+    get_options_chain,
+    get_quote,
+    get_quotes,
+)
+
+
+def _bulk_row(symbol, price):
+    return {
+        "symbol": symbol,
+        "shortName": f"{symbol} Inc.",
+        "regularMarketPrice": price,
+        "regularMarketChange": 1.5,
+        "regularMarketChangePercent": 0.75,
+        "regularMarketVolume": 1_200_000,
+        "averageDailyVolume3Month": 1_000_000,
+        "marketCap": 2.5e12,
+        "trailingPE": 31.234,
+        "trailingAnnualDividendYield": 0.005,
+    }
+
+
+@pytest.fixture
+def bulk_requests(monkeypatch):
+    """Record bulk quote requests instead of calling Yahoo."""
+    requests = []
+
+    class FakeYfData:
+        def get_raw_json(self, url, params=None, timeout=30):
+            symbols = params["symbols"].split(",")
+            requests.append(symbols)
+            rows = [
+                _bulk_row(s, 100.0 + i) for i, s in enumerate(symbols) if s != "NOPE"
+            ]
+            return {"quoteResponse": {"result": rows, "error": None}}
+
+    monkeypatch.setattr("yfinance.data.YfData", FakeYfData)
+    return requests
+
+
+def test_get_quotes_uses_one_bulk_request(bulk_requests):
+    result = get_quotes.invoke({"symbols": ["aapl", "MSFT", "AAPL", "NOPE"]})
+
+    assert bulk_requests == [["AAPL", "MSFT", "NOPE"]]
+    assert "| AAPL | $100.00 | +0.75% | 1,200,000 | $2.50T | 31.2 |" in result
+    assert "| MSFT | $101.00 |" in result
+    assert "**Not found:** NOPE" in result
+
+
+def test_bulk_fetch_primes_single_symbol_cache(bulk_requests, monkeypatch):
+    """get_quote after get_quotes is served from the cache."""
+    fetch_quotes(["AAPL", "MSFT"])
+
+    def no_ticker(symbol):
+        raise AssertionError("get_quote should not call Yahoo")
+
+    monkeypatch.setattr(yahoo_finance.yf, "Ticker", no_ticker)
+    result = get_quote.invoke({"symbol": "MSFT"})
+    assert "**MSFT - MSFT Inc.**" in result
+    assert "**Volume:** 1,200,000 (Avg: 1,000,000)" in result
+    assert "**Dividend Yield:** 0.50%" in result
+
+    # Cached symbols are not requested again; only misses are
+    fetch_quotes(["MSFT", "NVDA"])
+    assert bulk_requests == [["AAPL", "MSFT"], ["NVDA"]]
+
+
+def test_get_quote_prefers_bulk_price_over_info_snapshot():
+    """A get_quotes refresh wins over an older info snapshot's price."""
+    snapshot = {"symbol": "AAPL", "longName": "Apple Inc.", "sector": "Technology"}
+    yahoo_finance._get_info_cached.prime(
+        {**snapshot, "currentPrice": 190.0, "regularMarketPrice": 190.0}, "AAPL"
+    )
+    yahoo_finance._get_quote_fields_cached.prime(_bulk_row("AAPL", 205.0), "AAPL")
+
+    result = get_quote.invoke({"symbol": "AAPL"})
+    assert "**Price:** $205.0" in result
+    assert "**AAPL - Apple Inc.**" in result
+
+
+def test_bulk_requests_are_chunked(bulk_requests, monkeypatch):
+    monkeypatch.setattr(yahoo_finance, "_BULK_QUOTE_CHUNK", 2)
+    quotes = fetch_quotes(["A", "B", "C"])
+    assert list(quotes) == ["A", "B", "C"]
+    assert bulk_requests == [["A", "B"], ["C"]]
+
+
+def test_parse_symbol_list():
+    assert yahoo_finance.parse_symbol_list("S&P 500=^GSPC, xlk ,,Tech=XLK") == {
+        "S&P 500": "^GSPC",
+        "XLK": "XLK",
+        "Tech": "XLK",
+    }
+
+
+def test_market_indices_fetch_in_one_batch_and_cache_per_index(
+    bulk_requests, monkeypatch, isolated_cache
+):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("MARKET_INDICES", "S&P 500=^GSPC,Nasdaq=^IXIC,Missing=NOPE")
+    monkeypatch.setenv("MARKET_SECTOR_ETFS", "Technology=XLK,Energy=XLE")
+
+    result = get_market_indices.invoke({"include_sectors": True})
+    assert bulk_requests == [["^GSPC", "^IXIC", "NOPE", "XLK", "XLE"]]
+    assert "**S&P 500:** 100.00 (+1.50, +0.75%)" in result
+    assert "**Missing:** N/A" in result
+    assert "**Sector ETFs**" in result and "**Energy:** 104.00" in result
+
+    # Only the expired index is refetched
+    key = isolated_cache._generate_cache_key(
+        "yahoo_finance", "_get_quote_fields_cached", ("^IXIC",), {}
+    )
+    isolated_cache._memory.pop(key)
+    isolated_cache.conn.execute(
+        "UPDATE cache_entries SET expires_at = ? WHERE cache_key = ?",
+        [datetime.now() - timedelta(hours=1), key],
+    )
+    result = get_market_indices.invoke({})
+    assert bulk_requests[1:] == [["^IXIC", "NOPE"]]
+    assert "Sector ETFs" not in result
+
+
+class FakeTicker:
+    """Ticker stand-in counting ``info`` downloads."""
+
+    info_downloads = 0
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+
+    @property
+    def info(self):
+        FakeTicker.info_downloads += 1
+        return {
+            "longName": "Apple Inc.",
+            "currentPrice": 200.0,
+            "regularMarketChange": 2.0,
+            "regularMarketChangePercent": 1.0,
+            "volume": 50_000_000,
+            "averageVolume": 60_000_000,
+            "marketCap": 3.1e12,
+            "sector": "Technology",
+            "fullTimeEmployees": 160_000,
+            "targetMeanPrice": 230.0,
+            "dividendYield": 0.0045,
+            "earningsDate": None,
+        }
+
+    @property
+    def recommendations(self):
+        return pd.DataFrame(
+            {
+                "Firm": ["A", "B"],
+                "From Grade": ["Hold", "Buy"],
+                "To Grade": ["Buy", "Sell"],
+                "Action": ["up", "down"],
+            }
+        )
+
+    @property
+    def dividends(self):
+        index = pd.to_datetime(["2024-02-01", "2024-05-01"])
+        return pd.Series([0.24, 0.25], index=index)
+
+    calendar = {
+        "Earnings Date": [date(2025, 1, 30)],
+        "Earnings Average": 2.35,
+        "Earnings Low": 2.2,
+        "Earnings High": 2.5,
+        "Revenue Average": 124_000_000_000,
+    }
+    options = ("2025-01-17",)
+
+    def option_chain(self, expiration):
+        chain = pd.DataFrame(
+            {
+                "strike": [150.0, 200.0, 250.0],
+                "lastPrice": [50.0, 5.0, 0.5],
+                "bid": [49.0, 4.9, 0.4],
+                "ask": [51.0, 5.1, 0.6],
+                "volume": [10, None, 30],
+                "openInterest": [100, 200, 300],
+                "impliedVolatility": [0.3, 0.25, 0.35],
+            }
+        )
+        return SimpleNamespace(calls=chain, puts=chain)
+
+
+def test_yahoo_tools_share_one_info_snapshot(monkeypatch):
+    """Six info-based tools download ``Ticker.info`` once per symbol."""
+    FakeTicker.info_downloads = 0
+    monkeypatch.setattr(yahoo_finance.yf, "Ticker", FakeTicker)
+
+    quote = get_quote.invoke({"symbol": "AAPL"})
+    profile = get_company_info.invoke({"symbol": "aapl"})
+    ratings = get_analyst_recommendations.invoke({"symbol": "AAPL"})
+    dividends = get_dividends.invoke({"symbol": "AAPL"})
+    options = get_options_chain.invoke({"symbol": "AAPL"})
+    earnings = get_earnings_calendar.invoke({"symbol": "AAPL"})
+
+    assert FakeTicker.info_downloads == 1
+    assert "**Price:** $200.0" in quote
+    assert "**Sector:** Technology" in profile and "160,000" in profile
+    assert "Buy/Overweight: 1" in ratings and "Mean: $230.0" in ratings
+    assert "B: Buy → Sell (down)" in ratings
+    assert "**Current Yield:** 0.45%" in dividends
+    assert "2024-05-01: $0.25" in dividends
+    assert "**Underlying Price:** $200.00" in options
+    # Only the at-the-money strike is within 10% of the price
+    assert "Strike $200.00" in options and "Strike $150.00" not in options
+    assert "**Earnings Date:** 2025-01-30" in earnings
+    assert "**EPS Estimate:** 2.35 (Low: 2.2, High: 2.5)" in earnings
+
+
+def test_market_index_lists_fall_back_to_settings_defaults(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)  # no .env
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+    indices, sectors = yahoo_finance._market_index_lists()
+    assert indices["S&P 500"] == "^GSPC" and len(indices) == 5
+    assert sectors["Technology"] == "XLK"
+
+
+@pytest.mark.asyncio
+async def test_cache_warming_fetches_indices_in_one_request(
+    bulk_requests, monkeypatch, isolated_cache
+):
+    from navam_invest.cache.common_queries import get_common_queries
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("MARKET_INDICES", "S&P 500=^GSPC,Nasdaq=^IXIC")
+    queries = [q for q in get_common_queries() if q["tool_name"] == "fetch_quotes"]
+
+    stats = await isolated_cache.warm_cache(queries)
+    assert stats["warmed"] == 1
+    assert bulk_requests == [["^GSPC", "^IXIC"]]
+    assert yahoo_finance._get_quote_fields_cached.peek("^IXIC") is not None
+
+    # Warm indices are served from the cache
+    await isolated_cache.warm_cache(queries)
+    assert len(bulk_requests) == 1
+
+
+def test_bulk_quotes_fall_back_to_per_symbol_info(monkeypatch):
+    """Without yfinance's internal bulk API, quotes come from Ticker.info."""
+
+    class OldYfData:
+        pass  # no get_raw_json
+
+    monkeypatch.setattr("yfinance.data.YfData", OldYfData)
+    FakeTicker.info_downloads = 0
+    monkeypatch.setattr(yahoo_finance.yf, "Ticker", FakeTicker)
+
+    quotes = fetch_quotes(["AAPL", "MSFT"])
+    assert list(quotes) == ["AAPL", "MSFT"]
+    assert quotes["AAPL"]["regularMarketPrice"] == 200.0
+    assert FakeTicker.info_downloads == 2
+
+    result = get_quotes.invoke({"symbols": ["AAPL"]})
+    assert "| AAPL | $200.00 |" in result
+
+
+def test_per_symbol_fallback_stays_within_the_yahoo_executor(monkeypatch):
+    """When the bulk request fails, snapshots download on the calling worker."""
+    import threading
+
+    class FailingYfData:
+        def get_raw_json(self, url, params=None, timeout=30):
+            raise RuntimeError("bulk endpoint down")
+
+    threads = set()
+
+    class RecordingTicker(FakeTicker):
+        @property
+        def info(self):
+            threads.add(threading.current_thread().name)
+            return {"longName": self.symbol, "regularMarketPrice": 10.0}
+
+    monkeypatch.setattr("yfinance.data.YfData", FailingYfData)
+    monkeypatch.setattr(yahoo_finance.yf, "Ticker", RecordingTicker)
+
+    symbols = ["^GSPC", "^DJI", "^IXIC", "XLK", "XLF", "XLE"]
+    quotes = fetch_quotes(symbols)
+
+    assert list(quotes) == symbols
+    assert threads == {threading.current_thread().name}